@@ -0,0 +1,76 @@
+"""Add indexes for hot list, statistics and overdue queries
+
+Revision ID: 18ecc3bd4a41
+Revises: 820b0458b417
+Create Date: 2026-10-19 09:12:41.208114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '18ecc3bd4a41'
+down_revision: Union[str, Sequence[str], None] = '820b0458b417'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (인덱스 이름, 테이블, 컬럼, 부분 인덱스 조건(SQLite, PostgreSQL))
+# SQLAlchemy는 불리언 리터럴을 SQLite에서 1, PostgreSQL에서 true로 렌더링하므로
+# 부분 인덱스 조건도 방언별로 쿼리와 같은 형태로 맞춰야 플래너가 사용합니다.
+INDEXES = [
+    ("ix_student_is_active_created_at", "student", ["is_active", "created_at", "id"], None),
+    ("ix_student_created_at_id", "student", ["created_at", "id"], None),
+    ("ix_student_grade", "student", ["grade"], None),
+    ("ix_student_active_tuition_due_date", "student", ["tuition_due_date"],
+     ("is_active = 1", "is_active = true")),
+    ("ix_teacher_is_active_created_at", "teacher", ["is_active", "created_at", "id"], None),
+    ("ix_teacher_created_at_id", "teacher", ["created_at", "id"], None),
+    ("ix_material_is_active_created_at", "material", ["is_active", "created_at", "id"], None),
+    ("ix_material_created_at_id", "material", ["created_at", "id"], None),
+    ("ix_material_subject", "material", ["subject"], None),
+    ("ix_material_isbn", "material", ["isbn"],
+     ("isbn IS NOT NULL", "isbn IS NOT NULL")),
+    ("ix_lecture_is_active_created_at", "lecture", ["is_active", "created_at", "id"], None),
+    ("ix_lecture_created_at_id", "lecture", ["created_at", "id"], None),
+    ("ix_lecture_teacher_id", "lecture", ["teacher_id"], None),
+    ("ix_lecture_material_id", "lecture", ["material_id"], None),
+]
+
+
+def _existing_indexes(table: str) -> set:
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = {}
+    for name, table, columns, where in INDEXES:
+        if table not in existing:
+            existing[table] = _existing_indexes(table)
+        # create_all로 만든 DB에는 이미 있을 수 있음
+        if name in existing[table]:
+            continue
+
+        kwargs = {}
+        if where:
+            kwargs["sqlite_where"] = sa.text(where[0])
+            kwargs["postgresql_where"] = sa.text(where[1])
+        op.create_index(name, table, columns, unique=False, **kwargs)
+
+    # 새 인덱스를 반영하도록 플래너 통계 갱신
+    op.execute("ANALYZE")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    existing = {}
+    for name, table, _, _ in reversed(INDEXES):
+        if table not in existing:
+            existing[table] = _existing_indexes(table)
+        if name in existing[table]:
+            op.drop_index(name, table_name=table)
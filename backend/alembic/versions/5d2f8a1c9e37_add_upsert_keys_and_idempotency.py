@@ -0,0 +1,97 @@
+"""Add unique upsert keys (material.isbn, lecture.title) and idempotency_key table
+
+Revision ID: 5d2f8a1c9e37
+Revises: 80073b304248
+Create Date: 2026-10-19 13:20:45.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2f8a1c9e37'
+down_revision: Union[str, Sequence[str], None] = '80073b304248'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# app/models/material.py의 MATERIAL_ISBN_PREDICATE와 같아야 ON CONFLICT가 인덱스를 찾음
+MATERIAL_ISBN_PREDICATE = "isbn IS NOT NULL AND isbn <> ''"
+
+
+def _existing_indexes(table: str) -> set:
+    inspector = sa.inspect(op.get_bind())
+    return {index["name"] for index in inspector.get_indexes(table)}
+
+
+def _duplicates(table: str, column: str, where: str = "") -> list:
+    where = f"WHERE {where}" if where else ""
+    rows = op.get_bind().execute(sa.text(
+        f"SELECT {column}, COUNT(*) FROM {table} {where} GROUP BY {column} HAVING COUNT(*) > 1"
+    )).fetchall()
+    return [row[0] for row in rows]
+
+
+def _make_unique(name: str, table: str, column: str, where: str = "") -> None:
+    """기존 인덱스를 고유 인덱스로 교체 (중복 데이터가 있으면 마이그레이션 실패)
+
+    중복을 둔 채 넘어가면 이후 upsert의 ON CONFLICT가 인덱스를 찾지 못하고 등록/수정이 500이 되므로
+    여기서 멈추고 정리할 값을 알려줍니다.
+    """
+    duplicates = _duplicates(table, column, where)
+    if duplicates:
+        raise RuntimeError(
+            f"{table}.{column}에 중복 값이 있어 고유 인덱스를 만들 수 없습니다: {duplicates[:10]} "
+            f"(중복을 정리한 뒤 다시 실행하세요)"
+        )
+
+    if name in _existing_indexes(table):
+        op.drop_index(name, table_name=table)
+    kwargs = {}
+    if where:
+        kwargs = {"sqlite_where": sa.text(where), "postgresql_where": sa.text(where)}
+    op.create_index(name, table, [column], unique=True, **kwargs)
+
+
+def _replace_index(name: str, table: str, column: str, where: str = "") -> None:
+    """고유 인덱스를 일반 인덱스로 되돌림 (없으면 새로 만듦)"""
+    if name in _existing_indexes(table):
+        op.drop_index(name, table_name=table)
+    kwargs = {}
+    if where:
+        kwargs = {"sqlite_where": sa.text(where), "postgresql_where": sa.text(where)}
+    op.create_index(name, table, [column], **kwargs)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    if "idempotency_key" not in inspector.get_table_names():
+        op.create_table(
+            "idempotency_key",
+            sa.Column("key", sa.String(length=255), nullable=False),
+            sa.Column("path", sa.String(length=255), nullable=False),
+            sa.Column("request_hash", sa.String(length=64), nullable=False),
+            sa.Column("status_code", sa.Integer(), nullable=False),
+            sa.Column("response_body", sa.String(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("key"),
+        )
+        op.create_index("ix_idempotency_key_created_at", "idempotency_key", ["created_at"])
+
+    _make_unique("ix_material_isbn", "material", "isbn", MATERIAL_ISBN_PREDICATE)
+    _make_unique("ix_lecture_title", "lecture", "title")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_index("ix_lecture_title", "lecture", "title")
+    _replace_index("ix_material_isbn", "material", "isbn", "isbn IS NOT NULL")
+
+    if "idempotency_key" in sa.inspect(op.get_bind()).get_table_names():
+        if "ix_idempotency_key_created_at" in _existing_indexes("idempotency_key"):
+            op.drop_index("ix_idempotency_key_created_at", table_name="idempotency_key")
+        op.drop_table("idempotency_key")
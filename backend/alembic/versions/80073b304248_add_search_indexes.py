@@ -0,0 +1,107 @@
+"""Add full-text / trigram search indexes for students, teachers and materials
+
+Revision ID: 80073b304248
+Revises: 18ecc3bd4a41
+Create Date: 2026-10-19 10:03:27.551920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '80073b304248'
+down_revision: Union[str, Sequence[str], None] = '18ecc3bd4a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 테이블별 검색 대상 컬럼 (app/core/search_index.py의 SEARCH_COLUMNS와 같아야 함)
+# 전화번호는 하이픈을 뺀 숫자만으로도 찾을 수 있도록 별도 컬럼/표현식을 둡니다.
+SEARCH_COLUMNS = {
+    "student": ["name", "email", "phone"],
+    "teacher": ["name", "email", "phone", "subject"],
+    "material": ["name", "author", "subject"],
+}
+
+
+def _fts_columns(columns):
+    return columns + (["phone_digits"] if "phone" in columns else [])
+
+
+def _fts_values(columns, prefix):
+    values = [f"{prefix}.{col}" for col in columns]
+    if "phone" in columns:
+        values.append(f"replace({prefix}.phone, '-', '')")
+    return values
+
+
+def _pg_expression(columns):
+    parts = [f"coalesce({col}, '')" for col in columns]
+    if "phone" in columns:
+        parts.append("replace(coalesce(phone, ''), '-', '')")
+    return "(" + " || ' ' || ".join(parts) + ")"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for table, columns in SEARCH_COLUMNS.items():
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_{table}_search_trgm ON {table} "
+                f"USING gin ({_pg_expression(columns)} gin_trgm_ops)"
+            )
+        return
+
+    if dialect != "sqlite":
+        return
+
+    # SQLite: trigram 토크나이저 FTS5 테이블 + 원본 테이블 동기화 트리거
+    for table, columns in SEARCH_COLUMNS.items():
+        fts = f"{table}_fts"
+        fts_columns = ", ".join(_fts_columns(columns))
+        new_values = ", ".join(_fts_values(columns, "new"))
+
+        op.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({fts_columns}, tokenize='trigram')")
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {fts}(rowid, {fts_columns}) VALUES (new.id, {new_values}); END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+            f"DELETE FROM {fts} WHERE rowid = old.id; END"
+        )
+        op.execute(
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN "
+            f"DELETE FROM {fts} WHERE rowid = old.id; "
+            f"INSERT INTO {fts}(rowid, {fts_columns}) VALUES (new.id, {new_values}); END"
+        )
+        # 기존 데이터 색인
+        op.execute(f"DELETE FROM {fts}")
+        op.execute(
+            f"INSERT INTO {fts}(rowid, {fts_columns}) "
+            f"SELECT id, {', '.join(_fts_values(columns, table))} FROM {table}"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        for table in SEARCH_COLUMNS:
+            op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_trgm")
+        return
+
+    if dialect != "sqlite":
+        return
+
+    for table in SEARCH_COLUMNS:
+        fts = f"{table}_fts"
+        for suffix in ("ai", "ad", "au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+        op.execute(f"DROP TABLE IF EXISTS {fts}")
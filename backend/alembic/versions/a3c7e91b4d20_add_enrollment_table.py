@@ -0,0 +1,60 @@
+"""Add enrollment table (student ↔ lecture registrations)
+
+Revision ID: a3c7e91b4d20
+Revises: 5d2f8a1c9e37
+Create Date: 2026-10-19 15:02:11.473520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c7e91b4d20'
+down_revision: Union[str, Sequence[str], None] = '5d2f8a1c9e37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# app/models/enrollment.py의 ACTIVE_ENROLLMENT_PREDICATE와 같아야 ON CONFLICT가 인덱스를 찾음
+ACTIVE_ENROLLMENT_PREDICATE = "status = 'enrolled'"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    if "enrollment" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "enrollment",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("student_id", sa.Integer(), nullable=False),
+        sa.Column("lecture_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("enrolled_at", sa.DateTime(), nullable=False),
+        sa.Column("withdrawn_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["lecture_id"], ["lecture.id"]),
+        sa.ForeignKeyConstraint(["student_id"], ["student.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_enrollment_student_id", "enrollment", ["student_id"])
+    op.create_index("ix_enrollment_lecture_id", "enrollment", ["lecture_id"])
+    op.create_index(
+        "ix_enrollment_active_student_lecture", "enrollment", ["student_id", "lecture_id"],
+        unique=True,
+        sqlite_where=sa.text(ACTIVE_ENROLLMENT_PREDICATE),
+        postgresql_where=sa.text(ACTIVE_ENROLLMENT_PREDICATE),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_enrollment_active_student_lecture", table_name="enrollment")
+    op.drop_index("ix_enrollment_lecture_id", table_name="enrollment")
+    op.drop_index("ix_enrollment_student_id", table_name="enrollment")
+    op.drop_table("enrollment")
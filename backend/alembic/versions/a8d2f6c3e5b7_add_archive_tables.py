@@ -0,0 +1,78 @@
+"""Add cold archive tables for inactive students
+
+Revision ID: a8d2f6c3e5b7
+Revises: c1f7e4a9d3b5
+Create Date: 2026-10-21 10:03:27.881406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d2f6c3e5b7'
+down_revision: Union[str, Sequence[str], None] = 'c1f7e4a9d3b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 운영 테이블 → (기본 키 유지 여부, 인덱스 이름 → 컬럼)
+ARCHIVED_TABLES = {
+    "student": (True, {
+        "ix_student_archive_archived_at_id": ["archived_at", "id"],
+        "ix_student_archive_email": ["email"],
+    }),
+    "enrollment": (False, {
+        "ix_enrollment_archive_student_id": ["student_id"],
+        "ix_enrollment_archive_lecture_id_ordinal": ["lecture_id", "ordinal"],
+    }),
+    "payment": (False, {
+        "ix_payment_archive_student_id": ["student_id"],
+    }),
+    "student_balance": (True, {
+        "ix_student_balance_archive_student_id": ["student_id"],
+    }),
+    "tuition_reminder": (False, {
+        "ix_tuition_reminder_archive_student_id": ["student_id"],
+    }),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    existing = set(sa.inspect(bind).get_table_names())
+
+    for name, (keep_primary_key, indexes) in ARCHIVED_TABLES.items():
+        archive = f"{name}_archive"
+        if archive in existing or name not in existing:
+            continue
+        # 운영 테이블과 같은 컬럼 (기본값, 고유 제약, 외래 키는 복사하지 않음)
+        source = sa.Table(name, sa.MetaData(), autoload_with=bind)
+        columns = [
+            sa.Column(
+                column.name,
+                column.type,
+                primary_key=column.primary_key and keep_primary_key,
+                nullable=column.nullable and not column.primary_key,
+                autoincrement=False
+            )
+            for column in source.columns
+        ]
+        op.create_table(archive, *columns, sa.Column("archived_at", sa.DateTime(), nullable=False))
+        for index_name, index_columns in indexes.items():
+            op.create_index(index_name, archive, index_columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    for name, (_, indexes) in reversed(list(ARCHIVED_TABLES.items())):
+        archive = f"{name}_archive"
+        if archive not in existing:
+            continue
+        for index_name in indexes:
+            op.drop_index(index_name, table_name=archive)
+        op.drop_table(archive)
@@ -0,0 +1,50 @@
+"""Add tuition_reminder table (overdue reminder dispatch state)
+
+Revision ID: a9d3e6f2c7b1
+Revises: f4c8a1d6b9e2
+Create Date: 2026-10-19 22:48:31.602417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d3e6f2c7b1'
+down_revision: Union[str, Sequence[str], None] = 'f4c8a1d6b9e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if "tuition_reminder" in sa.inspect(op.get_bind()).get_table_names():
+        return
+
+    op.create_table(
+        "tuition_reminder",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("student_id", sa.Integer(), nullable=False),
+        sa.Column("due_date", sa.DateTime(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.String(length=500), nullable=True),
+        sa.Column("claimed_at", sa.DateTime(), nullable=True),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["student_id"], ["student.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_tuition_reminder_student_id_due_date", "tuition_reminder", ["student_id", "due_date"], unique=True
+    )
+    op.create_index("ix_tuition_reminder_status_id", "tuition_reminder", ["status", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_tuition_reminder_status_id", table_name="tuition_reminder")
+    op.drop_index("ix_tuition_reminder_student_id_due_date", table_name="tuition_reminder")
+    op.drop_table("tuition_reminder")
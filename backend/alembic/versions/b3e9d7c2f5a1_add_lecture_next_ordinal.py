@@ -0,0 +1,53 @@
+"""Add lecture.next_ordinal enrollment ordinal counter
+
+Revision ID: b3e9d7c2f5a1
+Revises: a8d2f6c3e5b7
+Create Date: 2026-10-22 09:12:40.512337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e9d7c2f5a1'
+down_revision: Union[str, Sequence[str], None] = 'a8d2f6c3e5b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _ordinal_sources(existing: set) -> list:
+    """순번이 남아 있는 테이블 (보관된 수강 등록의 순번도 출석 비트맵에 남아 있음)"""
+    return [table for table in ("enrollment", "enrollment_archive") if table in existing]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    existing = set(inspector.get_table_names())
+    if "next_ordinal" not in {column["name"] for column in inspector.get_columns("lecture")}:
+        with op.batch_alter_table("lecture") as batch_op:
+            batch_op.add_column(sa.Column("next_ordinal", sa.Integer(), nullable=False, server_default="0"))
+
+    # 지금까지 쓴 가장 큰 순번 다음부터 발급
+    sources = _ordinal_sources(existing)
+    if sources:
+        used = " UNION ALL ".join(
+            f"SELECT lecture_id, ordinal FROM {table} WHERE ordinal IS NOT NULL" for table in sources
+        )
+        bind.execute(sa.text(
+            f"UPDATE lecture SET next_ordinal = COALESCE(("
+            f"SELECT MAX(used.ordinal) + 1 FROM ({used}) AS used WHERE used.lecture_id = lecture.id"
+            f"), 0)"
+        ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    if "next_ordinal" in {column["name"] for column in inspector.get_columns("lecture")}:
+        with op.batch_alter_table("lecture") as batch_op:
+            batch_op.drop_column("next_ordinal")
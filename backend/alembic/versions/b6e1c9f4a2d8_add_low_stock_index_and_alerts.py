@@ -0,0 +1,75 @@
+"""Add material low-stock partial index and material_stock_alert table
+
+Revision ID: b6e1c9f4a2d8
+Revises: a9d3e6f2c7b1
+Create Date: 2026-10-19 23:20:57.381046
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e1c9f4a2d8'
+down_revision: Union[str, Sequence[str], None] = 'a9d3e6f2c7b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 쿼리의 불리언 리터럴과 같은 형태여야 플래너가 부분 인덱스를 사용함 (SQLite 1, PostgreSQL true)
+LOW_STOCK_PREDICATE = "is_active = {true} AND quantity <= min_quantity"
+OPEN_STOCK_ALERT_PREDICATE = "resolved_at IS NULL"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    sqlite_low_stock = LOW_STOCK_PREDICATE.format(true=1)
+    postgresql_low_stock = LOW_STOCK_PREDICATE.format(true="true")
+
+    if "ix_material_low_stock" not in {index["name"] for index in inspector.get_indexes("material")}:
+        op.create_index(
+            "ix_material_low_stock", "material", ["is_active", "quantity", "id"],
+            sqlite_where=sa.text(sqlite_low_stock),
+            postgresql_where=sa.text(postgresql_low_stock),
+        )
+        op.execute("ANALYZE material")
+
+    if "material_stock_alert" not in inspector.get_table_names():
+        op.create_table(
+            "material_stock_alert",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("material_id", sa.Integer(), nullable=False),
+            sa.Column("quantity", sa.Integer(), nullable=False),
+            sa.Column("min_quantity", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("resolved_at", sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(["material_id"], ["material.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(
+            "ix_material_stock_alert_open_material", "material_stock_alert", ["material_id"],
+            unique=True,
+            sqlite_where=sa.text(OPEN_STOCK_ALERT_PREDICATE),
+            postgresql_where=sa.text(OPEN_STOCK_ALERT_PREDICATE),
+        )
+        op.create_index(
+            "ix_material_stock_alert_created_at_id", "material_stock_alert", ["created_at", "id"]
+        )
+
+        # 이미 재고가 부족한 교재는 처리 중인 알림으로 시작
+        predicate = postgresql_low_stock if op.get_bind().dialect.name == "postgresql" else sqlite_low_stock
+        op.execute(
+            "INSERT INTO material_stock_alert (material_id, quantity, min_quantity, created_at) "
+            f"SELECT id, quantity, min_quantity, CURRENT_TIMESTAMP FROM material WHERE {predicate}"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_material_stock_alert_created_at_id", table_name="material_stock_alert")
+    op.drop_index("ix_material_stock_alert_open_material", table_name="material_stock_alert")
+    op.drop_table("material_stock_alert")
+    op.drop_index("ix_material_low_stock", table_name="material")
@@ -0,0 +1,56 @@
+"""Add lecture_slot table (parsed schedule intervals for conflict checks)
+
+Revision ID: b8e4d2f6a1c3
+Revises: a3c7e91b4d20
+Create Date: 2026-10-19 16:40:27.905114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e4d2f6a1c3'
+down_revision: Union[str, Sequence[str], None] = 'a3c7e91b4d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    if "lecture_slot" in inspector.get_table_names():
+        return
+
+    # 행은 앱이 처음 겹침을 조회하거나 강의가 커밋될 때 Lecture.schedule에서 채움
+    op.create_table(
+        "lecture_slot",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("lecture_id", sa.Integer(), nullable=False),
+        sa.Column("weekday", sa.Integer(), nullable=False),
+        sa.Column("start_minute", sa.Integer(), nullable=False),
+        sa.Column("end_minute", sa.Integer(), nullable=False),
+        sa.Column("classroom", sa.String(), nullable=False),
+        sa.Column("teacher_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["lecture_id"], ["lecture.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_lecture_slot_lecture_id", "lecture_slot", ["lecture_id"])
+    op.create_index(
+        "ix_lecture_slot_classroom_weekday_start", "lecture_slot",
+        ["classroom", "weekday", "start_minute", "end_minute"]
+    )
+    op.create_index(
+        "ix_lecture_slot_teacher_weekday_start", "lecture_slot",
+        ["teacher_id", "weekday", "start_minute", "end_minute"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_lecture_slot_teacher_weekday_start", table_name="lecture_slot")
+    op.drop_index("ix_lecture_slot_classroom_weekday_start", table_name="lecture_slot")
+    op.drop_index("ix_lecture_slot_lecture_id", table_name="lecture_slot")
+    op.drop_table("lecture_slot")
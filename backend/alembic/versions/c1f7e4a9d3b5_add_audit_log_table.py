@@ -0,0 +1,79 @@
+"""Add month-partitioned audit_log table
+
+Revision ID: c1f7e4a9d3b5
+Revises: b6e1c9f4a2d8
+Create Date: 2026-10-20 09:12:44.518207
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c1f7e4a9d3b5'
+down_revision: Union[str, Sequence[str], None] = 'b6e1c9f4a2d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _month_partitions(count: int):
+    """이번 달부터 count개월의 (파티션 이름, 시작, 끝) - 이후 달은 쓰기 스레드가 만듦"""
+    now = datetime.utcnow()
+    year, month = now.year, now.month
+    for _ in range(count):
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        yield f"audit_log_{year:04d}_{month:02d}", f"{year:04d}-{month:02d}-01", f"{next_year:04d}-{next_month:02d}-01"
+        year, month = next_year, next_month
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if "audit_log" in sa.inspect(bind).get_table_names():
+        return
+
+    if bind.dialect.name == "postgresql":
+        # 파티션 키(created_at)가 기본 키에 들어가야 하므로 (id, created_at)
+        op.execute(
+            "CREATE TABLE audit_log ("
+            " id BIGINT GENERATED BY DEFAULT AS IDENTITY,"
+            " created_at TIMESTAMP NOT NULL,"
+            " table_name VARCHAR(50) NOT NULL,"
+            " record_id INTEGER,"
+            " action VARCHAR(10) NOT NULL,"
+            " source VARCHAR(20) NOT NULL,"
+            " changes TEXT NOT NULL,"
+            " PRIMARY KEY (id, created_at)"
+            ") PARTITION BY RANGE (created_at)"
+        )
+        for name, start, end in _month_partitions(2):
+            op.execute(f"CREATE TABLE {name} PARTITION OF audit_log FOR VALUES FROM ('{start}') TO ('{end}')")
+    else:
+        op.create_table(
+            "audit_log",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("table_name", sa.String(length=50), nullable=False),
+            sa.Column("record_id", sa.Integer(), nullable=True),
+            sa.Column("action", sa.String(length=10), nullable=False),
+            sa.Column("source", sa.String(length=20), nullable=False),
+            sa.Column("changes", sa.String(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    # PostgreSQL에서는 부모에 만든 인덱스가 모든 파티션에 만들어짐
+    op.create_index(
+        "ix_audit_log_table_record_created_at", "audit_log", ["table_name", "record_id", "created_at"]
+    )
+    op.create_index("ix_audit_log_created_at_id", "audit_log", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_audit_log_created_at_id", table_name="audit_log")
+    op.drop_index("ix_audit_log_table_record_created_at", table_name="audit_log")
+    # PostgreSQL에서는 파티션도 함께 삭제됨
+    op.drop_table("audit_log")
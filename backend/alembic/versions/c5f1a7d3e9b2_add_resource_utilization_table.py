@@ -0,0 +1,43 @@
+"""Add resource_utilization table (precomputed classroom/teacher heatmaps)
+
+Revision ID: c5f1a7d3e9b2
+Revises: b8e4d2f6a1c3
+Create Date: 2026-10-19 18:05:52.337190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f1a7d3e9b2'
+down_revision: Union[str, Sequence[str], None] = 'b8e4d2f6a1c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    if "resource_utilization" in inspector.get_table_names():
+        return
+
+    # 행은 앱이 lecture_slot을 처음 동기화할 때 채움
+    op.create_table(
+        "resource_utilization",
+        sa.Column("resource_type", sa.String(length=20), nullable=False),
+        sa.Column("resource_key", sa.String(length=100), nullable=False),
+        sa.Column("slot_minutes", sa.Integer(), nullable=False),
+        sa.Column("occupancy", sa.LargeBinary(), nullable=False),
+        sa.Column("occupied_minutes", sa.Integer(), nullable=False),
+        sa.Column("lecture_count", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("resource_type", "resource_key"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("resource_utilization")
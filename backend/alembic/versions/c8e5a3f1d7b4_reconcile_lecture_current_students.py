@@ -0,0 +1,46 @@
+"""Reconcile lecture.current_students with enrollment rows
+
+Revision ID: c8e5a3f1d7b4
+Revises: f9b2d5e8a3c6
+Create Date: 2026-10-23 10:05:52.318460
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e5a3f1d7b4'
+down_revision: Union[str, Sequence[str], None] = 'f9b2d5e8a3c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def recount_current_students() -> None:
+    """강의 인원을 수강 중인 등록 수로 다시 계산
+
+    정원 확인은 current_students로 하므로, 수강 등록 테이블 이전에 손으로 넣은 인원처럼
+    등록 행이 없는 인원은 0으로 맞춥니다. (EnrollmentService.recount_lectures와 같은 규칙)
+    """
+    bind = op.get_bind()
+    if "enrollment" not in sa.inspect(bind).get_table_names():
+        return
+    bind.execute(sa.text(
+        "UPDATE lecture SET current_students = ("
+        "SELECT COUNT(*) FROM enrollment e WHERE e.lecture_id = lecture.id AND e.status = :enrolled"
+        ") WHERE current_students <> ("
+        "SELECT COUNT(*) FROM enrollment e WHERE e.lecture_id = lecture.id AND e.status = :enrolled"
+        ")"
+    ), {"enrolled": "enrolled"})
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    recount_current_students()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 예전 인원 값은 남아 있지 않으므로 되돌리지 않음
@@ -0,0 +1,48 @@
+"""Add lecture_session table (expanded session calendar)
+
+Revision ID: d2a9c4e7f1b6
+Revises: c5f1a7d3e9b2
+Create Date: 2026-10-19 19:31:08.664251
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a9c4e7f1b6'
+down_revision: Union[str, Sequence[str], None] = 'c5f1a7d3e9b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+    if "lecture_session" in inspector.get_table_names():
+        return
+
+    # 행은 앱이 lecture_slot을 처음 동기화할 때 강의 등록일부터 펼쳐 채움
+    op.create_table(
+        "lecture_session",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("lecture_id", sa.Integer(), nullable=False),
+        sa.Column("session_no", sa.Integer(), nullable=False),
+        sa.Column("starts_at", sa.DateTime(), nullable=False),
+        sa.Column("ends_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["lecture_id"], ["lecture.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_lecture_session_starts_at", "lecture_session", ["starts_at"])
+    op.create_index(
+        "ix_lecture_session_lecture_id_session_no", "lecture_session", ["lecture_id", "session_no"], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_lecture_session_lecture_id_session_no", table_name="lecture_session")
+    op.drop_index("ix_lecture_session_starts_at", table_name="lecture_session")
+    op.drop_table("lecture_session")
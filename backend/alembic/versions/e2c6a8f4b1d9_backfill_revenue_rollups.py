@@ -0,0 +1,135 @@
+"""Keep payment ledger on student delete and backfill revenue rollups
+
+Revision ID: e2c6a8f4b1d9
+Revises: b3e9d7c2f5a1
+Create Date: 2026-10-22 14:31:08.204719
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2c6a8f4b1d9'
+down_revision: Union[str, Sequence[str], None] = 'b3e9d7c2f5a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 학생을 완전 삭제해도 원장과 학생별 집계는 남기므로 student 외래 키를 없앰
+LEDGER_TABLES = ("payment", "student_balance")
+
+# SQLite의 이름 없는 외래 키를 batch 모드에서 찾기 위한 이름 규칙
+NAMING_CONVENTION = {"fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s"}
+
+
+def _student_foreign_key(inspector, table: str):
+    return next(
+        (
+            fk for fk in inspector.get_foreign_keys(table)
+            if fk["referred_table"] == "student" and fk["constrained_columns"] == ["student_id"]
+        ),
+        None
+    )
+
+
+def drop_student_foreign_keys() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table in LEDGER_TABLES:
+        fk = _student_foreign_key(inspector, table)
+        if fk is None:
+            continue
+        name = fk.get("name") or f"fk_{table}_student_id_student"
+        with op.batch_alter_table(table, naming_convention=NAMING_CONVENTION) as batch_op:
+            batch_op.drop_constraint(name, type_="foreignkey")
+
+
+def rebuild_rollups(now: datetime) -> None:
+    """원장에서 납부 집계를 다시 계산하고, 이번 달 청구가 없으면 현재 수강 상태로 청구"""
+    bind = op.get_bind()
+    params = {"now": now}
+
+    # 학생별 납부 합계
+    bind.execute(sa.text(
+        "UPDATE student_balance SET paid = COALESCE(("
+        "SELECT SUM(p.amount) FROM payment p "
+        "WHERE p.student_id = student_balance.student_id AND p.period = student_balance.period"
+        "), 0), updated_at = :now"
+    ), params)
+    bind.execute(sa.text(
+        "INSERT INTO student_balance (period, student_id, billed, paid, updated_at) "
+        "SELECT p.period, p.student_id, 0, SUM(p.amount), :now FROM payment p "
+        "WHERE NOT EXISTS (SELECT 1 FROM student_balance b WHERE b.period = p.period AND b.student_id = p.student_id) "
+        "GROUP BY p.period, p.student_id"
+    ), params)
+
+    # 이번 달 청구 (PaymentService.bill_period와 같은 규칙: 수강 중인 활성 강의 수강료 합계, 없으면 학생 수강료)
+    period = now.strftime("%Y-%m")
+    already_billed = bind.execute(
+        sa.text("SELECT COUNT(*) FROM student_balance WHERE period = :period AND billed <> 0"),
+        {"period": period}
+    ).scalar()
+    if not already_billed:
+        fees = (
+            "SELECT s.id AS student_id, CAST(COALESCE(("
+            "SELECT SUM(l.tuition_fee) FROM enrollment e JOIN lecture l ON l.id = e.lecture_id "
+            "WHERE e.student_id = s.id AND e.status = :enrolled AND l.is_active = :true"
+            "), s.tuition_fee, 0) AS INTEGER) AS fee "
+            "FROM student s WHERE s.is_active = :true"
+        )
+        billing = {"period": period, "enrolled": "enrolled", "true": True, "now": now}
+        bind.execute(sa.text(
+            f"UPDATE student_balance SET billed = (SELECT fees.fee FROM ({fees}) AS fees "
+            f"WHERE fees.student_id = student_balance.student_id), updated_at = :now "
+            f"WHERE period = :period AND student_id IN (SELECT fees.student_id FROM ({fees}) AS fees WHERE fees.fee > 0)"
+        ), billing)
+        bind.execute(sa.text(
+            f"INSERT INTO student_balance (period, student_id, billed, paid, updated_at) "
+            f"SELECT :period, fees.student_id, fees.fee, 0, :now FROM ({fees}) AS fees "
+            f"WHERE fees.fee > 0 AND NOT EXISTS ("
+            f"SELECT 1 FROM student_balance b WHERE b.period = :period AND b.student_id = fees.student_id)"
+        ), billing)
+
+    # 강의별/월별 집계는 원장과 학생별 집계에서 통째로 다시 만듦
+    # (보관된 학생의 집계와 원장도 더함, PaymentService._refresh_periods와 같은 규칙)
+    tables = set(sa.inspect(bind).get_table_names())
+    balances = " UNION ALL ".join(
+        f"SELECT period, billed, paid FROM {table}"
+        for table in ("student_balance", "student_balance_archive") if table in tables
+    )
+    payments = " UNION ALL ".join(
+        f"SELECT period, lecture_id, amount FROM {table}" for table in ("payment", "payment_archive") if table in tables
+    )
+    bind.execute(sa.text("DELETE FROM lecture_revenue"))
+    bind.execute(sa.text(
+        "INSERT INTO lecture_revenue (period, lecture_id, paid, payment_count, updated_at) "
+        f"SELECT p.period, p.lecture_id, SUM(p.amount), COUNT(*), :now FROM ({payments}) AS p "
+        "WHERE p.lecture_id IS NOT NULL GROUP BY p.period, p.lecture_id"
+    ), params)
+    bind.execute(sa.text("DELETE FROM monthly_revenue"))
+    bind.execute(sa.text(
+        "INSERT INTO monthly_revenue (period, billed, paid, outstanding, payment_count, updated_at) "
+        "SELECT b.period, SUM(b.billed), SUM(b.paid), "
+        "SUM(CASE WHEN b.billed > b.paid THEN b.billed - b.paid ELSE 0 END), "
+        f"(SELECT COUNT(*) FROM ({payments}) AS p WHERE p.period = b.period), :now "
+        f"FROM ({balances}) AS b GROUP BY b.period"
+    ), params)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    drop_student_foreign_keys()
+    rebuild_rollups(datetime.utcnow())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 삭제된 학생의 원장이 남아 있으면 외래 키를 다시 만들 수 없음
+    inspector = sa.inspect(op.get_bind())
+    for table in LEDGER_TABLES:
+        if _student_foreign_key(inspector, table) is not None:
+            continue
+        with op.batch_alter_table(table, naming_convention=NAMING_CONVENTION) as batch_op:
+            batch_op.create_foreign_key(f"fk_{table}_student_id_student", "student", ["student_id"], ["id"])
@@ -0,0 +1,62 @@
+"""Add enrollment.ordinal and session_attendance table (bitmap attendance)
+
+Revision ID: e7b3f5a2c8d4
+Revises: d2a9c4e7f1b6
+Create Date: 2026-10-19 21:12:40.518337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3f5a2c8d4'
+down_revision: Union[str, Sequence[str], None] = 'd2a9c4e7f1b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    inspector = sa.inspect(op.get_bind())
+
+    if "ordinal" not in {column["name"] for column in inspector.get_columns("enrollment")}:
+        with op.batch_alter_table("enrollment") as batch_op:
+            batch_op.add_column(sa.Column("ordinal", sa.Integer(), nullable=True))
+
+        # 기존 등록은 강의별 등록 순서대로 0부터 번호를 매김
+        bind = op.get_bind()
+        rows = bind.execute(sa.text("SELECT id, lecture_id FROM enrollment ORDER BY lecture_id, id")).fetchall()
+        next_ordinal = {}
+        for enrollment_id, lecture_id in rows:
+            ordinal = next_ordinal.get(lecture_id, 0)
+            next_ordinal[lecture_id] = ordinal + 1
+            bind.execute(
+                sa.text("UPDATE enrollment SET ordinal = :ordinal WHERE id = :id"),
+                {"ordinal": ordinal, "id": enrollment_id}
+            )
+        op.create_index("ix_enrollment_lecture_id_ordinal", "enrollment", ["lecture_id", "ordinal"], unique=True)
+
+    if "session_attendance" not in inspector.get_table_names():
+        op.create_table(
+            "session_attendance",
+            sa.Column("lecture_id", sa.Integer(), nullable=False),
+            sa.Column("session_no", sa.Integer(), nullable=False),
+            sa.Column("present", sa.LargeBinary(), nullable=False),
+            sa.Column("enrolled", sa.LargeBinary(), nullable=False),
+            sa.Column("present_count", sa.Integer(), nullable=False),
+            sa.Column("enrolled_count", sa.Integer(), nullable=False),
+            sa.Column("marked_at", sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(["lecture_id"], ["lecture.id"]),
+            sa.PrimaryKeyConstraint("lecture_id", "session_no"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("session_attendance")
+    op.drop_index("ix_enrollment_lecture_id_ordinal", table_name="enrollment")
+    with op.batch_alter_table("enrollment") as batch_op:
+        batch_op.drop_column("ordinal")
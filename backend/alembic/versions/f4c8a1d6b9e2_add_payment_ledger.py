@@ -0,0 +1,90 @@
+"""Add payment ledger and monthly revenue rollups
+
+Revision ID: f4c8a1d6b9e2
+Revises: e7b3f5a2c8d4
+Create Date: 2026-10-19 22:05:13.274906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c8a1d6b9e2'
+down_revision: Union[str, Sequence[str], None] = 'e7b3f5a2c8d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    tables = sa.inspect(op.get_bind()).get_table_names()
+
+    if "payment" not in tables:
+        op.create_table(
+            "payment",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("student_id", sa.Integer(), nullable=False),
+            sa.Column("lecture_id", sa.Integer(), nullable=True),
+            sa.Column("amount", sa.Integer(), nullable=False),
+            sa.Column("period", sa.String(length=7), nullable=False),
+            sa.Column("paid_at", sa.DateTime(), nullable=False),
+            sa.Column("method", sa.String(length=20), nullable=True),
+            sa.Column("memo", sa.String(length=200), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(["student_id"], ["student.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_payment_period", "payment", ["period"])
+        op.create_index("ix_payment_lecture_id", "payment", ["lecture_id"])
+        op.create_index("ix_payment_student_id_period", "payment", ["student_id", "period"])
+
+    if "student_balance" not in tables:
+        op.create_table(
+            "student_balance",
+            sa.Column("period", sa.String(length=7), nullable=False),
+            sa.Column("student_id", sa.Integer(), nullable=False),
+            sa.Column("billed", sa.Integer(), nullable=False),
+            sa.Column("paid", sa.Integer(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(["student_id"], ["student.id"]),
+            sa.PrimaryKeyConstraint("period", "student_id"),
+        )
+        op.create_index("ix_student_balance_student_id", "student_balance", ["student_id"])
+
+    if "lecture_revenue" not in tables:
+        op.create_table(
+            "lecture_revenue",
+            sa.Column("period", sa.String(length=7), nullable=False),
+            sa.Column("lecture_id", sa.Integer(), nullable=False),
+            sa.Column("paid", sa.Integer(), nullable=False),
+            sa.Column("payment_count", sa.Integer(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("period", "lecture_id"),
+        )
+
+    if "monthly_revenue" not in tables:
+        op.create_table(
+            "monthly_revenue",
+            sa.Column("period", sa.String(length=7), nullable=False),
+            sa.Column("billed", sa.Integer(), nullable=False),
+            sa.Column("paid", sa.Integer(), nullable=False),
+            sa.Column("outstanding", sa.Integer(), nullable=False),
+            sa.Column("payment_count", sa.Integer(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("period"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("monthly_revenue")
+    op.drop_table("lecture_revenue")
+    op.drop_index("ix_student_balance_student_id", table_name="student_balance")
+    op.drop_table("student_balance")
+    op.drop_index("ix_payment_student_id_period", table_name="payment")
+    op.drop_index("ix_payment_lecture_id", table_name="payment")
+    op.drop_index("ix_payment_period", table_name="payment")
+    op.drop_table("payment")
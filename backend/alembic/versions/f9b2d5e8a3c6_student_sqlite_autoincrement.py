@@ -0,0 +1,68 @@
+"""Never reuse student ids on SQLite (AUTOINCREMENT)
+
+Revision ID: f9b2d5e8a3c6
+Revises: e2c6a8f4b1d9
+Create Date: 2026-10-22 16:48:27.931054
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f9b2d5e8a3c6'
+down_revision: Union[str, Sequence[str], None] = 'e2c6a8f4b1d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_autoincrement(bind) -> bool:
+    sql = bind.execute(sa.text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'student'")).scalar()
+    return "AUTOINCREMENT" in (sql or "").upper()
+
+
+def _recreate_student(autoincrement: bool) -> None:
+    """student 테이블을 다시 만들고 인덱스/트리거(부분 인덱스, 검색 트리거)는 원래 문장 그대로 되살림"""
+    bind = op.get_bind()
+    saved = bind.execute(sa.text(
+        "SELECT type, name, sql FROM sqlite_master "
+        "WHERE tbl_name = 'student' AND type IN ('index', 'trigger') AND sql IS NOT NULL"
+    )).all()
+
+    with op.batch_alter_table("student", recreate="always", table_kwargs={"sqlite_autoincrement": autoincrement}):
+        pass
+
+    for kind, name, sql in saved:
+        bind.execute(sa.text(f'DROP {kind.upper()} IF EXISTS "{name}"'))
+        bind.execute(sa.text(sql))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # PostgreSQL 시퀀스는 원래 값을 다시 쓰지 않음
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite" or _has_autoincrement(bind):
+        return
+    _recreate_student(True)
+
+    # 보관된 학생의 id도 다시 쓰지 않도록 다음 id를 운영/보관 테이블의 최대값 뒤로
+    tables = sa.inspect(bind).get_table_names()
+    sources = ["SELECT MAX(id) AS id FROM student"]
+    if "student_archive" in tables:
+        sources.append("SELECT MAX(id) AS id FROM student_archive")
+    last_id = bind.execute(sa.text(
+        f"SELECT MAX(used.id) FROM ({' UNION ALL '.join(sources)}) AS used"
+    )).scalar()
+    if last_id is not None:
+        bind.execute(sa.text("DELETE FROM sqlite_sequence WHERE name = 'student'"))
+        bind.execute(sa.text("INSERT INTO sqlite_sequence (name, seq) VALUES ('student', :seq)"), {"seq": last_id})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != "sqlite" or not _has_autoincrement(bind):
+        return
+    _recreate_student(False)
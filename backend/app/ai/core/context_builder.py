@@ -1,15 +1,28 @@
 from typing import Dict, Any, Optional
 from sqlmodel import Session
-from app.models.student import Student
-from app.models.teacher import Teacher
-from app.models.material import Material
-from app.models.lecture import Lecture
+from app.core.config import settings
+from app.services.export_service import ExportService
 import httpx
 import asyncio
 import json
 import os
 from datetime import datetime
 
+# DB에서 직접 읽을 때 엔티티별로 컨텍스트에 넣는 최대 행 수 (최신 등록순, AI_CONTEXT_MAX_ROWS)
+# 잘린 목록은 system_summary['truncated']로 AI에게 알림
+CONTEXT_MAX_ROWS = settings.ai_context_max_rows
+
+# 엔티티별 컨텍스트 컬럼
+CONTEXT_COLUMNS = {
+    'students': ['name', 'grade', 'email', 'phone', 'tuition_fee', 'is_active'],
+    'teachers': ['name', 'subject', 'email', 'phone', 'hourly_rate', 'is_active'],
+    'materials': ['name', 'subject', 'grade', 'publisher', 'quantity', 'price', 'is_active'],
+    'lectures': [
+        'title', 'subject', 'grade', 'schedule', 'classroom',
+        'max_students', 'current_students', 'tuition_fee', 'is_active'
+    ],
+}
+
 class ContextBuilder:
     """컨텍스트 데이터 빌더"""
     
@@ -177,65 +190,13 @@ class ContextBuilder:
         context_data = {}
         
         try:
-            # 학생 정보
-            students = session.query(Student).all()
-            students = sorted(students, key=lambda x: x.created_at, reverse=True)
-            context_data['students'] = [
-                {
-                    'name': s.name,
-                    'grade': s.grade,
-                    'email': s.email,
-                    'phone': s.phone,
-                    'tuition_fee': s.tuition_fee,
-                    'is_active': s.is_active
-                } for s in students
-            ]
-            
-            # 강사 정보
-            teachers = session.query(Teacher).all()
-            teachers = sorted(teachers, key=lambda x: x.created_at, reverse=True)
-            context_data['teachers'] = [
-                {
-                    'name': t.name,
-                    'subject': t.subject,
-                    'email': t.email,
-                    'phone': t.phone,
-                    'hourly_rate': t.hourly_rate,
-                    'is_active': t.is_active
-                } for t in teachers
-            ]
-            
-            # 교재 정보
-            materials = session.query(Material).all()
-            materials = sorted(materials, key=lambda x: x.created_at, reverse=True)
-            context_data['materials'] = [
-                {
-                    'name': m.name,
-                    'subject': m.subject,
-                    'grade': m.grade,
-                    'publisher': m.publisher,
-                    'quantity': m.quantity,
-                    'price': m.price,
-                    'is_active': m.is_active
-                } for m in materials
-            ]
-            
-            # 강의 정보
-            lectures = session.query(Lecture).all()
-            lectures = sorted(lectures, key=lambda x: x.created_at, reverse=True)
-            context_data['lectures'] = [
-                {
-                    'title': l.title,
-                    'subject': l.subject,
-                    'grade': l.grade,
-                    'schedule': l.schedule,
-                    'classroom': l.classroom,
-                    'max_students': l.max_students,
-                    'current_students': l.current_students,
-                    'tuition_fee': l.tuition_fee,
-                    'is_active': l.is_active
-                } for l in lectures
-            ]
+            # 정렬과 행 수 제한은 SQL(최신 등록순, LIMIT)에서 하고, 필요한 컬럼만 읽음
+            # 전체 개수는 system_summary가 잘리지 않은 수를 보이도록 따로 셈
+            export = ExportService(session)
+            context_data['totals'] = {}
+            for entity, columns in CONTEXT_COLUMNS.items():
+                context_data[entity] = list(export.iter_rows(entity, columns, limit=CONTEXT_MAX_ROWS))
+                context_data['totals'][entity] = export.count(entity)
             
             print(f"[ContextBuilder] DB에서 직접 조회: 학생 {len(context_data['students'])}명, 강사 {len(context_data['teachers'])}명, 교재 {len(context_data['materials'])}개, 강의 {len(context_data['lectures'])}개")
             
@@ -251,11 +212,12 @@ class ContextBuilder:
         message_lower = message.lower()
         filtered_context = {}
         
-        # 기본 시스템 현황 (항상 포함)
-        student_count = len(context_data.get('students', []))
-        teacher_count = len(context_data.get('teachers', []))
-        material_count = len(context_data.get('materials', []))
-        lecture_count = len(context_data.get('lectures', []))
+        # 기본 시스템 현황 (항상 포함, DB 조회는 행 수를 제한하므로 전체 개수가 있으면 사용)
+        totals = context_data.get('totals', {})
+        student_count = totals.get('students', len(context_data.get('students', [])))
+        teacher_count = totals.get('teachers', len(context_data.get('teachers', [])))
+        material_count = totals.get('materials', len(context_data.get('materials', [])))
+        lecture_count = totals.get('lectures', len(context_data.get('lectures', [])))
         
         filtered_context['system_summary'] = {
             'students': student_count,
@@ -264,6 +226,15 @@ class ContextBuilder:
             'lectures': lecture_count
         }
         
+        # 행 수 제한으로 잘린 목록은 AI가 전체인 것처럼 답하지 않도록 명시
+        truncated = {
+            entity: f"최근 등록순 {len(context_data.get(entity, []))}건만 포함 (전체 {total}건)"
+            for entity, total in totals.items()
+            if len(context_data.get(entity, [])) < total
+        }
+        if truncated:
+            filtered_context['system_summary']['truncated'] = truncated
+        
         # 키워드 기반 필터링 (전체 데이터 포함)
         if any(keyword in message_lower for keyword in ['학생', 'student', '학생 목록', '학생들']):
             filtered_context['students'] = context_data.get('students', [])
@@ -8,10 +8,14 @@ import google.generativeai as genai
 from app.core.database import get_session
 from app.core.auth import AuthService
 from app.core.config import settings
+from app.core.audit import AUDIT_SOURCE_AI, set_audit_source
 from app.models.student import Student
 from app.models.teacher import Teacher
 from app.models.material import Material
 from app.models.lecture import Lecture
+from app.core.learning_analytics import analyze_cohort, merge_student_scores
+from app.schemas.analytics import LearningAnalysisRequest
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from app.ai.core.context_builder import ContextBuilder
 from app.ai.services.ai_service_factory import AIServiceFactory
@@ -220,63 +224,52 @@ async def chat_with_ai_stream(
 
 @router.post("/analyze", summary="학습 분석")
 async def analyze_learning(
-    data: Dict[str, Any] = Body(...),
+    request: LearningAnalysisRequest,
     session: Session = Depends(get_session),
     current_user = Depends(AuthService.get_current_active_user)
 ):
-    """학습 데이터를 분석합니다."""
+    """과목별 점수로 추세, 반 내 백분위, 약점, 진행도 점수를 계산합니다.
+
+    분석은 반 전체를 NumPy로 한 번에 계산하고, AI는 요약할 학생의 계산 결과를 문장으로 정리만 합니다.
+    """
     try:
-        # 학습 데이터 분석을 위한 프롬프트
-        analysis_prompt = f"""
-        다음 학습 데이터를 분석하여 학생의 강점, 약점, 개선 방안을 제시해주세요.
-        
-        학습 데이터: {json.dumps(data, ensure_ascii=False)}
+        cohort = merge_student_scores(
+            [student.dict() for student in request.students], request.student_id, request.scores
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not cohort:
+        raise HTTPException(status_code=400, detail="분석할 점수가 없습니다")
+
+    try:
+        results = await run_in_threadpool(analyze_cohort, cohort)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if request.student_id is not None:
+        target = next((result for result in results if result["student_id"] == request.student_id), None)
+        if target is None:
+            raise HTTPException(status_code=404, detail="요청한 학생의 점수가 없습니다")
+    else:
+        target = results[0] if len(results) == 1 else None
+
+    if target is None:
+        return {"cohort_size": len(results), "students": results}
+
+    ai_analysis = None
+    if request.summarize:
+        summary_prompt = f"""
+        아래는 한 학생의 과목별 학습 분석 결과입니다 (trend는 평가당 점수 변화, percentile은 반 내 백분위).
+        수치는 바꾸지 말고 학생과 학부모가 읽기 쉬운 3~4문장으로 요약해주세요.
         
-        분석 결과를 다음 형식으로 제공해주세요:
-        1. 강점 (strengths): 학생이 잘하는 영역
-        2. 약점 (weaknesses): 개선이 필요한 영역
-        3. 권장사항 (recommendations): 구체적인 학습 방안
-        4. 진행도 점수 (progress_score): 0-100 사이의 점수
+        {json.dumps({key: target[key] for key in ("strengths", "weaknesses", "progress_score", "subjects")}, ensure_ascii=False)}
         """
-        
-        # AI API로 분석 수행
-        response = await ai_service.generate_response(analysis_prompt, session)
-        
-        if response:
-            # 응답을 파싱하여 구조화된 데이터로 변환
-            try:
-                # 간단한 파싱 (실제로는 더 정교한 파싱 필요)
-                analysis_text = response
-                
-                # 기본 분석 결과 반환
-                analysis_result = {
-                    "strengths": ["수학", "과학"],  # 기본값
-                    "weaknesses": ["영어"],  # 기본값
-                    "recommendations": ["영어 학습 시간을 늘리세요"],  # 기본값
-                    "progress_score": 75,  # 기본값
-                    "ai_analysis": analysis_text  # AI 분석 텍스트 포함
-                }
-                
-                return analysis_result
-            except Exception as parse_error:
-                return {
-                    "strengths": ["수학", "과학"],
-                    "weaknesses": ["영어"],
-                    "recommendations": ["영어 학습 시간을 늘리세요"],
-                    "progress_score": 75,
-                    "ai_analysis": response
-                }
-        else:
-            return {
-                "strengths": ["수학", "과학"],
-                "weaknesses": ["영어"],
-                "recommendations": ["영어 학습 시간을 늘리세요"],
-                "progress_score": 75,
-                "error": "AI 분석 결과를 생성할 수 없습니다."
-            }
-            
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"분석 오류: {str(e)}")
+        try:
+            ai_analysis = await ai_service.generate_response(summary_prompt, session)
+        except Exception as e:
+            print(f"[AI] 학습 분석 요약 실패: {e}")
+
+    return {**target, "cohort_size": len(results), "ai_analysis": ai_analysis}
 
 @router.post("/command", summary="자연어 명령 처리")
 async def process_natural_language_command(
@@ -361,6 +354,8 @@ async def execute_crud_command(
     """CRUD 명령 실행"""
     try:
         print(f"[CRUD] 명령 수신: {command}")
+        # AI가 만든 명령으로 바뀐 내용은 변경 이력에 출처를 ai로 남김
+        set_audit_source(session, AUDIT_SOURCE_AI)
         
         # 명령 분석 및 실행
         if command.get("command_type") == "student":
@@ -0,0 +1,63 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
+from typing import Optional
+
+from ...core.database import get_session
+from ...core.response_cache import CachedRoute
+from ...core.versions import conditional_get
+from ...schemas.archive import ArchivedStudentResponse, ArchivedStudentListResponse, ArchiveRunResult
+from ...schemas.student import StudentResponse
+from ...services.archive_service import ArchiveService, ArchiveNotFoundError, ArchiveConflictError, run_student_archive
+
+router = APIRouter(route_class=CachedRoute)
+
+
+@router.post("/run", response_model=ArchiveRunResult, summary="비활성 학생 보관 실행")
+def run_archive(
+    months: Optional[int] = Query(None, ge=1, description="Inactive for more than N months (default ARCHIVE_AFTER_MONTHS)")
+):
+    """months개월 넘게 비활성인 학생과 수강/납부 기록을 보관 테이블로 옮김 (매일 Celery beat로도 실행)
+
+    이 프로세스에서 이미 보관 작업이 실행 중이면 겹쳐 실행하지 않고 0을 반환합니다.
+    """
+    return ArchiveRunResult(archived=run_student_archive(months))
+
+
+@router.get("/students", response_model=ArchivedStudentListResponse, dependencies=[Depends(conditional_get("student_archive"))])
+def get_archived_students(
+    skip: int = Query(0, ge=0, description="Skip records"),
+    limit: int = Query(100, ge=1, le=1000, description="Limit records"),
+    db: Session = Depends(get_session)
+):
+    """보관된 학생 목록 (최근 보관 순)"""
+    page = ArchiveService(db).get_archived_page(skip=skip, limit=limit)
+    return ArchivedStudentListResponse(
+        students=[ArchivedStudentResponse(**row) for row in page.items],
+        total=page.total,
+        page=skip // limit + 1,
+        size=limit
+    )
+
+
+@router.get(
+    "/students/{student_id}",
+    response_model=ArchivedStudentResponse,
+    dependencies=[Depends(conditional_get("student", "student_archive"))]
+)
+def get_student(student_id: int, db: Session = Depends(get_session)):
+    """학생 조회 (운영 테이블에 없으면 보관 테이블에서 읽음)"""
+    student = ArchiveService(db).get_student(student_id)
+    if student is None:
+        raise HTTPException(status_code=404, detail="Student not found")
+    return ArchivedStudentResponse(**student)
+
+
+@router.post("/students/{student_id}/restore", response_model=StudentResponse, summary="보관된 학생 복원")
+def restore_student(student_id: int, db: Session = Depends(get_session)):
+    """보관된 학생과 수강/납부 기록을 운영 테이블로 되돌림"""
+    try:
+        return ArchiveService(db).restore_student(student_id)
+    except ArchiveNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ArchiveConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
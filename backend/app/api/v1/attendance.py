@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlmodel import Session
+from typing import Any, Dict
+
+from ...core.database import get_session
+from ...core.response_cache import CachedRoute
+from ...core.versions import conditional_get
+from ...schemas.attendance import AttendanceMarkRequest
+from ...services.attendance_service import AttendanceService, AttendanceNotFoundError
+
+router = APIRouter(route_class=CachedRoute)
+
+# 출석 조회는 출석 기록과 수강 등록(순번 → 학생)에 따라 바뀜
+attendance_etag = conditional_get("session_attendance", "enrollment")
+
+
+@router.put("/lectures/{lecture_id}/sessions/{session_no}", summary="회차 출석 기록")
+def mark_session_attendance(
+    lecture_id: int,
+    session_no: int,
+    data: AttendanceMarkRequest,
+    db: Session = Depends(get_session)
+) -> Dict[str, Any]:
+    """회차에 출석한 학생을 한 번에 기록합니다 (나머지 수강생은 결석, 다시 보내면 덮어씀)."""
+    service = AttendanceService(db)
+    try:
+        return service.mark_session(lecture_id, session_no, data.present_student_ids)
+    except AttendanceNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/lectures/{lecture_id}/sessions/{session_no}", summary="회차 출석 조회", dependencies=[Depends(attendance_etag)])
+def get_session_attendance(lecture_id: int, session_no: int, db: Session = Depends(get_session)) -> Dict[str, Any]:
+    """회차의 출석/결석 학생 목록"""
+    attendance = AttendanceService(db).get_session(lecture_id, session_no)
+    if attendance is None:
+        raise HTTPException(status_code=404, detail="출석 기록이 없습니다")
+    return attendance
+
+
+@router.get("/lectures/{lecture_id}", summary="강의 출석률", dependencies=[Depends(attendance_etag)])
+def get_lecture_attendance(lecture_id: int, db: Session = Depends(get_session)) -> Dict[str, Any]:
+    """강의 전체 출석률과 학생별 출석률"""
+    return AttendanceService(db).get_lecture_attendance(lecture_id)
+
+
+@router.get("/students/{student_id}", summary="학생 출석률", dependencies=[Depends(attendance_etag)])
+def get_student_attendance(student_id: int, db: Session = Depends(get_session)) -> Dict[str, Any]:
+    """학생의 강의별 출석률"""
+    return AttendanceService(db).get_student_attendance(student_id)
@@ -0,0 +1,87 @@
+import json
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
+from typing import Optional, Tuple
+
+from ...core.database import get_session
+from ...core.response_cache import CachedRoute
+from ...core.versions import conditional_get
+from ...models.audit import audit_month_bounds
+from ...schemas.audit import AuditLogResponse, AuditLogListResponse
+from ...services.audit_service import AuditService
+
+router = APIRouter(route_class=CachedRoute)
+
+
+def _period(
+    month: Optional[str],
+    since: Optional[datetime],
+    until: Optional[datetime]
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """month(YYYY-MM)가 있으면 그 달의 범위, 없으면 since/until 그대로"""
+    if month is None:
+        return since, until
+    try:
+        return audit_month_bounds(datetime.strptime(month, "%Y-%m"))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"월은 YYYY-MM 형식이어야 합니다: {month}")
+
+
+def _list_response(page, skip: int, limit: int) -> AuditLogListResponse:
+    return AuditLogListResponse(
+        logs=[
+            AuditLogResponse(
+                id=log.id,
+                created_at=log.created_at,
+                table_name=log.table_name,
+                record_id=log.record_id,
+                action=log.action,
+                source=log.source,
+                changes=json.loads(log.changes)
+            )
+            for log in page.items
+        ],
+        total=page.total,
+        page=skip // limit + 1,
+        size=limit
+    )
+
+
+@router.get("/", response_model=AuditLogListResponse, dependencies=[Depends(conditional_get("audit_log"))])
+def get_audit_logs(
+    skip: int = Query(0, ge=0, description="Skip records"),
+    limit: int = Query(100, ge=1, le=1000, description="Limit records"),
+    table_name: Optional[str] = Query(None, description="Filter by table (student, teacher, lecture, material)"),
+    action: Optional[str] = Query(None, description="Filter by action (create, update, delete)"),
+    source: Optional[str] = Query(None, description="Filter by source (api, ai, archive)"),
+    month: Optional[str] = Query(None, description="Month (YYYY-MM), overrides since/until"),
+    since: Optional[datetime] = Query(None, description="From (inclusive)"),
+    until: Optional[datetime] = Query(None, description="To (exclusive)"),
+    db: Session = Depends(get_session)
+):
+    """변경 이력 목록 (최근 순). 기간(month 또는 since/until)을 주면 해당 달의 파티션만 읽습니다."""
+    since, until = _period(month, since, until)
+    page = AuditService(db).get_logs_page(
+        skip=skip, limit=limit, table_name=table_name, action=action, source=source, since=since, until=until
+    )
+    return _list_response(page, skip, limit)
+
+
+@router.get("/{table_name}/{record_id}", response_model=AuditLogListResponse, dependencies=[Depends(conditional_get("audit_log"))])
+def get_record_history(
+    table_name: str,
+    record_id: int,
+    skip: int = Query(0, ge=0, description="Skip records"),
+    limit: int = Query(100, ge=1, le=1000, description="Limit records"),
+    month: Optional[str] = Query(None, description="Month (YYYY-MM), overrides since/until"),
+    since: Optional[datetime] = Query(None, description="From (inclusive)"),
+    until: Optional[datetime] = Query(None, description="To (exclusive)"),
+    db: Session = Depends(get_session)
+):
+    """레코드 한 건의 변경 이력 (최근 순)"""
+    since, until = _period(month, since, until)
+    page = AuditService(db).get_logs_page(
+        skip=skip, limit=limit, table_name=table_name, record_id=record_id, since=since, until=until
+    )
+    return _list_response(page, skip, limit)
@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
+from typing import Any, Dict, Optional
+from datetime import date, datetime, time
+
+from ...core.database import get_session
+from ...core.response_cache import CachedRoute
+from ...core.versions import conditional_get
+from ...services.calendar_service import CalendarService
+from ...services.schedule_service import ensure_schedule_index
+
+router = APIRouter(route_class=CachedRoute)
+
+# 한 번에 조회할 수 있는 최대 기간 (일)
+MAX_CALENDAR_RANGE_DAYS = 366
+
+
+@router.get(
+    "/sessions",
+    summary="기간별 수업 달력",
+    # 완료 여부와 강의명은 lecture에서 읽으므로 두 테이블 버전으로 ETag를 만듦
+    dependencies=[Depends(conditional_get("lecture_session", "lecture"))]
+)
+def get_calendar_sessions(
+    start: date = Query(..., description="시작일 (포함), e.g. 2026-10-01"),
+    end: date = Query(..., description="종료일 (제외), e.g. 2026-11-01"),
+    lecture_id: Optional[int] = Query(None, description="Filter by lecture"),
+    classroom: Optional[str] = Query(None, description="Filter by classroom"),
+    teacher_id: Optional[int] = Query(None, description="Filter by teacher"),
+    db: Session = Depends(get_session)
+) -> Dict[str, Any]:
+    """[start, end) 기간에 시작하는 수업을 시작 시각 순으로 반환합니다."""
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end는 start보다 뒤여야 합니다")
+    if (end - start).days > MAX_CALENDAR_RANGE_DAYS:
+        raise HTTPException(status_code=400, detail=f"조회 기간은 최대 {MAX_CALENDAR_RANGE_DAYS}일입니다")
+
+    ensure_schedule_index()
+    sessions = CalendarService(db).get_sessions(
+        datetime.combine(start, time.min),
+        datetime.combine(end, time.min),
+        lecture_id=lecture_id,
+        classroom=classroom,
+        teacher_id=teacher_id
+    )
+    return {"start": start, "end": end, "sessions": sessions, "total": len(sessions)}
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, HTTPException, Query
+
+from app.schemas.dashboard import DashboardResponse
+from app.services.dashboard_service import DashboardService
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+
+@router.get("", response_model=DashboardResponse, summary="대시보드 데이터 일괄 조회")
+async def get_dashboard(
+    limit: int = Query(100, ge=1, le=1000, description="Limit records per list"),
+    refresh: bool = Query(False, description="Bypass section cache")
+):
+    """통계와 학생/강사/교재/강의 첫 페이지를 한 번에 조회"""
+    try:
+        service = DashboardService(limit=limit, use_cache=not refresh)
+        return await service.get_dashboard()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"대시보드 조회 실패: {str(e)}")
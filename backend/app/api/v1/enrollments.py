@@ -0,0 +1,84 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
+from typing import Optional
+
+from ...core.database import get_session
+from ...core.response_cache import CachedRoute
+from ...core.versions import conditional_get
+from ...models.enrollment import EnrollmentCreate
+from ...schemas.enrollment import EnrollmentResponse, EnrollmentListResponse
+from ...services.enrollment_service import (
+    EnrollmentService,
+    EnrollmentNotFoundError,
+    EnrollmentConflictError,
+)
+
+router = APIRouter(route_class=CachedRoute)
+
+
+@router.get("/", response_model=EnrollmentListResponse, dependencies=[Depends(conditional_get("enrollment"))])
+def get_enrollments(
+    skip: int = Query(0, ge=0, description="Skip records"),
+    limit: int = Query(100, ge=1, le=1000, description="Limit records"),
+    lecture_id: Optional[int] = Query(None, description="Filter by lecture"),
+    student_id: Optional[int] = Query(None, description="Filter by student"),
+    status: Optional[str] = Query(None, description="Filter by status (enrolled, withdrawn)"),
+    db: Session = Depends(get_session)
+):
+    """수강 등록 목록 조회"""
+    service = EnrollmentService(db)
+    page = service.get_enrollments_page(
+        skip=skip, limit=limit, lecture_id=lecture_id, student_id=student_id, status=status
+    )
+    return EnrollmentListResponse(
+        enrollments=[EnrollmentResponse.from_orm(enrollment) for enrollment in page.items],
+        total=page.total,
+        page=skip // limit + 1,
+        size=limit
+    )
+
+
+@router.post("/", response_model=EnrollmentResponse, summary="수강 등록", status_code=201)
+def enroll(enrollment_data: EnrollmentCreate, db: Session = Depends(get_session)):
+    """학생을 강의에 등록하고 강의의 현재 수강생 수를 1 늘립니다.
+
+    정원이 찼거나 이미 수강 중이면 409를 반환합니다.
+    """
+    service = EnrollmentService(db)
+    try:
+        enrollment = service.enroll(enrollment_data.student_id, enrollment_data.lecture_id)
+    except EnrollmentNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except EnrollmentConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return EnrollmentResponse.from_orm(enrollment)
+
+
+@router.get("/{enrollment_id}", response_model=EnrollmentResponse, dependencies=[Depends(conditional_get("enrollment"))])
+def get_enrollment(enrollment_id: int, db: Session = Depends(get_session)):
+    """특정 수강 등록 조회"""
+    service = EnrollmentService(db)
+    enrollment = service.get_enrollment(enrollment_id)
+    if not enrollment:
+        raise HTTPException(status_code=404, detail="Enrollment not found")
+    return EnrollmentResponse.from_orm(enrollment)
+
+
+@router.post("/{enrollment_id}/withdraw", response_model=EnrollmentResponse, summary="수강 취소")
+def withdraw(enrollment_id: int, db: Session = Depends(get_session)):
+    """수강을 취소하고 강의의 현재 수강생 수를 1 줄입니다."""
+    service = EnrollmentService(db)
+    try:
+        enrollment = service.withdraw(enrollment_id)
+    except EnrollmentNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except EnrollmentConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return EnrollmentResponse.from_orm(enrollment)
+
+
+@router.post("/recount", summary="강의 인원 재계산")
+def recount_lectures(db: Session = Depends(get_session)):
+    """강의의 현재 수강생 수를 수강 중인 등록 수로 다시 맞추고 바뀐 강의 수를 반환합니다."""
+    service = EnrollmentService(db)
+    return {"updated": service.recount_lectures()}
@@ -1,14 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Tuple
 import json
 import os
 from datetime import datetime
 from app.core.database import get_session
-from app.models.student import Student
-from app.models.teacher import Teacher
-from app.models.material import Material
-from app.models.lecture import Lecture
+from app.services.export_service import ExportService
 
 router = APIRouter()
 
@@ -16,15 +13,26 @@ router = APIRouter()
 EXCEL_PREVIEW_DIR = "excel_preview_data"
 os.makedirs(EXCEL_PREVIEW_DIR, exist_ok=True)
 
-def save_excel_preview_data(entity_type: str, data: List[Dict[str, Any]]):
-    """엑셀 미리보기 데이터를 파일로 저장"""
+def write_excel_preview_rows(entity_type: str, rows: Iterable[Dict[str, Any]]) -> Tuple[str, int]:
+    """엑셀 미리보기 행을 한 행씩 파일에 써서 저장 (전체 목록을 메모리에 올리지 않음)"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"{entity_type}_{timestamp}.json"
     filepath = os.path.join(EXCEL_PREVIEW_DIR, filename)
     
+    count = 0
     with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+        f.write("[")
+        for row in rows:
+            f.write(",\n" if count else "\n")
+            f.write(json.dumps(row, ensure_ascii=False, default=str))
+            count += 1
+        f.write("\n]")
     
+    return filepath, count
+
+def save_excel_preview_data(entity_type: str, data: List[Dict[str, Any]]):
+    """엑셀 미리보기 데이터를 파일로 저장"""
+    filepath, _ = write_excel_preview_rows(entity_type, data)
     return filepath
 
 def get_latest_excel_preview_data(entity_type: str) -> List[Dict[str, Any]]:
@@ -50,93 +58,92 @@ async def generate_excel_preview(
     session: Session = Depends(get_session)
 ):
     """DB 데이터를 엑셀 미리보기 형식으로 변환하여 저장"""
+    # 정렬은 SQL에서 하고, 필요한 컬럼만 서버 측 커서로 나눠 읽어 파일에 바로 씀
+    export = ExportService(session)
     try:
         if entity_type == "students":
-            # 학생 데이터 조회 및 변환
-            students = session.query(Student).all()
-            students = sorted(students, key=lambda x: x.created_at, reverse=True)
+            students = export.iter_rows("students", ["name", "grade", "email", "phone", "tuition_fee", "is_active", "created_at"])
+            excel_data = (
+                {
+                    "이름": student["name"],
+                    "학년": student["grade"],
+                    "이메일": student["email"],
+                    "전화번호": student["phone"],
+                    "수강료": student["tuition_fee"],
+                    "활성화 여부": "활성" if student["is_active"] else "비활성",
+                    "등록일": student["created_at"].strftime("%Y-%m-%d") if student["created_at"] else ""
+                }
+                for student in students
+            )
             
-            excel_data = []
-            for student in students:
-                excel_data.append({
-                    "이름": student.name,
-                    "학년": student.grade,
-                    "이메일": student.email,
-                    "전화번호": student.phone,
-                    "수강료": student.tuition_fee,
-                    "활성화 여부": "활성" if student.is_active else "비활성",
-                    "등록일": student.created_at.strftime("%Y-%m-%d") if student.created_at else ""
-                })
-            
-            filepath = save_excel_preview_data("students", excel_data)
-            return {"message": "학생 엑셀 미리보기 데이터 생성 완료", "filepath": filepath, "count": len(excel_data)}
+            filepath, count = write_excel_preview_rows("students", excel_data)
+            return {"message": "학생 엑셀 미리보기 데이터 생성 완료", "filepath": filepath, "count": count}
             
         elif entity_type == "teachers":
-            # 강사 데이터 조회 및 변환
-            teachers = session.query(Teacher).all()
-            teachers = sorted(teachers, key=lambda x: x.created_at, reverse=True)
-            
-            excel_data = []
-            for teacher in teachers:
-                excel_data.append({
-                    "이름": teacher.name,
-                    "과목": teacher.subject,
-                    "이메일": teacher.email,
-                    "전화번호": teacher.phone,
-                    "시간당 급여": teacher.hourly_rate,
-                    "활성화 여부": "활성" if teacher.is_active else "비활성",
-                    "등록일": teacher.created_at.strftime("%Y-%m-%d") if teacher.created_at else ""
-                })
+            teachers = export.iter_rows("teachers", ["name", "subject", "email", "phone", "hourly_rate", "is_active", "created_at"])
+            excel_data = (
+                {
+                    "이름": teacher["name"],
+                    "과목": teacher["subject"],
+                    "이메일": teacher["email"],
+                    "전화번호": teacher["phone"],
+                    "시간당 급여": teacher["hourly_rate"],
+                    "활성화 여부": "활성" if teacher["is_active"] else "비활성",
+                    "등록일": teacher["created_at"].strftime("%Y-%m-%d") if teacher["created_at"] else ""
+                }
+                for teacher in teachers
+            )
             
-            filepath = save_excel_preview_data("teachers", excel_data)
-            return {"message": "강사 엑셀 미리보기 데이터 생성 완료", "filepath": filepath, "count": len(excel_data)}
+            filepath, count = write_excel_preview_rows("teachers", excel_data)
+            return {"message": "강사 엑셀 미리보기 데이터 생성 완료", "filepath": filepath, "count": count}
             
         elif entity_type == "materials":
-            # 교재 데이터 조회 및 변환
-            materials = session.query(Material).all()
-            materials = sorted(materials, key=lambda x: x.created_at, reverse=True)
+            materials = export.iter_rows("materials", ["subject", "grade", "name", "publisher", "quantity", "price", "is_active", "created_at"])
+            excel_data = (
+                {
+                    "과목": material["subject"],
+                    "학년": material["grade"],
+                    "이름": material["name"],
+                    "출판사": material["publisher"],
+                    "수량": material["quantity"],
+                    "가격": material["price"],
+                    "활성화 여부": "활성" if material["is_active"] else "비활성",
+                    "등록일": material["created_at"].strftime("%Y-%m-%d") if material["created_at"] else ""
+                }
+                for material in materials
+            )
             
-            excel_data = []
-            for material in materials:
-                excel_data.append({
-                    "과목": material.subject,
-                    "학년": material.grade,
-                    "이름": material.name,
-                    "출판사": material.publisher,
-                    "수량": material.quantity,
-                    "가격": material.price,
-                    "활성화 여부": "활성" if material.is_active else "비활성",
-                    "등록일": material.created_at.strftime("%Y-%m-%d") if material.created_at else ""
-                })
-            
-            filepath = save_excel_preview_data("materials", excel_data)
-            return {"message": "교재 엑셀 미리보기 데이터 생성 완료", "filepath": filepath, "count": len(excel_data)}
+            filepath, count = write_excel_preview_rows("materials", excel_data)
+            return {"message": "교재 엑셀 미리보기 데이터 생성 완료", "filepath": filepath, "count": count}
             
         elif entity_type == "lectures":
-            # 강의 데이터 조회 및 변환
-            lectures = session.query(Lecture).all()
-            lectures = sorted(lectures, key=lambda x: x.created_at, reverse=True)
-            
-            excel_data = []
-            for lecture in lectures:
-                excel_data.append({
-                    "강의 제목": lecture.title,
-                    "과목": lecture.subject,
-                    "학년": lecture.grade,
-                    "일정": lecture.schedule,
-                    "강의실": lecture.classroom,
-                    "수강생 수": f"{lecture.current_students}/{lecture.max_students}",
-                    "수강료": lecture.tuition_fee,
-                    "활성화 여부": "활성" if lecture.is_active else "비활성",
-                    "등록일": lecture.created_at.strftime("%Y-%m-%d") if lecture.created_at else ""
-                })
+            lectures = export.iter_rows("lectures", [
+                "title", "subject", "grade", "schedule", "classroom",
+                "current_students", "max_students", "tuition_fee", "is_active", "created_at"
+            ])
+            excel_data = (
+                {
+                    "강의 제목": lecture["title"],
+                    "과목": lecture["subject"],
+                    "학년": lecture["grade"],
+                    "일정": lecture["schedule"],
+                    "강의실": lecture["classroom"],
+                    "수강생 수": f"{lecture['current_students']}/{lecture['max_students']}",
+                    "수강료": lecture["tuition_fee"],
+                    "활성화 여부": "활성" if lecture["is_active"] else "비활성",
+                    "등록일": lecture["created_at"].strftime("%Y-%m-%d") if lecture["created_at"] else ""
+                }
+                for lecture in lectures
+            )
             
-            filepath = save_excel_preview_data("lectures", excel_data)
-            return {"message": "강의 엑셀 미리보기 데이터 생성 완료", "filepath": filepath, "count": len(excel_data)}
+            filepath, count = write_excel_preview_rows("lectures", excel_data)
+            return {"message": "강의 엑셀 미리보기 데이터 생성 완료", "filepath": filepath, "count": count}
             
         else:
             raise HTTPException(status_code=400, detail="지원하지 않는 엔티티 타입입니다")
             
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"엑셀 미리보기 데이터 생성 실패: {str(e)}")
 
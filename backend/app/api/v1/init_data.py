@@ -1,10 +1,11 @@
 from fastapi import APIRouter, HTTPException, Depends
-from sqlmodel import Session, select
+from sqlmodel import Session, select, text
 from app.core.database import get_session
 from app.models.lecture import Lecture
 from app.models.teacher import Teacher
 from app.models.student import Student
 from app.models.material import Material
+from app.services.upsert_service import UpsertService
 from typing import Dict, Any
 
 router = APIRouter()
@@ -32,13 +33,9 @@ def init_sample_data(session: Session = Depends(get_session)) -> Dict[str, Any]:
             {"name": "최국어", "subject": "국어", "email": "choi.korean@academy.com", "phone": "010-4567-8901"},
         ]
         
-        for teacher_data in teachers_data:
-            existing = session.exec(select(Teacher).where(Teacher.email == teacher_data["email"])).first()
-            if not existing:
-                teacher = Teacher(**teacher_data)
-                session.add(teacher)
-        
-        session.commit()
+        # 이미 있는 이메일은 건너뜀 (한 문장으로 처리, 여러 번 호출해도 안전)
+        upsert_service = UpsertService(session)
+        upsert_service.insert_many_if_absent("teachers", teachers_data)
         
         # 교재 데이터 추가 (PostgreSQL 스키마에 맞게)
         if "name" in material_columns and "subject" in material_columns and "grade" in material_columns:
@@ -61,33 +58,23 @@ def init_sample_data(session: Session = Depends(get_session)) -> Dict[str, Any]:
         
         # 학생 데이터 추가
         students_data = [
-            Student(name="김학생", grade="중1", email="kim.student@email.com", phone="010-1111-2222"),
-            Student(name="이학생", grade="고1", email="lee.student@email.com", phone="010-2222-3333"),
-            Student(name="박학생", grade="중2", email="park.student@email.com", phone="010-3333-4444"),
-            Student(name="최학생", grade="고2", email="choi.student@email.com", phone="010-4444-5555"),
+            {"name": "김학생", "grade": "중1", "email": "kim.student@email.com", "phone": "010-1111-2222"},
+            {"name": "이학생", "grade": "고1", "email": "lee.student@email.com", "phone": "010-2222-3333"},
+            {"name": "박학생", "grade": "중2", "email": "park.student@email.com", "phone": "010-3333-4444"},
+            {"name": "최학생", "grade": "고2", "email": "choi.student@email.com", "phone": "010-4444-5555"},
         ]
         
-        for student in students_data:
-            existing = session.exec(select(Student).where(Student.email == student.email)).first()
-            if not existing:
-                session.add(student)
-        
-        session.commit()
+        upsert_service.insert_many_if_absent("students", students_data)
         
         # 강의 데이터 추가
         lectures_data = [
-            Lecture(title="중등 수학 기초반", subject="수학", grade="중1", max_students=15, current_students=8, tuition_fee=150000, schedule="월수금 14:00-16:00", classroom="A-101", is_active=True, description="중학교 1학년 수학 기초 과정"),
-            Lecture(title="고등 영어 독해반", subject="영어", grade="고1", max_students=12, current_students=10, tuition_fee=180000, schedule="화목 16:00-18:00", classroom="B-201", is_active=True, description="고등학교 1학년 영어 독해 과정"),
-            Lecture(title="중등 과학 실험반", subject="과학", grade="중2", max_students=10, current_students=6, tuition_fee=200000, schedule="토 10:00-12:00", classroom="실험실-1", is_active=True, description="중학교 2학년 과학 실험 과정"),
-            Lecture(title="고등 국어 문학반", subject="국어", grade="고2", max_students=15, current_students=12, tuition_fee=160000, schedule="월수 19:00-21:00", classroom="C-301", is_active=True, description="고등학교 2학년 국어 문학 과정"),
+            {"title": "중등 수학 기초반", "subject": "수학", "grade": "중1", "max_students": 15, "current_students": 8, "tuition_fee": 150000, "schedule": "월수금 14:00-16:00", "classroom": "A-101", "is_active": True, "description": "중학교 1학년 수학 기초 과정"},
+            {"title": "고등 영어 독해반", "subject": "영어", "grade": "고1", "max_students": 12, "current_students": 10, "tuition_fee": 180000, "schedule": "화목 16:00-18:00", "classroom": "B-201", "is_active": True, "description": "고등학교 1학년 영어 독해 과정"},
+            {"title": "중등 과학 실험반", "subject": "과학", "grade": "중2", "max_students": 10, "current_students": 6, "tuition_fee": 200000, "schedule": "토 10:00-12:00", "classroom": "실험실-1", "is_active": True, "description": "중학교 2학년 과학 실험 과정"},
+            {"title": "고등 국어 문학반", "subject": "국어", "grade": "고2", "max_students": 15, "current_students": 12, "tuition_fee": 160000, "schedule": "월수 19:00-21:00", "classroom": "C-301", "is_active": True, "description": "고등학교 2학년 국어 문학 과정"},
         ]
         
-        for lecture in lectures_data:
-            existing = session.exec(select(Lecture).where(Lecture.title == lecture.title)).first()
-            if not existing:
-                session.add(lecture)
-        
-        session.commit()
+        upsert_service.insert_many_if_absent("lectures", lectures_data)
         
         # 데이터 확인
         teacher_count = len(session.exec(select(Teacher)).all())
@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
+from typing import Any, Dict
+
+from ...core.database import get_session
+from ...core.response_cache import CachedRoute
+from ...core.versions import conditional_get
+from ...schemas.inventory import StockAdjustRequest, MaterialStockAlertResponse, MaterialStockAlertListResponse
+from ...schemas.material import MaterialResponse
+from ...services.inventory_service import InventoryService, InventoryNotFoundError
+
+router = APIRouter(route_class=CachedRoute)
+
+
+@router.get("/low-stock", summary="재고 부족 교재", dependencies=[Depends(conditional_get("material"))])
+def get_low_stock(db: Session = Depends(get_session)) -> Dict[str, Any]:
+    """재고가 최소 수량 이하인 활성 교재를 재고 적은 순으로 반환합니다."""
+    materials = InventoryService(db).get_low_stock()
+    return {"materials": materials, "total": len(materials)}
+
+
+@router.get("/alerts", response_model=MaterialStockAlertListResponse, dependencies=[Depends(conditional_get("material_stock_alert"))])
+def get_stock_alerts(
+    skip: int = Query(0, ge=0, description="Skip records"),
+    limit: int = Query(100, ge=1, le=1000, description="Limit records"),
+    open_only: bool = Query(False, description="Only alerts that are not resolved yet"),
+    db: Session = Depends(get_session)
+):
+    """재고 부족 알림 목록 (최근 순)"""
+    page = InventoryService(db).get_alerts_page(skip=skip, limit=limit, open_only=open_only)
+    return MaterialStockAlertListResponse(
+        alerts=[MaterialStockAlertResponse.from_orm(alert) for alert in page.items],
+        total=page.total,
+        page=skip // limit + 1,
+        size=limit
+    )
+
+
+@router.post("/materials/{material_id}/adjust", response_model=MaterialResponse, summary="교재 재고 증감")
+def adjust_stock(material_id: int, request: StockAdjustRequest, db: Session = Depends(get_session)):
+    """재고를 delta만큼 늘리거나(입고) 줄입니다(출고). 재고보다 많이 줄이면 400을 반환합니다."""
+    try:
+        material = InventoryService(db).adjust_stock(material_id, request.delta)
+    except InventoryNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return MaterialResponse.from_orm(material)
@@ -1,34 +1,149 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Header, Request, Depends, HTTPException, Query, UploadFile, File
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session
 from typing import Optional
 
 from ...core.database import get_session
-from ...models.lecture import LectureCreate, LectureUpdate
+from ...core.projection import parse_fields, project_items
+from ...core.response_cache import CachedRoute
+from ...core.serialization import FastJSONResponse, response_columns
+from ...core.versions import conditional_get
+from ...models.lecture import Lecture, LectureCreate, LectureUpdate
 from ...schemas.lecture import LectureResponse, LectureListResponse
+from ...schemas.bulk import ImportResult, BulkUpdateRequest, BulkDeleteRequest, BulkUpdateResult
+from ...services.bulk_import_service import BulkImportService
+from ...services.bulk_update_service import BulkUpdateService
+from ...services.export_service import EXPORT_FORMATS, stream_export
+from ...services.idempotency_service import IdempotencyService, IdempotencyConflictError
+from ...services.upsert_service import UpsertService
 from ...services.lecture_service import LectureService
+from ...services.schedule_service import ScheduleConflictError
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 @router.get("/", response_model=LectureListResponse)
 def get_lectures(
     skip: int = Query(0, ge=0, description="Skip records"),
     limit: int = Query(100, ge=1, le=1000, description="Limit records"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (overrides skip)"),
+    with_total: bool = Query(False, description="Count total rows in cursor mode (total is null otherwise)"),
+    fields: Optional[str] = Query(None, description="Comma separated columns to return, e.g. id,name"),
+    etag: str = Depends(conditional_get("lecture")),
     db: Session = Depends(get_session)
 ):
     """강의 목록 조회"""
     service = LectureService(db)
-    lectures = service.get_lectures(skip=skip, limit=limit, is_active=is_active)
-    total = service.count_lectures(is_active=is_active)
+    try:
+        columns = parse_fields(fields, Lecture) or response_columns(LectureResponse)
+        page = service.get_lectures_page(skip=skip, limit=limit, is_active=is_active, cursor=cursor, fields=columns, with_total=with_total)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return LectureListResponse(
-        lectures=[LectureResponse.from_orm(l) for l in lectures],
-        total=total,
-        page=skip // limit + 1,
-        size=limit
+    # 컬럼 값 dict를 바로 JSON 바이트로 직렬화 (ORM 객체 생성과 응답 모델 재검증 생략)
+    return FastJSONResponse({
+        "lectures": project_items(page.items, columns),
+        "total": page.total,
+        # 커서 방식에는 페이지 번호가 없음
+        "page": None if cursor else skip // limit + 1,
+        "size": limit,
+        "next_cursor": page.next_cursor
+    }, headers={"ETag": etag})
+
+
+@router.post("/import", response_model=ImportResult, summary="강의 일괄 등록", status_code=201)
+def import_lectures(
+    file: UploadFile = File(..., description="CSV, XLSX or NDJSON file"),
+    file_format: Optional[str] = Query(None, alias="format", description="csv, xlsx or ndjson (default: by extension)"),
+    dry_run: bool = Query(False, description="Validate only, do not insert"),
+    db: Session = Depends(get_session)
+):
+    """파일로 강의를 일괄 등록하고 행별 오류 보고서를 반환합니다."""
+    service = BulkImportService(db)
+    try:
+        return service.import_file("lectures", file.file, filename=file.filename, file_format=file_format, dry_run=dry_run)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError as e:
+        raise HTTPException(status_code=409, detail=f"일괄 등록 중 중복 데이터 충돌: {e.orig}")
+
+
+@router.patch("/bulk", response_model=BulkUpdateResult, summary="강의 일괄 수정")
+def bulk_update_lectures(request: BulkUpdateRequest, db: Session = Depends(get_session)):
+    """ID 목록 또는 필터에 맞는 강의를 한 번의 UPDATE로 수정합니다."""
+    service = BulkUpdateService(db)
+    try:
+        affected = service.bulk_update("lectures", request.patch, ids=request.ids, filters=request.filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError as e:
+        raise HTTPException(status_code=409, detail=f"일괄 수정 중 중복 데이터 충돌: {e.orig}")
+    return BulkUpdateResult(entity="lectures", affected=affected)
+
+
+@router.post("/bulk-delete", response_model=BulkUpdateResult, summary="강의 일괄 삭제 (소프트 삭제)")
+def bulk_delete_lectures(request: BulkDeleteRequest, db: Session = Depends(get_session)):
+    """ID 목록 또는 필터에 맞는 강의를 한 번의 UPDATE로 비활성화합니다."""
+    service = BulkUpdateService(db)
+    try:
+        affected = service.bulk_deactivate("lectures", ids=request.ids, filters=request.filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return BulkUpdateResult(entity="lectures", affected=affected)
+
+
+@router.get("/export", summary="강의 전체 내보내기 (NDJSON/CSV 스트리밍)")
+def export_lectures(
+    file_format: str = Query("ndjson", alias="format", description="ndjson or csv"),
+    fields: Optional[str] = Query(None, description="Comma separated columns to export, e.g. id,name"),
+    is_active: Optional[bool] = Query(None, description="Filter by active status")
+):
+    """강의 전체를 일정한 메모리로 읽어 스트리밍으로 내보냅니다."""
+    if file_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 형식입니다: {file_format} (ndjson, csv)")
+    try:
+        columns = parse_fields(fields, Lecture)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        stream_export("lectures", file_format, columns, is_active),
+        media_type=EXPORT_FORMATS[file_format],
+        headers={"Content-Disposition": f'attachment; filename="lectures.{file_format}"'}
     )
 
-@router.get("/{lecture_id}", response_model=LectureResponse)
+
+@router.post("/upsert", response_model=LectureResponse, summary="강의 등록 또는 수정 (제목 기준)")
+def upsert_lecture(
+    request: Request,
+    lecture_data: LectureCreate,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
+    db: Session = Depends(get_session)
+):
+    """제목이 같은 강의가 있으면 보낸 값으로 수정하고, 없으면 등록합니다.
+
+    Idempotency-Key 헤더를 보내면 같은 키로 재시도해도 처음 응답을 그대로 돌려줍니다.
+    """
+    payload = lecture_data.dict(exclude_unset=True)
+    service = IdempotencyService(db)
+    try:
+        body, replayed = service.run(
+            idempotency_key,
+            request.url.path,
+            payload,
+            lambda: jsonable_encoder(LectureResponse.from_orm(UpsertService(db).upsert("lectures", payload, commit=False)))
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IdempotencyConflictError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    return FastJSONResponse(body, headers={"Idempotent-Replayed": "true"} if replayed else None)
+
+
+@router.get("/{lecture_id}", response_model=LectureResponse, dependencies=[Depends(conditional_get("lecture"))])
 def get_lecture(lecture_id: int, db: Session = Depends(get_session)):
     """강의 상세 조회"""
     service = LectureService(db)
@@ -43,14 +158,28 @@ def get_lecture(lecture_id: int, db: Session = Depends(get_session)):
 def create_lecture(lecture_data: LectureCreate, db: Session = Depends(get_session)):
     """강의 등록"""
     service = LectureService(db)
-    lecture = service.create_lecture(lecture_data)
+    try:
+        lecture = service.create_lecture(lecture_data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ScheduleConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except IntegrityError:
+        raise HTTPException(status_code=409, detail="같은 제목의 강의가 이미 있습니다")
     return LectureResponse.from_orm(lecture)
 
 @router.put("/{lecture_id}", response_model=LectureResponse)
 def update_lecture(lecture_id: int, lecture_data: LectureUpdate, db: Session = Depends(get_session)):
     """강의 정보 수정"""
     service = LectureService(db)
-    lecture = service.update_lecture(lecture_id, lecture_data)
+    try:
+        lecture = service.update_lecture(lecture_id, lecture_data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ScheduleConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except IntegrityError:
+        raise HTTPException(status_code=409, detail="같은 제목의 강의가 이미 있습니다")
     
     if not lecture:
         raise HTTPException(status_code=404, detail="Lecture not found")
@@ -1,35 +1,147 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Header, Request, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 from typing import List, Optional
 from app.models.material import Material
 from app.schemas.material import MaterialCreate, MaterialUpdate, MaterialResponse, MaterialListResponse
 from app.core.database import get_session
+from app.core.projection import parse_fields, project_items
+from app.core.response_cache import CachedRoute
+from app.core.serialization import FastJSONResponse, response_columns
+from app.core.versions import conditional_get
 from app.core.auth import AuthService
+from app.schemas.bulk import ImportResult, BulkUpdateRequest, BulkDeleteRequest, BulkUpdateResult
+from app.services.bulk_import_service import BulkImportService
+from app.services.bulk_update_service import BulkUpdateService
+from app.services.export_service import EXPORT_FORMATS, stream_export
+from app.services.idempotency_service import IdempotencyService, IdempotencyConflictError
+from app.services.upsert_service import UpsertService
 from app.services.material_service import MaterialService
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 @router.get("/", response_model=MaterialListResponse, summary="교재 목록 조회")
 def get_materials(
     skip: int = Query(0, ge=0, description="Skip records"),
     limit: int = Query(100, ge=1, le=1000, description="Limit records"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (overrides skip)"),
+    with_total: bool = Query(False, description="Count total rows in cursor mode (total is null otherwise)"),
+    fields: Optional[str] = Query(None, description="Comma separated columns to return, e.g. id,name"),
+    etag: str = Depends(conditional_get("material")),
     session: Session = Depends(get_session)
     # current_user = Depends(AuthService.get_current_active_user)  # 임시 비활성화
 ):
     """교재 목록을 조회합니다."""
     service = MaterialService(session)
-    materials = service.get_materials(skip=skip, limit=limit, is_active=is_active)
-    total = len(materials)  # MaterialService에 count_materials 메서드가 있다면 그것을 사용
+    try:
+        columns = parse_fields(fields, Material) or response_columns(MaterialResponse)
+        page = service.get_materials_page(skip=skip, limit=limit, is_active=is_active, cursor=cursor, fields=columns, with_total=with_total)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return MaterialListResponse(
-        materials=[MaterialResponse.from_orm(m) for m in materials],
-        total=total,
-        page=skip // limit + 1,
-        size=limit
+    # 컬럼 값 dict를 바로 JSON 바이트로 직렬화 (ORM 객체 생성과 응답 모델 재검증 생략)
+    return FastJSONResponse({
+        "materials": project_items(page.items, columns),
+        "total": page.total,
+        # 커서 방식에는 페이지 번호가 없음
+        "page": None if cursor else skip // limit + 1,
+        "size": limit,
+        "next_cursor": page.next_cursor
+    }, headers={"ETag": etag})
+
+
+@router.post("/import", response_model=ImportResult, summary="교재 일괄 등록", status_code=201)
+def import_materials(
+    file: UploadFile = File(..., description="CSV, XLSX or NDJSON file"),
+    file_format: Optional[str] = Query(None, alias="format", description="csv, xlsx or ndjson (default: by extension)"),
+    dry_run: bool = Query(False, description="Validate only, do not insert"),
+    session: Session = Depends(get_session)
+):
+    """파일로 교재를 일괄 등록하고 행별 오류 보고서를 반환합니다."""
+    service = BulkImportService(session)
+    try:
+        return service.import_file("materials", file.file, filename=file.filename, file_format=file_format, dry_run=dry_run)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError as e:
+        raise HTTPException(status_code=409, detail=f"일괄 등록 중 중복 데이터 충돌: {e.orig}")
+
+
+@router.patch("/bulk", response_model=BulkUpdateResult, summary="교재 일괄 수정")
+def bulk_update_materials(request: BulkUpdateRequest, session: Session = Depends(get_session)):
+    """ID 목록 또는 필터에 맞는 교재를 한 번의 UPDATE로 수정합니다."""
+    service = BulkUpdateService(session)
+    try:
+        affected = service.bulk_update("materials", request.patch, ids=request.ids, filters=request.filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return BulkUpdateResult(entity="materials", affected=affected)
+
+
+@router.post("/bulk-delete", response_model=BulkUpdateResult, summary="교재 일괄 삭제 (소프트 삭제)")
+def bulk_delete_materials(request: BulkDeleteRequest, session: Session = Depends(get_session)):
+    """ID 목록 또는 필터에 맞는 교재를 한 번의 UPDATE로 비활성화합니다."""
+    service = BulkUpdateService(session)
+    try:
+        affected = service.bulk_deactivate("materials", ids=request.ids, filters=request.filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return BulkUpdateResult(entity="materials", affected=affected)
+
+
+@router.get("/export", summary="교재 전체 내보내기 (NDJSON/CSV 스트리밍)")
+def export_materials(
+    file_format: str = Query("ndjson", alias="format", description="ndjson or csv"),
+    fields: Optional[str] = Query(None, description="Comma separated columns to export, e.g. id,name"),
+    is_active: Optional[bool] = Query(None, description="Filter by active status")
+):
+    """교재 전체를 일정한 메모리로 읽어 스트리밍으로 내보냅니다."""
+    if file_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 형식입니다: {file_format} (ndjson, csv)")
+    try:
+        columns = parse_fields(fields, Material)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        stream_export("materials", file_format, columns, is_active),
+        media_type=EXPORT_FORMATS[file_format],
+        headers={"Content-Disposition": f'attachment; filename="materials.{file_format}"'}
     )
 
-@router.get("/{material_id}", response_model=MaterialResponse, summary="교재 상세 조회")
+
+@router.post("/upsert", response_model=MaterialResponse, summary="교재 등록 또는 수정 (ISBN 기준)")
+def upsert_material(
+    request: Request,
+    material: MaterialCreate,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
+    session: Session = Depends(get_session)
+):
+    """ISBN이 같은 교재가 있으면 보낸 값으로 수정하고, 없으면 등록합니다.
+
+    Idempotency-Key 헤더를 보내면 같은 키로 재시도해도 처음 응답을 그대로 돌려줍니다.
+    """
+    payload = material.dict(exclude_unset=True)
+    service = IdempotencyService(session)
+    try:
+        body, replayed = service.run(
+            idempotency_key,
+            request.url.path,
+            payload,
+            lambda: jsonable_encoder(MaterialResponse.from_orm(UpsertService(session).upsert("materials", payload, commit=False)))
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IdempotencyConflictError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    return FastJSONResponse(body, headers={"Idempotent-Replayed": "true"} if replayed else None)
+
+
+@router.get("/{material_id}", response_model=MaterialResponse, summary="교재 상세 조회", dependencies=[Depends(conditional_get("material"))])
 def get_material(
     material_id: int,
     session: Session = Depends(get_session)
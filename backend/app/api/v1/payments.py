@@ -0,0 +1,93 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
+from typing import List, Optional
+
+from ...core.database import get_session
+from ...core.response_cache import CachedRoute
+from ...core.versions import conditional_get
+from ...models.payment import PaymentCreate
+from ...schemas.payment import (
+    PaymentResponse,
+    PaymentListResponse,
+    StudentBalanceResponse,
+    MonthlyRevenueResponse,
+)
+from ...services.payment_service import PaymentService, PaymentNotFoundError
+
+router = APIRouter(route_class=CachedRoute)
+
+
+@router.get("/", response_model=PaymentListResponse, dependencies=[Depends(conditional_get("payment"))])
+def get_payments(
+    skip: int = Query(0, ge=0, description="Skip records"),
+    limit: int = Query(100, ge=1, le=1000, description="Limit records"),
+    student_id: Optional[int] = Query(None, description="Filter by student"),
+    lecture_id: Optional[int] = Query(None, description="Filter by lecture"),
+    period: Optional[str] = Query(None, description="Filter by period (YYYY-MM)"),
+    db: Session = Depends(get_session)
+):
+    """납부 내역 조회"""
+    service = PaymentService(db)
+    try:
+        page = service.get_payments_page(
+            skip=skip, limit=limit, student_id=student_id, lecture_id=lecture_id, period=period
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return PaymentListResponse(
+        payments=[PaymentResponse.from_orm(payment) for payment in page.items],
+        total=page.total,
+        page=skip // limit + 1,
+        size=limit
+    )
+
+
+@router.post("/", response_model=PaymentResponse, summary="수강료 납부 기록", status_code=201)
+def record_payment(payment_data: PaymentCreate, db: Session = Depends(get_session)):
+    """납부를 원장에 추가합니다. 환불이나 정정은 음수 금액으로 기록합니다.
+
+    period(YYYY-MM)를 생략하면 paid_at이 속한 월로 기록합니다.
+    """
+    service = PaymentService(db)
+    try:
+        payment = service.record_payment(payment_data)
+    except PaymentNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return PaymentResponse.from_orm(payment)
+
+
+@router.get("/monthly", response_model=List[MonthlyRevenueResponse], dependencies=[Depends(conditional_get("monthly_revenue"))])
+def get_monthly_revenue(
+    start: Optional[str] = Query(None, description="시작 월 (포함), e.g. 2026-01"),
+    end: Optional[str] = Query(None, description="끝 월 (포함), e.g. 2026-12"),
+    db: Session = Depends(get_session)
+):
+    """월별 청구/납부/미납 합계"""
+    service = PaymentService(db)
+    try:
+        months = service.get_monthly_revenue(start, end)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return [MonthlyRevenueResponse.from_orm(month) for month in months]
+
+
+@router.post("/periods/{period}/bill", response_model=MonthlyRevenueResponse, summary="월 수강료 청구")
+def bill_period(period: str, db: Session = Depends(get_session)):
+    """귀속 월의 학생별 청구액을 현재 수강 상태로 다시 계산합니다. 여러 번 실행해도 결과는 같습니다."""
+    service = PaymentService(db)
+    try:
+        month = service.bill_period(period)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if month is None:
+        raise HTTPException(status_code=404, detail="청구할 학생이 없습니다")
+    return MonthlyRevenueResponse.from_orm(month)
+
+
+@router.get("/students/{student_id}/balances", response_model=List[StudentBalanceResponse], dependencies=[Depends(conditional_get("student_balance"))])
+def get_student_balances(student_id: int, db: Session = Depends(get_session)):
+    """학생의 월별 청구/납부/미납"""
+    service = PaymentService(db)
+    return [StudentBalanceResponse.from_orm(balance) for balance in service.get_student_balances(student_id)]
@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Any, Dict
+
+from ...core.response_cache import CachedRoute
+from ...core.versions import conditional_get
+from ...schemas.recommendation import IntakeMatchRequest, IntakeMatchResponse
+from ...services.recommendation_service import (
+    RecommendationNotFoundError,
+    match_intake,
+    recommend_lectures,
+    recommend_students,
+)
+
+router = APIRouter(route_class=CachedRoute)
+
+# 추천은 학생/강의/수강 등록/출석으로만 정해지므로 이 테이블 버전으로 ETag를 만듦
+recommendation_etag = conditional_get("student", "lecture", "enrollment", "session_attendance")
+
+
+@router.get("/students/{student_id}/lectures", summary="학생에게 추천할 강의", dependencies=[Depends(recommendation_etag)])
+def get_lecture_recommendations(
+    student_id: int,
+    k: int = Query(5, ge=1, le=50, description="Number of lectures"),
+) -> Dict[str, Any]:
+    """학년, 수강 중인 과목, 출석률, 남은 좌석으로 점수를 매겨 상위 k개 강의를 반환합니다.
+    이미 수강 중이거나 정원이 찬 강의는 제외합니다."""
+    try:
+        lectures = recommend_lectures([student_id], k)[student_id]
+    except RecommendationNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {"student_id": student_id, "lectures": lectures}
+
+
+@router.get("/lectures/{lecture_id}/students", summary="강의에 추천할 학생", dependencies=[Depends(recommendation_etag)])
+def get_student_recommendations(
+    lecture_id: int,
+    k: int = Query(10, ge=1, le=200, description="Number of students"),
+) -> Dict[str, Any]:
+    """강의와 잘 맞는 활성 학생 상위 k명을 반환합니다. 이미 수강 중인 학생은 제외합니다."""
+    try:
+        students = recommend_students(lecture_id, k)
+    except RecommendationNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {"lecture_id": lecture_id, "students": students}
+
+
+@router.post("/match", response_model=IntakeMatchResponse, summary="신규 학생 일괄 강의 추천")
+def match_students(request: IntakeMatchRequest):
+    """여러 학생의 추천 강의를 한 번에 계산합니다. student_ids가 없으면 수강 중인 강의가 없는 활성 학생 전체가 대상입니다."""
+    try:
+        matches = match_intake(request.student_ids, request.k)
+    except RecommendationNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return IntakeMatchResponse(
+        students=[{"student_id": student_id, "lectures": lectures} for student_id, lectures in matches.items()],
+        total=len(matches)
+    )
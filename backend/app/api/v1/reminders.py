@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+from typing import Optional
+
+from ...core.database import get_session
+from ...core.response_cache import CachedRoute
+from ...core.versions import conditional_get
+from ...schemas.reminder import TuitionReminderResponse, TuitionReminderListResponse, ReminderRunResponse
+from ...services.reminder_service import ReminderService, run_overdue_reminders
+
+router = APIRouter(route_class=CachedRoute)
+
+
+@router.get("/", response_model=TuitionReminderListResponse, dependencies=[Depends(conditional_get("tuition_reminder"))])
+def get_reminders(
+    skip: int = Query(0, ge=0, description="Skip records"),
+    limit: int = Query(100, ge=1, le=1000, description="Limit records"),
+    status: Optional[str] = Query(None, description="Filter by status (pending, sending, sent, failed, cancelled)"),
+    student_id: Optional[int] = Query(None, description="Filter by student"),
+    db: Session = Depends(get_session)
+):
+    """수강료 체납 알림 목록 조회"""
+    service = ReminderService(db)
+    page = service.get_reminders_page(skip=skip, limit=limit, status=status, student_id=student_id)
+    return TuitionReminderListResponse(
+        reminders=[TuitionReminderResponse.from_orm(reminder) for reminder in page.items],
+        total=page.total,
+        page=skip // limit + 1,
+        size=limit
+    )
+
+
+@router.post("/run", response_model=ReminderRunResponse, summary="체납 알림 즉시 실행")
+def run_reminders():
+    """주기 실행을 기다리지 않고 체납 감지와 알림 발송을 한 번 실행합니다.
+
+    이미 발송한 (학생, 납부일) 알림은 다시 보내지 않습니다.
+    """
+    return run_overdue_reminders()
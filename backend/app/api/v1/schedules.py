@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
+from typing import Any, Dict, Optional
+
+from ...core.database import get_session
+from ...core.schedule import WEEKDAYS, format_minute, parse_schedule
+from ...services.schedule_service import ScheduleService
+
+router = APIRouter()
+
+
+@router.get("/conflicts", summary="강의실/강사 일정 겹침 확인")
+def check_schedule_conflicts(
+    schedule: str = Query(..., description="확인할 일정, e.g. 화 15:00-17:00"),
+    classroom: Optional[str] = Query(None, description="강의실"),
+    teacher_id: Optional[int] = Query(None, description="강사 ID"),
+    exclude_lecture_id: Optional[int] = Query(None, description="겹침 확인에서 제외할 강의 (수정 중인 강의)"),
+    db: Session = Depends(get_session)
+) -> Dict[str, Any]:
+    """강의실 또는 강사가 주어진 시간에 비어 있는지 확인합니다.
+
+    예: /schedules/conflicts?classroom=A-101&schedule=화 15:00-17:00
+    """
+    if not classroom and teacher_id is None:
+        raise HTTPException(status_code=400, detail="classroom 또는 teacher_id가 필요합니다")
+    try:
+        slots = parse_schedule(schedule)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not slots:
+        raise HTTPException(status_code=400, detail="확인할 일정이 없습니다")
+
+    conflicts = ScheduleService(db).find_conflicts(slots, classroom, teacher_id, exclude_lecture_id)
+    return {
+        "available": not conflicts,
+        "slots": [
+            {"weekday": WEEKDAYS[slot.weekday], "start": format_minute(slot.start_minute), "end": format_minute(slot.end_minute)}
+            for slot in slots
+        ],
+        "conflicts": conflicts,
+    }
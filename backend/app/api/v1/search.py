@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
+from typing import Optional
+
+from app.core.database import get_session
+from app.schemas.search import SearchResponse
+from app.services.search_service import SearchService, SEARCH_TARGETS
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("", response_model=SearchResponse, summary="학생/강사/교재 통합 검색")
+def search(
+    q: str = Query(..., min_length=1, max_length=100, description="Search keyword"),
+    limit: int = Query(10, ge=1, le=50, description="Limit records per entity"),
+    entities: Optional[str] = Query(None, description="Comma separated: students,teachers,materials"),
+    include_inactive: bool = Query(False, description="Include inactive records"),
+    db: Session = Depends(get_session)
+):
+    """이름, 이메일, 전화번호, 과목, 교재명, 저자로 검색합니다."""
+    targets = None
+    if entities:
+        targets = [e.strip() for e in entities.split(",") if e.strip()]
+        unknown = [e for e in targets if e not in SEARCH_TARGETS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 검색 대상입니다: {', '.join(unknown)}")
+
+    service = SearchService(db)
+    return service.search(q, limit=limit, entities=targets, include_inactive=include_inactive)
@@ -2,12 +2,17 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session
 from typing import Dict
 from app.core.database import get_session
+from app.core.response_cache import CachedRoute
+from app.core.versions import conditional_get
 from app.services.statistics_service import StatisticsService
 
-router = APIRouter(prefix="/statistics", tags=["statistics"])
+router = APIRouter(prefix="/statistics", tags=["statistics"], route_class=CachedRoute)
 
+# 연체/최근 등록 수는 시간이 지나면 바뀌므로 1분마다 ETag를 새로 만듦
+TIME_DEPENDENT_ETAG_SECONDS = 60
 
-@router.get("/students")
+
+@router.get("/students", dependencies=[Depends(conditional_get("student", "monthly_revenue", time_bucket=TIME_DEPENDENT_ETAG_SECONDS))])
 async def get_student_statistics(db: Session = Depends(get_session)) -> Dict:
     """학생 관련 기본 통계 조회"""
     try:
@@ -17,7 +22,7 @@ async def get_student_statistics(db: Session = Depends(get_session)) -> Dict:
         raise HTTPException(status_code=500, detail=f"학생 통계 조회 실패: {str(e)}")
 
 
-@router.get("/lectures")
+@router.get("/lectures", dependencies=[Depends(conditional_get("lecture", "lecture_revenue"))])
 async def get_lecture_statistics(db: Session = Depends(get_session)) -> Dict:
     """강의 관련 기본 통계 조회"""
     try:
@@ -27,7 +32,7 @@ async def get_lecture_statistics(db: Session = Depends(get_session)) -> Dict:
         raise HTTPException(status_code=500, detail=f"강의 통계 조회 실패: {str(e)}")
 
 
-@router.get("/teachers")
+@router.get("/teachers", dependencies=[Depends(conditional_get("teacher", "lecture"))])
 async def get_teacher_statistics(db: Session = Depends(get_session)) -> Dict:
     """강사 관련 기본 통계 조회"""
     try:
@@ -37,7 +42,7 @@ async def get_teacher_statistics(db: Session = Depends(get_session)) -> Dict:
         raise HTTPException(status_code=500, detail=f"강사 통계 조회 실패: {str(e)}")
 
 
-@router.get("/materials")
+@router.get("/materials", dependencies=[Depends(conditional_get("material"))])
 async def get_material_statistics(db: Session = Depends(get_session)) -> Dict:
     """교재 관련 기본 통계 조회"""
     try:
@@ -47,7 +52,27 @@ async def get_material_statistics(db: Session = Depends(get_session)) -> Dict:
         raise HTTPException(status_code=500, detail=f"교재 통계 조회 실패: {str(e)}")
 
 
-@router.get("/overall")
+@router.get("/attendance", dependencies=[Depends(conditional_get("session_attendance", "enrollment", "lecture"))])
+async def get_attendance_statistics(db: Session = Depends(get_session)) -> Dict:
+    """출석 관련 통계 조회"""
+    try:
+        stats_service = StatisticsService(db)
+        return stats_service.get_attendance_statistics()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"출석 통계 조회 실패: {str(e)}")
+
+
+@router.get("/finance", dependencies=[Depends(conditional_get("monthly_revenue", time_bucket=TIME_DEPENDENT_ETAG_SECONDS))])
+async def get_finance_statistics(db: Session = Depends(get_session)) -> Dict:
+    """수납 관련 통계 조회"""
+    try:
+        stats_service = StatisticsService(db)
+        return stats_service.get_finance_statistics()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"수납 통계 조회 실패: {str(e)}")
+
+
+@router.get("/overall", dependencies=[Depends(conditional_get("student", "lecture", "teacher", "material", "monthly_revenue", "lecture_revenue", time_bucket=TIME_DEPENDENT_ETAG_SECONDS))])
 async def get_overall_statistics(db: Session = Depends(get_session)) -> Dict:
     """전체 종합 통계 조회"""
     try:
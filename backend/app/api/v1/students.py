@@ -1,17 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Header, Request, Depends, HTTPException, Query, UploadFile, File
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session
 from typing import Optional
 
 from ...core.database import get_session
+from ...core.projection import parse_fields, project_items
+from ...core.response_cache import CachedRoute
+from ...core.serialization import FastJSONResponse, response_columns
+from ...core.versions import conditional_get
+from ...models.student import Student
 from ...schemas.student import (
     StudentCreate, 
     StudentUpdate, 
     StudentResponse, 
     StudentListResponse
 )
+from ...schemas.bulk import ImportResult, BulkUpdateRequest, BulkDeleteRequest, BulkUpdateResult
+from ...services.bulk_import_service import BulkImportService
+from ...services.bulk_update_service import BulkUpdateService
+from ...services.export_service import EXPORT_FORMATS, stream_export
+from ...services.idempotency_service import IdempotencyService, IdempotencyConflictError
+from ...services.upsert_service import UpsertService
 from ...services.student_service import StudentService
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 
 @router.get("/", response_model=StudentListResponse)
@@ -19,22 +33,120 @@ def get_students(
     skip: int = Query(0, ge=0, description="Skip records"),
     limit: int = Query(100, ge=1, le=1000, description="Limit records"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (overrides skip)"),
+    with_total: bool = Query(False, description="Count total rows in cursor mode (total is null otherwise)"),
+    fields: Optional[str] = Query(None, description="Comma separated columns to return, e.g. id,name"),
+    etag: str = Depends(conditional_get("student")),
     db: Session = Depends(get_session)
 ):
     """학생 목록 조회"""
     service = StudentService(db)
-    students = service.get_students(skip=skip, limit=limit, is_active=is_active)
-    total = service.count_students(is_active=is_active)
+    try:
+        columns = parse_fields(fields, Student) or response_columns(StudentResponse)
+        page = service.get_students_page(skip=skip, limit=limit, is_active=is_active, cursor=cursor, fields=columns, with_total=with_total)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return StudentListResponse(
-        students=[StudentResponse.from_orm(s) for s in students],
-        total=total,
-        page=skip // limit + 1,
-        size=limit
+    # 컬럼 값 dict를 바로 JSON 바이트로 직렬화 (ORM 객체 생성과 응답 모델 재검증 생략)
+    return FastJSONResponse({
+        "students": project_items(page.items, columns),
+        "total": page.total,
+        # 커서 방식에는 페이지 번호가 없음
+        "page": None if cursor else skip // limit + 1,
+        "size": limit,
+        "next_cursor": page.next_cursor
+    }, headers={"ETag": etag})
+
+
+@router.post("/import", response_model=ImportResult, summary="학생 일괄 등록", status_code=201)
+def import_students(
+    file: UploadFile = File(..., description="CSV, XLSX or NDJSON file"),
+    file_format: Optional[str] = Query(None, alias="format", description="csv, xlsx or ndjson (default: by extension)"),
+    dry_run: bool = Query(False, description="Validate only, do not insert"),
+    db: Session = Depends(get_session)
+):
+    """파일로 학생을 일괄 등록하고 행별 오류 보고서를 반환합니다."""
+    service = BulkImportService(db)
+    try:
+        return service.import_file("students", file.file, filename=file.filename, file_format=file_format, dry_run=dry_run)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError as e:
+        raise HTTPException(status_code=409, detail=f"일괄 등록 중 중복 데이터 충돌: {e.orig}")
+
+
+@router.patch("/bulk", response_model=BulkUpdateResult, summary="학생 일괄 수정")
+def bulk_update_students(request: BulkUpdateRequest, db: Session = Depends(get_session)):
+    """ID 목록 또는 필터에 맞는 학생을 한 번의 UPDATE로 수정합니다."""
+    service = BulkUpdateService(db)
+    try:
+        affected = service.bulk_update("students", request.patch, ids=request.ids, filters=request.filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return BulkUpdateResult(entity="students", affected=affected)
+
+
+@router.post("/bulk-delete", response_model=BulkUpdateResult, summary="학생 일괄 삭제 (소프트 삭제)")
+def bulk_delete_students(request: BulkDeleteRequest, db: Session = Depends(get_session)):
+    """ID 목록 또는 필터에 맞는 학생을 한 번의 UPDATE로 비활성화합니다."""
+    service = BulkUpdateService(db)
+    try:
+        affected = service.bulk_deactivate("students", ids=request.ids, filters=request.filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return BulkUpdateResult(entity="students", affected=affected)
+
+
+@router.get("/export", summary="학생 전체 내보내기 (NDJSON/CSV 스트리밍)")
+def export_students(
+    file_format: str = Query("ndjson", alias="format", description="ndjson or csv"),
+    fields: Optional[str] = Query(None, description="Comma separated columns to export, e.g. id,name"),
+    is_active: Optional[bool] = Query(None, description="Filter by active status")
+):
+    """학생 전체를 일정한 메모리로 읽어 스트리밍으로 내보냅니다."""
+    if file_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 형식입니다: {file_format} (ndjson, csv)")
+    try:
+        columns = parse_fields(fields, Student)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return StreamingResponse(
+        stream_export("students", file_format, columns, is_active),
+        media_type=EXPORT_FORMATS[file_format],
+        headers={"Content-Disposition": f'attachment; filename="students.{file_format}"'}
     )
 
 
-@router.get("/{student_id}", response_model=StudentResponse)
+@router.post("/upsert", response_model=StudentResponse, summary="학생 등록 또는 수정 (이메일 기준)")
+def upsert_student(
+    request: Request,
+    student_data: StudentCreate,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
+    db: Session = Depends(get_session)
+):
+    """이메일이 같은 학생이 있으면 보낸 값으로 수정하고, 없으면 등록합니다.
+
+    Idempotency-Key 헤더를 보내면 같은 키로 재시도해도 처음 응답을 그대로 돌려줍니다.
+    """
+    payload = student_data.dict(exclude_unset=True)
+    service = IdempotencyService(db)
+    try:
+        body, replayed = service.run(
+            idempotency_key,
+            request.url.path,
+            payload,
+            lambda: jsonable_encoder(StudentResponse.from_orm(UpsertService(db).upsert("students", payload, commit=False)))
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IdempotencyConflictError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    return FastJSONResponse(body, headers={"Idempotent-Replayed": "true"} if replayed else None)
+
+
+@router.get("/{student_id}", response_model=StudentResponse, dependencies=[Depends(conditional_get("student"))])
 def get_student(student_id: int, db: Session = Depends(get_session)):
     """학생 상세 조회"""
     service = StudentService(db)
@@ -52,12 +164,10 @@ def create_student(student_data: StudentCreate, db: Session = Depends(get_sessio
     print(f"받은 학생 데이터: {student_data}")
     service = StudentService(db)
     
-    # 이메일 중복 확인
-    existing_student = service.get_student_by_email(student_data.email)
-    if existing_student:
-        raise HTTPException(status_code=400, detail="Email already registered")
-    
+    # 이메일 중복은 ON CONFLICT로 확인 (동시 등록에도 500이 나지 않음)
     student = service.create_student(student_data)
+    if student is None:
+        raise HTTPException(status_code=400, detail="Email already registered")
     print(f"생성된 학생: {student}")
     return StudentResponse.from_orm(student)
 
@@ -1,28 +1,149 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Header, Request, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 from typing import List, Optional
 from app.models import Teacher, TeacherCreate, TeacherUpdate
+from app.schemas.teacher import TeacherResponse, TeacherListResponse
 from app.core.database import get_session
+from app.core.projection import parse_fields, project_items
+from app.core.response_cache import CachedRoute
+from app.core.serialization import FastJSONResponse, response_columns
+from app.core.versions import conditional_get
 from app.core.auth import AuthService
+from app.schemas.bulk import ImportResult, BulkUpdateRequest, BulkDeleteRequest, BulkUpdateResult
+from app.services.bulk_import_service import BulkImportService
+from app.services.bulk_update_service import BulkUpdateService
+from app.services.export_service import EXPORT_FORMATS, stream_export
+from app.services.idempotency_service import IdempotencyService, IdempotencyConflictError
+from app.services.upsert_service import UpsertService
 from app.services.teacher_service import TeacherService
 import json
 from datetime import datetime
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
-@router.get("/", summary="강사 목록 조회")
+@router.get("/", response_model=TeacherListResponse, summary="강사 목록 조회")
 def get_teachers(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0, description="Skip records"),
+    limit: int = Query(100, ge=1, le=1000, description="Limit records"),
+    is_active: Optional[bool] = Query(None, description="Filter by active status"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from next_cursor (overrides skip)"),
+    with_total: bool = Query(False, description="Count total rows in cursor mode (total is null otherwise)"),
+    fields: Optional[str] = Query(None, description="Comma separated columns to return, e.g. id,name"),
+    etag: str = Depends(conditional_get("teacher")),
     session: Session = Depends(get_session)
     # current_user = Depends(AuthService.get_current_active_user)  # 임시 비활성화
 ):
     """강사 목록을 조회합니다."""
-    statement = select(Teacher).offset(skip).limit(limit)
-    teachers = session.exec(statement).all()
-    return {"teachers": teachers}
+    service = TeacherService(session)
+    try:
+        columns = parse_fields(fields, Teacher) or response_columns(TeacherResponse)
+        page = service.get_teachers_page(skip=skip, limit=limit, is_active=is_active, cursor=cursor, fields=columns, with_total=with_total)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # 컬럼 값 dict를 바로 JSON 바이트로 직렬화 (ORM 객체 생성과 응답 모델 재검증 생략)
+    return FastJSONResponse({
+        "teachers": project_items(page.items, columns),
+        "total": page.total,
+        # 커서 방식에는 페이지 번호가 없음
+        "page": None if cursor else skip // limit + 1,
+        "size": limit,
+        "next_cursor": page.next_cursor
+    }, headers={"ETag": etag})
+
+
+@router.post("/import", response_model=ImportResult, summary="강사 일괄 등록", status_code=201)
+def import_teachers(
+    file: UploadFile = File(..., description="CSV, XLSX or NDJSON file"),
+    file_format: Optional[str] = Query(None, alias="format", description="csv, xlsx or ndjson (default: by extension)"),
+    dry_run: bool = Query(False, description="Validate only, do not insert"),
+    session: Session = Depends(get_session)
+):
+    """파일로 강사를 일괄 등록하고 행별 오류 보고서를 반환합니다."""
+    service = BulkImportService(session)
+    try:
+        return service.import_file("teachers", file.file, filename=file.filename, file_format=file_format, dry_run=dry_run)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError as e:
+        raise HTTPException(status_code=409, detail=f"일괄 등록 중 중복 데이터 충돌: {e.orig}")
+
+
+@router.patch("/bulk", response_model=BulkUpdateResult, summary="강사 일괄 수정")
+def bulk_update_teachers(request: BulkUpdateRequest, session: Session = Depends(get_session)):
+    """ID 목록 또는 필터에 맞는 강사를 한 번의 UPDATE로 수정합니다."""
+    service = BulkUpdateService(session)
+    try:
+        affected = service.bulk_update("teachers", request.patch, ids=request.ids, filters=request.filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return BulkUpdateResult(entity="teachers", affected=affected)
+
+
+@router.post("/bulk-delete", response_model=BulkUpdateResult, summary="강사 일괄 삭제 (소프트 삭제)")
+def bulk_delete_teachers(request: BulkDeleteRequest, session: Session = Depends(get_session)):
+    """ID 목록 또는 필터에 맞는 강사를 한 번의 UPDATE로 비활성화합니다."""
+    service = BulkUpdateService(session)
+    try:
+        affected = service.bulk_deactivate("teachers", ids=request.ids, filters=request.filters)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return BulkUpdateResult(entity="teachers", affected=affected)
+
+
+@router.get("/export", summary="강사 전체 내보내기 (NDJSON/CSV 스트리밍)")
+def export_teachers(
+    file_format: str = Query("ndjson", alias="format", description="ndjson or csv"),
+    fields: Optional[str] = Query(None, description="Comma separated columns to export, e.g. id,name"),
+    is_active: Optional[bool] = Query(None, description="Filter by active status")
+):
+    """강사 전체를 일정한 메모리로 읽어 스트리밍으로 내보냅니다."""
+    if file_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 형식입니다: {file_format} (ndjson, csv)")
+    try:
+        columns = parse_fields(fields, Teacher)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/{teacher_id}", response_model=Teacher, summary="강사 상세 조회")
+    return StreamingResponse(
+        stream_export("teachers", file_format, columns, is_active),
+        media_type=EXPORT_FORMATS[file_format],
+        headers={"Content-Disposition": f'attachment; filename="teachers.{file_format}"'}
+    )
+
+
+@router.post("/upsert", response_model=TeacherResponse, summary="강사 등록 또는 수정 (이메일 기준)")
+def upsert_teacher(
+    request: Request,
+    teacher: TeacherCreate,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=255),
+    session: Session = Depends(get_session)
+):
+    """이메일이 같은 강사가 있으면 보낸 값으로 수정하고, 없으면 등록합니다.
+
+    Idempotency-Key 헤더를 보내면 같은 키로 재시도해도 처음 응답을 그대로 돌려줍니다.
+    """
+    payload = teacher.dict(exclude_unset=True)
+    service = IdempotencyService(session)
+    try:
+        body, replayed = service.run(
+            idempotency_key,
+            request.url.path,
+            payload,
+            lambda: jsonable_encoder(TeacherResponse.from_orm(UpsertService(session).upsert("teachers", payload, commit=False)))
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IdempotencyConflictError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    return FastJSONResponse(body, headers={"Idempotent-Replayed": "true"} if replayed else None)
+
+
+@router.get("/{teacher_id}", response_model=Teacher, summary="강사 상세 조회", dependencies=[Depends(conditional_get("teacher"))])
 def get_teacher(
     teacher_id: int,
     session: Session = Depends(get_session)
@@ -51,10 +172,10 @@ def create_teacher(
     if teacher_data.get('hire_date') is None:
         teacher_data['hire_date'] = datetime.utcnow()
     
-    db_teacher = Teacher(**teacher_data)
-    session.add(db_teacher)
-    session.commit()
-    session.refresh(db_teacher)
+    # 이메일 중복은 ON CONFLICT로 확인 (동시 등록에도 500이 나지 않음)
+    db_teacher = UpsertService(session).insert_if_absent("teachers", teacher_data)
+    if db_teacher is None:
+        raise HTTPException(status_code=400, detail="Email already registered")
     return db_teacher
 
 @router.put("/{teacher_id}", response_model=Teacher, summary="강사 정보 수정")
@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlmodel import Session
+from typing import Any, Dict
+
+from ...core.database import get_session
+from ...core.response_cache import CachedRoute
+from ...core.versions import conditional_get
+from ...services.schedule_service import ensure_schedule_index
+from ...services.utilization_service import (
+    RESOURCE_CLASSROOM,
+    RESOURCE_TEACHER,
+    UtilizationService,
+    heatmap_to_dict,
+)
+
+router = APIRouter(route_class=CachedRoute)
+
+# 히트맵은 lecture_slot과 함께 갱신되므로 resource_utilization 버전으로 ETag를 만듦
+utilization_etag = conditional_get("resource_utilization")
+
+
+def _list_heatmaps(db: Session, resource_type: str, key_name: str) -> Dict[str, Any]:
+    ensure_schedule_index()
+    records = UtilizationService(db).list_utilization(resource_type)
+    return {key_name: [heatmap_to_dict(record) for record in records], "total": len(records)}
+
+
+def _get_heatmap(db: Session, resource_type: str, resource_key: str) -> Dict[str, Any]:
+    ensure_schedule_index()
+    record = UtilizationService(db).get_utilization(resource_type, resource_key)
+    if record is None:
+        raise HTTPException(status_code=404, detail="사용 중인 일정이 없습니다")
+    return heatmap_to_dict(record)
+
+
+@router.get("/classrooms", summary="강의실별 주간 이용률 히트맵", dependencies=[Depends(utilization_etag)])
+def get_classroom_utilization(db: Session = Depends(get_session)):
+    """강의실마다 요일 × 30분 칸의 사용 중인 분을 반환합니다."""
+    return _list_heatmaps(db, RESOURCE_CLASSROOM, "classrooms")
+
+
+@router.get("/classrooms/{classroom}", summary="강의실 주간 이용률 히트맵", dependencies=[Depends(utilization_etag)])
+def get_classroom_heatmap(classroom: str, db: Session = Depends(get_session)):
+    """강의실 하나의 히트맵"""
+    return _get_heatmap(db, RESOURCE_CLASSROOM, classroom)
+
+
+@router.get("/teachers", summary="강사별 주간 이용률 히트맵", dependencies=[Depends(utilization_etag)])
+def get_teacher_utilization(db: Session = Depends(get_session)):
+    """강사마다 요일 × 30분 칸의 수업 중인 분을 반환합니다."""
+    return _list_heatmaps(db, RESOURCE_TEACHER, "teachers")
+
+
+@router.get("/teachers/{teacher_id}", summary="강사 주간 이용률 히트맵", dependencies=[Depends(utilization_etag)])
+def get_teacher_heatmap(teacher_id: int, db: Session = Depends(get_session)):
+    """강사 한 명의 히트맵"""
+    return _get_heatmap(db, RESOURCE_TEACHER, str(teacher_id))
@@ -0,0 +1,162 @@
+import logging
+import queue
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import Session
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# 변경 이력을 남기는 테이블
+AUDITED_TABLES = frozenset({"student", "teacher", "lecture", "material"})
+
+AUDIT_CREATE = "create"
+AUDIT_UPDATE = "update"
+AUDIT_DELETE = "delete"
+
+# 이력에 남기지 않는 컬럼 (매번 바뀌는 시각)
+AUDIT_IGNORED_COLUMNS = frozenset({"updated_at"})
+
+# 출처 (세션마다 set_audit_source로 바꿈)
+AUDIT_SOURCE_API = "api"
+AUDIT_SOURCE_AI = "ai"
+AUDIT_SOURCE_ARCHIVE = "archive"
+
+
+class AuditEvent(NamedTuple):
+    """변경 한 건 (changes는 필드 → [이전 값, 이후 값])"""
+    created_at: datetime
+    table_name: str
+    record_id: Optional[int]
+    action: str
+    source: str
+    changes: Dict[str, List[Any]]
+
+
+# 커밋된 변경을 쓰기 스레드(services.audit_service.AuditWriter)가 가져갈 때까지 담아 두는 큐
+audit_queue: "queue.Queue[AuditEvent]" = queue.Queue(maxsize=settings.audit_queue_size)
+# 큐가 가득 차 버린 이력 수 (프로세스 시작 후 누적)
+audit_dropped = 0
+
+
+def set_audit_source(session: Session, source: str) -> None:
+    """이 세션에서 커밋되는 변경의 출처 지정 (기본 api)"""
+    session.info["audit_source"] = source
+
+
+def record_audit(
+    session: Session,
+    table_name: str,
+    record_id: Optional[int],
+    action: str,
+    changes: Dict[str, List[Any]],
+    source: Optional[str] = None
+) -> None:
+    """ORM 객체를 거치지 않는 쓰기(일괄 UPDATE, INSERT ... RETURNING 등)의 변경을 세션에 기록 (커밋 시 큐로)
+
+    source를 주지 않으면 세션의 출처(set_audit_source, 기본 api)를 씁니다.
+    """
+    if not settings.audit_enabled or table_name not in AUDITED_TABLES:
+        return
+    changes = {field: values for field, values in changes.items() if field not in AUDIT_IGNORED_COLUMNS}
+    if action == AUDIT_UPDATE and not changes:
+        return
+    _pending(session).append(AuditEvent(
+        datetime.utcnow(), table_name, record_id, action, source or session.info.get("audit_source", AUDIT_SOURCE_API), changes
+    ))
+
+
+def record_created(session: Session, table_name: str, record_id: Optional[int], values: Dict[str, Any]) -> None:
+    """등록된 행 기록"""
+    record_audit(session, table_name, record_id, AUDIT_CREATE, {field: [None, value] for field, value in values.items()})
+
+
+def record_updated(session: Session, table_name: str, record_id: Optional[int], before: Dict[str, Any], after: Dict[str, Any]) -> None:
+    """수정된 행 기록 (값이 실제로 바뀐 필드만)"""
+    changes = {
+        field: [before.get(field), value]
+        for field, value in after.items()
+        if field in before and before[field] != value
+    }
+    record_audit(session, table_name, record_id, AUDIT_UPDATE, changes)
+
+
+def drain_audit_queue(limit: int) -> List[AuditEvent]:
+    """큐에 쌓인 변경을 최대 limit개 꺼냄 (기다리지 않음)"""
+    events: List[AuditEvent] = []
+    while len(events) < limit:
+        try:
+            events.append(audit_queue.get_nowait())
+        except queue.Empty:
+            break
+    return events
+
+
+def _pending(session: Session) -> List[AuditEvent]:
+    return session.info.setdefault("audit_pending", [])
+
+
+def _column_values(obj: Any) -> Dict[str, Any]:
+    return {attr.key: getattr(obj, attr.key) for attr in sa_inspect(obj).mapper.column_attrs}
+
+
+def _capture_flush(session: Session, flush_context: Any) -> None:
+    """flush된 ORM 객체의 변경 전/후 값을 세션에 기록 (서비스의 add/setattr/delete, CRUD 실행기 모두)"""
+    if not settings.audit_enabled:
+        return
+    for obj in session.new:
+        table = getattr(obj, "__tablename__", None)
+        if table in AUDITED_TABLES:
+            record_created(session, table, getattr(obj, "id", None), _column_values(obj))
+
+    for obj in session.dirty:
+        table = getattr(obj, "__tablename__", None)
+        if table not in AUDITED_TABLES or not session.is_modified(obj, include_collections=False):
+            continue
+        state = sa_inspect(obj)
+        changes = {}
+        for attr in state.mapper.column_attrs:
+            history = state.attrs[attr.key].history
+            if history.added or history.deleted:
+                before = history.deleted[0] if history.deleted else None
+                after = history.added[0] if history.added else None
+                if before != after:
+                    changes[attr.key] = [before, after]
+        record_audit(session, table, getattr(obj, "id", None), AUDIT_UPDATE, changes)
+
+    for obj in session.deleted:
+        table = getattr(obj, "__tablename__", None)
+        if table in AUDITED_TABLES:
+            values = _column_values(obj)
+            record_audit(session, table, values.get("id"), AUDIT_DELETE, {field: [value, None] for field, value in values.items()})
+
+
+def _enqueue_committed(session: Session) -> None:
+    """커밋된 변경을 큐에 넣음 (요청은 DB에 쓰지 않고 큐에 넣기만 하며, 큐가 가득 차도 기다리지 않음)"""
+    global audit_dropped
+    events = session.info.pop("audit_pending", None)
+    dropped = 0
+    for audit_event in events or ():
+        try:
+            audit_queue.put_nowait(audit_event)
+        except queue.Full:
+            dropped += 1
+    if dropped:
+        audit_dropped += dropped
+        logger.error(f"변경 이력 큐가 가득 차 이번 커밋의 이력 {dropped}건을 기록하지 못했습니다 (누적 {audit_dropped}건)")
+
+
+def _discard_uncommitted(session: Session) -> None:
+    session.info.pop("audit_pending", None)
+
+
+def install_audit_hooks() -> None:
+    """세션 flush마다 변경을 모으고 커밋되면 큐에 넣도록 등록"""
+    if event.contains(Session, "after_commit", _enqueue_committed):
+        return
+    event.listen(Session, "after_flush", _capture_flush)
+    event.listen(Session, "after_commit", _enqueue_committed)
+    event.listen(Session, "after_rollback", _discard_uncommitted)
@@ -0,0 +1,46 @@
+import zlib
+from typing import Iterable, List
+
+# 이 크기(바이트)보다 큰 비트맵만 zlib으로 압축 (작은 비트맵은 압축 헤더가 더 큼)
+BITMAP_COMPRESS_MIN_BYTES = 64
+
+_RAW = b"r"
+_ZLIB = b"z"
+
+
+def bitmap_from_positions(positions: Iterable[int]) -> int:
+    """비트 위치 목록을 정수 비트맵으로"""
+    value = 0
+    for position in positions:
+        value |= 1 << position
+    return value
+
+
+def bitmap_positions(value: int) -> List[int]:
+    """정수 비트맵에서 켜진 비트 위치 목록 (오름차순)"""
+    positions = []
+    while value:
+        low = value & -value
+        positions.append(low.bit_length() - 1)
+        value ^= low
+    return positions
+
+
+def encode_bitmap(value: int) -> bytes:
+    """정수 비트맵을 저장용 바이트로 (1바이트 형식 표시 + 리틀엔디언 비트, 크면 zlib 압축)"""
+    raw = value.to_bytes((value.bit_length() + 7) // 8, "little")
+    if len(raw) > BITMAP_COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(raw)
+        if len(compressed) < len(raw):
+            return _ZLIB + compressed
+    return _RAW + raw
+
+
+def decode_bitmap(data: bytes) -> int:
+    """encode_bitmap으로 저장한 바이트를 정수 비트맵으로"""
+    if not data:
+        return 0
+    kind, body = data[:1], data[1:]
+    if kind == _ZLIB:
+        body = zlib.decompress(body)
+    return int.from_bytes(body, "little")
@@ -0,0 +1,70 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """프로세스 내 TTL 캐시 (스레드 안전)
+
+    대시보드처럼 짧은 시간 동안 같은 결과를 여러 번 요청하는 곳에서 사용합니다.
+    maxsize를 넘으면 가장 먼저 만료되는 항목부터 제거합니다.
+    invalidate할 때마다 세대(generation)가 올라가므로, 값을 계산하기 전 세대를 set에 넘기면
+    계산 중에 무효화된 (이미 낡았을 수 있는) 결과를 저장하지 않습니다.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """무효화 세대 (invalidate마다 1 증가)"""
+        with self._lock:
+            return self._generation
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> bool:
+        """캐시 저장 (generation이 현재 세대와 다르면 저장하지 않고 False)"""
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            if key not in self._data and len(self._data) >= self.maxsize:
+                oldest = min(self._data, key=lambda k: self._data[k][0])
+                del self._data[oldest]
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            return True
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """캐시에 없으면 factory 결과를 저장 후 반환"""
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """조건에 맞는 항목 삭제 (조건이 없으면 전체 삭제)"""
+        with self._lock:
+            self._generation += 1
+            if predicate is None:
+                removed = len(self._data)
+                self._data.clear()
+                return removed
+            keys = [k for k in self._data if predicate(k)]
+            for k in keys:
+                del self._data[k]
+            return len(keys)
@@ -21,6 +21,51 @@ class Settings:
     # Redis (Celery 브로커)
     redis_url: str = str(config("REDIS_URL", default="redis://localhost:6379"))
     
+    # 대시보드 섹션 캐시 유지 시간 (초)
+    dashboard_cache_ttl: int = config("DASHBOARD_CACHE_TTL", default=30, cast=int)
+
+    # 직렬화된 GET 응답 캐시 (프로세스 내 LRU + 선택적 Redis)
+    response_cache_enabled: bool = config("RESPONSE_CACHE_ENABLED", default=True, cast=bool)
+    response_cache_max_bytes: int = config("RESPONSE_CACHE_MAX_BYTES", default=32 * 1024 * 1024, cast=int)
+    response_cache_redis: bool = config("RESPONSE_CACHE_REDIS", default=False, cast=bool)
+    response_cache_redis_ttl: int = config("RESPONSE_CACHE_REDIS_TTL", default=300, cast=int)
+    # 세션 훅을 거치지 않은 쓰기(직접 연결한 SQL 등)가 있어도 이 시간이 지나면 다시 조회 (초)
+    response_cache_ttl: int = config("RESPONSE_CACHE_TTL", default=60, cast=int)
+    # 테이블 버전(ETag, 캐시 키)을 Redis에서 공유 (웹 워커 여러 개, Celery 워커의 쓰기 반영)
+    table_versions_redis: bool = config("TABLE_VERSIONS_REDIS", default=response_cache_redis, cast=bool)
+    # 웹 워커 수 (버전을 공유하지 않으면 2 이상일 때 ETag/응답 캐시를 쓰지 않음)
+    web_concurrency: int = config("WEB_CONCURRENCY", default=1, cast=int)
+
+    # Idempotency-Key 응답 보관 시간 (시간)
+    idempotency_key_ttl_hours: int = config("IDEMPOTENCY_KEY_TTL_HOURS", default=24, cast=int)
+
+    # 수강료 체납 알림 (기본은 꺼짐, 실제 학생에게 발송되므로 배포 환경에서 명시적으로 켬)
+    reminder_scheduler: str = str(config("REMINDER_SCHEDULER", default="off"))  # celery, inprocess, off
+    reminder_interval_seconds: int = config("REMINDER_INTERVAL_SECONDS", default=3600, cast=int)
+    reminder_lookback_days: int = config("REMINDER_LOOKBACK_DAYS", default=30, cast=int)
+    reminder_batch_size: int = config("REMINDER_BATCH_SIZE", default=200, cast=int)
+    reminder_notifier: str = str(config("REMINDER_NOTIFIER", default="off"))  # file, smtp, off
+    reminder_file_path: str = str(config("REMINDER_FILE_PATH", default="./reminders.jsonl"))
+
+    # 변경 이력 (요청은 큐에 넣기만 하고 쓰기 스레드가 모아서 저장)
+    audit_enabled: bool = config("AUDIT_ENABLED", default=True, cast=bool)
+    audit_flush_interval_seconds: float = config("AUDIT_FLUSH_INTERVAL_SECONDS", default=1.0, cast=float)
+    audit_batch_size: int = config("AUDIT_BATCH_SIZE", default=500, cast=int)
+    audit_queue_size: int = config("AUDIT_QUEUE_SIZE", default=50000, cast=int)
+
+    # 비활성 학생 보관 (이 개월 수 동안 비활성이면 보관 테이블로 옮김)
+    archive_after_months: int = config("ARCHIVE_AFTER_MONTHS", default=6, cast=int)
+    archive_batch_size: int = config("ARCHIVE_BATCH_SIZE", default=200, cast=int)
+    archive_interval_seconds: int = config("ARCHIVE_INTERVAL_SECONDS", default=86400, cast=int)
+
+    # SMTP (기본값은 로컬 테스트용 SMTP 서버, 예: python -m aiosmtpd -n -l localhost:1025)
+    smtp_host: str = str(config("SMTP_HOST", default="localhost"))
+    smtp_port: int = config("SMTP_PORT", default=1025, cast=int)
+    smtp_username: str = str(config("SMTP_USERNAME", default=""))
+    smtp_password: str = str(config("SMTP_PASSWORD", default=""))
+    smtp_use_tls: bool = config("SMTP_USE_TLS", default=False, cast=bool)
+    smtp_sender: str = str(config("SMTP_SENDER", default="academy@localhost"))
+
     # JWT
     jwt_secret_key: str = str(config("JWT_SECRET_KEY", default="your-super-secret-jwt-key-change-in-production"))
     jwt_algorithm: str = str(config("JWT_ALGORITHM", default="HS256"))
@@ -32,6 +77,8 @@ class Settings:
     
     # AI API 설정
     ai_model: str = str(config("AI_MODEL", default="openai"))  # "gemini" 또는 "openai"
+    # AI 컨텍스트에 엔티티별로 넣는 최대 행 수 (넘으면 최신 등록순으로 자르고 잘렸다고 알림)
+    ai_context_max_rows: int = config("AI_CONTEXT_MAX_ROWS", default=500, cast=int)
     
     # Gemini API
     gemini_api_key: str = str(config("GEMINI_API_KEY", default=""))
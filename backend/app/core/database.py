@@ -1,6 +1,10 @@
 from sqlmodel import SQLModel, create_engine, Session, text
 from sqlalchemy import inspect
 from .config import settings
+from .audit import install_audit_hooks
+from .events import install_session_hooks
+from .search_index import install_search_indexes
+from .versions import install_version_hooks
 
 # Create database engine
 engine = create_engine(
@@ -12,6 +16,13 @@ engine = create_engine(
     connect_args={"check_same_thread": False} if "sqlite" in settings.get_database_url else {}
 )
 
+# 커밋된 쓰기를 테이블 변경 알림으로 전달 (캐시 무효화, ETag 버전)
+install_session_hooks()
+# 테이블 버전 증가 (ETag, 응답 캐시 키) - Celery 워커에서도 같은 저장소의 버전을 올림
+install_version_hooks()
+# 서비스/CRUD 실행기의 변경 전후 값을 커밋 시 변경 이력 큐로 전달
+install_audit_hooks()
+
 
 def fix_postgresql_schema():
     """PostgreSQL 스키마 수정 - 누락된 컬럼 추가"""
@@ -102,6 +113,8 @@ def create_db_and_tables():
             # 테이블이 없을 때만 생성
             SQLModel.metadata.create_all(engine)
             print("✅ 새로운 테이블 생성됨")
+            # create_all은 검색용 FTS5 가상 테이블/트리거를 만들지 않음
+            install_search_indexes(engine)
             
             # 프로덕션 환경에서만 샘플 데이터 추가
             if settings.environment == "production":
@@ -110,6 +123,14 @@ def create_db_and_tables():
         else:
             print(f"✅ 기존 테이블 유지됨: {existing_tables}")
             
+            # 새로 추가된 모델의 테이블만 생성 (기존 테이블은 변경하지 않음)
+            missing_tables = [t for t in SQLModel.metadata.tables if t not in existing_tables]
+            if missing_tables:
+                SQLModel.metadata.create_all(engine, tables=[SQLModel.metadata.tables[t] for t in missing_tables])
+                print(f"✅ 새 테이블 생성됨: {missing_tables}")
+            # 마이그레이션 없이 만든 DB에도 검색 인덱스를 둠 (이미 있으면 건너뜀)
+            install_search_indexes(engine)
+            
             # PostgreSQL 스키마 수정 (기존 테이블이 있을 때)
             if settings.environment == "production":
                 fix_postgresql_schema()
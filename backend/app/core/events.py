@@ -0,0 +1,88 @@
+import logging
+import threading
+from itertools import chain
+from typing import Any, Callable, List, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+TableChangeHandler = Callable[[str], None]
+
+_handlers: List[TableChangeHandler] = []
+_lock = threading.Lock()
+
+
+def subscribe_table_change(handler: TableChangeHandler) -> TableChangeHandler:
+    """테이블 변경 알림 구독 (데코레이터로도 사용 가능)"""
+    with _lock:
+        if handler not in _handlers:
+            _handlers.append(handler)
+    return handler
+
+
+def unsubscribe_table_change(handler: TableChangeHandler) -> None:
+    """테이블 변경 알림 구독 해제"""
+    with _lock:
+        if handler in _handlers:
+            _handlers.remove(handler)
+
+
+def publish_table_change(table: str) -> None:
+    """테이블 데이터가 바뀌었음을 구독자(캐시 등)에게 알림
+
+    보통은 install_session_hooks()가 커밋마다 변경된 테이블에 대해 한 번씩 호출합니다.
+    구독자에서 난 오류는 기록만 하고 쓰기 요청을 실패시키지 않습니다.
+    """
+    with _lock:
+        handlers = list(_handlers)
+    for handler in handlers:
+        try:
+            handler(table)
+        except Exception as e:
+            logger.error(f"테이블 변경 알림 처리 실패 ({table}): {e}")
+
+
+def _changed_tables(session: Session) -> Set[str]:
+    return session.info.setdefault("changed_tables", set())
+
+
+def _track_flush(session: Session, flush_context: Any) -> None:
+    """flush된 객체의 테이블 이름을 세션에 기록 (커밋 시 알림)"""
+    tables = _changed_tables(session)
+    for obj in chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table:
+            tables.add(table)
+
+
+def _track_orm_execute(state: Any) -> None:
+    """session.execute(insert/update/delete(Model)) 같은 일괄 DML도 기록"""
+    if state.is_insert or state.is_update or state.is_delete:
+        table = getattr(state.statement, "table", None)
+        if table is not None:
+            _changed_tables(state.session).add(table.name)
+
+
+def _publish_committed(session: Session) -> None:
+    tables = session.info.pop("changed_tables", None)
+    for table in sorted(tables or ()):
+        publish_table_change(table)
+
+
+def _discard_uncommitted(session: Session) -> None:
+    session.info.pop("changed_tables", None)
+
+
+def install_session_hooks() -> None:
+    """세션 커밋 시 변경된 테이블마다 publish_table_change를 한 번씩 호출하도록 등록
+
+    라우터/서비스/스크립트 어디서 쓰든 커밋 단위로 한 번만 알림이 갑니다.
+    """
+    if event.contains(Session, "after_commit", _publish_committed):
+        return
+    event.listen(Session, "after_flush", _track_flush)
+    event.listen(Session, "do_orm_execute", _track_orm_execute)
+    event.listen(Session, "after_commit", _publish_committed)
+    event.listen(Session, "after_rollback", _discard_uncommitted)
@@ -0,0 +1,184 @@
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 점수 척도 (0~100점)
+MAX_SCORE = 100.0
+
+# 과목 판정 기준
+WEAK_PERCENTILE = 30.0      # 반에서 이 백분위 미만이면 약점 (평균이 아래 점수 미만일 때만)
+WEAK_PERCENTILE_FLOOR = 80.0  # 평균이 이 점수 이상이면 반에서 하위여도 약점으로 보지 않음
+WEAK_SCORE = 60.0           # 평균이 이 점수 미만이면 약점
+STRONG_PERCENTILE = 70.0    # 반에서 이 백분위 이상이고 하락 중이 아니면 강점
+DECLINING_SLOPE = -2.0      # 평가 한 번마다 이만큼 이상 떨어지면 하락 중
+
+# 진행도 점수 = 최근 점수 수준 + 반 내 위치 + 추세 (가중치 합 1)
+PROGRESS_WEIGHTS = (0.5, 0.3, 0.2)
+# 추세 점수에서 최대로 치는 기울기 (평가당 점수)
+TREND_SLOPE_CAP = 10.0
+
+
+def build_score_tensor(
+    students: Sequence[Mapping[str, Any]]
+) -> Tuple[List[Any], List[str], np.ndarray]:
+    """학생별 과목 점수 목록을 (학생 × 과목 × 평가 회차) 배열로 (없는 칸은 NaN, 회차는 앞에서부터 채움)
+
+    students 항목은 {"student_id": ..., "scores": {"수학": [70, 75, ...], ...}} 형태입니다.
+    점수가 0~100을 벗어나면 ValueError를 냅니다.
+    """
+    subjects = sorted({subject for student in students for subject in (student.get("scores") or {})})
+    subject_index = {subject: i for i, subject in enumerate(subjects)}
+    length = max(
+        (len(series) for student in students for series in (student.get("scores") or {}).values()),
+        default=0
+    )
+
+    tensor = np.full((len(students), len(subjects), max(length, 1)), np.nan)
+    for row, student in enumerate(students):
+        for subject, series in (student.get("scores") or {}).items():
+            if series:
+                tensor[row, subject_index[subject], :len(series)] = series
+
+    if np.any((tensor < 0) | (tensor > MAX_SCORE)):
+        raise ValueError(f"점수는 0~{MAX_SCORE:g} 사이여야 합니다")
+    return [student.get("student_id") for student in students], subjects, tensor
+
+
+def series_slopes(tensor: np.ndarray) -> np.ndarray:
+    """각 (학생, 과목) 점수열의 최소제곱 기울기 (평가 한 번당 점수 변화, 두 번 미만이면 0)"""
+    present = ~np.isnan(tensor)
+    counts = present.sum(axis=-1)
+    x = np.broadcast_to(np.arange(tensor.shape[-1], dtype=float), tensor.shape)
+    y = np.where(present, tensor, 0.0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_mean = np.where(present, x, 0.0).sum(axis=-1) / counts
+        y_mean = y.sum(axis=-1) / counts
+        dx = np.where(present, x - x_mean[..., None], 0.0)
+        dy = np.where(present, y - y_mean[..., None], 0.0)
+        slopes = (dx * dy).sum(axis=-1) / (dx * dx).sum(axis=-1)
+    return np.where(counts >= 2, slopes, 0.0)
+
+
+def latest_scores(tensor: np.ndarray) -> np.ndarray:
+    """각 (학생, 과목)의 마지막 점수 (점수가 없으면 NaN)"""
+    counts = (~np.isnan(tensor)).sum(axis=-1)
+    last = np.take_along_axis(tensor, np.maximum(counts - 1, 0)[..., None], axis=-1)[..., 0]
+    return np.where(counts > 0, last, np.nan)
+
+
+def cohort_percentiles(values: np.ndarray) -> np.ndarray:
+    """과목별로 같은 과목 점수가 있는 학생들 사이의 백분위 (동점은 절반씩, 값이 없으면 NaN)
+
+    values는 (학생 × 과목) 배열이며 과목마다 한 번 정렬해 모든 학생의 순위를 이진 탐색으로 구합니다.
+    """
+    percentiles = np.full(values.shape, np.nan)
+    for col in range(values.shape[1]):
+        present = ~np.isnan(values[:, col])
+        if not present.any():
+            continue
+        cohort = np.sort(values[present, col])
+        below = np.searchsorted(cohort, values[present, col], side="left")
+        not_above = np.searchsorted(cohort, values[present, col], side="right")
+        percentiles[present, col] = (below + 0.5 * (not_above - below)) / len(cohort) * 100
+    return percentiles
+
+
+def progress_scores(latest: np.ndarray, percentiles: np.ndarray, slopes: np.ndarray, present: np.ndarray) -> np.ndarray:
+    """학생별 진행도 점수 (0~100, 점수가 있는 과목만 평균)"""
+    level = np.where(present, latest / MAX_SCORE, np.nan)
+    standing = np.where(present, percentiles / 100, np.nan)
+    trend = np.where(present, (np.clip(slopes, -TREND_SLOPE_CAP, TREND_SLOPE_CAP) / TREND_SLOPE_CAP + 1) / 2, np.nan)
+
+    counts = present.sum(axis=1)
+    level_weight, standing_weight, trend_weight = PROGRESS_WEIGHTS
+    with np.errstate(invalid="ignore", divide="ignore"):
+        combined = (
+            level_weight * np.nansum(level, axis=1)
+            + standing_weight * np.nansum(standing, axis=1)
+            + trend_weight * np.nansum(trend, axis=1)
+        ) / counts
+    return np.where(counts > 0, np.round(combined * 100), 0).astype(int)
+
+
+def merge_student_scores(
+    students: Sequence[Mapping[str, Any]],
+    student_id: Optional[Any],
+    scores: Optional[Mapping[str, Sequence[float]]]
+) -> List[Dict[str, Any]]:
+    """반 목록에 학생 한 명의 점수를 합침 (반에 이미 있으면 과목을 더하고, 같은 과목 점수가 다르면 ValueError)"""
+    cohort = [dict(student) for student in students]
+    if scores is None:
+        return cohort
+
+    existing = next(
+        (student for student in cohort if student_id is not None and student.get("student_id") == student_id),
+        None
+    )
+    if existing is None:
+        cohort.append({"student_id": student_id, "name": None, "scores": dict(scores)})
+        return cohort
+
+    merged = dict(existing.get("scores") or {})
+    for subject, series in scores.items():
+        if subject in merged and list(merged[subject]) != list(series):
+            raise ValueError(f"학생 {student_id}의 {subject} 점수가 students와 scores에서 서로 다릅니다")
+        merged[subject] = series
+    existing["scores"] = merged
+    return cohort
+
+
+def analyze_cohort(students: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """반 전체의 과목별 추세, 반 내 백분위, 약점/강점, 진행도 점수를 한 번에 계산"""
+    if not students:
+        return []
+    student_ids, subjects, tensor = build_score_tensor(students)
+
+    assessments = (~np.isnan(tensor)).sum(axis=-1)
+    present = assessments > 0
+    means = np.where(present, np.nansum(tensor, axis=-1) / np.maximum(assessments, 1), np.nan)
+    latest = latest_scores(tensor)
+    slopes = series_slopes(tensor)
+    percentiles = cohort_percentiles(means)
+    progress = progress_scores(latest, percentiles, slopes, present)
+
+    with np.errstate(invalid="ignore"):
+        declining = present & (slopes <= DECLINING_SLOPE)
+        # 모두 점수가 높은 반에서 하위 30%라는 이유만으로 약점이 되지 않도록 백분위 기준에는 점수 상한을 둠
+        lagging = (percentiles < WEAK_PERCENTILE) & (means < WEAK_PERCENTILE_FLOOR)
+        weak = present & (lagging | (means < WEAK_SCORE) | declining)
+        strong = present & (percentiles >= STRONG_PERCENTILE) & ~declining & ~weak
+
+    results = []
+    for row, student_id in enumerate(student_ids):
+        subject_rows = [
+            {
+                "subject": subject,
+                "latest": float(latest[row, col]),
+                "mean": round(float(means[row, col]), 2),
+                "trend": round(float(slopes[row, col]), 2),
+                "percentile": round(float(percentiles[row, col]), 1),
+                "assessments": int(assessments[row, col]),
+            }
+            for col, subject in enumerate(subjects)
+            if present[row, col]
+        ]
+        weaknesses = [subjects[col] for col in np.flatnonzero(weak[row])]
+        results.append({
+            "student_id": student_id,
+            "strengths": [subjects[col] for col in np.flatnonzero(strong[row])],
+            "weaknesses": weaknesses,
+            "recommendations": [_recommendation(item) for item in subject_rows if item["subject"] in weaknesses],
+            "progress_score": int(progress[row]),
+            "subjects": subject_rows,
+        })
+    return results
+
+
+def _recommendation(item: Dict[str, Any]) -> str:
+    subject = item["subject"]
+    if item["trend"] <= DECLINING_SLOPE:
+        return f"{subject}: 최근 점수가 평가마다 {abs(item['trend']):.1f}점씩 떨어지고 있어 최근 단원 복습이 필요합니다"
+    if item["mean"] < WEAK_SCORE:
+        return f"{subject}: 평균 {item['mean']:.0f}점으로 기초 개념 보충이 필요합니다"
+    return f"{subject}: 반에서 하위 {item['percentile']:.0f}% 수준이라 학습 시간을 늘리는 것이 좋습니다"
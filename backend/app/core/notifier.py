@@ -0,0 +1,136 @@
+import json
+import logging
+import smtplib
+from abc import ABC, abstractmethod
+from datetime import datetime
+from email.message import EmailMessage
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ReminderMessage(NamedTuple):
+    """체납 알림 한 건"""
+    reminder_id: int
+    student_id: int
+    name: str
+    email: str
+    due_date: datetime
+
+
+def reminder_subject(message: ReminderMessage) -> str:
+    return f"[학원] {message.name}님 수강료 납부 안내"
+
+
+def reminder_body(message: ReminderMessage) -> str:
+    return (
+        f"{message.name}님, 안녕하세요.\n\n"
+        f"{message.due_date:%Y-%m-%d}까지 납부하셔야 할 수강료가 아직 확인되지 않았습니다.\n"
+        "이미 납부하셨다면 이 안내는 무시해 주세요.\n"
+    )
+
+
+class Notifier(ABC):
+    """알림 발송기 (한 번에 여러 건을 보내고 실패한 건만 돌려줌)"""
+
+    @abstractmethod
+    def send_batch(self, messages: List[ReminderMessage]) -> Dict[int, str]:
+        """발송에 실패한 알림 id → 오류 메시지"""
+
+
+class FileNotifier(Notifier):
+    """알림을 JSON Lines 파일에 덧붙이는 발송기 (로컬 개발/테스트용)"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+
+    def send_batch(self, messages: List[ReminderMessage]) -> Dict[int, str]:
+        lines = [
+            json.dumps({
+                "reminder_id": message.reminder_id,
+                "student_id": message.student_id,
+                "to": message.email,
+                "subject": reminder_subject(message),
+                "body": reminder_body(message),
+                "sent_at": datetime.utcnow().isoformat(),
+            }, ensure_ascii=False)
+            for message in messages
+        ]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write("".join(line + "\n" for line in lines))
+        except OSError as e:
+            return {message.reminder_id: str(e) for message in messages}
+        return {}
+
+
+class SmtpNotifier(Notifier):
+    """SMTP 발송기 (배치마다 연결 한 번)"""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        sender: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = False,
+        timeout: float = 30
+    ):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+
+    def send_batch(self, messages: List[ReminderMessage]) -> Dict[int, str]:
+        failures: Dict[int, str] = {}
+        delivered = set()
+        try:
+            with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+                if self.use_tls:
+                    smtp.starttls()
+                if self.username:
+                    smtp.login(self.username, self.password or "")
+                for message in messages:
+                    email = EmailMessage()
+                    email["From"] = self.sender
+                    email["To"] = message.email
+                    email["Subject"] = reminder_subject(message)
+                    email.set_content(reminder_body(message))
+                    try:
+                        smtp.send_message(email)
+                        delivered.add(message.reminder_id)
+                    except smtplib.SMTPException as e:
+                        failures[message.reminder_id] = str(e)
+        except (OSError, smtplib.SMTPException) as e:
+            # 연결/인증 실패는 아직 보내지 않은 건 모두 실패로 처리
+            logger.warning(f"SMTP 발송 실패 ({self.host}:{self.port}): {e}")
+            for message in messages:
+                if message.reminder_id not in delivered:
+                    failures.setdefault(message.reminder_id, str(e))
+        return failures
+
+
+def get_notifier() -> Optional[Notifier]:
+    """설정(REMINDER_NOTIFIER)에 맞는 발송기 (off면 None, 알림은 대기 상태로 남음)"""
+    if settings.reminder_notifier == "off":
+        return None
+    if settings.reminder_notifier == "smtp":
+        return SmtpNotifier(
+            host=settings.smtp_host,
+            port=settings.smtp_port,
+            sender=settings.smtp_sender,
+            username=settings.smtp_username or None,
+            password=settings.smtp_password or None,
+            use_tls=settings.smtp_use_tls
+        )
+    if settings.reminder_notifier == "file":
+        return FileNotifier(settings.reminder_file_path)
+    raise ValueError(f"지원하지 않는 알림 발송기입니다: {settings.reminder_notifier}")
@@ -0,0 +1,115 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import and_, func, or_, select as sa_select
+from sqlmodel import Session
+
+
+# 내림차순 정렬에서 NULL을 맨 앞에 두는 DB (SQLite, MySQL은 맨 뒤)
+NULLS_FIRST_WHEN_DESC_DIALECTS = frozenset({"postgresql", "oracle"})
+
+
+class Page(NamedTuple):
+    """목록 조회 결과 (항목, 전체 개수(세지 않았으면 None), 다음 페이지 커서)"""
+    items: List[Any]
+    total: Optional[int]
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(created_at: Optional[datetime], row_id: int) -> str:
+    """(created_at, id)를 불투명한 커서 문자열로 인코딩 (created_at이 없는 예전 행은 null)"""
+    payload = json.dumps([created_at.isoformat() if created_at is not None else None, row_id]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """커서 문자열을 (created_at, id)로 디코딩 (형식이 잘못되면 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return (datetime.fromisoformat(created_at) if created_at is not None else None), int(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def cursor_for(item: Any) -> str:
+    """목록 항목의 (created_at, id)로 커서 생성 (모델 객체 또는 컬럼 dict)"""
+    if isinstance(item, dict):
+        return encode_cursor(item["created_at"], item["id"])
+    return encode_cursor(item.created_at, item.id)
+
+
+def _row_reader(query: Any) -> Callable[[Any], Any]:
+    """결과 행을 항목으로 바꾸는 함수 (엔티티 select는 모델 객체, 컬럼 select는 dict)"""
+    descriptions = query.column_descriptions
+    if len(descriptions) == 1 and descriptions[0]["expr"] is descriptions[0]["entity"]:
+        return lambda row: row[0]
+
+    names = [d["name"] for d in descriptions]
+    return lambda row: dict(zip(names, row))
+
+
+def count_rows(db: Session, query: Any) -> int:
+    """쿼리 결과 행 수를 SQL COUNT로 계산"""
+    count_query = sa_select(func.count()).select_from(query.order_by(None).subquery())
+    return db.execute(count_query).scalar_one()
+
+
+def fetch_page(db: Session, query: Any, skip: int, limit: int) -> Page:
+    """페이지와 전체 개수를 한 번의 쿼리로 조회 (COUNT(*) OVER())
+
+    query는 엔티티 하나 또는 id, created_at을 포함한 컬럼들을 선택하는 select여야 합니다.
+    페이지가 비어 있으면 윈도 함수 결과를 얻을 수 없으므로 COUNT 쿼리로 전체 개수를 구합니다.
+    """
+    windowed = query.add_columns(func.count().over().label("total_count"))
+    rows = db.execute(windowed.offset(skip).limit(limit)).all()
+
+    if not rows:
+        return Page([], count_rows(db, query))
+
+    read = _row_reader(query)
+    items = [read(row) for row in rows]
+    total = rows[0][-1]
+    next_cursor = cursor_for(items[-1]) if skip + len(items) < total else None
+    return Page(items, total, next_cursor)
+
+
+def _after_cursor(db: Session, model: Any, created_at: Optional[datetime], row_id: int) -> Any:
+    """created_at DESC, id DESC 순서에서 커서 다음 행들의 조건 (created_at이 NULL인 행 포함)"""
+    nulls_first = db.get_bind().dialect.name in NULLS_FIRST_WHEN_DESC_DIALECTS
+    if created_at is None:
+        same_null = and_(model.created_at.is_(None), model.id < row_id)
+        return or_(same_null, model.created_at.is_not(None)) if nulls_first else same_null
+
+    after = or_(
+        model.created_at < created_at,
+        and_(model.created_at == created_at, model.id < row_id)
+    )
+    return after if nulls_first else or_(after, model.created_at.is_(None))
+
+
+def fetch_keyset_page(
+    db: Session,
+    query: Any,
+    model: Any,
+    cursor: str,
+    limit: int,
+    with_total: bool = False
+) -> Page:
+    """(created_at, id) 키셋 기준으로 커서 다음 페이지 조회
+
+    query는 created_at DESC, id DESC로 정렬되어 있어야 합니다.
+    OFFSET을 쓰지 않으므로 깊은 페이지도 인덱스 범위 탐색 한 번으로 끝납니다.
+    전체 개수는 매 페이지 COUNT가 들지 않도록 with_total일 때만 셉니다 (아니면 total은 None).
+    """
+    created_at, row_id = decode_cursor(cursor)
+    keyset_query = query.where(_after_cursor(db, model, created_at, row_id))
+    read = _row_reader(query)
+    items = [read(row) for row in db.execute(keyset_query.limit(limit + 1)).all()]
+
+    has_more = len(items) > limit
+    items = items[:limit]
+    next_cursor = cursor_for(items[-1]) if has_more else None
+    return Page(items, count_rows(db, query) if with_total else None, next_cursor)
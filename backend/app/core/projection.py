@@ -0,0 +1,42 @@
+from typing import Any, Dict, List, Optional
+
+from sqlmodel import select
+
+# 커서 생성에 필요해 항상 SELECT에 포함하는 컬럼
+CURSOR_COLUMNS = ("id", "created_at")
+
+
+def parse_fields(fields: Optional[str], model: Any) -> Optional[List[str]]:
+    """fields 쿼리 파라미터("id,name,email")를 컬럼 이름 목록으로 변환
+
+    값이 없으면 None(전체 컬럼)을 반환하고, 모델에 없는 컬럼이 있으면 ValueError를 냅니다.
+    """
+    if not fields:
+        return None
+
+    requested = []
+    for field in fields.split(","):
+        field = field.strip()
+        if field and field not in requested:
+            requested.append(field)
+    if not requested:
+        return None
+
+    columns = model.__table__.columns.keys()
+    unknown = [field for field in requested if field not in columns]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)} (available: {', '.join(columns)})")
+    return requested
+
+
+def build_projection_query(model: Any, fields: List[str]):
+    """요청한 컬럼(+ 커서용 컬럼)만 선택하는 select 생성"""
+    names = list(fields) + [c for c in CURSOR_COLUMNS if c not in fields]
+    return select(*(getattr(model, name) for name in names))
+
+
+def project_items(items: List[Dict[str, Any]], fields: List[str]) -> List[Dict[str, Any]]:
+    """조회한 행에서 요청한 키만 남김 (커서용으로 추가한 컬럼 제거)"""
+    if all(column in fields for column in CURSOR_COLUMNS):
+        return items
+    return [{field: item[field] for field in fields} for item in items]
@@ -0,0 +1,81 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# 학년 순서 (학년 차이를 거리로 쓰기 위한 순위)
+GRADE_ORDER = ("초1", "초2", "초3", "초4", "초5", "초6", "중1", "중2", "중3", "고1", "고2", "고3")
+_GRADE_RANKS = {grade: float(rank) for rank, grade in enumerate(GRADE_ORDER)}
+
+# 강의 난이도 순위 (영문/한글 표기 모두 허용, 모르는 값은 중급)
+DIFFICULTY_RANKS = {
+    "beginner": 0.0, "초급": 0.0,
+    "intermediate": 1.0, "중급": 1.0,
+    "advanced": 2.0, "고급": 2.0,
+}
+DEFAULT_DIFFICULTY = 1.0
+MAX_DIFFICULTY = 2.0
+
+# 추천 점수 = 학년 적합 + 수강 과목 연속성 + 난이도 적합 + 남은 좌석 (가중치 합 1)
+RECOMMENDATION_WEIGHTS = (0.45, 0.25, 0.2, 0.1)
+# 학년이 이만큼 차이 나면 학년 점수 0
+GRADE_TOLERANCE = 2.0
+# 학년을 모르는 학생/강의의 학년 점수
+UNKNOWN_GRADE_FIT = 0.5
+
+
+def grade_rank(grade: Optional[str]) -> float:
+    """학년 순위 (모르는 학년은 NaN)"""
+    return _GRADE_RANKS.get((grade or "").strip(), np.nan)
+
+
+def difficulty_rank(level: Optional[str]) -> float:
+    """난이도 순위 (0 초급 ~ 2 고급)"""
+    return DIFFICULTY_RANKS.get((level or "").strip().lower(), DEFAULT_DIFFICULTY)
+
+
+def target_difficulties(attended: np.ndarray, sessions: np.ndarray) -> np.ndarray:
+    """학생별로 맞는 난이도 (출석률 0~100%를 0~2로, 출석 기록이 없으면 중급)"""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rates = attended / sessions
+    return np.where(sessions > 0, rates * MAX_DIFFICULTY, DEFAULT_DIFFICULTY)
+
+
+def score_pairs(
+    student_grades: np.ndarray,
+    student_subjects: np.ndarray,
+    student_levels: np.ndarray,
+    lecture_grades: np.ndarray,
+    lecture_subjects: np.ndarray,
+    lecture_levels: np.ndarray,
+    lecture_free_ratio: np.ndarray
+) -> np.ndarray:
+    """(학생 × 강의) 추천 점수 (0~1)
+
+    student_subjects는 (학생 × 과목) 수강 여부 행렬이고 lecture_subjects는 강의마다 과목 열 번호입니다.
+    """
+    with np.errstate(invalid="ignore"):
+        grade_gap = np.abs(student_grades[:, None] - lecture_grades[None, :])
+        grade_fit = np.where(np.isnan(grade_gap), UNKNOWN_GRADE_FIT, np.clip(1 - grade_gap / GRADE_TOLERANCE, 0, 1))
+    subject_fit = student_subjects[:, lecture_subjects]
+    level_fit = 1 - np.abs(student_levels[:, None] - lecture_levels[None, :]) / MAX_DIFFICULTY
+    seat_fit = np.clip(lecture_free_ratio, 0, 1)[None, :]
+
+    grade_weight, subject_weight, level_weight, seat_weight = RECOMMENDATION_WEIGHTS
+    return grade_weight * grade_fit + subject_weight * subject_fit + level_weight * level_fit + seat_weight * seat_fit
+
+
+def top_k(scores: np.ndarray, k: int) -> List[List[Tuple[int, float]]]:
+    """행마다 점수가 높은 열 k개 (열 번호, 점수), -inf인 칸(추천 제외)은 빠짐"""
+    if scores.size == 0 or k <= 0:
+        return [[] for _ in range(scores.shape[0])]
+    k = min(k, scores.shape[1])
+    # 행마다 전체 정렬 없이 상위 k개만 고른 뒤 그 k개만 정렬
+    candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+    order = np.argsort(-candidate_scores, axis=1, kind="stable")
+    columns = np.take_along_axis(candidates, order, axis=1)
+    values = np.take_along_axis(candidate_scores, order, axis=1)
+    return [
+        [(int(col), round(float(value), 4)) for col, value in zip(row_columns, row_values) if np.isfinite(value)]
+        for row_columns, row_values in zip(columns, values)
+    ]
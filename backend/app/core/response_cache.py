@@ -0,0 +1,167 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Coroutine, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+from .config import settings
+from .versions import create_redis_client, etag_matches, make_etag, table_versions
+
+logger = logging.getLogger(__name__)
+
+REDIS_RESPONSE_PREFIX = "academy:response:"
+
+# (본문 바이트, Content-Type)
+CachedBody = Tuple[bytes, str]
+
+
+class LRUBytesCache:
+    """본문 바이트 크기 합계로 제한되는 LRU 캐시 (스레드 안전)
+
+    ttl_seconds가 0보다 크면 저장 후 그 시간이 지난 항목은 없는 것으로 봅니다.
+    """
+
+    def __init__(self, max_bytes: int, ttl_seconds: float = 0):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.current_bytes = 0
+        # 키 → (만료 시각, 항목)
+        self._data: "OrderedDict[str, Tuple[float, CachedBody]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedBody]:
+        """캐시 조회 (조회한 항목은 가장 최근 사용으로 이동, 만료되었으면 제거하고 None)"""
+        with self._lock:
+            stored = self._data.get(key)
+            if stored is None:
+                return None
+            expires_at, entry = stored
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.current_bytes -= len(entry[0])
+                return None
+            self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedBody) -> None:
+        """캐시 저장 (한도를 넘으면 오래 안 쓴 항목부터 제거)"""
+        size = len(entry[0])
+        if size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds > 0 else float("inf")
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.current_bytes -= len(old[1][0])
+            self._data[key] = (expires_at, entry)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted) = self._data.popitem(last=False)
+                self.current_bytes -= len(evicted[0])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ResponseCache:
+    """직렬화된 응답 캐시 (프로세스 내 LRU → Redis 순으로 조회)
+
+    키는 ETag(경로, 정렬된 쿼리, 테이블 버전의 해시)이므로 쓰기가 일어나면 키 자체가 바뀌어
+    따로 무효화할 필요가 없습니다. 예전 키의 항목은 LRU에서 밀려나거나 TTL로 사라집니다.
+    버전에 잡히지 않은 쓰기(세션을 거치지 않은 SQL 등)도 ttl_seconds가 지나면 반영됩니다.
+    """
+
+    def __init__(self, max_bytes: int, redis_client: Optional[Any] = None, redis_ttl: int = 300, ttl_seconds: int = 0):
+        self.local = LRUBytesCache(max_bytes, ttl_seconds)
+        self.redis = redis_client
+        self.redis_ttl = min(redis_ttl, ttl_seconds) if ttl_seconds > 0 else redis_ttl
+
+    def get(self, key: str) -> Optional[CachedBody]:
+        entry = self.local.get(key)
+        if entry is not None or self.redis is None:
+            return entry
+
+        try:
+            raw = self.redis.get(REDIS_RESPONSE_PREFIX + key)
+        except Exception as e:
+            logger.error(f"Redis 응답 캐시 조회 실패: {e}")
+            return None
+        if raw is None:
+            return None
+
+        media_type, _, body = raw.partition(b"\n")
+        entry = (body, media_type.decode())
+        self.local.set(key, entry)
+        return entry
+
+    def set(self, key: str, entry: CachedBody) -> None:
+        self.local.set(key, entry)
+        if self.redis is None:
+            return
+        body, media_type = entry
+        try:
+            self.redis.set(REDIS_RESPONSE_PREFIX + key, media_type.encode() + b"\n" + body, ex=self.redis_ttl)
+        except Exception as e:
+            logger.error(f"Redis 응답 캐시 저장 실패: {e}")
+
+
+response_cache = ResponseCache(
+    settings.response_cache_max_bytes,
+    redis_client=create_redis_client() if settings.response_cache_redis else None,
+    redis_ttl=settings.response_cache_redis_ttl,
+    ttl_seconds=settings.response_cache_ttl
+)
+
+
+def _find_conditional_get(dependant: Any) -> Optional[Callable]:
+    """라우트 의존성에서 core.versions.conditional_get 의존성 찾기"""
+    for sub in dependant.dependencies:
+        if hasattr(sub.call, "tables"):
+            return sub.call
+        found = _find_conditional_get(sub)
+        if found is not None:
+            return found
+    return None
+
+
+class CachedRoute(APIRoute):
+    """conditional_get 의존성이 있는 GET 라우트의 응답 바이트를 캐시하는 라우트 클래스
+
+    캐시에 있으면 DB 조회와 직렬화 없이 저장된 바이트를 그대로 돌려줍니다.
+    APIRouter(route_class=CachedRoute)로 사용합니다.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        spec = _find_conditional_get(self.dependant)
+        if spec is None or "GET" not in self.methods:
+            return handler
+
+        async def cached_handler(request: Request) -> Response:
+            if not settings.response_cache_enabled or not table_versions.cacheable:
+                return await handler(request)
+
+            # 버전은 조회보다 먼저 읽음 (사이에 쓰기가 있으면 아래에서 저장하지 않음)
+            key = make_etag(request, spec.tables, spec.time_bucket)
+            cached = response_cache.get(key)
+            if cached is not None:
+                if etag_matches(request.headers.get("if-none-match"), key):
+                    return Response(status_code=304, headers={"ETag": key})
+                body, media_type = cached
+                return Response(content=body, media_type=media_type, headers={"ETag": key, "X-Cache": "HIT"})
+
+            response = await handler(request)
+            # 핸들러가 만든 ETag가 키와 같을 때만 저장 (그 사이 버전이 바뀌었으면 저장하지 않음)
+            if response.status_code == 200 and response.headers.get("etag") == key and hasattr(response, "body"):
+                response_cache.set(key, (response.body, response.headers.get("content-type", "application/json")))
+            return response
+
+        return cached_handler
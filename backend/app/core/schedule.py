@@ -0,0 +1,110 @@
+import re
+from datetime import datetime, time, timedelta
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+WEEKDAYS = "월화수목금토일"  # 0 = 월요일 (datetime.weekday()와 같음)
+MINUTES_PER_DAY = 24 * 60
+
+# 이용률 히트맵 칸 크기 (하루 48칸)
+UTILIZATION_SLOT_MINUTES = 30
+
+# "월수금 14:00-16:00", "화,목 9:30~11:00" (여러 묶음은 "/", ",", ";"로 구분)
+_GROUP = re.compile(
+    r"(?P<days>[월화수목금토일](?:[\s,·]*[월화수목금토일])*)\s*"
+    r"(?P<start>\d{1,2}:\d{2})\s*[-~]\s*(?P<end>\d{1,2}:\d{2})"
+)
+_SEPARATORS = re.compile(r"[\s,/;]*")
+
+# 일정/강의실이 아직 정해지지 않았음을 뜻하는 값 (빈 값과 같게 취급)
+UNDECIDED = "미정"
+
+
+class ScheduleSlot(NamedTuple):
+    """요일과 분 단위 시간 구간 [start_minute, end_minute)"""
+    weekday: int
+    start_minute: int
+    end_minute: int
+
+
+def _minutes(value: str) -> int:
+    hour, minute = (int(part) for part in value.split(":"))
+    if minute >= 60 or hour * 60 + minute > MINUTES_PER_DAY:
+        raise ValueError(f"잘못된 시각입니다: {value}")
+    return hour * 60 + minute
+
+
+def is_undecided(value: Optional[str]) -> bool:
+    """빈 값이거나 "미정"인지"""
+    return not value or value.strip() in ("", UNDECIDED)
+
+
+def is_free_text(schedule: Optional[str]) -> bool:
+    """요일+시각 묶음이 하나도 없는 자유 형식 일정인지 (예: "협의 후 결정")"""
+    return not is_undecided(schedule) and _GROUP.search(schedule) is None
+
+
+def parse_schedule(schedule: str) -> List[ScheduleSlot]:
+    """강의 일정 문자열을 요일별 시간 구간으로 변환 (빈 문자열과 "미정"은 빈 목록)
+
+    해석할 수 없는 부분이 있으면 ValueError를 냅니다.
+    """
+    if is_undecided(schedule):
+        return []
+    slots: List[ScheduleSlot] = []
+    position = 0
+    schedule = schedule.strip()
+    for match in _GROUP.finditer(schedule):
+        if not _SEPARATORS.fullmatch(schedule, position, match.start()):
+            break
+        start, end = _minutes(match["start"]), _minutes(match["end"])
+        if end <= start:
+            raise ValueError(f"종료 시각이 시작 시각보다 늦어야 합니다: {match.group(0)}")
+        for day in dict.fromkeys(re.findall(r"[월화수목금토일]", match["days"])):
+            slots.append(ScheduleSlot(WEEKDAYS.index(day), start, end))
+        position = match.end()
+
+    if not _SEPARATORS.fullmatch(schedule, position):
+        raise ValueError(f"일정 형식을 해석할 수 없습니다: '{schedule}' (예: '월수금 14:00-16:00')")
+    return sorted(set(slots))
+
+
+def format_minute(minute: int) -> str:
+    """분을 "HH:MM"으로"""
+    return f"{minute // 60:02d}:{minute % 60:02d}"
+
+
+def occupancy_matrix(slots: Iterable[ScheduleSlot], slot_minutes: int = UTILIZATION_SLOT_MINUTES) -> bytes:
+    """요일 × 시간 칸마다 사용 중인 분을 1바이트로 담은 배열 (요일 순, 행 우선)
+
+    같은 칸에 구간이 겹치면 합산하며 255에서 멈춥니다.
+    """
+    per_day = MINUTES_PER_DAY // slot_minutes
+    cells = bytearray(len(WEEKDAYS) * per_day)
+    for slot in slots:
+        for cell in range(slot.start_minute // slot_minutes, (slot.end_minute - 1) // slot_minutes + 1):
+            cell_start = cell * slot_minutes
+            overlap = min(slot.end_minute, cell_start + slot_minutes) - max(slot.start_minute, cell_start)
+            index = slot.weekday * per_day + cell
+            cells[index] = min(255, cells[index] + overlap)
+    return bytes(cells)
+
+
+def expand_sessions(slots: List[ScheduleSlot], start: datetime, count: int) -> List[Tuple[datetime, datetime]]:
+    """start 이후 일정대로 열리는 수업 count회의 (시작, 끝) 목록 (시각은 일정 문자열 그대로의 현지 시각)"""
+    if not slots or count <= 0:
+        return []
+
+    weekly = sorted(slots)
+    monday = datetime.combine(start.date() - timedelta(days=start.weekday()), time.min)
+    sessions: List[Tuple[datetime, datetime]] = []
+    week = 0
+    while len(sessions) < count:
+        for slot in weekly:
+            begins = monday + timedelta(weeks=week, days=slot.weekday, minutes=slot.start_minute)
+            if begins < start:
+                continue
+            sessions.append((begins, begins + timedelta(minutes=slot.end_minute - slot.start_minute)))
+            if len(sessions) == count:
+                break
+        week += 1
+    return sessions
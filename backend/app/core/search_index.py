@@ -0,0 +1,93 @@
+"""통합 검색용 인덱스 (SQLite FTS5 trigram 테이블, PostgreSQL pg_trgm GIN 인덱스)
+
+alembic 80073b304248 마이그레이션과 같은 객체를 만듭니다. create_all로 만든 DB에는 가상 테이블과
+트리거가 생기지 않으므로 create_db_and_tables에서 install_search_indexes를 함께 호출합니다.
+"""
+import logging
+from typing import Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+
+logger = logging.getLogger(__name__)
+
+# 테이블별 검색 대상 컬럼 (alembic 80073b304248 마이그레이션의 SEARCH_COLUMNS와 같아야 함)
+# 전화번호는 하이픈을 뺀 숫자만으로도 찾을 수 있도록 별도 컬럼/표현식을 둡니다.
+SEARCH_COLUMNS: Dict[str, List[str]] = {
+    "student": ["name", "email", "phone"],
+    "teacher": ["name", "email", "phone", "subject"],
+    "material": ["name", "author", "subject"],
+}
+
+
+def pg_search_expression(columns: List[str]) -> str:
+    """pg_trgm GIN 인덱스와 같은 검색 표현식"""
+    parts = [f"coalesce({col}, '')" for col in columns]
+    if "phone" in columns:
+        parts.append("replace(coalesce(phone, ''), '-', '')")
+    return "(" + " || ' ' || ".join(parts) + ")"
+
+
+def _fts_columns(columns: List[str]) -> List[str]:
+    return columns + (["phone_digits"] if "phone" in columns else [])
+
+
+def _fts_values(columns: List[str], prefix: str) -> List[str]:
+    values = [f"{prefix}.{col}" for col in columns]
+    if "phone" in columns:
+        values.append(f"replace({prefix}.phone, '-', '')")
+    return values
+
+
+def _sqlite_statements(table: str, columns: List[str]) -> List[str]:
+    """FTS5 테이블, 원본 테이블 동기화 트리거, 기존 데이터 색인"""
+    fts = f"{table}_fts"
+    fts_columns = ", ".join(_fts_columns(columns))
+    new_values = ", ".join(_fts_values(columns, "new"))
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({fts_columns}, tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {fts_columns}) VALUES (new.id, {new_values}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"DELETE FROM {fts} WHERE rowid = old.id; END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN "
+        f"DELETE FROM {fts} WHERE rowid = old.id; "
+        f"INSERT INTO {fts}(rowid, {fts_columns}) VALUES (new.id, {new_values}); END",
+        f"INSERT INTO {fts}(rowid, {fts_columns}) "
+        f"SELECT id, {', '.join(_fts_values(columns, table))} FROM {table}",
+    ]
+
+
+def install_search_indexes(engine: Engine) -> bool:
+    """검색 인덱스가 없으면 만들고 사용할 수 있는지 반환 (이미 있으면 그대로 둠)
+
+    FTS5/trigram 토크나이저나 pg_trgm 확장을 쓸 수 없으면 경고를 남기고 False (검색은 LIKE로 동작)
+    """
+    dialect = engine.dialect.name
+    try:
+        with engine.begin() as connection:
+            if dialect == "postgresql":
+                connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                for table, columns in SEARCH_COLUMNS.items():
+                    connection.execute(text(
+                        f"CREATE INDEX IF NOT EXISTS ix_{table}_search_trgm ON {table} "
+                        f"USING gin ({pg_search_expression(columns)} gin_trgm_ops)"
+                    ))
+                return True
+            if dialect != "sqlite":
+                return False
+
+            existing = set(connection.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE '%_fts'")
+            ).scalars())
+            for table, columns in SEARCH_COLUMNS.items():
+                if f"{table}_fts" in existing:
+                    continue
+                for statement in _sqlite_statements(table, columns):
+                    connection.execute(text(statement))
+                logger.info(f"검색 인덱스 생성: {table}_fts")
+        return True
+    except DBAPIError as e:
+        logger.warning(f"검색 인덱스를 만들 수 없어 통합 검색이 LIKE 전체 스캔으로 동작합니다: {e}")
+        return False
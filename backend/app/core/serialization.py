@@ -0,0 +1,45 @@
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(value: Any) -> Any:
+    """표준 json 모듈이 처리하지 못하는 값 변환 (orjson이 없을 때만 사용)"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """dict/list를 JSON 바이트로 변환 (orjson이 있으면 사용)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """응답 모델 검증과 jsonable_encoder를 거치지 않고 바로 직렬화하는 JSON 응답
+
+    라우터의 response_model은 그대로 두어 OpenAPI 스키마는 유지됩니다.
+    내용은 응답 모델과 같은 키/타입의 dict로 만들어 넘겨야 합니다.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def response_columns(schema: Any) -> List[str]:
+    """응답 스키마의 필드 이름 목록 (SELECT할 컬럼으로 사용)"""
+    return list(schema.model_fields)
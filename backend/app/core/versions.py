@@ -0,0 +1,164 @@
+import hashlib
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from fastapi import HTTPException, Request, Response
+
+from .config import settings
+from .events import subscribe_table_change
+
+logger = logging.getLogger(__name__)
+
+REDIS_VERSION_PREFIX = "academy:table_version:"
+
+
+class TableVersions:
+    """테이블별 버전 카운터 (스레드 안전)
+
+    커밋마다 변경된 테이블의 버전이 1씩 올라갑니다. 기본은 프로세스 메모리에만 있으므로
+    재시작하면 0부터 다시 시작하며, 스냅샷에는 프로세스마다 다른 boot_id를 함께 넣습니다.
+    Redis를 연결하면 버전을 Redis에서 공유해 여러 프로세스가 같은 ETag/캐시 키를 만들고,
+    Celery 워커처럼 다른 프로세스에서 커밋한 쓰기도 반영됩니다.
+
+    버전은 세션 커밋 훅(core.events)으로만 올라가므로, 세션을 거치지 않고 직접 연결로 쓰는 코드는
+    커밋 후 publish_table_change(table)를 호출해야 합니다. (놓친 쓰기도 응답 캐시 TTL이 지나면 반영)
+    """
+
+    def __init__(self):
+        self.boot_id = uuid.uuid4().hex
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._redis: Optional[Any] = None
+
+    def use_redis(self, client: Any) -> None:
+        """버전을 Redis에서 공유 (None이면 프로세스 내 카운터만 사용)"""
+        self._redis = client
+
+    @property
+    def shared(self) -> bool:
+        """버전을 프로세스 사이에 공유하는지"""
+        return self._redis is not None
+
+    @property
+    def cacheable(self) -> bool:
+        """ETag 304/응답 캐시를 써도 되는지
+
+        버전이 프로세스 내에만 있으면 다른 웹 워커의 쓰기를 모르므로 워커가 하나일 때만 씁니다.
+        """
+        return self.shared or settings.web_concurrency <= 1
+
+    def bump(self, table: str) -> int:
+        """테이블 버전 증가"""
+        with self._lock:
+            self._versions[table] = self._versions.get(table, 0) + 1
+            version = self._versions[table]
+        if self._redis is not None:
+            try:
+                self._redis.incr(REDIS_VERSION_PREFIX + table)
+            except Exception as e:
+                logger.error(f"Redis 테이블 버전 증가 실패 ({table}): {e}")
+        return version
+
+    def get(self, table: str) -> int:
+        """테이블 현재 버전 (프로세스 내 카운터)"""
+        with self._lock:
+            return self._versions.get(table, 0)
+
+    def snapshot(self, tables: Iterable[str]) -> Tuple[Tuple[str, Any], ...]:
+        """여러 테이블의 현재 버전 (첫 항목은 버전의 범위: Redis 공유 또는 이 프로세스)"""
+        tables = sorted(tables)
+        if self._redis is not None:
+            try:
+                keys = [REDIS_VERSION_PREFIX + table for table in tables]
+                values = self._redis.mget(keys)
+                if any(value is None for value in values):
+                    # 키가 없으면(첫 사용, Redis 초기화) 현재 시각에서 시작해 예전 ETag와 겹치지 않게 함
+                    start = time.time_ns() // 1000
+                    for key, value in zip(keys, values):
+                        if value is None:
+                            self._redis.set(key, start, nx=True)
+                    values = self._redis.mget(keys)
+                return (("scope", "redis"),) + tuple(
+                    (table, int(value)) for table, value in zip(tables, values)
+                )
+            except Exception as e:
+                # Redis 장애 시 프로세스 내 카운터로 대신 (범위가 달라 키가 섞이지 않음)
+                logger.error(f"Redis 테이블 버전 조회 실패: {e}")
+        with self._lock:
+            return (("scope", self.boot_id),) + tuple(
+                (table, self._versions.get(table, 0)) for table in tables
+            )
+
+
+def create_redis_client() -> Optional[Any]:
+    """설정의 Redis 클라이언트 (redis 패키지가 없으면 None)"""
+    try:
+        import redis
+    except ImportError:
+        logger.warning("redis 패키지가 없어 프로세스 내 저장소만 사용합니다.")
+        return None
+    return redis.Redis.from_url(settings.redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+
+
+table_versions = TableVersions()
+
+
+def install_version_hooks() -> None:
+    """커밋된 테이블 변경마다 버전을 올리도록 등록 (TABLE_VERSIONS_REDIS면 Redis에서 공유)"""
+    subscribe_table_change(table_versions.bump)
+    if settings.table_versions_redis and not table_versions.shared:
+        table_versions.use_redis(create_redis_client())
+    if not table_versions.cacheable:
+        logger.warning(
+            f"WEB_CONCURRENCY={settings.web_concurrency}인데 테이블 버전을 공유하지 않아 ETag/응답 캐시를 끕니다 "
+            "(TABLE_VERSIONS_REDIS=true로 켤 수 있음)"
+        )
+
+
+def make_etag(request: Request, tables: Iterable[str], time_bucket: Optional[int] = None) -> str:
+    """경로, 쿼리, 테이블 버전으로 강한 ETag 생성
+
+    time_bucket(초)을 주면 그 간격마다 ETag가 바뀝니다 (연체 수처럼 시간에 따라 바뀌는 응답용).
+    """
+    query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+    parts = [request.url.path, query]
+    parts.extend(f"{table}:{version}" for table, version in table_versions.snapshot(tables))
+    if time_bucket:
+        parts.append(str(int(time.time() // time_bucket)))
+    return '"' + hashlib.sha1("|".join(parts).encode()).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교, RFC 9110)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (value.strip() for value in if_none_match.split(","))
+    return any(
+        (candidate[2:] if candidate.startswith("W/") else candidate) == etag
+        for candidate in candidates
+    )
+
+
+def conditional_get(*tables: str, time_bucket: Optional[int] = None):
+    """ETag를 붙이고, If-None-Match가 일치하면 DB 조회 없이 304를 반환하는 의존성
+
+    의존성은 ETag 문자열을 반환합니다. Response 객체를 직접 반환하는 엔드포인트는
+    headers={"ETag": etag}로 직접 넣어야 합니다.
+    """
+    def dependency(request: Request, response: Response) -> str:
+        # 버전을 조회보다 먼저 읽어야 그 사이의 쓰기가 다음 요청에서 반영됨
+        etag = make_etag(request, tables, time_bucket)
+        if table_versions.cacheable and etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers={"ETag": etag})
+        response.headers["ETag"] = etag
+        return etag
+
+    # 응답 캐시(core.response_cache.CachedRoute)가 같은 키를 만들 수 있도록 설정을 남김
+    dependency.tables = tables
+    dependency.time_bucket = time_bucket
+    return dependency
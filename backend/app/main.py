@@ -7,7 +7,7 @@ from datetime import datetime
 from sqlalchemy import text
 
 from app.core.database import create_db_and_tables, get_session
-from app.api.v1 import ai, auth, lectures, materials, students, teachers, user, excel_preview, statistics
+from app.api.v1 import ai, auth, lectures, materials, students, teachers, user, excel_preview, statistics, dashboard, search, enrollments, schedules, utilization, calendar, attendance, payments, reminders, inventory, recommendations, audit, archive
 
 # 강제 스키마 수정 함수 추가
 def force_fix_postgresql_schema():
@@ -648,12 +648,25 @@ async def lifespan(app: FastAPI):
         import traceback
         traceback.print_exc()
     
+    # 수강료 체납 알림 (Celery beat를 쓰지 않으면 프로세스 안에서 주기 실행)
+    from app.core.config import settings
+    from app.services.reminder_service import reminder_scheduler
+    if settings.reminder_scheduler == "inprocess":
+        reminder_scheduler.start()
+
+    # 변경 이력 쓰기 스레드 (요청은 큐에 넣기만 함)
+    from app.services.audit_service import audit_writer
+    audit_writer.start()
+    
     print("✅ 애플리케이션 초기화 완료")
     
     yield
     
     # 종료 시
     print("🛑 애플리케이션 종료...")
+    reminder_scheduler.stop()
+    # 남은 변경 이력을 모두 저장하고 종료
+    audit_writer.stop()
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -689,6 +702,19 @@ app.include_router(teachers.router, prefix="/api/v1/teachers", tags=["Teachers"]
 app.include_router(user.router, prefix="/api/v1/user", tags=["User"])
 app.include_router(excel_preview.router, prefix="/api/v1/excel-preview", tags=["Excel Preview"])
 app.include_router(statistics.router, prefix="/api/v1", tags=["Statistics"])
+app.include_router(dashboard.router, prefix="/api/v1", tags=["Dashboard"])
+app.include_router(search.router, prefix="/api/v1", tags=["Search"])
+app.include_router(enrollments.router, prefix="/api/v1/enrollments", tags=["Enrollments"])
+app.include_router(schedules.router, prefix="/api/v1/schedules", tags=["Schedules"])
+app.include_router(utilization.router, prefix="/api/v1/utilization", tags=["Utilization"])
+app.include_router(calendar.router, prefix="/api/v1/calendar", tags=["Calendar"])
+app.include_router(attendance.router, prefix="/api/v1/attendance", tags=["Attendance"])
+app.include_router(payments.router, prefix="/api/v1/payments", tags=["Payments"])
+app.include_router(reminders.router, prefix="/api/v1/reminders", tags=["Reminders"])
+app.include_router(inventory.router, prefix="/api/v1/inventory", tags=["Inventory"])
+app.include_router(recommendations.router, prefix="/api/v1/recommendations", tags=["Recommendations"])
+app.include_router(audit.router, prefix="/api/v1/audit", tags=["Audit"])
+app.include_router(archive.router, prefix="/api/v1/archive", tags=["Archive"])
 
 @app.get("/")
 async def root():
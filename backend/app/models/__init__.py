@@ -3,11 +3,39 @@ from .teacher import Teacher, TeacherCreate, TeacherUpdate
 from .material import Material, MaterialCreate, MaterialUpdate
 from .user import User
 from .lecture import Lecture, LectureCreate, LectureUpdate
+from .idempotency import IdempotencyKey
+from .enrollment import Enrollment, EnrollmentCreate
+from .schedule import LectureSlot
+from .utilization import ResourceUtilization
+from .calendar import LectureSession
+from .attendance import SessionAttendance
+from .payment import Payment, PaymentCreate, StudentBalance, LectureRevenue, MonthlyRevenue
+from .reminder import TuitionReminder
+from .inventory import MaterialStockAlert
+from .audit import AuditLog
+from .archive import (
+    student_archive,
+    enrollment_archive,
+    payment_archive,
+    student_balance_archive,
+    tuition_reminder_archive,
+)
 
 __all__ = [
     "Student", 
     "Teacher", "TeacherCreate", "TeacherUpdate",
     "Material", "MaterialCreate", "MaterialUpdate", 
     "User",
-    "Lecture", "LectureCreate", "LectureUpdate"
+    "Lecture", "LectureCreate", "LectureUpdate",
+    "IdempotencyKey",
+    "Enrollment", "EnrollmentCreate",
+    "LectureSlot",
+    "ResourceUtilization",
+    "LectureSession",
+    "SessionAttendance",
+    "Payment", "PaymentCreate", "StudentBalance", "LectureRevenue", "MonthlyRevenue",
+    "TuitionReminder",
+    "MaterialStockAlert",
+    "AuditLog",
+    "student_archive", "enrollment_archive", "payment_archive", "student_balance_archive", "tuition_reminder_archive"
 ] 
\ No newline at end of file
@@ -0,0 +1,60 @@
+from sqlmodel import SQLModel
+from sqlalchemy import Column, DateTime, Index, Table
+from typing import Any, Tuple
+
+from .enrollment import Enrollment
+from .payment import Payment, StudentBalance
+from .reminder import TuitionReminder
+from .student import Student
+
+
+def archive_table(model: Any, keep_primary_key: bool = True) -> Table:
+    """운영 테이블과 같은 컬럼에 archived_at을 더한 보관 테이블 (<테이블>_archive)
+
+    값만 보관하므로 기본값, 고유 제약, 외래 키는 복사하지 않습니다. 복원할 때 새 id를 받는 테이블은
+    (SQLite는 삭제된 마지막 id를 다시 쓰므로) 같은 id가 두 번 보관될 수 있어 기본 키를 두지 않습니다.
+    """
+    source = model.__table__
+    columns = [
+        Column(
+            column.name,
+            column.type,
+            primary_key=column.primary_key and keep_primary_key,
+            nullable=column.nullable and not column.primary_key,
+            autoincrement=False
+        )
+        for column in source.columns
+    ]
+    return Table(
+        f"{source.name}_archive",
+        SQLModel.metadata,
+        *columns,
+        Column("archived_at", DateTime, nullable=False),
+    )
+
+
+student_archive = archive_table(Student)
+Index("ix_student_archive_archived_at_id", student_archive.c.archived_at, student_archive.c.id)
+Index("ix_student_archive_email", student_archive.c.email)
+
+enrollment_archive = archive_table(Enrollment, keep_primary_key=False)
+Index("ix_enrollment_archive_student_id", enrollment_archive.c.student_id)
+# 새 수강 순번은 보관된 등록의 순번까지 피해서 매김 (출석 비트맵 위치가 겹치지 않도록)
+Index("ix_enrollment_archive_lecture_id_ordinal", enrollment_archive.c.lecture_id, enrollment_archive.c.ordinal)
+
+payment_archive = archive_table(Payment, keep_primary_key=False)
+Index("ix_payment_archive_student_id", payment_archive.c.student_id)
+
+student_balance_archive = archive_table(StudentBalance)
+Index("ix_student_balance_archive_student_id", student_balance_archive.c.student_id)
+
+tuition_reminder_archive = archive_table(TuitionReminder, keep_primary_key=False)
+Index("ix_tuition_reminder_archive_student_id", tuition_reminder_archive.c.student_id)
+
+# 학생과 함께 옮기는 (운영 모델, 보관 테이블) - 학생을 참조하는 테이블
+STUDENT_ARCHIVE_CHILDREN: Tuple[Tuple[Any, Table], ...] = (
+    (Enrollment, enrollment_archive),
+    (Payment, payment_archive),
+    (StudentBalance, student_balance_archive),
+    (TuitionReminder, tuition_reminder_archive),
+)
@@ -0,0 +1,19 @@
+from sqlmodel import SQLModel, Field
+from datetime import datetime
+
+
+class SessionAttendance(SQLModel, table=True):
+    """수업 한 회차의 출석 (학생별 행 대신 수강 순번 비트맵으로 저장)
+
+    present/enrolled는 core.bitmap.encode_bitmap 형식이며 비트 위치는 Enrollment.ordinal입니다.
+    enrolled는 출석을 기록할 때 수강 중이던 학생들로, 출석률의 분모가 됩니다.
+    """
+    __tablename__ = "session_attendance"
+
+    lecture_id: int = Field(foreign_key="lecture.id", primary_key=True)
+    session_no: int = Field(primary_key=True)
+    present: bytes
+    enrolled: bytes
+    present_count: int = Field(default=0)
+    enrolled_count: int = Field(default=0)
+    marked_at: datetime = Field(default_factory=datetime.utcnow)
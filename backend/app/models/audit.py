@@ -0,0 +1,73 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import BigInteger, Column, Identity, Index, Integer, PrimaryKeyConstraint, event, text
+from sqlalchemy.ext.compiler import compiles
+from typing import Optional, Tuple
+from datetime import datetime
+
+
+def audit_month_bounds(moment: datetime) -> Tuple[datetime, datetime]:
+    """일시가 속한 달의 [시작, 다음 달 시작) (변경 이력 파티션 범위)"""
+    start = datetime(moment.year, moment.month, 1)
+    end = datetime(moment.year + 1, 1, 1) if moment.month == 12 else datetime(moment.year, moment.month + 1, 1)
+    return start, end
+
+
+def audit_partition_name(moment: datetime) -> str:
+    """일시가 속한 달의 변경 이력 파티션 테이블 이름 (audit_log_YYYY_MM)"""
+    return f"audit_log_{moment.year:04d}_{moment.month:02d}"
+
+
+def audit_partition_ddl(moment: datetime) -> str:
+    """일시가 속한 달의 파티션을 만드는 문장 (PostgreSQL, 이미 있으면 그대로)"""
+    start, end = audit_month_bounds(moment)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {audit_partition_name(moment)} PARTITION OF audit_log "
+        f"FOR VALUES FROM ('{start:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+    )
+
+
+class AuditLog(SQLModel, table=True):
+    """데이터 변경 이력 (추가만 함)
+
+    PostgreSQL에서는 created_at 기준 월별 RANGE 파티션 테이블이며 (파티션 키가 들어가야 하므로 기본 키는 (id, created_at)),
+    기간 조건이 있는 조회는 해당 달의 파티션만 읽습니다. 테이블을 만들 때 이번 달과 다음 달 파티션을 만들고,
+    이후 파티션은 쓰기 스레드가 필요할 때 만듭니다. SQLite는 파티션 없이 id만 기본 키인 단일 테이블입니다.
+    """
+    __tablename__ = "audit_log"
+    __table_args__ = (
+        # 레코드별 이력 조회
+        Index("ix_audit_log_table_record_created_at", "table_name", "record_id", "created_at"),
+        # 기간별 목록 조회 (최근 순)
+        Index("ix_audit_log_created_at_id", "created_at", "id"),
+        PrimaryKeyConstraint("id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(BigInteger().with_variant(Integer, "sqlite"), Identity(), nullable=False)
+    )
+    created_at: datetime = Field(nullable=False)
+    table_name: str = Field(max_length=50)
+    record_id: Optional[int] = Field(default=None)
+    action: str = Field(max_length=10)                  # create, update, delete
+    source: str = Field(default="api", max_length=20)   # api, ai, archive
+    changes: str = Field(default="{}")                  # JSON {"필드": [이전 값, 이후 값]}
+
+
+@compiles(PrimaryKeyConstraint, "sqlite")
+def _sqlite_primary_key(constraint, compiler, **kw):
+    """SQLite의 변경 이력은 파티션이 없으므로 id만 기본 키로 (rowid 별칭이 되어 자동 증가)"""
+    if constraint.table is not None and constraint.table.name == AuditLog.__tablename__:
+        return "PRIMARY KEY (id)"
+    return compiler.visit_primary_key_constraint(constraint, **kw)
+
+
+@event.listens_for(AuditLog.__table__, "after_create")
+def _create_initial_partitions(target, connection, **kw) -> None:
+    """PostgreSQL에서 테이블을 만들면 이번 달과 다음 달 파티션도 만듦 (create_all로 만든 경우 포함)"""
+    if connection.dialect.name != "postgresql":
+        return
+    now = datetime.utcnow()
+    for moment in (now, audit_month_bounds(now)[1]):
+        connection.execute(text(audit_partition_ddl(moment)))
@@ -0,0 +1,21 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+from typing import Optional
+from datetime import datetime
+
+
+class LectureSession(SQLModel, table=True):
+    """강의 일정을 날짜별 수업으로 펼친 행 (달력 조회용)
+
+    starts_at/ends_at은 일정 문자열 그대로의 현지 시각입니다.
+    """
+    __tablename__ = "lecture_session"
+    __table_args__ = (
+        Index("ix_lecture_session_lecture_id_session_no", "lecture_id", "session_no", unique=True),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    lecture_id: int = Field(foreign_key="lecture.id")
+    session_no: int                                          # 1부터 시작하는 회차
+    starts_at: datetime = Field(index=True)
+    ends_at: datetime
@@ -0,0 +1,39 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index, text
+from typing import Optional
+from datetime import datetime
+
+
+ENROLLMENT_ENROLLED = "enrolled"
+ENROLLMENT_WITHDRAWN = "withdrawn"
+
+# 한 학생은 같은 강의에 수강 중인 등록을 하나만 가짐 (수강 취소 후 재등록은 허용)
+ACTIVE_ENROLLMENT_PREDICATE = "status = 'enrolled'"
+
+
+class Enrollment(SQLModel, table=True):
+    """수강 등록 (강의의 current_students는 이 테이블의 수강 중 등록 수와 함께 갱신됨)"""
+    __table_args__ = (
+        Index(
+            "ix_enrollment_active_student_lecture", "student_id", "lecture_id",
+            unique=True,
+            sqlite_where=text(ACTIVE_ENROLLMENT_PREDICATE),
+            postgresql_where=text(ACTIVE_ENROLLMENT_PREDICATE),
+        ),
+        Index("ix_enrollment_lecture_id_ordinal", "lecture_id", "ordinal", unique=True),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    student_id: int = Field(foreign_key="student.id", index=True)
+    lecture_id: int = Field(foreign_key="lecture.id", index=True)
+    status: str = Field(default=ENROLLMENT_ENROLLED, max_length=20)  # enrolled, withdrawn
+    ordinal: Optional[int] = Field(default=None)  # 강의 안에서의 등록 순번 (출석 비트맵의 비트 위치, 재사용 안 함)
+    enrolled_at: datetime = Field(default_factory=datetime.utcnow)
+    withdrawn_at: Optional[datetime] = Field(default=None)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class EnrollmentCreate(SQLModel):
+    student_id: int
+    lecture_id: int
@@ -0,0 +1,14 @@
+from sqlmodel import SQLModel, Field
+from datetime import datetime
+
+
+class IdempotencyKey(SQLModel, table=True):
+    """Idempotency-Key 헤더로 처리한 요청의 응답 (재시도 시 그대로 재전송)"""
+    __tablename__ = "idempotency_key"
+
+    key: str = Field(primary_key=True, max_length=255)
+    path: str = Field(max_length=255)                 # 요청 경로 (다른 API에 같은 키 사용 방지)
+    request_hash: str = Field(max_length=64)          # 요청 본문 해시 (다른 내용에 같은 키 사용 방지)
+    status_code: int = Field(default=200)
+    response_body: str = Field(default="")            # JSON 문자열
+    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
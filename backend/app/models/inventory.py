@@ -0,0 +1,29 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index, text
+from typing import Optional
+from datetime import datetime
+
+
+# 교재마다 처리 중인(해소되지 않은) 알림은 하나
+OPEN_STOCK_ALERT_PREDICATE = "resolved_at IS NULL"
+
+
+class MaterialStockAlert(SQLModel, table=True):
+    """교재 재고 부족 알림 (재고가 최소 수량 이하로 내려가면 생기고 다시 채워지면 해소됨)"""
+    __tablename__ = "material_stock_alert"
+    __table_args__ = (
+        Index(
+            "ix_material_stock_alert_open_material", "material_id",
+            unique=True,
+            sqlite_where=text(OPEN_STOCK_ALERT_PREDICATE),
+            postgresql_where=text(OPEN_STOCK_ALERT_PREDICATE),
+        ),
+        Index("ix_material_stock_alert_created_at_id", "created_at", "id"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    material_id: int = Field(foreign_key="material.id")
+    quantity: int                       # 알림이 생길 때의 재고
+    min_quantity: int
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    resolved_at: Optional[datetime] = Field(default=None)
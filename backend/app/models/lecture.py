@@ -1,13 +1,20 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 from typing import Optional
 from datetime import datetime
 
 class Lecture(SQLModel, table=True):
+    __table_args__ = (
+        # 목록 조회 (상태 필터 + 최신순 정렬, 상태별 개수)
+        Index("ix_lecture_is_active_created_at", "is_active", "created_at", "id"),
+        Index("ix_lecture_created_at_id", "created_at", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    title: str = Field(index=True)
+    title: str = Field(index=True, unique=True)  # upsert의 ON CONFLICT 대상
     subject: str = Field(index=True)
-    teacher_id: Optional[int] = Field(default=None, foreign_key="teacher.id")
-    material_id: Optional[int] = Field(default=None, foreign_key="material.id")
+    teacher_id: Optional[int] = Field(default=None, foreign_key="teacher.id", index=True)
+    material_id: Optional[int] = Field(default=None, foreign_key="material.id", index=True)
     grade: str = Field(index=True)
     max_students: int = Field(default=20)
     current_students: int = Field(default=0)
@@ -16,6 +23,8 @@ class Lecture(SQLModel, table=True):
     classroom: str = Field(default="")
     is_active: bool = Field(default=True, index=True)
     description: Optional[str] = Field(default=None)
+    # 다음 수강 등록에 줄 순번 (Enrollment.ordinal, 등록 시 강의 행을 잠근 채 1씩 증가하며 줄지 않음)
+    next_ordinal: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
     
     # 새로 추가할 필드들
     difficulty_level: str = Field(default="intermediate")      # 난이도 (beginner, intermediate, advanced)
@@ -1,12 +1,39 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index, text
 from typing import Optional
 from datetime import datetime
 
+# ISBN이 있는 교재만 고유 인덱스 대상 (이관 스크립트가 빈 문자열을 넣은 행 제외)
+MATERIAL_ISBN_PREDICATE = "isbn IS NOT NULL AND isbn <> ''"
+
+# 재고 부족 (활성 교재 중 재고가 최소 수량 이하)
+MATERIAL_LOW_STOCK_PREDICATE = "is_active = {true} AND quantity <= min_quantity"
+
 
 class Material(SQLModel, table=True):
+    __table_args__ = (
+        # 목록 조회 (상태 필터 + 최신순 정렬, 상태별 개수)
+        Index("ix_material_is_active_created_at", "is_active", "created_at", "id"),
+        Index("ix_material_created_at_id", "created_at", "id"),
+        # ISBN 고유 (ISBN이 있는 교재만, upsert의 ON CONFLICT 대상)
+        Index(
+            "ix_material_isbn", "isbn",
+            unique=True,
+            sqlite_where=text(MATERIAL_ISBN_PREDICATE),
+            postgresql_where=text(MATERIAL_ISBN_PREDICATE),
+        ),
+        # 재고 부족 목록 (부족한 교재만 담기므로 전체 교재를 훑지 않음, 재고 적은 순)
+        # is_active를 앞에 두어야 is_active 조건이 같은 다른 인덱스보다 이 인덱스가 선택됨
+        Index(
+            "ix_material_low_stock", "is_active", "quantity", "id",
+            sqlite_where=text(MATERIAL_LOW_STOCK_PREDICATE.format(true=1)),
+            postgresql_where=text(MATERIAL_LOW_STOCK_PREDICATE.format(true="true")),
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=200)
-    subject: str = Field(max_length=100)
+    subject: str = Field(max_length=100, index=True)
     grade: str = Field(max_length=20)
     publisher: Optional[str] = Field(max_length=100, default=None)  # 다시 추가
     author: Optional[str] = Field(max_length=100, default=None)
@@ -0,0 +1,69 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+from typing import Optional
+from datetime import datetime
+
+
+# 수강료 귀속 월 형식 (YYYY-MM)
+PAYMENT_PERIOD_PATTERN = r"^\d{4}-(0[1-9]|1[0-2])$"
+
+
+class Payment(SQLModel, table=True):
+    """수강료 납부 원장 (추가만 하고 수정하지 않음, 환불/정정은 음수 금액으로 기록)"""
+    __table_args__ = (
+        Index("ix_payment_student_id_period", "student_id", "period"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    student_id: int                                               # 학생을 완전 삭제해도 원장은 남기므로 외래 키 없음
+    lecture_id: Optional[int] = Field(default=None, index=True)   # 강의를 삭제해도 원장은 그대로 두므로 외래 키 없음
+    amount: int                                                   # 원 단위, 음수는 환불
+    period: str = Field(max_length=7, index=True)                 # 귀속 월 (YYYY-MM)
+    paid_at: datetime = Field(default_factory=datetime.utcnow)
+    method: Optional[str] = Field(default=None, max_length=20)    # card, transfer, cash 등
+    memo: Optional[str] = Field(default=None, max_length=200)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class PaymentCreate(SQLModel):
+    student_id: int
+    lecture_id: Optional[int] = None
+    amount: int
+    period: Optional[str] = None       # 없으면 paid_at의 월
+    paid_at: Optional[datetime] = None
+    method: Optional[str] = None
+    memo: Optional[str] = None
+
+
+class StudentBalance(SQLModel, table=True):
+    """학생별 월 청구/납부 합계 (납부 기록과 청구 시 함께 갱신되는 집계)"""
+    __tablename__ = "student_balance"
+
+    period: str = Field(primary_key=True, max_length=7)
+    student_id: int = Field(primary_key=True, index=True)        # 원장과 함께 남기므로 외래 키 없음
+    billed: int = Field(default=0)
+    paid: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class LectureRevenue(SQLModel, table=True):
+    """강의별 월 납부 합계 (강의가 지정된 납부만)"""
+    __tablename__ = "lecture_revenue"
+
+    period: str = Field(primary_key=True, max_length=7)
+    lecture_id: int = Field(primary_key=True)
+    paid: int = Field(default=0)
+    payment_count: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class MonthlyRevenue(SQLModel, table=True):
+    """월별 청구/납부/미납 합계 (outstanding은 학생별 미납액 합계)"""
+    __tablename__ = "monthly_revenue"
+
+    period: str = Field(primary_key=True, max_length=7)
+    billed: int = Field(default=0)
+    paid: int = Field(default=0)
+    outstanding: int = Field(default=0)
+    payment_count: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
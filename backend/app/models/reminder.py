@@ -0,0 +1,31 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+from typing import Optional
+from datetime import datetime
+
+
+REMINDER_PENDING = "pending"
+REMINDER_SENDING = "sending"
+REMINDER_SENT = "sent"
+REMINDER_FAILED = "failed"
+REMINDER_CANCELLED = "cancelled"
+
+
+class TuitionReminder(SQLModel, table=True):
+    """수강료 체납 알림 발송 상태 (학생의 납부일마다 한 번만 만들어지므로 다시 실행해도 중복 발송하지 않음)"""
+    __tablename__ = "tuition_reminder"
+    __table_args__ = (
+        Index("ix_tuition_reminder_student_id_due_date", "student_id", "due_date", unique=True),
+        # 발송 대기 조회
+        Index("ix_tuition_reminder_status_id", "status", "id"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    student_id: int = Field(foreign_key="student.id")
+    due_date: datetime                                              # 체납된 납부일 (Student.tuition_due_date)
+    status: str = Field(default=REMINDER_PENDING, max_length=20)    # pending, sending, sent, failed, cancelled
+    attempts: int = Field(default=0)
+    last_error: Optional[str] = Field(default=None, max_length=500)
+    claimed_at: Optional[datetime] = Field(default=None)
+    sent_at: Optional[datetime] = Field(default=None)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
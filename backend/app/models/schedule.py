@@ -0,0 +1,24 @@
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
+from typing import Optional
+
+
+class LectureSlot(SQLModel, table=True):
+    """Lecture.schedule을 요일별 분 단위 구간으로 풀어 둔 행 (겹침 조회용)
+
+    강의실/강사는 인덱스로 바로 찾을 수 있도록 강의에서 복사해 둡니다.
+    구간은 [start_minute, end_minute)이며 겹침 조건은 start_minute < 끝 AND end_minute > 시작입니다.
+    """
+    __tablename__ = "lecture_slot"
+    __table_args__ = (
+        Index("ix_lecture_slot_classroom_weekday_start", "classroom", "weekday", "start_minute", "end_minute"),
+        Index("ix_lecture_slot_teacher_weekday_start", "teacher_id", "weekday", "start_minute", "end_minute"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    lecture_id: int = Field(foreign_key="lecture.id", index=True)
+    weekday: int                                       # 0 = 월요일
+    start_minute: int                                  # 0 ~ 1440
+    end_minute: int
+    classroom: str = Field(default="")
+    teacher_id: Optional[int] = Field(default=None)
@@ -1,16 +1,31 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index, text
 from typing import Optional
 from datetime import datetime
 
 
 class Student(SQLModel, table=True):
+    __table_args__ = (
+        # 목록 조회 (상태 필터 + 최신순 정렬, 상태별 개수)
+        Index("ix_student_is_active_created_at", "is_active", "created_at", "id"),
+        Index("ix_student_created_at_id", "created_at", "id"),
+        # 체납 조회 (활성 학생만)
+        Index(
+            "ix_student_active_tuition_due_date", "tuition_due_date",
+            sqlite_where=text("is_active = 1"),
+            postgresql_where=text("is_active = true"),
+        ),
+        # 삭제/보관된 학생의 id를 다시 쓰지 않도록 (SQLite는 기본으로 마지막 id를 재사용)
+        {"sqlite_autoincrement": True},
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=100)
     email: str = Field(max_length=100, unique=True)
     phone: Optional[str] = Field(max_length=20, default=None)
-    grade: Optional[str] = Field(max_length=20, default=None)
+    grade: Optional[str] = Field(max_length=20, default=None, index=True)
     tuition_fee: float = Field(default=0.0)
     tuition_due_date: Optional[datetime] = Field(default=None)
     is_active: bool = Field(default=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow) 
\ No newline at end of file
+    updated_at: datetime = Field(default_factory=datetime.utcnow) 
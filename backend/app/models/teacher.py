@@ -1,10 +1,17 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 from typing import Optional, List
 from datetime import datetime
 import json
 
 
 class Teacher(SQLModel, table=True):
+    __table_args__ = (
+        # 목록 조회 (상태 필터 + 최신순 정렬, 상태별 개수)
+        Index("ix_teacher_is_active_created_at", "is_active", "created_at", "id"),
+        Index("ix_teacher_created_at_id", "created_at", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=100)
     email: str = Field(max_length=100, unique=True)
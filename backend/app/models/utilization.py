@@ -0,0 +1,18 @@
+from sqlmodel import SQLModel, Field
+from datetime import datetime
+
+
+class ResourceUtilization(SQLModel, table=True):
+    """강의실/강사별 주간 점유 히트맵 (lecture_slot에서 미리 계산)
+
+    occupancy는 요일(월~일) × 시간 칸(slot_minutes 단위)마다 사용 중인 분을 1바이트씩 담은 배열입니다.
+    """
+    __tablename__ = "resource_utilization"
+
+    resource_type: str = Field(primary_key=True, max_length=20)   # classroom, teacher
+    resource_key: str = Field(primary_key=True, max_length=100)   # 강의실 이름 또는 강사 ID
+    slot_minutes: int = Field(default=30)
+    occupancy: bytes
+    occupied_minutes: int = Field(default=0)                      # 주간 총 사용 시간 (분)
+    lecture_count: int = Field(default=0)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
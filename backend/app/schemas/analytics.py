@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+
+class StudentScores(BaseModel):
+    student_id: Optional[int] = None
+    name: Optional[str] = None
+    scores: Dict[str, List[float]]      # 과목 → 평가 순 점수 (0~100)
+
+class LearningAnalysisRequest(BaseModel):
+    students: List[StudentScores] = []  # 백분위 비교 대상 (반 전체)
+    student_id: Optional[int] = None    # 요약할 학생 (없고 학생이 한 명이면 그 학생)
+    scores: Optional[Dict[str, List[float]]] = None  # 학생 한 명만 보낼 때 (student_id와 함께)
+    summarize: bool = True              # 요약할 학생의 분석 결과를 AI가 문장으로 정리
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+from .student import StudentResponse
+
+class ArchivedStudentResponse(StudentResponse):
+    archived: bool = True
+    archived_at: Optional[datetime] = None   # 운영 테이블에 있으면 None
+
+class ArchivedStudentListResponse(BaseModel):
+    students: list[ArchivedStudentResponse]
+    total: int
+    page: int
+    size: int
+
+class ArchiveRunResult(BaseModel):
+    archived: int
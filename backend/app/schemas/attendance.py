@@ -0,0 +1,5 @@
+from pydantic import BaseModel
+from typing import List
+
+class AttendanceMarkRequest(BaseModel):
+    present_student_ids: List[int]
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+class AuditLogResponse(BaseModel):
+    id: int
+    created_at: datetime
+    table_name: str
+    record_id: Optional[int] = None
+    action: str
+    source: str
+    changes: Dict[str, List[Any]]   # 필드 → [이전 값, 이후 값]
+
+class AuditLogListResponse(BaseModel):
+    logs: list[AuditLogResponse]
+    total: int
+    page: int
+    size: int
@@ -0,0 +1,33 @@
+from pydantic import BaseModel
+from typing import Any, Dict, Optional
+
+
+class ImportRowError(BaseModel):
+    row: int
+    errors: list[str]
+
+
+class ImportResult(BaseModel):
+    entity: str
+    total_rows: int
+    inserted: int
+    skipped_duplicates: int
+    failed: int
+    dry_run: bool
+    errors: list[ImportRowError]
+
+
+class BulkUpdateRequest(BaseModel):
+    ids: Optional[list[int]] = None
+    filters: Optional[Dict[str, Any]] = None
+    patch: Dict[str, Any]
+
+
+class BulkDeleteRequest(BaseModel):
+    ids: Optional[list[int]] = None
+    filters: Optional[Dict[str, Any]] = None
+
+
+class BulkUpdateResult(BaseModel):
+    entity: str
+    affected: int
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import Any, Dict
+from datetime import datetime
+
+from .student import StudentListResponse
+from .teacher import TeacherListResponse
+from .material import MaterialListResponse
+from .lecture import LectureListResponse
+
+
+class DashboardResponse(BaseModel):
+    statistics: Dict[str, Any]
+    students: StudentListResponse
+    teachers: TeacherListResponse
+    materials: MaterialListResponse
+    lectures: LectureListResponse
+    generated_at: datetime
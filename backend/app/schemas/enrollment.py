@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+class EnrollmentResponse(BaseModel):
+    id: int
+    student_id: int
+    lecture_id: int
+    status: str
+    ordinal: Optional[int] = None
+    enrolled_at: datetime
+    withdrawn_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class EnrollmentListResponse(BaseModel):
+    enrollments: list[EnrollmentResponse]
+    total: int
+    page: int
+    size: int
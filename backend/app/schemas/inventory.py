@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+class StockAdjustRequest(BaseModel):
+    delta: int
+
+class MaterialStockAlertResponse(BaseModel):
+    id: int
+    material_id: int
+    quantity: int
+    min_quantity: int
+    created_at: datetime
+    resolved_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class MaterialStockAlertListResponse(BaseModel):
+    alerts: list[MaterialStockAlertResponse]
+    total: int
+    page: int
+    size: int
@@ -24,6 +24,7 @@ class LectureResponse(BaseModel):
 
 class LectureListResponse(BaseModel):
     lectures: list[LectureResponse]
-    total: int
-    page: int
-    size: int 
\ No newline at end of file
+    total: Optional[int]
+    page: Optional[int]
+    size: int
+    next_cursor: Optional[str] = None 
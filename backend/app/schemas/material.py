@@ -47,6 +47,7 @@ class MaterialResponse(MaterialBase):
 
 class MaterialListResponse(BaseModel):
     materials: list[MaterialResponse]
-    total: int
-    page: int
-    size: int 
\ No newline at end of file
+    total: Optional[int]
+    page: Optional[int]
+    size: int
+    next_cursor: Optional[str] = None 
@@ -0,0 +1,49 @@
+from pydantic import BaseModel, computed_field
+from typing import Optional
+from datetime import datetime
+
+class PaymentResponse(BaseModel):
+    id: int
+    student_id: int
+    lecture_id: Optional[int] = None
+    amount: int
+    period: str
+    paid_at: datetime
+    method: Optional[str] = None
+    memo: Optional[str] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class PaymentListResponse(BaseModel):
+    payments: list[PaymentResponse]
+    total: int
+    page: int
+    size: int
+
+class StudentBalanceResponse(BaseModel):
+    period: str
+    student_id: int
+    billed: int
+    paid: int
+    updated_at: datetime
+
+    @computed_field
+    @property
+    def outstanding(self) -> int:
+        return max(0, self.billed - self.paid)
+
+    class Config:
+        from_attributes = True
+
+class MonthlyRevenueResponse(BaseModel):
+    period: str
+    billed: int
+    paid: int
+    outstanding: int
+    payment_count: int
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
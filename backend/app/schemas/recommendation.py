@@ -0,0 +1,28 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+class LectureRecommendation(BaseModel):
+    lecture_id: int
+    title: str
+    subject: str
+    grade: str
+    difficulty_level: str
+    free_seats: int
+    score: float
+
+class StudentRecommendation(BaseModel):
+    student_id: int
+    name: str
+    score: float
+
+class IntakeMatchRequest(BaseModel):
+    student_ids: Optional[List[int]] = None  # 없으면 수강 중인 강의가 없는 활성 학생 전체
+    k: int = Field(default=5, ge=1, le=50)
+
+class StudentLectureRecommendations(BaseModel):
+    student_id: int
+    lectures: List[LectureRecommendation]
+
+class IntakeMatchResponse(BaseModel):
+    students: List[StudentLectureRecommendations]
+    total: int
@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+class TuitionReminderResponse(BaseModel):
+    id: int
+    student_id: int
+    due_date: datetime
+    status: str
+    attempts: int
+    last_error: Optional[str] = None
+    sent_at: Optional[datetime] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class TuitionReminderListResponse(BaseModel):
+    reminders: list[TuitionReminderResponse]
+    total: int
+    page: int
+    size: int
+
+class ReminderRunResponse(BaseModel):
+    detected: int
+    sent: int
+    failed: int
+    retry: int
+    cancelled: int
@@ -0,0 +1,40 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+class StudentSearchHit(BaseModel):
+    id: int
+    name: str
+    email: str
+    phone: Optional[str] = None
+    grade: Optional[str] = None
+    is_active: bool
+    score: float
+
+
+class TeacherSearchHit(BaseModel):
+    id: int
+    name: str
+    email: str
+    phone: Optional[str] = None
+    subject: str
+    is_active: bool
+    score: float
+
+
+class MaterialSearchHit(BaseModel):
+    id: int
+    name: str
+    author: Optional[str] = None
+    subject: str
+    grade: str
+    is_active: bool
+    score: float
+
+
+class SearchResponse(BaseModel):
+    query: str
+    backend: str
+    students: list[StudentSearchHit] = []
+    teachers: list[TeacherSearchHit] = []
+    materials: list[MaterialSearchHit] = []
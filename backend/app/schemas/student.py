@@ -38,6 +38,7 @@ class StudentResponse(StudentBase):
 
 class StudentListResponse(BaseModel):
     students: list[StudentResponse]
-    total: int
-    page: int
-    size: int 
\ No newline at end of file
+    total: Optional[int]
+    page: Optional[int]
+    size: int
+    next_cursor: Optional[str] = None 
@@ -27,6 +27,15 @@ class TeacherUpdate(BaseModel):
 class TeacherResponse(TeacherBase):
     id: int
     is_active: bool
+    experience_years: int = 0
+    education_level: str = "bachelor"
+    specialization: str = ""
+    hire_date: Optional[datetime] = None
+    contract_type: str = "part_time"
+    max_lectures: int = 5
+    rating: Optional[float] = None
+    total_teaching_hours: int = 0
+    certification: str = "[]"
     created_at: datetime
     updated_at: datetime
 
@@ -36,6 +45,7 @@ class TeacherResponse(TeacherBase):
 
 class TeacherListResponse(BaseModel):
     teachers: list[TeacherResponse]
-    total: int
-    page: int
-    size: int 
\ No newline at end of file
+    total: Optional[int]
+    page: Optional[int]
+    size: int
+    next_cursor: Optional[str] = None 
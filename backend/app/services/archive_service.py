@@ -0,0 +1,182 @@
+import calendar
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Table, case, delete, desc, func, insert, literal, update
+from sqlmodel import Session, select
+
+from ..core.audit import AUDIT_CREATE, AUDIT_DELETE, AUDIT_SOURCE_ARCHIVE, AUDITED_TABLES, record_audit
+from ..core.config import settings
+from ..core.database import engine
+from ..core.pagination import Page, fetch_page
+from ..models.archive import STUDENT_ARCHIVE_CHILDREN, student_archive
+from ..models.enrollment import Enrollment, ENROLLMENT_ENROLLED, ENROLLMENT_WITHDRAWN
+from ..models.lecture import Lecture
+from ..models.student import Student
+from .payment_service import PaymentService
+
+
+class ArchiveNotFoundError(Exception):
+    """보관된 학생이 없음"""
+
+
+class ArchiveConflictError(Exception):
+    """복원할 학생의 id 또는 이메일을 운영 테이블에서 이미 사용 중"""
+
+
+def months_before(moment: datetime, months: int) -> datetime:
+    """moment에서 months개월 전 같은 날 같은 시각 (그 달에 없는 날은 말일)"""
+    year, month = divmod(moment.year * 12 + moment.month - 1 - months, 12)
+    day = min(moment.day, calendar.monthrange(year, month + 1)[1])
+    return moment.replace(year=year, month=month + 1, day=day)
+
+
+class ArchiveService:
+    """오래 비활성인 학생을 보관 테이블로 옮기고 조회/복원
+
+    학생과 학생을 참조하는 수강 등록, 납부 원장, 월별 청구/납부, 체납 알림을 같은 트랜잭션에서
+    INSERT ... SELECT로 보관 테이블(<테이블>_archive)에 옮긴 뒤 운영 테이블에서 지웁니다.
+    목록, 개수, AI 컨텍스트는 운영 테이블만 읽으므로 보관된 학생은 보이지 않습니다.
+    월별 매출 집계(monthly_revenue, lecture_revenue)는 그대로 두고, 다시 계산할 때도 보관 테이블을 함께 더하므로
+    지난 매출 통계는 바뀌지 않습니다. 보관한 학생의 받지 못한 청구는 완전 삭제와 같이 미납에서 뺍니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def archive_inactive_students(self, months: Optional[int] = None, now: Optional[datetime] = None) -> int:
+        """months개월 넘게 비활성(마지막 수정 기준)인 학생을 배치 단위로 보관하고 보관한 수를 반환"""
+        now = now or datetime.utcnow()
+        cutoff = months_before(now, settings.archive_after_months if months is None else months)
+        archived = 0
+        while True:
+            student_ids = self.db.exec(
+                select(Student.id)
+                .where(Student.is_active == False, Student.updated_at < cutoff)
+                .order_by(Student.id)
+                .limit(settings.archive_batch_size)
+            ).all()
+            if not student_ids:
+                return archived
+            self._archive_batch(list(student_ids), now)
+            archived += len(student_ids)
+
+    def get_student(self, student_id: int) -> Optional[Dict[str, Any]]:
+        """운영 테이블에 없으면 보관 테이블에서 조회 (archived, archived_at 포함)"""
+        student = self.db.get(Student, student_id)
+        if student is not None:
+            return {**student.dict(), "archived": False, "archived_at": None}
+        row = self.db.execute(select(student_archive).where(student_archive.c.id == student_id)).mappings().first()
+        return {**row, "archived": True} if row is not None else None
+
+    def get_archived_page(self, skip: int = 0, limit: int = 100) -> Page:
+        """보관된 학생과 전체 개수 조회 (최근 보관 순)"""
+        query = select(*student_archive.c).order_by(desc(student_archive.c.archived_at), desc(student_archive.c.id))
+        return fetch_page(self.db, query, skip, limit)
+
+    def restore_student(self, student_id: int) -> Student:
+        """보관된 학생과 관련 기록을 운영 테이블로 되돌림 (비활성 상태 그대로, 수정 시각은 지금으로)
+
+        기본 키가 없는 보관 테이블(수강 등록, 납부, 알림)의 행은 새 id로 되돌리고,
+        그 사이 삭제된 강의의 수강 등록은 되돌리지 않습니다.
+        """
+        row = self.db.execute(select(student_archive).where(student_archive.c.id == student_id)).mappings().first()
+        if row is None:
+            raise ArchiveNotFoundError("보관된 학생을 찾을 수 없습니다")
+        taken = self.db.exec(
+            select(Student.id).where((Student.id == student_id) | (Student.email == row["email"]))
+        ).first()
+        if taken is not None:
+            raise ArchiveConflictError("같은 id 또는 이메일의 학생이 이미 있습니다")
+
+        try:
+            # 수정 시각을 지금으로 해서 다음 보관 작업에 바로 다시 옮겨지지 않도록 함
+            values = {column.name: row[column.name] for column in Student.__table__.columns}
+            values["updated_at"] = datetime.utcnow()
+            self.db.execute(insert(Student).values(**values))
+            record_audit(
+                self.db, Student.__tablename__, student_id, AUDIT_CREATE,
+                {field: [None, value] for field, value in values.items()}, source=AUDIT_SOURCE_ARCHIVE
+            )
+
+            for model, archive in STUDENT_ARCHIVE_CHILDREN:
+                columns = [
+                    column.name for column in model.__table__.columns
+                    if archive.primary_key or not column.primary_key
+                ]
+                query = select(*[archive.c[name] for name in columns]).where(archive.c.student_id == student_id)
+                if model is Enrollment:
+                    query = query.where(archive.c.lecture_id.in_(select(Lecture.id)))
+                self.db.execute(insert(model).from_select(columns, query))
+                self.db.execute(delete(archive).where(archive.c.student_id == student_id))
+            self.db.execute(delete(student_archive).where(student_archive.c.id == student_id))
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return self.db.get(Student, student_id, populate_existing=True)
+
+    def _archive_batch(self, student_ids: List[int], now: datetime) -> None:
+        """학생 묶음 보관 (수강 중인 등록은 취소 처리해 강의 인원을 줄인 뒤 옮김)"""
+        try:
+            seats = self.db.execute(
+                select(Enrollment.lecture_id, func.count())
+                .where(Enrollment.student_id.in_(student_ids), Enrollment.status == ENROLLMENT_ENROLLED)
+                .group_by(Enrollment.lecture_id)
+            ).all()
+            for lecture_id, count in seats:
+                self.db.execute(
+                    update(Lecture)
+                    .where(Lecture.id == lecture_id)
+                    .values(
+                        current_students=case((Lecture.current_students > count, Lecture.current_students - count), else_=0),
+                        updated_at=now
+                    )
+                    .execution_options(synchronize_session=False, schedule_unchanged=True)
+                )
+            self.db.execute(
+                update(Enrollment)
+                .where(Enrollment.student_id.in_(student_ids), Enrollment.status == ENROLLMENT_ENROLLED)
+                .values(status=ENROLLMENT_WITHDRAWN, withdrawn_at=now, updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+
+            # 받지 못한 청구는 완전 삭제와 같이 미납에서 빼고 (납부와 지난 매출은 보관 테이블에서 계속 집계)
+            PaymentService(self.db).clear_outstanding(student_ids)
+
+            # 참조하는 행을 먼저 옮긴 뒤 학생을 옮김 (외래 키)
+            for model, archive in STUDENT_ARCHIVE_CHILDREN:
+                self._move(model.__table__, archive, model.student_id.in_(student_ids), now)
+            self._move(Student.__table__, student_archive, Student.id.in_(student_ids), now)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    def _move(self, source: Table, target: Table, condition: Any, archived_at: datetime) -> None:
+        """조건에 맞는 행을 보관 테이블로 INSERT ... SELECT 후 운영 테이블에서 삭제 (이력을 남기는 테이블은 삭제로 기록)"""
+        if source.name in AUDITED_TABLES:
+            for row in self.db.execute(select(*source.columns).where(condition)).mappings():
+                record_audit(
+                    self.db, source.name, row.get("id"), AUDIT_DELETE,
+                    {field: [value, None] for field, value in row.items()}, source=AUDIT_SOURCE_ARCHIVE
+                )
+        columns = [column.name for column in source.columns] + ["archived_at"]
+        query = select(*source.columns, literal(archived_at).label("archived_at")).where(condition)
+        self.db.execute(insert(target).from_select(columns, query))
+        self.db.execute(delete(source).where(condition))
+
+
+_archive_lock = threading.Lock()
+
+
+def run_student_archive(months: Optional[int] = None) -> int:
+    """비활성 학생 보관 한 번 실행 (이 프로세스에서 이미 실행 중이면 0)"""
+    if not _archive_lock.acquire(blocking=False):
+        return 0
+    try:
+        with Session(engine) as db:
+            return ArchiveService(db).archive_inactive_students(months)
+    finally:
+        _archive_lock.release()
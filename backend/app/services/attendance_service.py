@@ -0,0 +1,254 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import delete
+from sqlmodel import Session, func, select
+
+from ..core.bitmap import bitmap_from_positions, bitmap_positions, decode_bitmap, encode_bitmap
+from ..models.attendance import SessionAttendance
+from ..models.calendar import LectureSession
+from ..models.enrollment import Enrollment, ENROLLMENT_ENROLLED
+from .upsert_service import dialect_insert
+
+
+class AttendanceNotFoundError(Exception):
+    """수업 회차 또는 출석 기록이 없음"""
+
+
+def attendance_rate(attended: int, total: int) -> float:
+    """출석률 (%)"""
+    return round(attended / total * 100, 2) if total > 0 else 0.0
+
+
+def count_by_ordinal(rows: Iterable[SessionAttendance]) -> Tuple[Dict[int, int], Dict[int, int]]:
+    """회차 비트맵들에서 수강 순번별 (출석 횟수, 출석 대상 횟수)"""
+    attended: Dict[int, int] = defaultdict(int)
+    eligible: Dict[int, int] = defaultdict(int)
+    for row in rows:
+        for ordinal in bitmap_positions(decode_bitmap(row.present)):
+            attended[ordinal] += 1
+        for ordinal in bitmap_positions(decode_bitmap(row.enrolled)):
+            eligible[ordinal] += 1
+    return attended, eligible
+
+
+class AttendanceService:
+    """수업 회차별 출석 관리
+
+    회차마다 한 행에 출석한 학생(present)과 그때 수강 중이던 학생(enrolled)을 Enrollment.ordinal 비트맵으로
+    저장합니다. 학생 수만큼 행이 늘지 않고, 출석률은 저장된 개수 합계나 비트 연산으로 계산합니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def mark_session(self, lecture_id: int, session_no: int, present_student_ids: List[int]) -> Dict[str, Any]:
+        """회차의 출석 학생을 한 번에 기록 (다시 기록하면 덮어씀)"""
+        session = self.db.exec(
+            select(LectureSession).where(
+                LectureSession.lecture_id == lecture_id,
+                LectureSession.session_no == session_no
+            )
+        ).first()
+        if session is None:
+            raise AttendanceNotFoundError("수업 회차를 찾을 수 없습니다")
+
+        ordinals = self._enrolled_ordinals(lecture_id)
+        unknown = sorted(set(present_student_ids) - ordinals.keys())
+        if unknown:
+            raise ValueError(f"수강 중이 아닌 학생입니다: {unknown}")
+
+        present = bitmap_from_positions(ordinals[student_id] for student_id in set(present_student_ids))
+        enrolled = bitmap_from_positions(ordinals.values())
+        values = {
+            "present": encode_bitmap(present),
+            "enrolled": encode_bitmap(enrolled),
+            "present_count": present.bit_count(),
+            "enrolled_count": enrolled.bit_count(),
+            "marked_at": datetime.utcnow(),
+        }
+        statement = dialect_insert(self.db, SessionAttendance).values(
+            lecture_id=lecture_id, session_no=session_no, **values
+        ).on_conflict_do_update(index_elements=["lecture_id", "session_no"], set_=values)
+        try:
+            self.db.execute(statement)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return {
+            "lecture_id": lecture_id,
+            "session_no": session_no,
+            "present_count": values["present_count"],
+            "enrolled_count": values["enrolled_count"],
+            "attendance_rate": attendance_rate(values["present_count"], values["enrolled_count"]),
+            "marked_at": values["marked_at"],
+        }
+
+    def get_session(self, lecture_id: int, session_no: int) -> Optional[Dict[str, Any]]:
+        """회차의 출석/결석 학생 목록"""
+        row = self.db.get(SessionAttendance, (lecture_id, session_no))
+        if row is None:
+            return None
+
+        students = self._students_by_ordinal(lecture_id)
+        present = decode_bitmap(row.present)
+        absent = decode_bitmap(row.enrolled) & ~present
+        return {
+            "lecture_id": lecture_id,
+            "session_no": session_no,
+            "present_student_ids": [students[o] for o in bitmap_positions(present) if o in students],
+            "absent_student_ids": [students[o] for o in bitmap_positions(absent) if o in students],
+            "present_count": row.present_count,
+            "enrolled_count": row.enrolled_count,
+            "attendance_rate": attendance_rate(row.present_count, row.enrolled_count),
+            "marked_at": row.marked_at,
+        }
+
+    def get_lecture_attendance(self, lecture_id: int) -> Dict[str, Any]:
+        """강의 전체 출석률과 학생별 출석률"""
+        rows = self.db.exec(select(SessionAttendance).where(SessionAttendance.lecture_id == lecture_id)).all()
+        attended, eligible = count_by_ordinal(rows)
+        students = self._students_by_ordinal(lecture_id)
+
+        # 취소 후 다시 등록한 학생은 순번이 둘 이상이므로 학생 단위로 합침
+        per_student: Dict[int, List[int]] = {}
+        for ordinal in sorted(eligible):
+            if ordinal in students:
+                counts = per_student.setdefault(students[ordinal], [0, 0])
+                counts[0] += attended.get(ordinal, 0)
+                counts[1] += eligible[ordinal]
+
+        present_total = sum(row.present_count for row in rows)
+        enrolled_total = sum(row.enrolled_count for row in rows)
+        return {
+            "lecture_id": lecture_id,
+            "marked_sessions": len(rows),
+            "attendance_rate": attendance_rate(present_total, enrolled_total),
+            "students": [
+                {
+                    "student_id": student_id,
+                    "attended": attended_count,
+                    "sessions": sessions,
+                    "attendance_rate": attendance_rate(attended_count, sessions),
+                }
+                for student_id, (attended_count, sessions) in per_student.items()
+            ],
+        }
+
+    def get_student_attendance(self, student_id: int) -> Dict[str, Any]:
+        """학생의 강의별 출석률 (순번 비트 하나만 확인)"""
+        enrollments = self.db.exec(
+            select(Enrollment).where(Enrollment.student_id == student_id, Enrollment.ordinal.is_not(None))
+        ).all()
+        # 강의별 학생의 순번 비트 (취소 후 다시 등록했으면 순번이 둘 이상)
+        masks: Dict[int, int] = defaultdict(int)
+        for enrollment in enrollments:
+            masks[enrollment.lecture_id] |= 1 << enrollment.ordinal
+
+        counts: Dict[int, List[int]] = {lecture_id: [0, 0] for lecture_id in masks}
+        if masks:
+            rows = self.db.exec(
+                select(SessionAttendance).where(SessionAttendance.lecture_id.in_(list(masks)))
+            ).all()
+            for row in rows:
+                mask = masks[row.lecture_id]
+                if decode_bitmap(row.enrolled) & mask:
+                    counts[row.lecture_id][1] += 1
+                    if decode_bitmap(row.present) & mask:
+                        counts[row.lecture_id][0] += 1
+
+        attended_total = sum(attended for attended, _ in counts.values())
+        sessions_total = sum(sessions for _, sessions in counts.values())
+        return {
+            "student_id": student_id,
+            "attendance_rate": attendance_rate(attended_total, sessions_total),
+            "lectures": [
+                {
+                    "lecture_id": lecture_id,
+                    "attended": attended,
+                    "sessions": sessions,
+                    "attendance_rate": attendance_rate(attended, sessions),
+                }
+                for lecture_id, (attended, sessions) in sorted(counts.items())
+            ],
+        }
+
+    def lecture_totals(self) -> List[Tuple[int, int, int, int]]:
+        """강의별 (강의 id, 기록된 회차 수, 출석 합계, 출석 대상 합계) - 저장된 개수만 합산"""
+        query = select(
+            SessionAttendance.lecture_id,
+            func.count(),
+            func.sum(SessionAttendance.present_count),
+            func.sum(SessionAttendance.enrolled_count)
+        ).group_by(SessionAttendance.lecture_id)
+        return [
+            (lecture_id, sessions, present or 0, enrolled or 0)
+            for lecture_id, sessions, present, enrolled in self.db.execute(query)
+        ]
+
+    def student_totals(self, student_ids: Optional[Iterable[int]] = None) -> Dict[int, Tuple[int, int]]:
+        """학생별 (출석 횟수, 출석 대상 횟수) - 강의마다 비트맵을 순번별로 세어 학생으로 합침
+
+        student_ids가 있으면 그 학생이 등록했던 강의의 비트맵만 읽습니다.
+        """
+        ownership = (
+            select(Enrollment.lecture_id, Enrollment.ordinal, Enrollment.student_id)
+            .where(Enrollment.ordinal.is_not(None))
+        )
+        attendance = select(SessionAttendance)
+        if student_ids is not None:
+            student_ids = list(student_ids)
+            if not student_ids:
+                return {}
+            ownership = ownership.where(Enrollment.student_id.in_(student_ids))
+            attendance = attendance.where(
+                SessionAttendance.lecture_id.in_(
+                    select(Enrollment.lecture_id).where(Enrollment.student_id.in_(student_ids))
+                )
+            )
+
+        owners: Dict[Tuple[int, int], int] = {
+            (lecture_id, ordinal): student_id
+            for lecture_id, ordinal, student_id in self.db.execute(ownership)
+        }
+        rows_by_lecture: Dict[int, List[SessionAttendance]] = defaultdict(list)
+        for row in self.db.exec(attendance):
+            rows_by_lecture[row.lecture_id].append(row)
+
+        totals: Dict[int, List[int]] = defaultdict(lambda: [0, 0])
+        for lecture_id, rows in rows_by_lecture.items():
+            attended, eligible = count_by_ordinal(rows)
+            for ordinal, sessions in eligible.items():
+                student_id = owners.get((lecture_id, ordinal))
+                if student_id is not None:
+                    totals[student_id][0] += attended.get(ordinal, 0)
+                    totals[student_id][1] += sessions
+        return {student_id: (attended, sessions) for student_id, (attended, sessions) in totals.items()}
+
+    def delete_for_lecture(self, lecture_id: int) -> None:
+        """강의의 출석 기록을 모두 삭제 (커밋은 호출한 쪽에서)"""
+        self.db.execute(delete(SessionAttendance).where(SessionAttendance.lecture_id == lecture_id))
+
+    def _enrolled_ordinals(self, lecture_id: int) -> Dict[int, int]:
+        """현재 수강 중인 학생 id → 수강 순번"""
+        rows = self.db.execute(
+            select(Enrollment.student_id, Enrollment.ordinal).where(
+                Enrollment.lecture_id == lecture_id,
+                Enrollment.status == ENROLLMENT_ENROLLED,
+                Enrollment.ordinal.is_not(None)
+            )
+        )
+        return {student_id: ordinal for student_id, ordinal in rows}
+
+    def _students_by_ordinal(self, lecture_id: int) -> Dict[int, int]:
+        """수강 순번 → 학생 id (취소한 등록 포함)"""
+        rows = self.db.execute(
+            select(Enrollment.ordinal, Enrollment.student_id).where(
+                Enrollment.lecture_id == lecture_id,
+                Enrollment.ordinal.is_not(None)
+            )
+        )
+        return {ordinal: student_id for ordinal, student_id in rows}
@@ -0,0 +1,167 @@
+import logging
+import threading
+from datetime import datetime
+from typing import List, Optional, Set
+
+from sqlalchemy import insert, text
+from sqlmodel import Session, desc, select
+
+from ..core.audit import AuditEvent, audit_queue, drain_audit_queue
+from ..core.config import settings
+from ..core.database import engine
+from ..core.pagination import Page, fetch_page
+from ..core.serialization import dumps
+from ..models.audit import AuditLog, audit_partition_ddl, audit_partition_name
+
+logger = logging.getLogger(__name__)
+
+# 저장에 실패한 배치를 다시 시도하는 횟수
+AUDIT_WRITE_ATTEMPTS = 3
+
+# 이 프로세스에서 이미 있는 것을 확인한 월별 파티션
+_known_partitions: Set[str] = set()
+_partitioned: Optional[bool] = None
+
+
+class AuditService:
+    """변경 이력 저장과 조회
+
+    저장은 쓰기 스레드가 모아 온 변경을 한 문장(executemany)으로 넣고, 조회는 기간 조건을 함께 걸어
+    PostgreSQL에서 해당 달의 파티션만 읽도록 합니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def write_events(self, events: List[AuditEvent]) -> int:
+        """변경 이력 일괄 저장 (필요한 월별 파티션을 먼저 만듦)"""
+        if not events:
+            return 0
+        rows = [
+            {
+                "created_at": audit_event.created_at,
+                "table_name": audit_event.table_name,
+                "record_id": audit_event.record_id,
+                "action": audit_event.action,
+                "source": audit_event.source,
+                "changes": dumps(audit_event.changes).decode("utf-8"),
+            }
+            for audit_event in events
+        ]
+        try:
+            self._ensure_partitions({audit_event.created_at for audit_event in events})
+            self.db.execute(insert(AuditLog), rows)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return len(rows)
+
+    def get_logs_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        table_name: Optional[str] = None,
+        record_id: Optional[int] = None,
+        action: Optional[str] = None,
+        source: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> Page:
+        """변경 이력과 전체 개수 조회 (최근 순, since 포함 until 미포함)"""
+        query = select(AuditLog)
+        if table_name is not None:
+            query = query.where(AuditLog.table_name == table_name)
+        if record_id is not None:
+            query = query.where(AuditLog.record_id == record_id)
+        if action is not None:
+            query = query.where(AuditLog.action == action)
+        if source is not None:
+            query = query.where(AuditLog.source == source)
+        if since is not None:
+            query = query.where(AuditLog.created_at >= since)
+        if until is not None:
+            query = query.where(AuditLog.created_at < until)
+        query = query.order_by(desc(AuditLog.created_at), desc(AuditLog.id))
+        return fetch_page(self.db, query, skip, limit)
+
+    def _ensure_partitions(self, moments: Set[datetime]) -> None:
+        """PostgreSQL 파티션 테이블이면 이벤트가 속한 달의 파티션을 만듦 (SQLite는 단일 테이블)"""
+        global _partitioned
+        if self.db.get_bind().dialect.name != "postgresql":
+            return
+        if _partitioned is None:
+            _partitioned = self.db.execute(text(
+                "SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'audit_log'::regclass"
+            )).first() is not None
+        if not _partitioned:
+            return
+
+        for moment in moments:
+            name = audit_partition_name(moment)
+            if name in _known_partitions:
+                continue
+            self.db.execute(text(audit_partition_ddl(moment)))
+            _known_partitions.add(name)
+
+
+class AuditWriter:
+    """변경 이력 큐를 모아서 저장하는 쓰기 스레드
+
+    요청은 커밋 시 큐에 넣기만 하고, 이 스레드가 audit_flush_interval_seconds마다 또는 audit_batch_size만큼
+    모이면 한 번에 저장합니다. 종료할 때 남은 이력을 모두 저장합니다.
+    """
+
+    def __init__(self, interval_seconds: float, batch_size: int):
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._flush_lock = threading.Lock()
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+        self.flush()
+
+    def flush(self) -> int:
+        """큐에 있는 이력을 모두 저장하고 저장한 개수를 반환"""
+        written = 0
+        with self._flush_lock:
+            while True:
+                events = drain_audit_queue(self.batch_size)
+                if not events:
+                    return written
+                written += self._write(events)
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            # 큐가 배치 크기만큼 차거나 주기가 지나면 저장
+            deadline = self.interval_seconds
+            while audit_queue.qsize() < self.batch_size and deadline > 0 and not self._stop.is_set():
+                self._stop.wait(min(0.1, deadline))
+                deadline -= 0.1
+            self.flush()
+
+    def _write(self, events: List[AuditEvent]) -> int:
+        for attempt in range(1, AUDIT_WRITE_ATTEMPTS + 1):
+            try:
+                with Session(engine) as db:
+                    return AuditService(db).write_events(events)
+            except Exception as e:
+                logger.warning(f"변경 이력 저장 실패 ({attempt}/{AUDIT_WRITE_ATTEMPTS}): {e}")
+                if attempt < AUDIT_WRITE_ATTEMPTS:
+                    self._stop.wait(self.interval_seconds)
+        logger.error(f"변경 이력 {len(events)}건을 저장하지 못했습니다")
+        return 0
+
+
+audit_writer = AuditWriter(settings.audit_flush_interval_seconds, settings.audit_batch_size)
@@ -0,0 +1,254 @@
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlmodel import Session, select
+
+from ..core.audit import record_created
+from ..models.student import Student
+from ..models.teacher import Teacher, TeacherCreate
+from ..models.material import Material
+from ..models.lecture import Lecture, LectureCreate
+from ..schemas.student import StudentCreate
+from ..schemas.material import MaterialCreate
+
+
+# 엔티티별 (모델, 생성 스키마, 중복 확인 키)
+IMPORT_TARGETS: Dict[str, Tuple[Any, Any, Optional[str]]] = {
+    "students": (Student, StudentCreate, "email"),
+    "teachers": (Teacher, TeacherCreate, "email"),
+    "materials": (Material, MaterialCreate, "isbn"),
+    "lectures": (Lecture, LectureCreate, "title"),
+}
+
+SUPPORTED_FORMATS = ("csv", "xlsx", "ndjson")
+
+# 한 번에 INSERT / 중복 조회하는 행 수
+CHUNK_SIZE = 1000
+
+
+class RowParseError(ValueError):
+    """파일의 한 행을 읽을 수 없음 (잘못된 JSON, UTF-8이 아닌 바이트 등)"""
+
+
+def detect_format(filename: Optional[str], file_format: Optional[str] = None) -> str:
+    """파일 형식 결정 (명시한 형식 > 확장자)"""
+    if file_format:
+        file_format = file_format.lower()
+    else:
+        extension = os.path.splitext(filename or "")[1].lower().lstrip(".")
+        file_format = {"jsonl": "ndjson", "json": "ndjson"}.get(extension, extension)
+
+    if file_format not in SUPPORTED_FORMATS:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {file_format or filename} (csv, xlsx, ndjson)")
+    return file_format
+
+
+def iter_rows(stream: BinaryIO, file_format: str) -> Iterator[Union[Dict[str, Any], RowParseError]]:
+    """파일에서 행을 하나씩 읽기 (전체를 메모리에 올리지 않음)
+
+    읽을 수 없는 행은 멈추지 않고 RowParseError를 대신 내보내 행별 오류 보고서에 남깁니다.
+    """
+    if file_format == "csv":
+        # 잘못된 바이트는 대체 문자로 바꿔 읽고 그 행만 오류로 처리
+        text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", errors="replace", newline="")
+        reader = csv.DictReader(text_stream)
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                break
+            except csv.Error as e:
+                yield RowParseError(f"CSV 형식 오류: {e}")
+                continue
+            if any("\ufffd" in value for value in row.values() if isinstance(value, str)):
+                yield RowParseError("UTF-8이 아닌 문자가 있습니다 (파일을 UTF-8로 저장해 주세요)")
+                continue
+            yield row
+
+    elif file_format == "xlsx":
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(stream, read_only=True, data_only=True)
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [str(cell).strip() if cell is not None else "" for cell in next(rows, [])]
+        for values in rows:
+            if values is None or all(v is None for v in values):
+                continue
+            yield {key: value for key, value in zip(header, values) if key}
+        workbook.close()
+
+    else:
+        # 줄마다 따로 디코딩/파싱해 한 줄이 깨져도 나머지 줄은 등록
+        for raw_line in stream:
+            try:
+                line = raw_line.decode("utf-8-sig").strip()
+            except UnicodeDecodeError:
+                yield RowParseError("UTF-8이 아닌 문자가 있습니다 (파일을 UTF-8로 저장해 주세요)")
+                continue
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                yield RowParseError(f"JSON 형식 오류: {e.msg} (열 {e.colno})")
+
+
+def _clean_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """빈 셀은 None으로, 문자열은 앞뒤 공백 제거, 목록은 JSON 문자열로 변환"""
+    cleaned = {}
+    for key, value in row.items():
+        if key is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if value == "":
+                value = None
+        elif isinstance(value, (list, dict)):
+            # certification 같은 JSON 문자열 필드
+            value = json.dumps(value, ensure_ascii=False)
+        cleaned[key.strip()] = value
+    return cleaned
+
+
+def _format_validation_error(error: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}"
+        for e in error.errors()
+    ]
+
+
+class BulkImportService:
+    """CSV/XLSX/NDJSON 일괄 등록 서비스
+
+    행을 스트리밍으로 검증하고, CHUNK_SIZE 단위로 한 번의 IN 쿼리로 DB 중복을 확인한 뒤
+    executemany로 삽입합니다. 전체 작업은 하나의 트랜잭션으로 커밋됩니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def import_file(
+        self,
+        entity: str,
+        stream: BinaryIO,
+        filename: Optional[str] = None,
+        file_format: Optional[str] = None,
+        dry_run: bool = False
+    ) -> Dict[str, Any]:
+        """파일을 읽어 일괄 등록하고 행별 오류 보고서를 반환"""
+        if entity not in IMPORT_TARGETS:
+            raise ValueError(f"지원하지 않는 엔티티 타입입니다: {entity}")
+
+        file_format = detect_format(filename, file_format)
+        # CSV/XLSX는 1행이 헤더이므로 데이터는 2행부터
+        first_row = 1 if file_format == "ndjson" else 2
+        return self.import_rows(entity, iter_rows(stream, file_format), dry_run=dry_run, first_row=first_row)
+
+    def import_rows(
+        self,
+        entity: str,
+        rows: Iterator[Union[Dict[str, Any], RowParseError]],
+        dry_run: bool = False,
+        first_row: int = 1
+    ) -> Dict[str, Any]:
+        """검증된 행을 청크 단위로 삽입 (행 번호는 first_row부터)"""
+        model, create_schema, key = IMPORT_TARGETS[entity]
+        report = {
+            "entity": entity,
+            "total_rows": 0,
+            "inserted": 0,
+            "skipped_duplicates": 0,
+            "failed": 0,
+            "dry_run": dry_run,
+            "errors": [],
+        }
+        seen_keys = set()
+        buffer: List[Tuple[int, Dict[str, Any]]] = []
+
+        try:
+            for row_number, raw in enumerate(rows, start=first_row):
+                report["total_rows"] += 1
+                if isinstance(raw, RowParseError):
+                    report["failed"] += 1
+                    report["errors"].append({"row": row_number, "errors": [str(raw)]})
+                    continue
+                try:
+                    data = create_schema(**_clean_row(raw)).model_dump()
+                except ValidationError as e:
+                    report["failed"] += 1
+                    report["errors"].append({"row": row_number, "errors": _format_validation_error(e)})
+                    continue
+                except (TypeError, AttributeError):
+                    report["failed"] += 1
+                    report["errors"].append({"row": row_number, "errors": ["행 형식이 올바르지 않습니다"]})
+                    continue
+
+                key_value = data.get(key) if key else None
+                if key_value is not None:
+                    if key_value in seen_keys:
+                        self._add_duplicate(report, row_number, key, key_value, "파일 내 중복")
+                        continue
+                    seen_keys.add(key_value)
+
+                buffer.append((row_number, data))
+                if len(buffer) >= CHUNK_SIZE:
+                    self._flush(model, key, buffer, report, dry_run)
+                    buffer = []
+
+            if buffer:
+                self._flush(model, key, buffer, report, dry_run)
+
+            if dry_run:
+                self.db.rollback()
+            else:
+                self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return report
+
+    def _flush(
+        self,
+        model: Any,
+        key: Optional[str],
+        buffer: List[Tuple[int, Dict[str, Any]]],
+        report: Dict[str, Any],
+        dry_run: bool
+    ) -> None:
+        """버퍼의 행을 DB 중복 확인 후 한 번에 삽입"""
+        existing = set()
+        if key:
+            keys = [data[key] for _, data in buffer if data.get(key) is not None]
+            if keys:
+                column = getattr(model, key)
+                existing = set(self.db.exec(select(column).where(column.in_(keys))).all())
+
+        now = datetime.utcnow()
+        values = []
+        for row_number, data in buffer:
+            if key and data.get(key) in existing:
+                self._add_duplicate(report, row_number, key, data[key], "이미 등록됨")
+                continue
+            # None 값은 빼서 모델 기본값(hire_date 등)이 적용되도록 함
+            record = model(**{k: v for k, v in data.items() if v is not None}).model_dump(exclude={"id"})
+            record["created_at"] = now
+            record["updated_at"] = now
+            values.append(record)
+
+        if values and not dry_run:
+            ids = self.db.scalars(insert(model).returning(model.id, sort_by_parameter_order=True), values).all()
+            for record_id, record in zip(ids, values):
+                record_created(self.db, model.__tablename__, record_id, record)
+        report["inserted"] += len(values)
+
+    @staticmethod
+    def _add_duplicate(report: Dict[str, Any], row_number: int, key: str, value: Any, reason: str) -> None:
+        report["skipped_duplicates"] += 1
+        report["errors"].append({"row": row_number, "errors": [f"{key} 중복 ({reason}): {value}"]})
@@ -0,0 +1,156 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+from ..core.audit import AUDITED_TABLES, record_updated
+from ..models.student import Student
+from ..models.teacher import Teacher, TeacherUpdate
+from ..models.material import Material
+from ..models.lecture import Lecture, LectureUpdate
+from ..schemas.student import StudentUpdate
+from ..schemas.material import MaterialUpdate
+from .lecture_service import SCHEDULE_FIELDS
+from .schedule_service import SLOT_FIELDS
+
+
+# 엔티티별 (모델, 수정 스키마, 필터로 쓸 수 있는 컬럼, 일괄 수정할 수 없는 고유 컬럼)
+BULK_TARGETS: Dict[str, Tuple[Any, Any, Tuple[str, ...], Tuple[str, ...]]] = {
+    "students": (Student, StudentUpdate, ("grade", "is_active"), ("email",)),
+    "teachers": (Teacher, TeacherUpdate, ("subject", "contract_type", "is_active"), ("email",)),
+    "materials": (Material, MaterialUpdate, ("subject", "grade", "publisher", "is_active"), ("isbn",)),
+    "lectures": (Lecture, LectureUpdate, ("subject", "grade", "teacher_id", "material_id", "is_active"), ("title",)),
+}
+
+
+class BulkUpdateService:
+    """일괄 수정 / 일괄 소프트 삭제 서비스
+
+    ID 목록이나 필터에 맞는 행을 한 번의 UPDATE ... WHERE 문으로 수정합니다.
+    테이블 변경 알림은 커밋 시 한 번만 갑니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def bulk_update(
+        self,
+        entity: str,
+        patch: Dict[str, Any],
+        ids: Optional[List[int]] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """조건에 맞는 행을 patch로 수정하고 수정된 행 수를 반환"""
+        model, update_schema, _, unique_fields = self._get_target(entity)
+
+        unknown = [field for field in patch if field not in update_schema.__fields__]
+        if unknown:
+            raise ValueError(f"수정할 수 없는 필드입니다: {', '.join(unknown)}")
+        blocked = [field for field in patch if field in unique_fields]
+        if blocked:
+            raise ValueError(f"고유 값은 일괄 수정할 수 없습니다: {', '.join(blocked)}")
+
+        try:
+            values = update_schema(**patch).dict(exclude_unset=True)
+        except ValidationError as e:
+            raise ValueError(str(e))
+        if not values:
+            raise ValueError("수정할 내용이 없습니다")
+        # 수정 스키마는 모든 필드가 Optional이므로 NOT NULL 컬럼의 null은 여기서 막음 (DB 오류 대신 400)
+        not_nullable = [
+            field for field, value in values.items()
+            if value is None and not model.__table__.c[field].nullable
+        ]
+        if not_nullable:
+            raise ValueError(f"null로 수정할 수 없는 필드입니다: {', '.join(not_nullable)}")
+        if model is Lecture:
+            # 일정/강의실/강사 변경과 재활성화는 강의마다 겹침을 확인해야 하므로 개별 수정으로만 (비활성화는 구간을 비우기만 함)
+            scheduled = [
+                field for field, value in values.items()
+                if field in SCHEDULE_FIELDS and not (field == "is_active" and value is False)
+            ]
+            if scheduled:
+                raise ValueError(f"일정 겹침 확인이 필요한 필드는 강의마다 수정해야 합니다: {', '.join(scheduled)}")
+
+        conditions = self._build_conditions(entity, ids, filters)
+        return self._execute(model, conditions, values)
+
+    def bulk_deactivate(
+        self,
+        entity: str,
+        ids: Optional[List[int]] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """조건에 맞는 활성 행을 소프트 삭제하고 삭제된 행 수를 반환"""
+        model = self._get_target(entity)[0]
+        conditions = self._build_conditions(entity, ids, filters)
+        # 이미 비활성인 행은 건드리지 않아 updated_at이 바뀌지 않도록 함
+        conditions.append(model.is_active == True)
+        return self._execute(model, conditions, {"is_active": False})
+
+    def _execute(self, model: Any, conditions: List[Any], values: Dict[str, Any]) -> int:
+        # updated_at은 문장 안에서 한 번만 설정 (행마다 계산하지 않음)
+        values["updated_at"] = datetime.utcnow()
+        statement = (
+            update(model)
+            .where(*conditions)
+            .values(**values)
+            .execution_options(
+                synchronize_session=False,
+                # 일정과 무관한 수정이면 커밋 후 강의 구간을 다시 확인하지 않음 (schedule_service)
+                schedule_unchanged=not set(SLOT_FIELDS).intersection(values)
+            )
+        )
+        try:
+            # 변경 이력용으로 바꿀 컬럼의 이전 값만 같은 조건으로 먼저 읽음
+            before = []
+            if model.__tablename__ in AUDITED_TABLES:
+                columns = [getattr(model, field) for field in values if field != "updated_at"]
+                before = self.db.execute(select(model.id, *columns).where(*conditions)).all()
+            # 커밋 시 세션 훅이 테이블 변경 알림을 한 번 보냄 (core.events)
+            affected = self.db.execute(statement).rowcount
+            for row in before:
+                old = row._asdict()
+                record_updated(self.db, model.__tablename__, old.pop("id"), old, values)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return affected
+
+    def _build_conditions(
+        self,
+        entity: str,
+        ids: Optional[List[int]],
+        filters: Optional[Dict[str, Any]]
+    ) -> List[Any]:
+        """ID 목록과 필터를 WHERE 조건으로 변환 (둘 다 있으면 AND)"""
+        model, _, filter_fields, _ = self._get_target(entity)
+        if not ids and not filters:
+            # 실수로 테이블 전체를 수정하지 않도록 조건을 필수로 함
+            raise ValueError("ids 또는 filters 중 하나는 필요합니다")
+
+        conditions = []
+        if ids:
+            conditions.append(model.id.in_(ids))
+
+        for field, value in (filters or {}).items():
+            if field not in filter_fields:
+                raise ValueError(f"필터로 사용할 수 없는 필드입니다: {field} ({', '.join(filter_fields)})")
+            column = getattr(model, field)
+            if value is None:
+                conditions.append(column.is_(None))
+            elif isinstance(value, list):
+                conditions.append(column.in_(value))
+            else:
+                conditions.append(column == value)
+
+        return conditions
+
+    @staticmethod
+    def _get_target(entity: str) -> Tuple[Any, Any, Tuple[str, ...], Tuple[str, ...]]:
+        if entity not in BULK_TARGETS:
+            raise ValueError(f"지원하지 않는 엔티티 타입입니다: {entity}")
+        return BULK_TARGETS[entity]
@@ -0,0 +1,104 @@
+from datetime import datetime, time
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, func
+from sqlmodel import Session, select
+
+from ..core.schedule import ScheduleSlot, expand_sessions
+from ..models.calendar import LectureSession
+from ..models.lecture import Lecture
+
+
+class CalendarService:
+    """강의 수업 달력 (lecture_session) 관리와 기간 조회
+
+    일정(요일/시각)이나 총 수업 횟수가 바뀐 강의만 다시 펼칩니다. 이미 시작한 수업은 그대로 두고
+    남은 회차만 새 일정으로 다시 만듭니다. 조회는 starts_at 인덱스로 [start, end) 범위를 읽습니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_sessions(
+        self,
+        start: datetime,
+        end: datetime,
+        lecture_id: Optional[int] = None,
+        classroom: Optional[str] = None,
+        teacher_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """start 이상 end 미만에 시작하는 수업 목록 (시작 시각 순)"""
+        query = (
+            select(
+                LectureSession.id, LectureSession.lecture_id, LectureSession.session_no,
+                LectureSession.starts_at, LectureSession.ends_at, Lecture.title, Lecture.subject,
+                Lecture.classroom, Lecture.teacher_id, Lecture.completed_sessions
+            )
+            .join(Lecture, Lecture.id == LectureSession.lecture_id)
+            .where(LectureSession.starts_at >= start, LectureSession.starts_at < end)
+        )
+        if lecture_id is not None:
+            query = query.where(LectureSession.lecture_id == lecture_id)
+        if classroom:
+            query = query.where(Lecture.classroom == classroom)
+        if teacher_id is not None:
+            query = query.where(Lecture.teacher_id == teacher_id)
+        query = query.order_by(LectureSession.starts_at, LectureSession.lecture_id)
+
+        return [
+            {
+                "id": row.id,
+                "lecture_id": row.lecture_id,
+                "title": row.title,
+                "subject": row.subject,
+                "classroom": row.classroom,
+                "teacher_id": row.teacher_id,
+                "session_no": row.session_no,
+                "starts_at": row.starts_at,
+                "ends_at": row.ends_at,
+                "completed": row.session_no <= (row.completed_sessions or 0),
+            }
+            for row in self.db.execute(query)
+        ]
+
+    def session_counts(self, lecture_ids: Optional[Iterable[int]] = None) -> Dict[int, int]:
+        """강의별 펼쳐진 수업 수 (lecture_ids가 없으면 전체)"""
+        query = select(LectureSession.lecture_id, func.count()).group_by(LectureSession.lecture_id)
+        if lecture_ids is not None:
+            query = query.where(LectureSession.lecture_id.in_(list(lecture_ids)))
+        return {lecture_id: count for lecture_id, count in self.db.execute(query)}
+
+    def regenerate(self, lecture: Any, slots: List[ScheduleSlot]) -> None:
+        """강의 하나의 수업을 다시 펼침 (커밋은 호출한 쪽에서)
+
+        처음 펼칠 때는 강의 등록일부터, 다시 펼칠 때는 지금부터 새 일정으로 남은 회차를 만듭니다.
+        비활성 강의이거나 일정이 없으면 수업을 모두 지웁니다.
+        """
+        existing = self.db.exec(
+            select(LectureSession)
+            .where(LectureSession.lecture_id == lecture.id)
+            .order_by(LectureSession.session_no)
+        ).all()
+        total = lecture.total_sessions if lecture.is_active and slots else 0
+
+        now = datetime.now()
+        kept = [session for session in existing if session.starts_at < now][:total]
+        self.db.execute(
+            delete(LectureSession).where(
+                LectureSession.lecture_id == lecture.id,
+                LectureSession.session_no > len(kept)
+            )
+        )
+
+        start = now if existing else datetime.combine(lecture.created_at.date(), time.min)
+        for number, (starts_at, ends_at) in enumerate(expand_sessions(slots, start, total - len(kept)), len(kept) + 1):
+            self.db.add(LectureSession(
+                lecture_id=lecture.id,
+                session_no=number,
+                starts_at=starts_at,
+                ends_at=ends_at
+            ))
+
+    def delete_for_lecture(self, lecture_id: int) -> None:
+        """강의의 수업을 모두 삭제 (커밋은 호출한 쪽에서)"""
+        self.db.execute(delete(LectureSession).where(LectureSession.lecture_id == lecture_id))
@@ -0,0 +1,133 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Callable, Dict
+
+from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.events import subscribe_table_change
+from app.core.database import engine
+from app.schemas.student import StudentResponse, StudentListResponse
+from app.schemas.teacher import TeacherResponse, TeacherListResponse
+from app.schemas.material import MaterialResponse, MaterialListResponse
+from app.schemas.lecture import LectureResponse, LectureListResponse
+from app.services.statistics_service import StatisticsService, STATISTICS_FAILED
+from app.services.student_service import StudentService
+from app.services.teacher_service import TeacherService
+from app.services.material_service import MaterialService
+from app.services.lecture_service import LectureService
+
+
+# 섹션 단위 캐시 (키: (섹션 이름, limit))
+dashboard_cache = TTLCache(ttl_seconds=settings.dashboard_cache_ttl)
+
+STATISTICS_SECTIONS = ("student_stats", "lecture_stats", "teacher_stats", "material_stats")
+LIST_SECTIONS = ("students", "teachers", "materials", "lectures")
+
+
+@subscribe_table_change
+def _invalidate_dashboard_cache(table: str) -> None:
+    """데이터가 바뀌면 TTL을 기다리지 않고 대시보드 캐시를 비움"""
+    dashboard_cache.invalidate()
+
+
+class DashboardService:
+    """대시보드 데이터를 한 번의 요청으로 모으는 서비스
+
+    섹션마다 별도 세션을 열어 스레드풀에서 동시에 조회하고, 결과는 섹션 단위로 캐시합니다.
+    """
+
+    def __init__(self, limit: int = 100, use_cache: bool = True):
+        self.limit = limit
+        self.use_cache = use_cache
+
+    async def get_dashboard(self) -> Dict[str, Any]:
+        """통계와 각 목록의 첫 페이지를 동시에 조회"""
+        loaders: Dict[str, Callable[[Session], Any]] = {
+            "student_stats": lambda db: StatisticsService(db).get_student_statistics(),
+            "lecture_stats": lambda db: StatisticsService(db).get_lecture_statistics(),
+            "teacher_stats": lambda db: StatisticsService(db).get_teacher_statistics(),
+            "material_stats": lambda db: StatisticsService(db).get_material_statistics(),
+            "students": self._load_students,
+            "teachers": self._load_teachers,
+            "materials": self._load_materials,
+            "lectures": self._load_lectures,
+        }
+
+        results = await asyncio.gather(*(
+            run_in_threadpool(self._load_section, name, loader)
+            for name, loader in loaders.items()
+        ))
+        sections = dict(zip(loaders.keys(), results))
+
+        return {
+            "statistics": StatisticsService.combine_overall_statistics(
+                *(sections[name] for name in STATISTICS_SECTIONS)
+            ),
+            "students": sections["students"],
+            "teachers": sections["teachers"],
+            "materials": sections["materials"],
+            "lectures": sections["lectures"],
+            "generated_at": datetime.utcnow(),
+        }
+
+    def _load_section(self, name: str, loader: Callable[[Session], Any]) -> Any:
+        """섹션 하나를 캐시 또는 독립 세션에서 조회"""
+        key = (name, self.limit) if name in LIST_SECTIONS else (name,)
+        if self.use_cache:
+            cached = dashboard_cache.get(key)
+            if cached is not None:
+                return cached
+
+        # 조회 중에 쓰기가 커밋되어 캐시가 무효화되면 (낡았을 수 있는) 이번 결과는 저장하지 않음
+        generation = dashboard_cache.generation
+        with Session(engine) as db:
+            value = loader(db)
+            failed = db.info.get(STATISTICS_FAILED, False)
+
+        # 오류로 받은 기본값(0)은 캐시하지 않고 다음 요청에서 다시 계산
+        if not failed:
+            dashboard_cache.set(key, value, generation=generation)
+        return value
+
+    def _load_students(self, db: Session) -> StudentListResponse:
+        page = StudentService(db).get_students_page(limit=self.limit)
+        return StudentListResponse(
+            students=[StudentResponse.from_orm(s) for s in page.items],
+            total=page.total,
+            page=1,
+            size=self.limit,
+            next_cursor=page.next_cursor
+        )
+
+    def _load_teachers(self, db: Session) -> TeacherListResponse:
+        page = TeacherService(db).get_teachers_page(limit=self.limit)
+        return TeacherListResponse(
+            teachers=[TeacherResponse.from_orm(t) for t in page.items],
+            total=page.total,
+            page=1,
+            size=self.limit,
+            next_cursor=page.next_cursor
+        )
+
+    def _load_materials(self, db: Session) -> MaterialListResponse:
+        page = MaterialService(db).get_materials_page(limit=self.limit)
+        return MaterialListResponse(
+            materials=[MaterialResponse.from_orm(m) for m in page.items],
+            total=page.total,
+            page=1,
+            size=self.limit,
+            next_cursor=page.next_cursor
+        )
+
+    def _load_lectures(self, db: Session) -> LectureListResponse:
+        page = LectureService(db).get_lectures_page(limit=self.limit)
+        return LectureListResponse(
+            lectures=[LectureResponse.from_orm(l) for l in page.items],
+            total=page.total,
+            page=1,
+            size=self.limit,
+            next_cursor=page.next_cursor
+        )
@@ -0,0 +1,242 @@
+from datetime import datetime
+from typing import Any, List, Optional
+
+from sqlalchemy import delete, func, text, update
+from sqlmodel import Session, desc, select
+
+from ..core.audit import record_updated
+from ..core.pagination import Page, fetch_page
+from ..models.enrollment import (
+    Enrollment,
+    ACTIVE_ENROLLMENT_PREDICATE,
+    ENROLLMENT_ENROLLED,
+    ENROLLMENT_WITHDRAWN,
+)
+from ..models.lecture import Lecture
+from ..models.material import Material
+from ..models.student import Student
+from .upsert_service import dialect_insert
+
+
+class EnrollmentError(Exception):
+    """수강 등록/취소를 처리할 수 없음"""
+
+
+class EnrollmentNotFoundError(EnrollmentError):
+    """학생, 강의 또는 등록 정보가 없음"""
+
+
+class EnrollmentConflictError(EnrollmentError):
+    """정원 초과, 중복 등록, 이미 취소된 등록 등 현재 상태와 충돌"""
+
+
+class EnrollmentService:
+    """수강 등록/취소 서비스
+
+    강의의 current_students는 조회 후 저장하지 않고 조건부 UPDATE 한 문장으로 증감합니다.
+    (current_students < max_students 조건으로 정원을 확인하므로 동시에 등록해도 정원을 넘지 않고,
+    잠기는 것은 해당 강의 행 하나뿐입니다.)
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_enrollments_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        lecture_id: Optional[int] = None,
+        student_id: Optional[int] = None,
+        status: Optional[str] = None
+    ) -> Page:
+        """수강 등록 목록과 전체 개수 조회"""
+        query = select(Enrollment)
+        if lecture_id is not None:
+            query = query.where(Enrollment.lecture_id == lecture_id)
+        if student_id is not None:
+            query = query.where(Enrollment.student_id == student_id)
+        if status is not None:
+            query = query.where(Enrollment.status == status)
+        query = query.order_by(desc(Enrollment.created_at), desc(Enrollment.id))
+        return fetch_page(self.db, query, skip, limit)
+
+    def get_enrollment(self, enrollment_id: int) -> Optional[Enrollment]:
+        """특정 수강 등록 조회"""
+        return self.db.get(Enrollment, enrollment_id)
+
+    def enroll(self, student_id: int, lecture_id: int) -> Enrollment:
+        """수강 등록 (정원이 찼거나 이미 수강 중이면 EnrollmentConflictError)"""
+        if self.db.get(Student, student_id) is None:
+            raise EnrollmentNotFoundError("학생을 찾을 수 없습니다")
+
+        now = datetime.utcnow()
+        try:
+            # 정원 확인과 증가, 순번 발급을 한 문장으로 (조건에 맞지 않으면 0행)
+            # 순번은 MAX(ordinal)+1이 아니라 강의의 카운터를 쓰므로 삭제/보관된 등록의 순번을 다시 쓰지 않음
+            seated = self.db.execute(
+                update(Lecture)
+                .where(
+                    Lecture.id == lecture_id,
+                    Lecture.is_active == True,
+                    Lecture.current_students < Lecture.max_students
+                )
+                .values(
+                    current_students=Lecture.current_students + 1,
+                    next_ordinal=Lecture.next_ordinal + 1,
+                    updated_at=now
+                )
+                .returning(Lecture.next_ordinal, Lecture.current_students)
+                .execution_options(synchronize_session=False, schedule_unchanged=True)
+            ).first()
+            if seated is None:
+                raise self._enroll_failure(lecture_id)
+            ordinal = seated.next_ordinal - 1
+            # 일괄 UPDATE는 ORM 객체를 거치지 않으므로 변경 이력을 직접 남김
+            record_updated(
+                self.db, "lecture", lecture_id,
+                {"current_students": seated.current_students - 1}, {"current_students": seated.current_students}
+            )
+
+            # 강의 교재를 한 부 차감 (재고가 없으면 0에서 멈추고 재고 부족 목록에 남음, 취소해도 돌려받지 않음)
+            stocked = self.db.execute(
+                update(Material)
+                .where(
+                    Material.id == select(Lecture.material_id).where(Lecture.id == lecture_id).scalar_subquery(),
+                    Material.quantity > 0
+                )
+                .values(quantity=Material.quantity - 1, updated_at=now)
+                .returning(Material.id, Material.quantity)
+                .execution_options(synchronize_session=False)
+            ).first()
+            if stocked is not None:
+                record_updated(
+                    self.db, "material", stocked.id, {"quantity": stocked.quantity + 1}, {"quantity": stocked.quantity}
+                )
+
+            # 같은 학생의 수강 중 등록이 있으면 아무것도 넣지 않음 (부분 고유 인덱스)
+            statement = dialect_insert(self.db, Enrollment).values(
+                student_id=student_id,
+                lecture_id=lecture_id,
+                status=ENROLLMENT_ENROLLED,
+                ordinal=ordinal,
+                enrolled_at=now,
+                created_at=now,
+                updated_at=now
+            ).on_conflict_do_nothing(
+                index_elements=["student_id", "lecture_id"],
+                index_where=text(ACTIVE_ENROLLMENT_PREDICATE)
+            ).returning(Enrollment)
+            enrollment = self.db.scalars(statement).first()
+            if enrollment is None:
+                raise EnrollmentConflictError("이미 수강 중인 강의입니다")
+
+            # RETURNING으로 받은 값을 커밋 후 다시 조회하지 않도록 세션에서 분리
+            self.db.expunge(enrollment)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return enrollment
+
+    def withdraw(self, enrollment_id: int) -> Enrollment:
+        """수강 취소 (이미 취소된 등록이면 EnrollmentConflictError)"""
+        enrollment = self.db.get(Enrollment, enrollment_id)
+        if enrollment is None:
+            raise EnrollmentNotFoundError("수강 등록을 찾을 수 없습니다")
+
+        now = datetime.utcnow()
+        try:
+            # 상태 전환을 조건부로 처리해 동시에 취소해도 인원은 한 번만 줄어듦
+            withdrawn = self.db.execute(
+                update(Enrollment)
+                .where(Enrollment.id == enrollment_id, Enrollment.status == ENROLLMENT_ENROLLED)
+                .values(status=ENROLLMENT_WITHDRAWN, withdrawn_at=now, updated_at=now)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if withdrawn == 0:
+                raise EnrollmentConflictError("이미 취소된 수강 등록입니다")
+
+            seats = self.db.execute(
+                update(Lecture)
+                .where(Lecture.id == enrollment.lecture_id, Lecture.current_students > 0)
+                .values(current_students=Lecture.current_students - 1, updated_at=now)
+                .returning(Lecture.current_students)
+                .execution_options(synchronize_session=False, schedule_unchanged=True)
+            ).scalar()
+            if seats is not None:
+                record_updated(
+                    self.db, "lecture", enrollment.lecture_id, {"current_students": seats + 1}, {"current_students": seats}
+                )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        self.db.refresh(enrollment)
+        return enrollment
+
+    def delete_for_student(self, student_id: int) -> None:
+        """학생의 수강 등록을 모두 삭제하고 수강 중이던 강의 인원을 줄임 (커밋은 호출한 쪽에서)"""
+        active_lectures = select(Enrollment.lecture_id).where(
+            Enrollment.student_id == student_id,
+            Enrollment.status == ENROLLMENT_ENROLLED
+        )
+        seats = self.db.execute(
+            update(Lecture)
+            .where(Lecture.id.in_(active_lectures), Lecture.current_students > 0)
+            .values(current_students=Lecture.current_students - 1, updated_at=datetime.utcnow())
+            .returning(Lecture.id, Lecture.current_students)
+            .execution_options(synchronize_session=False, schedule_unchanged=True)
+        ).all()
+        for lecture_id, count in seats:
+            record_updated(self.db, "lecture", lecture_id, {"current_students": count + 1}, {"current_students": count})
+        self.db.execute(delete(Enrollment).where(Enrollment.student_id == student_id))
+
+    def recount_lectures(self, lecture_ids: Optional[List[int]] = None) -> int:
+        """강의 인원을 수강 중인 등록 수로 다시 계산하고 인원이 바뀐 강의 수를 반환
+
+        수강 등록 테이블 이전에 넣은 인원처럼 등록 행과 어긋난 current_students를 맞춥니다.
+        """
+        enrolled = (
+            select(func.count())
+            .select_from(Enrollment)
+            .where(Enrollment.lecture_id == Lecture.id, Enrollment.status == ENROLLMENT_ENROLLED)
+            .scalar_subquery()
+        )
+        conditions = [Lecture.current_students != enrolled]
+        if lecture_ids is not None:
+            conditions.append(Lecture.id.in_(lecture_ids))
+        try:
+            before = self.db.execute(select(Lecture.id, Lecture.current_students).where(*conditions)).all()
+            if not before:
+                return 0
+            recounted = self.db.execute(
+                update(Lecture)
+                .where(Lecture.id.in_([row.id for row in before]))
+                .values(current_students=enrolled, updated_at=datetime.utcnow())
+                .returning(Lecture.id, Lecture.current_students)
+                .execution_options(synchronize_session=False, schedule_unchanged=True)
+            ).all()
+            previous = {row.id: row.current_students for row in before}
+            for lecture_id, count in recounted:
+                record_updated(
+                    self.db, "lecture", lecture_id, {"current_students": previous[lecture_id]}, {"current_students": count}
+                )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return len(recounted)
+
+    def delete_for_lecture(self, lecture_id: int) -> None:
+        """강의의 수강 등록을 모두 삭제 (커밋은 호출한 쪽에서)"""
+        self.db.execute(delete(Enrollment).where(Enrollment.lecture_id == lecture_id))
+
+    def _enroll_failure(self, lecture_id: int) -> EnrollmentError:
+        """조건부 UPDATE가 0행일 때 원인"""
+        lecture: Any = self.db.get(Lecture, lecture_id)
+        if lecture is None:
+            return EnrollmentNotFoundError("강의를 찾을 수 없습니다")
+        if not lecture.is_active:
+            return EnrollmentConflictError("비활성 강의에는 등록할 수 없습니다")
+        return EnrollmentConflictError("강의 정원이 찼습니다")
@@ -0,0 +1,147 @@
+import csv
+import io
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlmodel import Session, desc, func, select
+
+from ..core.database import engine
+from ..core.serialization import dumps, response_columns
+from ..models.student import Student
+from ..models.teacher import Teacher
+from ..models.material import Material
+from ..models.lecture import Lecture
+from ..schemas.student import StudentResponse
+from ..schemas.teacher import TeacherResponse
+from ..schemas.material import MaterialResponse
+from ..schemas.lecture import LectureResponse
+
+
+# 엔티티별 (모델, 기본 내보내기 컬럼을 정하는 응답 스키마)
+EXPORT_TARGETS: Dict[str, Any] = {
+    "students": (Student, StudentResponse),
+    "teachers": (Teacher, TeacherResponse),
+    "materials": (Material, MaterialResponse),
+    "lectures": (Lecture, LectureResponse),
+}
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# 서버 측 커서에서 한 번에 가져오는 행 수 (메모리에는 이만큼만 올라감)
+EXPORT_BATCH_SIZE = 1000
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class ExportService:
+    """엔티티 전체를 일정한 메모리로 읽어 내보내는 서비스
+
+    정렬은 SQL(created_at DESC, id DESC)에서 하고, yield_per로 서버 측 커서에서
+    EXPORT_BATCH_SIZE 행씩 가져옵니다. ORM 객체를 만들지 않고 필요한 컬럼만 읽습니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def default_columns(entity: str) -> List[str]:
+        """엔티티의 기본 내보내기 컬럼 (목록 API 응답과 같음)"""
+        if entity not in EXPORT_TARGETS:
+            raise ValueError(f"지원하지 않는 엔티티 타입입니다: {entity}")
+        return response_columns(EXPORT_TARGETS[entity][1])
+
+    def iter_batches(
+        self,
+        entity: str,
+        columns: Optional[List[str]] = None,
+        is_active: Optional[bool] = None,
+        batch_size: int = EXPORT_BATCH_SIZE,
+        limit: Optional[int] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """batch_size 행씩 dict 목록으로 반환 (limit이 있으면 최신 limit행까지만)"""
+        model = EXPORT_TARGETS[entity][0]
+        columns = columns or self.default_columns(entity)
+
+        query = select(*(getattr(model, column) for column in columns))
+        if is_active is not None:
+            query = query.where(model.is_active == is_active)
+        query = query.order_by(desc(model.created_at), desc(model.id))
+        if limit is not None:
+            query = query.limit(limit)
+
+        result = self.db.execute(query.execution_options(yield_per=batch_size))
+        for rows in result.partitions():
+            yield [dict(zip(columns, row)) for row in rows]
+
+    def iter_rows(
+        self,
+        entity: str,
+        columns: Optional[List[str]] = None,
+        is_active: Optional[bool] = None,
+        limit: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """한 행씩 dict로 반환 (limit이 있으면 최신 limit행까지만)"""
+        for batch in self.iter_batches(entity, columns, is_active, limit=limit):
+            yield from batch
+
+    def count(self, entity: str, is_active: Optional[bool] = None) -> int:
+        """내보낼 전체 행 수"""
+        model = EXPORT_TARGETS[entity][0]
+        query = select(func.count()).select_from(model)
+        if is_active is not None:
+            query = query.where(model.is_active == is_active)
+        return self.db.exec(query).one()
+
+    def iter_ndjson(
+        self,
+        entity: str,
+        columns: Optional[List[str]] = None,
+        is_active: Optional[bool] = None
+    ) -> Iterator[bytes]:
+        """배치마다 NDJSON 청크 하나를 반환"""
+        for batch in self.iter_batches(entity, columns, is_active):
+            yield b"".join(dumps(row) + b"\n" for row in batch)
+
+    def iter_csv(
+        self,
+        entity: str,
+        columns: Optional[List[str]] = None,
+        is_active: Optional[bool] = None
+    ) -> Iterator[bytes]:
+        """헤더 후 배치마다 CSV 청크 하나를 반환 (엑셀에서 한글이 깨지지 않도록 BOM 포함)"""
+        columns = columns or self.default_columns(entity)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        writer.writerow(columns)
+        yield ("\ufeff" + buffer.getvalue()).encode("utf-8")
+
+        for batch in self.iter_batches(entity, columns, is_active):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([_csv_value(row[column]) for column in columns] for row in batch)
+            yield buffer.getvalue().encode("utf-8")
+
+
+def stream_export(
+    entity: str,
+    file_format: str,
+    columns: Optional[List[str]] = None,
+    is_active: Optional[bool] = None
+) -> Iterator[bytes]:
+    """StreamingResponse용 제너레이터 (요청 세션과 별도로 전송이 끝날 때까지 세션을 유지)"""
+    with Session(engine) as db:
+        service = ExportService(db)
+        if file_format == "csv":
+            yield from service.iter_csv(entity, columns, is_active)
+        else:
+            yield from service.iter_ndjson(entity, columns, is_active)
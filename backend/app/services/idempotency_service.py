@@ -0,0 +1,108 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlmodel import Session, delete, update
+
+from ..core.config import settings
+from ..models.idempotency import IdempotencyKey
+from .upsert_service import dialect_insert
+
+
+class IdempotencyConflictError(Exception):
+    """같은 Idempotency-Key가 다른 요청에 사용됨"""
+
+
+def _request_hash(payload: Dict[str, Any]) -> str:
+    body = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+class IdempotencyService:
+    """Idempotency-Key 헤더 처리
+
+    처음 받은 키는 요청을 실행하고 응답을 저장합니다. 같은 키로 같은 요청이 다시 오면
+    실행하지 않고 저장된 응답을 돌려주며, 다른 요청에 같은 키를 쓰면 IdempotencyConflictError를 냅니다.
+
+    키는 요청을 실행하기 전에 INSERT ... ON CONFLICT DO NOTHING으로 먼저 잡고, 요청의 쓰기와
+    응답 저장을 같은 트랜잭션으로 커밋합니다. 같은 키로 동시에 들어온 요청은 먼저 잡은 쪽이
+    커밋할 때까지 기다린 뒤 그 응답을 재사용하므로 요청이 두 번 실행되지 않습니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def run(
+        self,
+        key: Optional[str],
+        path: str,
+        payload: Dict[str, Any],
+        handler: Callable[[], Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], bool]:
+        """(응답 본문, 저장된 응답 재사용 여부)를 반환
+
+        handler는 커밋하지 않아야 합니다 (키 저장과 함께 여기서 커밋).
+        """
+        if not key:
+            body = handler()
+            self._commit()
+            return body, False
+
+        request_hash = _request_hash(payload)
+        try:
+            claimed = self._claim(key, path, request_hash)
+        except Exception:
+            self.db.rollback()
+            raise
+        if not claimed:
+            self.db.rollback()
+            return self._replay(key, path, request_hash), True
+
+        try:
+            body = handler()
+            self.db.execute(
+                update(IdempotencyKey)
+                .where(IdempotencyKey.key == key)
+                .values(response_body=json.dumps(body, ensure_ascii=False, default=str))
+            )
+            self.db.commit()
+        except Exception:
+            # 요청이 실패하면 잡은 키도 함께 취소되어 같은 키로 다시 시도할 수 있음
+            self.db.rollback()
+            raise
+        return body, False
+
+    def _claim(self, key: str, path: str, request_hash: str) -> bool:
+        """키를 먼저 저장 (이미 있으면 False)"""
+        # 보관 기간이 지난 키는 지우고 새 요청으로 처리
+        self.db.execute(delete(IdempotencyKey).where(IdempotencyKey.created_at < self._cutoff()))
+        statement = dialect_insert(self.db, IdempotencyKey).values(
+            key=key,
+            path=path,
+            request_hash=request_hash,
+            status_code=200,
+            response_body="",
+            created_at=datetime.utcnow()
+        ).on_conflict_do_nothing(index_elements=["key"]).returning(IdempotencyKey.key)
+        return self.db.execute(statement).first() is not None
+
+    def _replay(self, key: str, path: str, request_hash: str) -> Dict[str, Any]:
+        record = self.db.get(IdempotencyKey, key, populate_existing=True)
+        if record is None or not record.response_body:
+            # 그 사이 만료되어 지워진 경우
+            raise IdempotencyConflictError("Idempotency-Key를 처리하는 중입니다. 잠시 후 다시 시도하세요")
+        if record.path != path or record.request_hash != request_hash:
+            raise IdempotencyConflictError("Idempotency-Key가 다른 요청에 이미 사용되었습니다")
+        return json.loads(record.response_body)
+
+    def _commit(self) -> None:
+        try:
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+    @staticmethod
+    def _cutoff() -> datetime:
+        return datetime.utcnow() - timedelta(hours=settings.idempotency_key_ttl_hours)
@@ -0,0 +1,144 @@
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import delete, text, update
+from sqlmodel import Session, desc, select
+
+from ..core.audit import record_updated
+from ..core.database import engine
+from ..core.events import subscribe_table_change
+from ..core.pagination import Page, fetch_page
+from ..models.inventory import MaterialStockAlert, OPEN_STOCK_ALERT_PREDICATE
+from ..models.material import Material
+from .upsert_service import dialect_insert
+
+
+class InventoryNotFoundError(Exception):
+    """교재가 없음"""
+
+
+class InventoryService:
+    """교재 재고 부족 조회와 알림 관리
+
+    재고 부족 교재는 부분 인덱스(ix_material_low_stock)에 든 행만 읽고, 알림은 교재가 커밋될 때마다
+    부족 교재와 처리 중인 알림만 비교해 새로 생긴 부족은 알림을 만들고 채워진 교재는 알림을 해소합니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_low_stock(self) -> List[Dict[str, Any]]:
+        """재고가 최소 수량 이하인 활성 교재 (재고 적은 순)"""
+        query = (
+            select(Material.id, Material.name, Material.subject, Material.quantity, Material.min_quantity)
+            .where(Material.is_active == True, Material.quantity <= Material.min_quantity)
+            .order_by(Material.quantity, Material.id)
+        )
+        return [
+            {
+                "material_id": row.id,
+                "name": row.name,
+                "subject": row.subject,
+                "quantity": row.quantity,
+                "min_quantity": row.min_quantity,
+                "shortage": row.min_quantity - row.quantity,
+            }
+            for row in self.db.execute(query)
+        ]
+
+    def adjust_stock(self, material_id: int, delta: int) -> Material:
+        """재고를 delta만큼 증감 (입고는 양수, 출고는 음수, 재고보다 많이 빼면 ValueError)"""
+        try:
+            quantity = self.db.scalars(
+                update(Material)
+                .where(Material.id == material_id, Material.quantity + delta >= 0)
+                .values(quantity=Material.quantity + delta, updated_at=datetime.utcnow())
+                .returning(Material.quantity)
+                .execution_options(synchronize_session=False)
+            ).first()
+            if quantity is None:
+                if self.db.get(Material, material_id) is None:
+                    raise InventoryNotFoundError("교재를 찾을 수 없습니다")
+                raise ValueError("재고보다 많이 차감할 수 없습니다")
+            record_updated(self.db, "material", material_id, {"quantity": quantity - delta}, {"quantity": quantity})
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return self.db.get(Material, material_id, populate_existing=True)
+
+    def sync_alerts(self) -> Tuple[int, int]:
+        """재고 부족 알림을 현재 재고에 맞춤 (새로 만든 수, 해소한 수)"""
+        low = {
+            row.id: row
+            for row in self.db.execute(
+                select(Material.id, Material.quantity, Material.min_quantity)
+                .where(Material.is_active == True, Material.quantity <= Material.min_quantity)
+            )
+        }
+        open_alerts = dict(self.db.execute(
+            select(MaterialStockAlert.material_id, MaterialStockAlert.id)
+            .where(MaterialStockAlert.resolved_at.is_(None))
+        ).all())
+
+        now = datetime.utcnow()
+        created = [
+            {"material_id": material_id, "quantity": row.quantity, "min_quantity": row.min_quantity, "created_at": now}
+            for material_id, row in low.items()
+            if material_id not in open_alerts
+        ]
+        resolved = [alert_id for material_id, alert_id in open_alerts.items() if material_id not in low]
+        if not created and not resolved:
+            return 0, 0
+
+        try:
+            if created:
+                # 동시에 맞추는 다른 프로세스가 먼저 만든 알림은 건너뜀
+                self.db.execute(
+                    dialect_insert(self.db, MaterialStockAlert).values(created).on_conflict_do_nothing(
+                        index_elements=["material_id"],
+                        index_where=text(OPEN_STOCK_ALERT_PREDICATE)
+                    )
+                )
+            if resolved:
+                self.db.execute(
+                    update(MaterialStockAlert)
+                    .where(MaterialStockAlert.id.in_(resolved), MaterialStockAlert.resolved_at.is_(None))
+                    .values(resolved_at=now)
+                    .execution_options(synchronize_session=False)
+                )
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return len(created), len(resolved)
+
+    def get_alerts_page(self, skip: int = 0, limit: int = 100, open_only: bool = False) -> Page:
+        """재고 부족 알림 목록과 전체 개수 조회 (최근 순)"""
+        query = select(MaterialStockAlert)
+        if open_only:
+            query = query.where(MaterialStockAlert.resolved_at.is_(None))
+        query = query.order_by(desc(MaterialStockAlert.created_at), desc(MaterialStockAlert.id))
+        return fetch_page(self.db, query, skip, limit)
+
+    def delete_for_material(self, material_id: int) -> None:
+        """교재의 알림을 모두 삭제 (커밋은 호출한 쪽에서)"""
+        self.db.execute(delete(MaterialStockAlert).where(MaterialStockAlert.material_id == material_id))
+
+
+_sync_lock = threading.Lock()
+
+
+def sync_stock_alerts() -> Tuple[int, int]:
+    """재고 부족 알림 맞춤 (독립 세션)"""
+    with _sync_lock:
+        with Session(engine) as db:
+            return InventoryService(db).sync_alerts()
+
+
+@subscribe_table_change
+def _sync_stock_alerts(table: str) -> None:
+    """교재가 커밋되면 (수정, 일괄 처리, 수강 등록 차감 등 어느 경로든) 재고 부족 알림을 갱신"""
+    if table == "material":
+        sync_stock_alerts()
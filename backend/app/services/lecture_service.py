@@ -1,7 +1,18 @@
-from sqlmodel import Session, select, desc
+from sqlmodel import Session, select, desc, func
 from typing import List, Optional
+from datetime import datetime
+from ..core.pagination import Page, fetch_page, fetch_keyset_page
+from ..core.projection import build_projection_query
+from ..core.schedule import parse_schedule
 from ..models.lecture import Lecture, LectureCreate, LectureUpdate
 from ..schemas.lecture import LectureResponse
+from .attendance_service import AttendanceService
+from .calendar_service import CalendarService
+from .enrollment_service import EnrollmentService
+from .schedule_service import SLOT_FIELDS, ScheduleService, schedule_write_lock
+
+# 바뀌면 강의실/강사 일정 겹침을 다시 확인해야 하는 필드
+SCHEDULE_FIELDS = {"schedule", "classroom", "teacher_id", "is_active"}
 
 class LectureService:
     def __init__(self, db: Session):
@@ -9,14 +20,24 @@ class LectureService:
 
     def get_lectures(self, skip: int = 0, limit: int = 100, is_active: Optional[bool] = None) -> List[Lecture]:
         """강의 목록 조회"""
-        query = select(Lecture)
+        query = self._build_list_query(is_active).offset(skip).limit(limit)
+        return list(self.db.exec(query).all())
+
+    def get_lectures_page(self, skip: int = 0, limit: int = 100, is_active: Optional[bool] = None, cursor: Optional[str] = None, fields: Optional[List[str]] = None, with_total: bool = False) -> Page:
+        """강의 목록과 전체 개수 조회 (cursor가 있으면 키셋(전체 개수는 with_total일 때만), 없으면 OFFSET 방식, fields가 있으면 해당 컬럼만 dict로)"""
+        query = self._build_list_query(is_active, fields)
+        if cursor:
+            return fetch_keyset_page(self.db, query, Lecture, cursor, limit, with_total=with_total)
+        return fetch_page(self.db, query, skip, limit)
+
+    def _build_list_query(self, is_active: Optional[bool] = None, fields: Optional[List[str]] = None):
+        """강의 목록 조회 쿼리 생성"""
+        query = build_projection_query(Lecture, fields) if fields else select(Lecture)
         if is_active is not None:
             query = query.where(Lecture.is_active == is_active)
         
-        # 최신 생성 순으로 정렬 (created_at 내림차순)
-        query = query.order_by(desc(Lecture.created_at))
-        query = query.offset(skip).limit(limit)
-        return list(self.db.exec(query).all())
+        # 최신 생성 순으로 정렬 (created_at 내림차순, 같은 시각은 id 내림차순)
+        return query.order_by(desc(Lecture.created_at), desc(Lecture.id))
 
     def get_lecture(self, lecture_id: int) -> Optional[Lecture]:
         """특정 강의 조회"""
@@ -24,10 +45,23 @@ class LectureService:
         return self.db.exec(statement).first()
 
     def create_lecture(self, lecture_data: LectureCreate) -> Lecture:
-        """새 강의 생성"""
+        """새 강의 생성 (일정 형식 오류는 ValueError, 강의실/강사 일정이 겹치면 ScheduleConflictError)"""
         lecture = Lecture.from_orm(lecture_data)
-        self.db.add(lecture)
-        self.db.commit()
+        schedules = ScheduleService(self.db)
+        # 겹침 확인과 구간 저장 사이에 다른 강의가 같은 시간을 차지하지 못하도록 잠금 안에서 커밋
+        with schedule_write_lock(self.db):
+            schedules.validate_lecture(
+                lecture.schedule, lecture.classroom, lecture.teacher_id, lecture.is_active
+            )
+            self.db.add(lecture)
+            try:
+                self.db.flush()
+                schedules.sync_lectures(lecture_ids=[lecture.id], commit=False)
+                self.db.commit()
+            except Exception:
+                # 제목 중복(고유 인덱스) 등은 라우터에서 409로
+                self.db.rollback()
+                raise
         self.db.refresh(lecture)
         return lecture
 
@@ -38,27 +72,60 @@ class LectureService:
             return None
         
         update_data = lecture_data.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(lecture, field, value)
         
-        self.db.add(lecture)
-        self.db.commit()
+        schedules = ScheduleService(self.db)
+        with schedule_write_lock(self.db):
+            # 일정에 영향을 주는 필드가 바뀔 때만 겹침 확인 (객체를 바꾸기 전에 확인)
+            # 일정은 그대로이고 저장된 일정이 예전 형식이라 해석되지 않으면 강의실/강사만 바꿔도 막지 않음
+            if SCHEDULE_FIELDS.intersection(update_data) and ("schedule" in update_data or self._schedule_parses(lecture.schedule)):
+                merged = {field: update_data.get(field, getattr(lecture, field)) for field in SCHEDULE_FIELDS}
+                schedules.validate_lecture(
+                    merged["schedule"], merged["classroom"], merged["teacher_id"], merged["is_active"],
+                    exclude_lecture_id=lecture_id
+                )
+
+            for field, value in update_data.items():
+                setattr(lecture, field, value)
+            lecture.updated_at = datetime.utcnow()
+
+            self.db.add(lecture)
+            try:
+                if set(SLOT_FIELDS).intersection(update_data):
+                    # 구간을 같은 트랜잭션에 써서 잠금이 풀린 뒤의 겹침 확인이 새 일정을 보게 함
+                    self.db.flush()
+                    schedules.sync_lectures(lecture_ids=[lecture_id], commit=False)
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
         self.db.refresh(lecture)
         return lecture
 
+    @staticmethod
+    def _schedule_parses(schedule: str) -> bool:
+        try:
+            parse_schedule(schedule)
+        except ValueError:
+            return False
+        return True
+
     def delete_lecture(self, lecture_id: int) -> bool:
         """강의 삭제"""
         lecture = self.get_lecture(lecture_id)
         if not lecture:
             return False
         
+        AttendanceService(self.db).delete_for_lecture(lecture_id)
+        EnrollmentService(self.db).delete_for_lecture(lecture_id)
+        ScheduleService(self.db).delete_for_lecture(lecture_id)
+        CalendarService(self.db).delete_for_lecture(lecture_id)
         self.db.delete(lecture)
         self.db.commit()
         return True
 
     def count_lectures(self, is_active: Optional[bool] = None) -> int:
         """강의 수 카운트"""
-        query = select(Lecture)
+        query = select(func.count()).select_from(Lecture)
         if is_active is not None:
             query = query.where(Lecture.is_active == is_active)
-        return len(self.db.exec(query).all()) 
\ No newline at end of file
+        return self.db.exec(query).one() 
@@ -1,9 +1,12 @@
-from sqlmodel import Session, select, desc
-from typing import Optional
+from sqlmodel import Session, select, desc, func
+from typing import List, Optional
 from datetime import datetime
 
+from ..core.pagination import Page, fetch_page, fetch_keyset_page
+from ..core.projection import build_projection_query
 from ..models.material import Material
 from ..schemas.material import MaterialCreate, MaterialUpdate
+from .inventory_service import InventoryService
 
 
 class MaterialService:
@@ -17,15 +20,38 @@ class MaterialService:
         is_active: Optional[bool] = None
     ) -> list[Material]:
         """교재 목록 조회"""
-        query = select(Material)
+        query = self._build_list_query(is_active).offset(skip).limit(limit)
+        return list(self.db.exec(query).all())
+
+    def get_materials_page(
+        self, 
+        skip: int = 0, 
+        limit: int = 100, 
+        is_active: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        with_total: bool = False
+    ) -> Page:
+        """교재 목록과 전체 개수 조회
+
+        cursor가 있으면 (created_at, id) 키셋 페이지네이션, 없으면 OFFSET 방식으로 조회합니다.
+        키셋 방식의 전체 개수는 with_total일 때만 세고 아니면 None입니다.
+        fields가 있으면 해당 컬럼만 SELECT하고 항목을 모델 객체 대신 dict로 반환합니다.
+        """
+        query = self._build_list_query(is_active, fields)
+        if cursor:
+            return fetch_keyset_page(self.db, query, Material, cursor, limit, with_total=with_total)
+        return fetch_page(self.db, query, skip, limit)
+
+    def _build_list_query(self, is_active: Optional[bool] = None, fields: Optional[List[str]] = None):
+        """교재 목록 조회 쿼리 생성"""
+        query = build_projection_query(Material, fields) if fields else select(Material)
         
         if is_active is not None:
             query = query.where(Material.is_active == is_active)
         
-        # 최신 생성 순으로 정렬 (created_at 내림차순)
-        query = query.order_by(desc(Material.created_at))
-        query = query.offset(skip).limit(limit)
-        return list(self.db.exec(query).all())
+        # 최신 생성 순으로 정렬 (created_at 내림차순, 같은 시각은 id 내림차순)
+        return query.order_by(desc(Material.created_at), desc(Material.id))
 
     def get_material(self, material_id: int) -> Optional[Material]:
         """교재 상세 조회"""
@@ -76,6 +102,7 @@ class MaterialService:
         material = self.db.get(Material, material_id)
         if not material:
             return False
+        InventoryService(self.db).delete_for_material(material_id)
         self.db.delete(material)
         self.db.commit()
         return True
@@ -87,9 +114,9 @@ class MaterialService:
 
     def count_materials(self, is_active: Optional[bool] = None) -> int:
         """교재 수 조회"""
-        query = select(Material)
+        query = select(func.count()).select_from(Material)
         
         if is_active is not None:
             query = query.where(Material.is_active == is_active)
         
-        return len(self.db.exec(query).all()) 
\ No newline at end of file
+        return self.db.exec(query).one() 
@@ -0,0 +1,288 @@
+import re
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, delete, union_all, update
+from sqlmodel import Session, desc, func, select
+
+from ..core.pagination import Page, fetch_page
+from ..models.archive import payment_archive, student_balance_archive
+from ..models.enrollment import Enrollment, ENROLLMENT_ENROLLED
+from ..models.lecture import Lecture
+from ..models.payment import (
+    Payment,
+    PaymentCreate,
+    StudentBalance,
+    LectureRevenue,
+    MonthlyRevenue,
+    PAYMENT_PERIOD_PATTERN,
+)
+from ..models.student import Student
+from .upsert_service import dialect_insert
+
+
+class PaymentNotFoundError(Exception):
+    """학생 또는 강의가 없음"""
+
+
+def payment_period(moment: datetime) -> str:
+    """일시가 속한 귀속 월 (YYYY-MM)"""
+    return moment.strftime("%Y-%m")
+
+
+def validate_period(period: str) -> str:
+    """귀속 월 형식 확인 (형식이 틀리면 ValueError)"""
+    if not re.match(PAYMENT_PERIOD_PATTERN, period or ""):
+        raise ValueError(f"귀속 월은 YYYY-MM 형식이어야 합니다: {period}")
+    return period
+
+
+def outstanding(billed: int, paid: int) -> int:
+    """미납액 (더 낸 금액은 다른 달의 미납을 상쇄하지 않음)"""
+    return max(0, billed - paid)
+
+
+class PaymentService:
+    """수강료 납부 원장과 월별 집계 관리
+
+    납부는 payment에 추가만 하고, 같은 트랜잭션에서 학생별/강의별/월별 집계 행을 증감합니다.
+    통계는 원장이나 학생/강의 행을 훑지 않고 집계 행만 읽습니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_payments_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        student_id: Optional[int] = None,
+        lecture_id: Optional[int] = None,
+        period: Optional[str] = None
+    ) -> Page:
+        """납부 내역과 전체 개수 조회 (최근 납부 순)"""
+        query = select(Payment)
+        if student_id is not None:
+            query = query.where(Payment.student_id == student_id)
+        if lecture_id is not None:
+            query = query.where(Payment.lecture_id == lecture_id)
+        if period is not None:
+            query = query.where(Payment.period == validate_period(period))
+        query = query.order_by(desc(Payment.paid_at), desc(Payment.id))
+        return fetch_page(self.db, query, skip, limit)
+
+    def record_payment(self, payment_data: PaymentCreate) -> Payment:
+        """납부(음수면 환불)를 원장에 추가하고 집계를 갱신"""
+        if payment_data.amount == 0:
+            raise ValueError("금액은 0이 아니어야 합니다")
+        if self.db.get(Student, payment_data.student_id) is None:
+            raise PaymentNotFoundError("학생을 찾을 수 없습니다")
+        if payment_data.lecture_id is not None and self.db.get(Lecture, payment_data.lecture_id) is None:
+            raise PaymentNotFoundError("강의를 찾을 수 없습니다")
+
+        paid_at = payment_data.paid_at or datetime.utcnow()
+        payment = Payment(
+            student_id=payment_data.student_id,
+            lecture_id=payment_data.lecture_id,
+            amount=payment_data.amount,
+            period=validate_period(payment_data.period or payment_period(paid_at)),
+            paid_at=paid_at,
+            method=payment_data.method,
+            memo=payment_data.memo
+        )
+        try:
+            self.db.add(payment)
+            self.db.flush()
+            self._apply_payment(payment)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        self.db.refresh(payment)
+        return payment
+
+    def bill_period(self, period: str) -> Optional[MonthlyRevenue]:
+        """귀속 월의 학생별 청구액을 현재 수강 상태로 다시 계산 (여러 번 실행해도 같은 결과)
+
+        수강 중인 활성 강의의 수강료 합계를 청구하고, 수강 등록이 없는 활성 학생은 학생의 수강료를 청구합니다.
+        청구할 학생도 납부도 없는 달이면 월별 집계 행이 없으므로 None을 반환합니다.
+        """
+        validate_period(period)
+        billed: Dict[int, int] = {
+            student_id: int(fee or 0)
+            for student_id, fee in self.db.execute(
+                select(Student.id, Student.tuition_fee).where(Student.is_active == True, Student.tuition_fee > 0)
+            )
+        }
+        enrolled = self.db.execute(
+            select(Enrollment.student_id, func.sum(Lecture.tuition_fee))
+            .join(Lecture, Lecture.id == Enrollment.lecture_id)
+            .join(Student, Student.id == Enrollment.student_id)
+            .where(Enrollment.status == ENROLLMENT_ENROLLED, Lecture.is_active == True, Student.is_active == True)
+            .group_by(Enrollment.student_id)
+        )
+        billed.update({student_id: int(fee or 0) for student_id, fee in enrolled})
+
+        now = datetime.utcnow()
+        try:
+            self.db.execute(
+                update(StudentBalance)
+                .where(StudentBalance.period == period)
+                .values(billed=0, updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            for student_id, amount in billed.items():
+                statement = dialect_insert(self.db, StudentBalance).values(
+                    period=period, student_id=student_id, billed=amount, paid=0, updated_at=now
+                )
+                self.db.execute(statement.on_conflict_do_update(
+                    index_elements=["period", "student_id"],
+                    set_={"billed": statement.excluded.billed, "updated_at": now}
+                ))
+            self._refresh_periods([period])
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return self.db.get(MonthlyRevenue, period, populate_existing=True)
+
+    def get_monthly_revenue(self, start: Optional[str] = None, end: Optional[str] = None) -> List[MonthlyRevenue]:
+        """월별 집계 (start, end 포함, 월 순)"""
+        query = select(MonthlyRevenue)
+        if start is not None:
+            query = query.where(MonthlyRevenue.period >= validate_period(start))
+        if end is not None:
+            query = query.where(MonthlyRevenue.period <= validate_period(end))
+        return list(self.db.exec(query.order_by(MonthlyRevenue.period)).all())
+
+    def get_student_balances(self, student_id: int) -> List[StudentBalance]:
+        """학생의 월별 청구/납부 (최근 월 순)"""
+        query = (
+            select(StudentBalance)
+            .where(StudentBalance.student_id == student_id)
+            .order_by(desc(StudentBalance.period))
+        )
+        return list(self.db.exec(query).all())
+
+    def revenue_totals(self) -> Tuple[int, int, int]:
+        """전체 (청구, 납부, 미납) 합계 - 월별 집계 행만 합산"""
+        billed, paid, unpaid = self.db.execute(
+            select(
+                func.sum(MonthlyRevenue.billed),
+                func.sum(MonthlyRevenue.paid),
+                func.sum(MonthlyRevenue.outstanding)
+            )
+        ).one()
+        return int(billed or 0), int(paid or 0), int(unpaid or 0)
+
+    def lecture_revenue_total(self) -> int:
+        """강의가 지정된 납부 합계 - 강의별 집계 행만 합산"""
+        return int(self.db.exec(select(func.sum(LectureRevenue.paid))).first() or 0)
+
+    def delete_for_student(self, student_id: int) -> None:
+        """학생 완전 삭제 시 받지 못한 청구만 정리 (커밋은 호출한 쪽에서)
+
+        원장과 납부 합계는 그대로 남기고, 청구액을 납부액까지 줄여 미납에서만 제외합니다.
+        """
+        self.clear_outstanding([student_id])
+
+    def clear_outstanding(self, student_ids: List[int]) -> None:
+        """학생들의 미납 청구를 납부액까지 줄이고 월별 집계를 다시 계산 (완전 삭제/보관 시, 커밋은 호출한 쪽에서)"""
+        unpaid = StudentBalance.billed > StudentBalance.paid
+        periods = self.db.exec(
+            select(StudentBalance.period).where(StudentBalance.student_id.in_(student_ids), unpaid).distinct()
+        ).all()
+        self.db.execute(
+            update(StudentBalance)
+            .where(StudentBalance.student_id.in_(student_ids), unpaid)
+            .values(billed=StudentBalance.paid, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        self._refresh_periods(periods)
+
+    def _apply_payment(self, payment: Payment) -> None:
+        """납부 한 건만큼 집계 행을 증감 (각 행을 원자적 UPDATE로 더하므로 동시 납부에도 맞음)"""
+        now = datetime.utcnow()
+        statement = dialect_insert(self.db, StudentBalance).values(
+            period=payment.period, student_id=payment.student_id, billed=0, paid=payment.amount, updated_at=now
+        )
+        billed, paid = self.db.execute(
+            statement.on_conflict_do_update(
+                index_elements=["period", "student_id"],
+                set_={"paid": StudentBalance.paid + payment.amount, "updated_at": now}
+            ).returning(StudentBalance.billed, StudentBalance.paid)
+        ).one()
+        # 이 학생 행은 위 문장으로 잠겨 있으므로 납부 전 값은 방금 더한 금액을 빼서 구함
+        outstanding_delta = outstanding(billed, paid) - outstanding(billed, paid - payment.amount)
+
+        statement = dialect_insert(self.db, MonthlyRevenue).values(
+            period=payment.period,
+            billed=0,
+            paid=payment.amount,
+            outstanding=outstanding_delta,
+            payment_count=1,
+            updated_at=now
+        )
+        self.db.execute(statement.on_conflict_do_update(
+            index_elements=["period"],
+            set_={
+                "paid": MonthlyRevenue.paid + payment.amount,
+                "outstanding": MonthlyRevenue.outstanding + outstanding_delta,
+                "payment_count": MonthlyRevenue.payment_count + 1,
+                "updated_at": now,
+            }
+        ))
+
+        if payment.lecture_id is not None:
+            statement = dialect_insert(self.db, LectureRevenue).values(
+                period=payment.period, lecture_id=payment.lecture_id, paid=payment.amount, payment_count=1, updated_at=now
+            )
+            self.db.execute(statement.on_conflict_do_update(
+                index_elements=["period", "lecture_id"],
+                set_={
+                    "paid": LectureRevenue.paid + payment.amount,
+                    "payment_count": LectureRevenue.payment_count + 1,
+                    "updated_at": now,
+                }
+            ))
+
+    def _refresh_periods(self, periods: Iterable[str]) -> None:
+        """귀속 월의 월별 집계를 학생별 집계(기본 키 앞부분이 월)에서 다시 계산
+
+        보관된 학생의 집계와 원장(student_balance_archive, payment_archive)도 더하므로
+        학생을 보관해도 지난 달 매출은 바뀌지 않습니다.
+        """
+        now = datetime.utcnow()
+        for period in set(periods):
+            balances = union_all(
+                select(StudentBalance.billed, StudentBalance.paid).where(StudentBalance.period == period),
+                select(student_balance_archive.c.billed, student_balance_archive.c.paid)
+                .where(student_balance_archive.c.period == period)
+            ).subquery()
+            billed, paid, unpaid = self.db.execute(
+                select(
+                    func.sum(balances.c.billed),
+                    func.sum(balances.c.paid),
+                    func.sum(case(
+                        (balances.c.billed > balances.c.paid, balances.c.billed - balances.c.paid),
+                        else_=0
+                    ))
+                )
+            ).one()
+            if billed is None:
+                self.db.execute(delete(MonthlyRevenue).where(MonthlyRevenue.period == period))
+                continue
+
+            payment_count = sum(
+                self.db.execute(select(func.count()).select_from(table).where(table.c.period == period)).scalar_one()
+                for table in (Payment.__table__, payment_archive)
+            )
+            values = {
+                "billed": int(billed),
+                "paid": int(paid or 0),
+                "outstanding": int(unpaid or 0),
+                "payment_count": payment_count,
+                "updated_at": now,
+            }
+            statement = dialect_insert(self.db, MonthlyRevenue).values(period=period, **values)
+            self.db.execute(statement.on_conflict_do_update(index_elements=["period"], set_=values))
@@ -0,0 +1,324 @@
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlmodel import Session, select
+
+from ..core.database import engine
+from ..core.recommendation import (
+    difficulty_rank,
+    grade_rank,
+    score_pairs,
+    target_difficulties,
+    top_k,
+)
+from ..core.versions import table_versions
+from ..models.attendance import SessionAttendance
+from ..models.enrollment import Enrollment, ENROLLMENT_ENROLLED
+from ..models.lecture import Lecture
+from ..models.student import Student
+from .attendance_service import AttendanceService
+
+# 추천 특성이 읽는 테이블 (이 테이블 버전이 바뀌면 다음 조회 때 동기화)
+RECOMMENDATION_TABLES = ("student", "lecture", "enrollment", "session_attendance")
+# 커밋이 늦게 끝난 트랜잭션도 놓치지 않도록 마지막 동기화 시각보다 이만큼 앞에서부터 다시 확인
+RECOMMENDATION_SYNC_OVERLAP = timedelta(minutes=5)
+# 바뀐 학생이 전체의 이 비율을 넘으면 바뀐 행만 고치지 않고 학생 행렬을 다시 만듦
+RECOMMENDATION_PARTIAL_REFRESH_RATIO = 0.5
+# 테이블 버전을 프로세스 사이에 공유하지 않으면 다른 프로세스(웹 워커, Celery)의 쓰기를 모르므로
+# 버전이 그대로여도 이 간격마다 동기화
+RECOMMENDATION_RESYNC_INTERVAL = timedelta(minutes=1)
+
+
+class RecommendationNotFoundError(Exception):
+    """학생 또는 강의가 없음 (비활성 포함)"""
+
+
+class RecommendationIndex:
+    """추천에 쓰는 학생/강의 특성 행렬 (활성 학생, 활성 강의만)
+
+    학생은 학년 순위, 과목별 수강 여부, 출석률로 정한 난이도를, 강의는 학년 순위, 과목 열 번호, 난이도,
+    남은 좌석을 배열로 들고 있어 추천은 DB 조회 없이 배열 연산 한 번으로 계산합니다.
+    """
+
+    def __init__(self):
+        self.subjects: List[str] = []
+        self.subject_index: Dict[str, int] = {}
+
+        self.lecture_ids = np.zeros(0, dtype=np.int64)
+        self.lecture_rows: Dict[int, int] = {}
+        self.lectures: List[Dict[str, Any]] = []
+        self.lecture_grades = np.zeros(0)
+        self.lecture_subjects = np.zeros(0, dtype=np.int64)
+        self.lecture_levels = np.zeros(0)
+        self.lecture_free = np.zeros(0, dtype=np.int64)
+        self.lecture_free_ratio = np.zeros(0)
+
+        self.student_ids = np.zeros(0, dtype=np.int64)
+        self.student_rows: Dict[int, int] = {}
+        self.student_names: List[str] = []
+        self.student_grades = np.zeros(0)
+        self.student_subjects = np.zeros((0, 0))
+        self.student_levels = np.zeros(0)
+        self.enrolled: Dict[int, Set[int]] = {}  # 학생 id → 수강 중인 강의 id
+
+        self.synced_at: Optional[datetime] = None
+        self.versions: Tuple[Tuple[str, Any], ...] = ()  # 마지막 동기화 때의 테이블 버전
+
+    def scores(self, student_rows: np.ndarray, lecture_cols: np.ndarray) -> np.ndarray:
+        """(학생 행 × 강의 열) 추천 점수"""
+        return score_pairs(
+            self.student_grades[student_rows],
+            self.student_subjects[student_rows],
+            self.student_levels[student_rows],
+            self.lecture_grades[lecture_cols],
+            self.lecture_subjects[lecture_cols],
+            self.lecture_levels[lecture_cols],
+            self.lecture_free_ratio[lecture_cols]
+        )
+
+    def lectures_for(self, student_ids: List[int], k: int) -> Dict[int, List[Dict[str, Any]]]:
+        """학생마다 추천 강의 상위 k개 (이미 수강 중이거나 정원이 찬 강의는 제외)"""
+        rows = np.array([self.student_rows[student_id] for student_id in student_ids], dtype=np.int64)
+        scores = self.scores(rows, np.arange(len(self.lecture_ids)))
+        scores[:, self.lecture_free <= 0] = -np.inf
+        for i, student_id in enumerate(student_ids):
+            taken = [self.lecture_rows[lecture_id] for lecture_id in self.enrolled.get(student_id, ()) if lecture_id in self.lecture_rows]
+            scores[i, taken] = -np.inf
+
+        return {
+            student_id: [{**self.lectures[col], "score": score} for col, score in ranked]
+            for student_id, ranked in zip(student_ids, top_k(scores, k))
+        }
+
+    def students_for(self, lecture_id: int, k: int) -> List[Dict[str, Any]]:
+        """강의에 추천할 학생 상위 k개 (이미 수강 중인 학생은 제외)"""
+        col = self.lecture_rows[lecture_id]
+        scores = self.scores(np.arange(len(self.student_ids)), np.array([col])).T
+        taken = [self.student_rows[student_id] for student_id, lectures in self.enrolled.items() if lecture_id in lectures]
+        scores[0, taken] = -np.inf
+        return [
+            {"student_id": int(self.student_ids[row]), "name": self.student_names[row], "score": score}
+            for row, score in top_k(scores, k)[0]
+        ]
+
+    def unenrolled_students(self) -> List[int]:
+        """수강 중인 강의가 없는 활성 학생 (신규 입학생 배정 대상)"""
+        return [int(student_id) for student_id in self.student_ids if not self.enrolled.get(int(student_id))]
+
+
+class RecommendationService:
+    """추천 특성 행렬을 DB에서 읽어 채움
+
+    처음에는 전체를 만들고, 이후에는 마지막 동기화 뒤에 학생/수강 등록/출석이 바뀐 학생의 행만 다시 읽어 고칩니다.
+    강의는 수가 적고 수강 등록마다 남은 좌석이 바뀌므로 강의 쪽은 통째로 다시 읽습니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def build_index(self) -> RecommendationIndex:
+        """특성 행렬 전체 생성"""
+        index = RecommendationIndex()
+        index.versions = table_versions.snapshot(RECOMMENDATION_TABLES)
+        started = datetime.utcnow()
+        self.refresh_lectures(index)
+        self.refresh_students(index)
+        index.synced_at = started
+        return index
+
+    def sync_index(self, index: RecommendationIndex, versions: Tuple[Tuple[str, Any], ...]) -> None:
+        """마지막 동기화 뒤에 바뀐 부분만 반영 (강의는 통째로, 학생은 바뀐 행만)"""
+        started = datetime.utcnow()
+        if self.refresh_lectures(index):
+            self.refresh_students(index)
+        else:
+            changed = self.changed_students(index, index.synced_at - RECOMMENDATION_SYNC_OVERLAP)
+            if len(changed) > len(index.student_ids) * RECOMMENDATION_PARTIAL_REFRESH_RATIO:
+                self.refresh_students(index)
+            elif changed:
+                self.refresh_students(index, changed)
+        index.synced_at = started
+        index.versions = versions
+
+    def refresh_lectures(self, index: RecommendationIndex) -> bool:
+        """강의 특성 다시 읽기 (과목 목록이 바뀌어 학생 행렬도 다시 만들어야 하면 True)"""
+        rows = self.db.execute(
+            select(
+                Lecture.id, Lecture.title, Lecture.subject, Lecture.grade, Lecture.difficulty_level,
+                Lecture.max_students, Lecture.current_students
+            )
+            .where(Lecture.is_active == True)
+            .order_by(Lecture.id)
+        ).all()
+
+        subjects = sorted({row.subject for row in rows})
+        subjects_changed = subjects != index.subjects
+        index.subjects = subjects
+        index.subject_index = {subject: i for i, subject in enumerate(subjects)}
+
+        free = np.array([max(0, row.max_students - row.current_students) for row in rows], dtype=np.int64)
+        capacity = np.array([max(1, row.max_students) for row in rows], dtype=float)
+        index.lecture_ids = np.array([row.id for row in rows], dtype=np.int64)
+        index.lecture_rows = {row.id: i for i, row in enumerate(rows)}
+        index.lectures = [
+            {
+                "lecture_id": row.id,
+                "title": row.title,
+                "subject": row.subject,
+                "grade": row.grade,
+                "difficulty_level": row.difficulty_level,
+                "free_seats": int(seats),
+            }
+            for row, seats in zip(rows, free)
+        ]
+        index.lecture_grades = np.array([grade_rank(row.grade) for row in rows], dtype=float)
+        index.lecture_subjects = np.array([index.subject_index[row.subject] for row in rows], dtype=np.int64)
+        index.lecture_levels = np.array([difficulty_rank(row.difficulty_level) for row in rows], dtype=float)
+        index.lecture_free = free
+        index.lecture_free_ratio = free / capacity if len(rows) else np.zeros(0)
+        return subjects_changed
+
+    def refresh_students(self, index: RecommendationIndex, student_ids: Optional[Iterable[int]] = None) -> None:
+        """학생 특성 다시 읽기 (student_ids가 있으면 그 학생 행만 고침)"""
+        query = select(Student.id, Student.name, Student.grade).where(Student.is_active == True)
+        enrollments = (
+            select(Enrollment.student_id, Enrollment.lecture_id, Lecture.subject)
+            .join(Lecture, Lecture.id == Enrollment.lecture_id)
+            .where(Enrollment.status == ENROLLMENT_ENROLLED)
+        )
+        if student_ids is not None:
+            student_ids = list(student_ids)
+            query = query.where(Student.id.in_(student_ids))
+            enrollments = enrollments.where(Enrollment.student_id.in_(student_ids))
+        students = self.db.execute(query.order_by(Student.id)).all()
+
+        enrolled: Dict[int, Set[int]] = defaultdict(set)
+        subjects: Dict[int, Set[str]] = defaultdict(set)
+        for student_id, lecture_id, subject in self.db.execute(enrollments):
+            enrolled[student_id].add(lecture_id)
+            subjects[student_id].add(subject)
+
+        grades = np.array([grade_rank(row.grade) for row in students], dtype=float)
+        subject_matrix = np.zeros((len(students), len(index.subjects)))
+        for i, row in enumerate(students):
+            columns = [index.subject_index[subject] for subject in subjects[row.id] if subject in index.subject_index]
+            subject_matrix[i, columns] = 1.0
+
+        if student_ids is None:
+            totals = AttendanceService(self.db).student_totals()
+            attended = np.array([totals.get(row.id, (0, 0))[0] for row in students], dtype=float)
+            sessions = np.array([totals.get(row.id, (0, 0))[1] for row in students], dtype=float)
+
+            index.student_ids = np.array([row.id for row in students], dtype=np.int64)
+            index.student_rows = {row.id: i for i, row in enumerate(students)}
+            index.student_names = [row.name for row in students]
+            index.student_grades = grades
+            index.student_subjects = subject_matrix
+            index.student_levels = target_difficulties(attended, sessions)
+            index.enrolled = {row.id: enrolled[row.id] for row in students if enrolled[row.id]}
+            return
+
+        # 바뀐 학생만: 남아 있는 행은 그 자리에서 고치고, 비활성이 됐거나 새로 보이는 학생은 행을 빼거나 붙임
+        totals = AttendanceService(self.db).student_totals(student_ids)
+        levels = target_difficulties(
+            np.array([totals.get(row.id, (0, 0))[0] for row in students], dtype=float),
+            np.array([totals.get(row.id, (0, 0))[1] for row in students], dtype=float)
+        )
+        found = {row.id: i for i, row in enumerate(students)}
+        keep = np.ones(len(index.student_ids), dtype=bool)
+        for student_id in student_ids:
+            index.enrolled.pop(student_id, None)
+            row = index.student_rows.get(student_id)
+            if row is None:
+                continue
+            if student_id in found:
+                i = found[student_id]
+                index.student_names[row] = students[i].name
+                index.student_grades[row] = grades[i]
+                index.student_subjects[row] = subject_matrix[i]
+                index.student_levels[row] = levels[i]
+            else:
+                keep[row] = False
+        added = [i for student_id, i in found.items() if student_id not in index.student_rows]
+
+        index.student_ids = np.concatenate([index.student_ids[keep], [students[i].id for i in added]]).astype(np.int64)
+        index.student_names = [name for name, kept in zip(index.student_names, keep) if kept] + [students[i].name for i in added]
+        index.student_grades = np.concatenate([index.student_grades[keep], grades[added]])
+        index.student_subjects = np.concatenate([index.student_subjects[keep], subject_matrix[added]])
+        index.student_levels = np.concatenate([index.student_levels[keep], levels[added]])
+        index.student_rows = {int(student_id): i for i, student_id in enumerate(index.student_ids)}
+        index.enrolled.update({student_id: enrolled[student_id] for student_id in found if enrolled[student_id]})
+
+    def changed_students(self, index: RecommendationIndex, since: datetime) -> Set[int]:
+        """since 이후 학생 정보/수강 등록/출석이 바뀌었거나, 활성 여부가 달라져 행을 넣고 빼야 하는 학생"""
+        changed = set(self.db.exec(select(Student.id).where(Student.updated_at >= since)).all())
+        changed.update(self.db.exec(
+            select(Enrollment.student_id).where(Enrollment.updated_at >= since).distinct()
+        ).all())
+        # 출석이 바뀐 강의에 등록했던 학생 (출석률로 정한 난이도가 바뀜)
+        changed.update(self.db.exec(
+            select(Enrollment.student_id)
+            .where(Enrollment.lecture_id.in_(
+                select(SessionAttendance.lecture_id).where(SessionAttendance.marked_at >= since)
+            ))
+            .distinct()
+        ).all())
+        # 보관/삭제처럼 updated_at을 남기지 않고 사라진 학생과 새로 보이는 학생
+        active = set(self.db.exec(select(Student.id).where(Student.is_active == True)).all())
+        changed.update(active.symmetric_difference(index.student_rows))
+        return changed
+
+
+_index_lock = threading.Lock()
+_index: Optional[RecommendationIndex] = None
+
+
+def get_recommendation_index() -> RecommendationIndex:
+    """특성 행렬 (이 프로세스에서 처음이면 전체 생성, 테이블 버전이 바뀌었으면 바뀐 부분만 동기화)
+
+    커밋 때가 아니라 조회 때 동기화하므로 쓰기 요청은 기다리지 않고, 다른 프로세스의 쓰기도
+    Redis로 공유한 테이블 버전(TABLE_VERSIONS_REDIS)이 바뀌면 반영됩니다.
+    """
+    global _index
+    versions = table_versions.snapshot(RECOMMENDATION_TABLES)
+    with _index_lock:
+        if _index is None:
+            with Session(engine) as db:
+                _index = RecommendationService(db).build_index()
+        elif versions != _index.versions or (
+            not table_versions.shared and datetime.utcnow() - _index.synced_at >= RECOMMENDATION_RESYNC_INTERVAL
+        ):
+            with Session(engine) as db:
+                RecommendationService(db).sync_index(_index, versions)
+        return _index
+
+
+def recommend_lectures(student_ids: List[int], k: int) -> Dict[int, List[Dict[str, Any]]]:
+    """학생마다 추천 강의 상위 k개 (활성 학생이 아니면 RecommendationNotFoundError)"""
+    index = get_recommendation_index()
+    with _index_lock:
+        missing = [student_id for student_id in student_ids if student_id not in index.student_rows]
+        if missing:
+            raise RecommendationNotFoundError(f"활성 학생을 찾을 수 없습니다: {missing[:10]}")
+        return index.lectures_for(student_ids, k)
+
+
+def recommend_students(lecture_id: int, k: int) -> List[Dict[str, Any]]:
+    """강의에 추천할 학생 상위 k개 (활성 강의가 아니면 RecommendationNotFoundError)"""
+    index = get_recommendation_index()
+    with _index_lock:
+        if lecture_id not in index.lecture_rows:
+            raise RecommendationNotFoundError("활성 강의를 찾을 수 없습니다")
+        return index.students_for(lecture_id, k)
+
+
+def match_intake(student_ids: Optional[List[int]], k: int) -> Dict[int, List[Dict[str, Any]]]:
+    """학생 여러 명(없으면 수강 중인 강의가 없는 활성 학생 전체)의 추천 강의를 한 번에 계산"""
+    if student_ids is None:
+        index = get_recommendation_index()
+        with _index_lock:
+            student_ids = index.unenrolled_students()
+    return recommend_lectures(student_ids, k)
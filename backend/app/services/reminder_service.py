@@ -0,0 +1,261 @@
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import case, delete, or_, update
+from sqlmodel import Session, desc, select
+
+from ..core.config import settings
+from ..core.database import engine
+from ..core.notifier import Notifier, ReminderMessage, get_notifier
+from ..core.pagination import Page, fetch_page
+from ..models.reminder import (
+    TuitionReminder,
+    REMINDER_PENDING,
+    REMINDER_SENDING,
+    REMINDER_SENT,
+    REMINDER_FAILED,
+    REMINDER_CANCELLED,
+)
+from ..models.student import Student
+from .upsert_service import dialect_insert
+
+logger = logging.getLogger(__name__)
+
+# 발송 중(sending)으로 가져간 뒤 이 시간이 지나도 끝나지 않으면 (프로세스가 죽은 것으로 보고) 다시 발송
+REMINDER_CLAIM_TIMEOUT = timedelta(minutes=10)
+# 이 횟수만큼 실패하면 더 이상 재시도하지 않음
+REMINDER_MAX_ATTEMPTS = 3
+# 알림 행을 한 문장에 넣는 개수
+REMINDER_INSERT_CHUNK = 500
+
+
+class ReminderService:
+    """수강료 체납 감지와 알림 일괄 발송
+
+    체납 학생은 활성 학생 납부일 부분 인덱스를 범위로 한 번 조회해 (학생, 납부일)마다 알림 행을 만들고,
+    발송은 대기 중인 알림을 배치 단위로 가져가 발송기에 한 번에 넘깁니다.
+    (학생, 납부일) 고유 인덱스와 상태 전환으로 여러 번 실행하거나 동시에 실행해도 한 번만 발송합니다.
+    """
+
+    def __init__(self, db: Session, notifier: Optional[Notifier] = None):
+        self.db = db
+        self.notifier = notifier
+
+    def detect_overdue(self, now: Optional[datetime] = None) -> int:
+        """최근 납부일이 지난 활성 학생의 알림을 만들고 새로 만든 개수를 반환"""
+        now = now or datetime.utcnow()
+        since = now - timedelta(days=settings.reminder_lookback_days)
+        overdue = self.db.execute(
+            select(Student.id, Student.tuition_due_date).where(
+                Student.is_active == True,
+                Student.tuition_due_date >= since,
+                Student.tuition_due_date < now
+            )
+        ).all()
+
+        created = 0
+        rows = [
+            {"student_id": student_id, "due_date": due_date, "status": REMINDER_PENDING, "attempts": 0, "created_at": now}
+            for student_id, due_date in overdue
+        ]
+        try:
+            for start in range(0, len(rows), REMINDER_INSERT_CHUNK):
+                chunk = rows[start:start + REMINDER_INSERT_CHUNK]
+                statement = dialect_insert(self.db, TuitionReminder).values(chunk).on_conflict_do_nothing(
+                    index_elements=["student_id", "due_date"]
+                )
+                created += self.db.execute(statement).rowcount
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return created
+
+    def dispatch_pending(self, batch_size: Optional[int] = None) -> Dict[str, int]:
+        """대기 중인 알림을 배치 단위로 발송하고 결과 개수를 반환"""
+        batch_size = batch_size or settings.reminder_batch_size
+        notifier = self.notifier or get_notifier()
+        totals = {"sent": 0, "failed": 0, "retry": 0, "cancelled": 0}
+        if notifier is None:
+            return totals
+
+        # 이번 실행에서 이미 다룬 알림(재시도 대기 포함)은 다시 가져가지 않음
+        after_id = 0
+        while True:
+            claimed = self._claim(after_id, batch_size)
+            if not claimed:
+                break
+            after_id = max(claimed)
+
+            rows = self.db.execute(
+                select(
+                    TuitionReminder.id, TuitionReminder.student_id, TuitionReminder.due_date,
+                    Student.name, Student.email, Student.is_active, Student.tuition_due_date
+                )
+                .join(Student, Student.id == TuitionReminder.student_id)
+                .where(TuitionReminder.id.in_(claimed))
+            ).all()
+            # 그 사이 납부해 납부일이 바뀌었거나 비활성이 된 학생은 보내지 않음
+            messages = [
+                ReminderMessage(row.id, row.student_id, row.name, row.email, row.due_date)
+                for row in rows
+                if row.is_active and row.tuition_due_date == row.due_date
+            ]
+            cancelled = set(claimed) - {message.reminder_id for message in messages}
+
+            failures = notifier.send_batch(messages) if messages else {}
+            sent = [message.reminder_id for message in messages if message.reminder_id not in failures]
+            for outcome, count in self._finish(sent, failures, cancelled).items():
+                totals[outcome] += count
+        return totals
+
+    def run(self) -> Dict[str, int]:
+        """체납 감지 후 대기 중인 알림 발송"""
+        detected = self.detect_overdue()
+        return {"detected": detected, **self.dispatch_pending()}
+
+    def get_reminders_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[str] = None,
+        student_id: Optional[int] = None
+    ) -> Page:
+        """알림 목록과 전체 개수 조회 (최근 생성 순)"""
+        query = select(TuitionReminder)
+        if status is not None:
+            query = query.where(TuitionReminder.status == status)
+        if student_id is not None:
+            query = query.where(TuitionReminder.student_id == student_id)
+        query = query.order_by(desc(TuitionReminder.created_at), desc(TuitionReminder.id))
+        return fetch_page(self.db, query, skip, limit)
+
+    def delete_for_student(self, student_id: int) -> None:
+        """학생의 알림을 모두 삭제 (커밋은 호출한 쪽에서)"""
+        self.db.execute(delete(TuitionReminder).where(TuitionReminder.student_id == student_id))
+
+    def _claim(self, after_id: int, batch_size: int) -> List[int]:
+        """발송할 알림을 sending으로 바꾸며 가져감 (다른 실행이 먼저 가져간 행은 조건에서 빠짐)"""
+        now = datetime.utcnow()
+        claimable = or_(
+            TuitionReminder.status == REMINDER_PENDING,
+            (TuitionReminder.status == REMINDER_SENDING) & (TuitionReminder.claimed_at < now - REMINDER_CLAIM_TIMEOUT)
+        )
+        candidates = (
+            select(TuitionReminder.id)
+            .where(claimable, TuitionReminder.id > after_id)
+            .order_by(TuitionReminder.id)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        try:
+            claimed = self.db.scalars(
+                update(TuitionReminder)
+                .where(TuitionReminder.id.in_(candidates), claimable)
+                .values(status=REMINDER_SENDING, claimed_at=now)
+                .returning(TuitionReminder.id)
+                .execution_options(synchronize_session=False)
+            ).all()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return sorted(claimed)
+
+    def _finish(self, sent: List[int], failures: Dict[int, str], cancelled: Set[int]) -> Dict[str, int]:
+        """발송 결과를 상태별로 한 번에 기록 (실패는 최대 횟수 전까지 다시 대기)"""
+        now = datetime.utcnow()
+        outcomes = {"sent": len(sent), "cancelled": len(cancelled), "failed": 0, "retry": 0}
+
+        # 보통 한 배치의 실패는 같은 원인이므로 오류 메시지별로 묶어 갱신
+        by_error: Dict[str, List[int]] = defaultdict(list)
+        for reminder_id, error in failures.items():
+            by_error[error[:500]].append(reminder_id)
+        try:
+            if sent:
+                self.db.execute(
+                    update(TuitionReminder)
+                    .where(TuitionReminder.id.in_(sent))
+                    .values(status=REMINDER_SENT, sent_at=now, attempts=TuitionReminder.attempts + 1, last_error=None)
+                    .execution_options(synchronize_session=False)
+                )
+            if cancelled:
+                self.db.execute(
+                    update(TuitionReminder)
+                    .where(TuitionReminder.id.in_(list(cancelled)))
+                    .values(status=REMINDER_CANCELLED)
+                    .execution_options(synchronize_session=False)
+                )
+            for error, reminder_ids in by_error.items():
+                statuses = self.db.scalars(
+                    update(TuitionReminder)
+                    .where(TuitionReminder.id.in_(reminder_ids))
+                    .values(
+                        status=case(
+                            (TuitionReminder.attempts + 1 >= REMINDER_MAX_ATTEMPTS, REMINDER_FAILED),
+                            else_=REMINDER_PENDING
+                        ),
+                        attempts=TuitionReminder.attempts + 1,
+                        last_error=error
+                    )
+                    .returning(TuitionReminder.status)
+                    .execution_options(synchronize_session=False)
+                ).all()
+                for status in statuses:
+                    outcomes["failed" if status == REMINDER_FAILED else "retry"] += 1
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return outcomes
+
+
+_run_lock = threading.Lock()
+
+
+def run_overdue_reminders() -> Dict[str, int]:
+    """체납 감지와 알림 발송 한 번 실행 (이 프로세스에서 이미 실행 중이면 건너뜀)"""
+    if not _run_lock.acquire(blocking=False):
+        return {"detected": 0, "sent": 0, "failed": 0, "retry": 0, "cancelled": 0}
+    try:
+        with Session(engine) as db:
+            return ReminderService(db).run()
+    finally:
+        _run_lock.release()
+
+
+class ReminderScheduler:
+    """Celery beat 없이 실행할 때 쓰는 프로세스 내 주기 실행기"""
+
+    def __init__(self, interval_seconds: int):
+        self.interval_seconds = interval_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="tuition-reminders", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                result = run_overdue_reminders()
+                if any(result.values()):
+                    logger.info(f"수강료 체납 알림: {result}")
+            except Exception as e:
+                logger.warning(f"수강료 체납 알림 실행 실패: {e}")
+            self._stop.wait(self.interval_seconds)
+
+
+reminder_scheduler = ReminderScheduler(settings.reminder_interval_seconds)
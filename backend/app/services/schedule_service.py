@@ -0,0 +1,352 @@
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, delete, event, inspect, or_, text
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, select
+
+from ..core.database import engine
+from ..core.schedule import WEEKDAYS, ScheduleSlot, format_minute, is_free_text, is_undecided, parse_schedule
+from ..models.lecture import Lecture
+from ..models.schedule import LectureSlot
+from .calendar_service import CalendarService
+from .utilization_service import Resource, UtilizationService, slot_resources
+
+logger = logging.getLogger(__name__)
+
+# 커밋이 늦게 끝난 트랜잭션도 놓치지 않도록 마지막 동기화 시각보다 이만큼 앞에서부터 다시 확인
+SCHEDULE_SYNC_OVERLAP = timedelta(minutes=5)
+
+# 바뀌면 lecture_slot이나 수업 달력을 다시 계산해야 하는 강의 필드
+SLOT_FIELDS = ("schedule", "classroom", "teacher_id", "is_active", "total_sessions")
+
+# 여러 프로세스의 일정 쓰기를 한 줄로 세우는 PostgreSQL advisory 잠금 키
+SCHEDULE_LOCK_KEY = 7_310_001
+
+# (요일, 시작, 끝, 강의실, 강사)
+SlotKey = Tuple[int, int, int, str, Optional[int]]
+
+
+class ScheduleConflictError(Exception):
+    """강의실 또는 강사의 일정이 다른 강의와 겹침"""
+
+    def __init__(self, conflicts: List[Dict[str, Any]]):
+        self.conflicts = conflicts
+        described = ", ".join(
+            f"{c['title']} ({c['weekday']} {c['start']}-{c['end']}, {c['classroom']})" for c in conflicts[:5]
+        )
+        super().__init__(f"일정이 겹치는 강의가 있습니다: {described}")
+
+
+class ScheduleService:
+    """강의 일정 구간(lecture_slot) 관리와 겹침 조회
+
+    lecture_slot은 활성 강의의 일정만 담으며, 일정 관련 필드가 바뀐 강의만 다시 풀어 쓰고
+    그 강의가 차지하던/차지하는 강의실과 강사의 히트맵만 다시 계산합니다.
+    겹침은 (강의실|강사, 요일, 시작 분) 인덱스로 조회하므로 전체 강의를 파싱하지 않습니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def find_conflicts(
+        self,
+        slots: List[ScheduleSlot],
+        classroom: Optional[str] = None,
+        teacher_id: Optional[int] = None,
+        exclude_lecture_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """주어진 구간과 겹치는 같은 강의실/강사의 강의 구간 목록 (강의실이 "미정"이면 강사만 확인)"""
+        resources = []
+        if not is_undecided(classroom):
+            resources.append(LectureSlot.classroom == classroom)
+        if teacher_id is not None:
+            resources.append(LectureSlot.teacher_id == teacher_id)
+        if not slots or not resources:
+            return []
+        ensure_schedule_index()
+
+        overlaps = or_(*(
+            and_(
+                LectureSlot.weekday == slot.weekday,
+                LectureSlot.start_minute < slot.end_minute,
+                LectureSlot.end_minute > slot.start_minute
+            )
+            for slot in slots
+        ))
+        conflicts: Dict[int, Dict[str, Any]] = {}
+        # 강의실/강사를 따로 조회해야 각각 인덱스를 탐
+        for resource in resources:
+            query = (
+                select(
+                    LectureSlot.id, LectureSlot.lecture_id, Lecture.title, LectureSlot.classroom,
+                    LectureSlot.teacher_id, LectureSlot.weekday, LectureSlot.start_minute, LectureSlot.end_minute
+                )
+                .join(Lecture, Lecture.id == LectureSlot.lecture_id)
+                .where(resource, overlaps)
+            )
+            if exclude_lecture_id is not None:
+                query = query.where(LectureSlot.lecture_id != exclude_lecture_id)
+            for row in self.db.execute(query):
+                conflicts[row.id] = {
+                    "lecture_id": row.lecture_id,
+                    "title": row.title,
+                    "classroom": row.classroom,
+                    "teacher_id": row.teacher_id,
+                    "weekday": WEEKDAYS[row.weekday],
+                    "start": format_minute(row.start_minute),
+                    "end": format_minute(row.end_minute),
+                }
+        return [conflicts[key] for key in sorted(conflicts)]
+
+    def validate_lecture(
+        self,
+        schedule: str,
+        classroom: str,
+        teacher_id: Optional[int],
+        is_active: bool = True,
+        exclude_lecture_id: Optional[int] = None
+    ) -> List[ScheduleSlot]:
+        """강의 일정 확인 (형식 오류는 ValueError, 겹치면 ScheduleConflictError)
+
+        요일+시각이 하나도 없는 자유 형식 일정("협의 후 결정" 등)은 겹침을 알 수 없으므로 확인하지 않습니다.
+        """
+        if is_free_text(schedule):
+            logger.info(f"자유 형식 일정이라 겹침 검사를 건너뜁니다: '{schedule}'")
+            return []
+        slots = parse_schedule(schedule)
+        if is_active:
+            conflicts = self.find_conflicts(slots, classroom, teacher_id, exclude_lecture_id)
+            if conflicts:
+                raise ScheduleConflictError(conflicts)
+        return slots
+
+    def sync_lectures(
+        self,
+        since: Optional[datetime] = None,
+        lecture_ids: Optional[Iterable[int]] = None,
+        commit: bool = True
+    ) -> Set[int]:
+        """강의 일정과 lecture_slot, 수업 달력을 맞추고 바뀐 강의 id를 반환
+
+        since와 lecture_ids가 모두 없으면 전체 강의를 확인하고 삭제된 강의의 구간도 정리합니다.
+        lecture_ids로 주면 그 강의만 확인하고, 그중 삭제된 강의의 구간을 정리합니다.
+        commit=False이면 호출한 쪽 트랜잭션에 함께 씁니다.
+        """
+        requested = None if lecture_ids is None else set(lecture_ids)
+        partial = since is not None or requested is not None
+        query = select(
+            Lecture.id, Lecture.schedule, Lecture.classroom, Lecture.teacher_id, Lecture.is_active,
+            Lecture.total_sessions, Lecture.created_at
+        )
+        if since is not None:
+            query = query.where(Lecture.updated_at >= since)
+        if requested is not None:
+            query = query.where(Lecture.id.in_(list(requested)))
+        lectures = self.db.execute(query).all()
+        if not lectures and not requested and partial:
+            return set()
+
+        checked = requested if requested is not None else {lecture.id for lecture in lectures}
+        slot_query = select(LectureSlot)
+        if partial:
+            slot_query = slot_query.where(LectureSlot.lecture_id.in_(list(checked)))
+        existing: Dict[int, Set[SlotKey]] = defaultdict(set)
+        for slot in self.db.exec(slot_query):
+            existing[slot.lecture_id].add(
+                (slot.weekday, slot.start_minute, slot.end_minute, slot.classroom, slot.teacher_id)
+            )
+
+        calendar = CalendarService(self.db)
+        session_counts = calendar.session_counts(checked if partial else None)
+
+        changed: Set[int] = set()
+        # 구간이 바뀐 강의의 이전/새 강의실과 강사 (히트맵을 다시 계산할 대상)
+        resources: Set[Resource] = set()
+        for lecture in lectures:
+            wanted = self._slot_keys(lecture)
+            previous = existing.pop(lecture.id, set())
+            if wanted != previous:
+                self._replace_slots(lecture.id, wanted)
+                changed.add(lecture.id)
+                for key in wanted | previous:
+                    resources.update(slot_resources(key[3], key[4]))
+
+            # 요일/시각이나 총 수업 횟수가 바뀐 강의만 달력을 다시 펼침
+            times = {key[:3] for key in wanted}
+            expected_sessions = lecture.total_sessions if times else 0
+            if times != {key[:3] for key in previous} or session_counts.get(lecture.id, 0) != expected_sessions:
+                calendar.regenerate(lecture, [ScheduleSlot(*key) for key in sorted(times)])
+                changed.add(lecture.id)
+
+        if since is None:
+            # 다른 경로로 삭제된 강의의 구간과 수업
+            orphans = (set(existing) | set(session_counts)) - {lecture.id for lecture in lectures}
+            if orphans:
+                for keys in existing.values():
+                    for key in keys:
+                        resources.update(slot_resources(key[3], key[4]))
+                self.db.execute(delete(LectureSlot).where(LectureSlot.lecture_id.in_(list(orphans))))
+                for lecture_id in orphans:
+                    calendar.delete_for_lecture(lecture_id)
+                changed.update(orphans)
+
+        utilization = UtilizationService(self.db)
+        if not partial:
+            # 프로세스 첫 동기화에서는 히트맵 전체를 맞춤 (배포 직후 비어 있는 경우 포함)
+            utilization.rebuild_all()
+        elif changed:
+            utilization.rebuild(resources)
+        # 이 세션에서 이미 맞춘 강의는 커밋 후 다시 동기화하지 않음
+        _pending_lectures(self.db).difference_update(checked)
+        if commit and (changed or not partial):
+            self.db.commit()
+        return changed
+
+    def delete_for_lecture(self, lecture_id: int) -> None:
+        """강의의 구간을 모두 삭제하고 관련 히트맵을 다시 계산 (커밋은 호출한 쪽에서)"""
+        slots = self.db.exec(select(LectureSlot).where(LectureSlot.lecture_id == lecture_id)).all()
+        resources: Set[Resource] = set()
+        for slot in slots:
+            resources.update(slot_resources(slot.classroom, slot.teacher_id))
+        self.db.execute(delete(LectureSlot).where(LectureSlot.lecture_id == lecture_id))
+        UtilizationService(self.db).rebuild(resources)
+
+    def _replace_slots(self, lecture_id: int, keys: Set[SlotKey]) -> None:
+        self.db.execute(delete(LectureSlot).where(LectureSlot.lecture_id == lecture_id))
+        for weekday, start_minute, end_minute, classroom, teacher_id in sorted(keys, key=lambda k: k[:3]):
+            self.db.add(LectureSlot(
+                lecture_id=lecture_id,
+                weekday=weekday,
+                start_minute=start_minute,
+                end_minute=end_minute,
+                classroom=classroom,
+                teacher_id=teacher_id
+            ))
+
+    @staticmethod
+    def _slot_keys(lecture: Any) -> Set[SlotKey]:
+        if not lecture.is_active:
+            return set()
+        try:
+            slots = parse_schedule(lecture.schedule)
+        except ValueError as e:
+            logger.warning(f"강의 {lecture.id} 일정을 해석할 수 없어 겹침 검사에서 제외합니다: {e}")
+            return set()
+        classroom = "" if is_undecided(lecture.classroom) else lecture.classroom
+        return {(s.weekday, s.start_minute, s.end_minute, classroom, lecture.teacher_id) for s in slots}
+
+
+_sync_lock = threading.Lock()
+_last_synced_at: Optional[datetime] = None
+_schedule_write_lock = threading.Lock()
+
+
+def sync_changed_lectures() -> Set[int]:
+    """마지막 동기화 이후 바뀐 강의의 구간만 다시 계산 (프로세스에서 처음이면 전체)"""
+    global _last_synced_at
+    with _sync_lock:
+        started = datetime.utcnow()
+        since = _last_synced_at - SCHEDULE_SYNC_OVERLAP if _last_synced_at else None
+        with Session(engine) as db:
+            changed = ScheduleService(db).sync_lectures(since)
+        _last_synced_at = started
+    return changed
+
+
+def sync_lecture_ids(lecture_ids: Iterable[int]) -> Set[int]:
+    """주어진 강의의 구간만 다시 계산 (프로세스에서 아직 동기화 전이면 전체)"""
+    if _last_synced_at is None:
+        return sync_changed_lectures()
+    with _sync_lock:
+        with Session(engine) as db:
+            return ScheduleService(db).sync_lectures(lecture_ids=lecture_ids)
+
+
+def ensure_schedule_index() -> None:
+    """이 프로세스에서 아직 한 번도 동기화하지 않았으면 전체 동기화"""
+    if _last_synced_at is None:
+        sync_changed_lectures()
+
+
+@contextmanager
+def schedule_write_lock(db: Session) -> Iterator[None]:
+    """겹침 확인부터 커밋까지 다른 강의 일정 쓰기가 끼어들지 못하게 잠금
+
+    같은 프로세스는 threading 잠금으로, PostgreSQL이면 트랜잭션 advisory 잠금으로 다른 프로세스도 막습니다.
+    잠금 안에서 구간을 같은 트랜잭션에 써야(sync_lectures(commit=False)) 다음 확인이 새 구간을 봅니다.
+    """
+    with _schedule_write_lock:
+        if db.get_bind().dialect.name == "postgresql":
+            db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEDULE_LOCK_KEY})
+        yield
+
+
+def _pending_lectures(session: Any) -> Set[int]:
+    return session.info.setdefault("schedule_changed", set())
+
+
+def _track_lecture_flush(session: Any, flush_context: Any) -> None:
+    """새로 만들거나 삭제했거나 일정 관련 필드가 바뀐 강의 id를 세션에 기록"""
+    pending = _pending_lectures(session)
+    for obj in chain(session.new, session.deleted):
+        if isinstance(obj, Lecture) and obj.id is not None:
+            pending.add(obj.id)
+    for obj in session.dirty:
+        if isinstance(obj, Lecture) and any(inspect(obj).attrs[field].history.has_changes() for field in SLOT_FIELDS):
+            pending.add(obj.id)
+
+
+def _track_lecture_execute(state: Any) -> None:
+    """강의 테이블에 대한 일괄 DML은 어떤 강의가 바뀌었는지 모르므로 커밋 후 updated_at으로 다시 확인
+
+    수강 인원처럼 일정과 무관한 컬럼만 바꾸는 문장은 execution_options(schedule_unchanged=True)로 제외합니다.
+    """
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    table = getattr(state.statement, "table", None)
+    if table is None or table.name != Lecture.__tablename__:
+        return
+    if not state.execution_options.get("schedule_unchanged"):
+        state.session.info["schedule_rescan"] = True
+
+
+def _sync_committed(session: Any) -> None:
+    lecture_ids = session.info.pop("schedule_changed", None)
+    rescan = session.info.pop("schedule_rescan", False)
+    if not lecture_ids and not rescan:
+        return
+    # 동기화 오류는 기록만 하고 이미 커밋된 쓰기를 실패시키지 않음
+    try:
+        if rescan:
+            sync_changed_lectures()
+        else:
+            sync_lecture_ids(lecture_ids)
+    except Exception as e:
+        logger.error(f"강의 일정 구간 동기화 실패: {e}")
+
+
+def _discard_uncommitted(session: Any) -> None:
+    session.info.pop("schedule_changed", None)
+    session.info.pop("schedule_rescan", None)
+
+
+def install_schedule_hooks() -> None:
+    """강의 일정 관련 변경이 커밋되면 (어느 경로로 쓰든) 그 강의의 구간을 갱신하도록 등록
+
+    수강 등록처럼 일정과 무관하게 강의 행만 바뀐 커밋은 동기화하지 않습니다.
+    """
+    if event.contains(OrmSession, "after_commit", _sync_committed):
+        return
+    event.listen(OrmSession, "after_flush", _track_lecture_flush)
+    event.listen(OrmSession, "do_orm_execute", _track_lecture_execute)
+    event.listen(OrmSession, "after_commit", _sync_committed)
+    event.listen(OrmSession, "after_rollback", _discard_uncommitted)
+
+
+install_schedule_hooks()
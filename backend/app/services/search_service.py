@@ -0,0 +1,158 @@
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlmodel import Session
+
+from ..core.search_index import SEARCH_COLUMNS, pg_search_expression
+
+logger = logging.getLogger(__name__)
+
+# 엔티티별 검색 설정 (검색 컬럼은 core.search_index의 인덱스와 같음)
+SEARCH_TARGETS: Dict[str, Dict[str, Any]] = {
+    "students": {
+        "table": "student",
+        "columns": SEARCH_COLUMNS["student"],
+        "fields": ["id", "name", "email", "phone", "grade", "is_active"],
+    },
+    "teachers": {
+        "table": "teacher",
+        "columns": SEARCH_COLUMNS["teacher"],
+        "fields": ["id", "name", "email", "phone", "subject", "is_active"],
+    },
+    "materials": {
+        "table": "material",
+        "columns": SEARCH_COLUMNS["material"],
+        "fields": ["id", "name", "author", "subject", "grade", "is_active"],
+    },
+}
+
+# trigram 인덱스는 3글자 이상부터 사용할 수 있음
+MIN_TRIGRAM_LENGTH = 3
+
+# DB URL별 검색 백엔드 감지 결과
+_backend_cache: Dict[str, str] = {}
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class SearchService:
+    """학생/강사/교재 통합 검색 서비스
+
+    PostgreSQL은 pg_trgm GIN 인덱스, SQLite는 FTS5(trigram) 테이블로 검색하고 점수순으로 정렬합니다.
+    인덱스가 없거나 검색어가 3글자 미만이면 LIKE 검색으로 대신합니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        entities: Optional[List[str]] = None,
+        include_inactive: bool = False
+    ) -> Dict[str, Any]:
+        """엔티티별로 최대 limit개씩 검색"""
+        query = query.strip()
+        backend = self.get_backend()
+        if len(query) < MIN_TRIGRAM_LENGTH:
+            backend = "like"
+
+        result: Dict[str, Any] = {"query": query, "backend": backend}
+        for entity in entities or list(SEARCH_TARGETS):
+            # 공백뿐인 검색어는 LIKE '%%'로 모든 행과 일치하므로 조회하지 않음
+            if not query:
+                result[entity] = []
+                continue
+            target = SEARCH_TARGETS[entity]
+            if backend == "fts5":
+                rows = self._search_fts5(target, query, limit, include_inactive)
+            elif backend == "pg_trgm":
+                rows = self._search_pg_trgm(target, query, limit, include_inactive)
+            else:
+                rows = self._search_like(target, query, limit, include_inactive)
+            result[entity] = [dict(row._mapping) for row in rows]
+
+        return result
+
+    def get_backend(self) -> str:
+        """사용 가능한 검색 백엔드 (fts5, pg_trgm, like)"""
+        bind = self.db.get_bind()
+        key = str(bind.url)
+        if key not in _backend_cache:
+            _backend_cache[key] = self._detect_backend(bind.dialect.name)
+            if _backend_cache[key] == "like":
+                # 프로세스당 한 번만 감지하므로 대체 검색으로 동작한다는 사실을 크게 남김
+                logger.warning(
+                    "검색 인덱스(FTS5/pg_trgm)가 없어 통합 검색이 LIKE 전체 스캔으로 동작합니다. "
+                    "alembic upgrade head를 실행하거나 create_db_and_tables로 인덱스를 만드세요."
+                )
+        return _backend_cache[key]
+
+    def _detect_backend(self, dialect: str) -> str:
+        if dialect == "postgresql":
+            found = self.db.execute(
+                text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            ).first()
+            return "pg_trgm" if found else "like"
+        if dialect == "sqlite":
+            found = self.db.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'student_fts'")
+            ).first()
+            return "fts5" if found else "like"
+        return "like"
+
+    def _search_fts5(self, target: Dict[str, Any], query: str, limit: int, include_inactive: bool):
+        table = target["table"]
+        fts = f"{table}_fts"
+        fields = ", ".join(f"t.{f}" for f in target["fields"])
+        active = "" if include_inactive else "AND t.is_active = 1"
+
+        sql = text(
+            f"SELECT {fields}, -bm25({fts}) AS score "
+            f"FROM {fts} JOIN {table} t ON t.id = {fts}.rowid "
+            f"WHERE {fts} MATCH :match {active} "
+            f"ORDER BY bm25({fts}) LIMIT :limit"
+        )
+        # 큰따옴표로 감싸 구문(phrase) 검색으로 처리 (FTS 연산자 해석 방지)
+        match = '"' + query.replace('"', '""') + '"'
+        return self.db.execute(sql, {"match": match, "limit": limit}).all()
+
+    def _search_pg_trgm(self, target: Dict[str, Any], query: str, limit: int, include_inactive: bool):
+        expression = pg_search_expression(target["columns"])
+        fields = ", ".join(f"t.{f}" for f in target["fields"])
+        active = "" if include_inactive else "AND t.is_active = true"
+
+        sql = text(
+            f"SELECT {fields}, word_similarity(:query, {expression}) AS score "
+            f"FROM {target['table']} t "
+            f"WHERE ({expression} ILIKE :pattern OR :query <% {expression}) {active} "
+            f"ORDER BY score DESC, t.id DESC LIMIT :limit"
+        )
+        params = {"query": query, "pattern": f"%{_escape_like(query)}%", "limit": limit}
+        return self.db.execute(sql, params).all()
+
+    def _search_like(self, target: Dict[str, Any], query: str, limit: int, include_inactive: bool):
+        columns = target["columns"]
+        fields = ", ".join(f"t.{f}" for f in target["fields"])
+        active = "" if include_inactive else "AND t.is_active = :active"
+
+        conditions = [f"lower(coalesce(t.{col}, '')) LIKE :pattern ESCAPE '\\'" for col in columns]
+        if "phone" in columns:
+            conditions.append("replace(coalesce(t.phone, ''), '-', '') LIKE :pattern ESCAPE '\\'")
+
+        sql = text(
+            f"SELECT {fields}, "
+            f"CASE WHEN lower(t.name) LIKE :prefix ESCAPE '\\' THEN 1.0 ELSE 0.5 END AS score "
+            f"FROM {target['table']} t "
+            f"WHERE ({' OR '.join(conditions)}) {active} "
+            f"ORDER BY score DESC, t.id DESC LIMIT :limit"
+        )
+        escaped = _escape_like(query.lower())
+        params = {"pattern": f"%{escaped}%", "prefix": f"{escaped}%", "limit": limit}
+        if not include_inactive:
+            params["active"] = True
+        return self.db.execute(sql, params).all()
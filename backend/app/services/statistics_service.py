@@ -5,6 +5,17 @@ from app.models.student import Student
 from app.models.lecture import Lecture
 from app.models.teacher import Teacher
 from app.models.material import Material
+from app.services.attendance_service import AttendanceService, attendance_rate
+from app.services.payment_service import PaymentService, payment_period
+
+# 이 출석률(%) 미만이면 출석 주의 학생으로 표시
+LOW_ATTENDANCE_RATE = 80.0
+# 출석 주의 판단에 필요한 최소 출석 대상 회차 수
+LOW_ATTENDANCE_MIN_SESSIONS = 3
+# 수납 통계에서 보여줄 최근 월 수
+FINANCE_RECENT_MONTHS = 12
+# 통계 계산이 실패해 기본값(0)을 돌려준 세션에 남기는 표시 (캐시하지 않도록)
+STATISTICS_FAILED = "statistics_failed"
 
 
 class StatisticsService:
@@ -12,6 +23,10 @@ class StatisticsService:
     
     def __init__(self, db: Session):
         self.db = db
+
+    def _mark_failed(self) -> None:
+        """기본값을 돌려주는 경우 세션에 표시 (DashboardService가 캐시하지 않음)"""
+        self.db.info[STATISTICS_FAILED] = True
     
     def get_student_statistics(self) -> Dict:
         """학생 관련 기본 통계"""
@@ -38,16 +53,18 @@ class StatisticsService:
             for grade, count in students_by_grade:
                 grade_distribution[grade] = count
             
-            # 수강료 통계
+            # 수강료 통계 (total_revenue는 예전과 같이 활성 학생 수강료 합계)
             tuition_stats = self.db.exec(
                 select(
                     func.sum(Student.tuition_fee).label('total_revenue'),
-                    func.avg(Student.tuition_fee).label('average_tuition'),
-                    func.count(Student.id).label('total_students')
+                    func.avg(Student.tuition_fee).label('average_tuition')
                 )
                 .where(Student.is_active == True)
             ).first()
             
+            # 실제 납부액/미납 (납부 원장의 월별 집계 합계)
+            _, total_paid, total_outstanding = PaymentService(self.db).revenue_totals()
+            
             # 체납 학생 수 (수강료 납부일이 지난 학생)
             overdue_students = self.db.exec(
                 select(func.count(Student.id))
@@ -74,13 +91,16 @@ class StatisticsService:
                 "grade_distribution": grade_distribution,
                 "tuition_stats": {
                     "total_revenue": float(tuition_stats.total_revenue or 0),
+                    "paid_revenue": float(total_paid),
                     "average_tuition": float(tuition_stats.average_tuition or 0),
+                    "outstanding_balance": float(total_outstanding),
                     "overdue_count": overdue_students,
                     "recent_registrations": recent_registrations
                 }
             }
         except Exception as e:
             print(f"학생 통계 계산 오류: {e}")
+            self._mark_failed()
             return {
                 "total_students": 0,
                 "active_students": 0,
@@ -88,7 +108,9 @@ class StatisticsService:
                 "grade_distribution": {},
                 "tuition_stats": {
                     "total_revenue": 0,
+                    "paid_revenue": 0,
                     "average_tuition": 0,
+                    "outstanding_balance": 0,
                     "overdue_count": 0,
                     "recent_registrations": 0
                 }
@@ -139,7 +161,7 @@ class StatisticsService:
                 .where(Lecture.is_active == True)
             ).first()
             
-            # 수익 통계
+            # 수익 통계 (total_revenue는 예전과 같이 수강료 × 현재 인원, 실제 납부액은 강의별 납부 집계 합계)
             revenue_stats = self.db.exec(
                 select(
                     func.sum(Lecture.tuition_fee * Lecture.current_students).label('total_revenue'),
@@ -147,6 +169,7 @@ class StatisticsService:
                 )
                 .where(Lecture.is_active == True)
             ).first()
+            lecture_revenue = PaymentService(self.db).lecture_revenue_total()
             
             # 인기 강의 TOP 5 (수강생 기준)
             popular_lectures = self.db.exec(
@@ -174,6 +197,7 @@ class StatisticsService:
                 },
                 "revenue_stats": {
                     "total_revenue": float(revenue_stats.total_revenue or 0),
+                    "paid_revenue": float(lecture_revenue),
                     "average_tuition": float(revenue_stats.average_tuition or 0)
                 },
                 "popular_lectures": [
@@ -193,6 +217,7 @@ class StatisticsService:
             }
         except Exception as e:
             print(f"강의 통계 계산 오류: {e}")
+            self._mark_failed()
             return {
                 "total_lectures": 0,
                 "active_lectures": 0,
@@ -208,6 +233,7 @@ class StatisticsService:
                 },
                 "revenue_stats": {
                     "total_revenue": 0,
+                    "paid_revenue": 0,
                     "average_tuition": 0
                 },
                 "popular_lectures": []
@@ -293,6 +319,7 @@ class StatisticsService:
             }
         except Exception as e:
             print(f"강사 통계 계산 오류: {e}")
+            self._mark_failed()
             import traceback
             traceback.print_exc()
             return {
@@ -317,6 +344,12 @@ class StatisticsService:
             # 비활성 교재 수
             inactive_materials = total_materials - active_materials
             
+            # 재고 부족 교재 수 (부분 인덱스)
+            low_stock_count = self.db.exec(
+                select(func.count(Material.id))
+                .where(Material.is_active == True, Material.quantity <= Material.min_quantity)
+            ).first() or 0
+            
             # 과목별 교재 분포
             subject_distribution = {}
             materials_by_subject = self.db.exec(
@@ -348,19 +381,160 @@ class StatisticsService:
                 "total_materials": total_materials,
                 "active_materials": active_materials,
                 "inactive_materials": inactive_materials,
+                "low_stock_count": low_stock_count,
                 "subject_distribution": subject_distribution,
                 "material_usage": material_usage
             }
         except Exception as e:
             print(f"교재 통계 계산 오류: {e}")
+            self._mark_failed()
             return {
                 "total_materials": 0,
                 "active_materials": 0,
                 "inactive_materials": 0,
+                "low_stock_count": 0,
                 "subject_distribution": {},
                 "material_usage": []
             }
     
+    def get_attendance_statistics(self) -> Dict:
+        """출석 관련 통계 (회차별 출석 비트맵에서 계산)"""
+        try:
+            attendance = AttendanceService(self.db)
+            
+            # 강의별 출석률 (저장된 출석/대상 인원 합계만 사용)
+            lecture_totals = attendance.lecture_totals()
+            titles = dict(self.db.exec(
+                select(Lecture.id, Lecture.title)
+                .where(Lecture.id.in_([lecture_id for lecture_id, *_ in lecture_totals]))
+            ).all()) if lecture_totals else {}
+            lecture_rates = sorted(
+                (
+                    {
+                        "lecture_id": lecture_id,
+                        "title": titles.get(lecture_id),
+                        "marked_sessions": sessions,
+                        "attendance_rate": attendance_rate(present, enrolled)
+                    }
+                    for lecture_id, sessions, present, enrolled in lecture_totals
+                ),
+                key=lambda item: item["attendance_rate"]
+            )
+            
+            # 학생별 출석률 (비트맵을 수강 순번별로 세어 합산)
+            student_totals = attendance.student_totals()
+            low_attendance = sorted(
+                (
+                    {
+                        "student_id": student_id,
+                        "attended": attended,
+                        "sessions": sessions,
+                        "attendance_rate": attendance_rate(attended, sessions)
+                    }
+                    for student_id, (attended, sessions) in student_totals.items()
+                    if sessions >= LOW_ATTENDANCE_MIN_SESSIONS
+                    and attendance_rate(attended, sessions) < LOW_ATTENDANCE_RATE
+                ),
+                key=lambda item: item["attendance_rate"]
+            )
+            
+            present_total = sum(present for _, _, present, _ in lecture_totals)
+            enrolled_total = sum(enrolled for _, _, _, enrolled in lecture_totals)
+            return {
+                "marked_sessions": sum(sessions for _, sessions, _, _ in lecture_totals),
+                "overall_attendance_rate": attendance_rate(present_total, enrolled_total),
+                "lowest_attendance_lectures": lecture_rates[:5],
+                "low_attendance_students": low_attendance,
+                "low_attendance_threshold": LOW_ATTENDANCE_RATE
+            }
+        except Exception as e:
+            print(f"출석 통계 계산 오류: {e}")
+            self._mark_failed()
+            return {
+                "marked_sessions": 0,
+                "overall_attendance_rate": 0,
+                "lowest_attendance_lectures": [],
+                "low_attendance_students": [],
+                "low_attendance_threshold": LOW_ATTENDANCE_RATE
+            }
+    
+    def get_finance_statistics(self) -> Dict:
+        """수납 관련 통계 (월별 집계 행만 읽음)"""
+        try:
+            payments = PaymentService(self.db)
+            billed, paid, unpaid = payments.revenue_totals()
+            recent_months = payments.get_monthly_revenue()[-FINANCE_RECENT_MONTHS:]
+            current = next(
+                (month for month in recent_months if month.period == payment_period(datetime.utcnow())),
+                None
+            )
+            
+            return {
+                "total_billed": billed,
+                "total_paid": paid,
+                "total_outstanding": unpaid,
+                "collection_rate": round(paid / billed * 100, 2) if billed > 0 else 0,
+                "current_month": {
+                    "period": payment_period(datetime.utcnow()),
+                    "billed": current.billed if current else 0,
+                    "paid": current.paid if current else 0,
+                    "outstanding": current.outstanding if current else 0,
+                    "payment_count": current.payment_count if current else 0
+                },
+                "monthly": [
+                    {
+                        "period": month.period,
+                        "billed": month.billed,
+                        "paid": month.paid,
+                        "outstanding": month.outstanding,
+                        "payment_count": month.payment_count
+                    }
+                    for month in recent_months
+                ]
+            }
+        except Exception as e:
+            print(f"수납 통계 계산 오류: {e}")
+            self._mark_failed()
+            return {
+                "total_billed": 0,
+                "total_paid": 0,
+                "total_outstanding": 0,
+                "collection_rate": 0,
+                "current_month": {},
+                "monthly": []
+            }
+    
+    @staticmethod
+    def combine_overall_statistics(
+        student_stats: Dict,
+        lecture_stats: Dict,
+        teacher_stats: Dict,
+        material_stats: Dict
+    ) -> Dict:
+        """개별 통계를 전체 종합 통계 형태로 합치기"""
+        # 전체 수익 (학생 수강료 + 강의 수강료, 예전 계산 유지)
+        total_revenue = (
+            student_stats["tuition_stats"]["total_revenue"] +
+            lecture_stats["revenue_stats"]["total_revenue"]
+        )
+        # 실제 납부액 (납부 원장 합계, 강의별 납부액은 그 일부이므로 더하지 않음)
+        paid_revenue = student_stats["tuition_stats"].get("paid_revenue", 0)
+        
+        return {
+            "summary": {
+                "total_students": student_stats["total_students"],
+                "total_lectures": lecture_stats["total_lectures"],
+                "total_teachers": teacher_stats["total_teachers"],
+                "total_materials": material_stats["total_materials"],
+                "total_revenue": total_revenue,
+                "paid_revenue": paid_revenue
+            },
+            "student_stats": student_stats,
+            "lecture_stats": lecture_stats,
+            "teacher_stats": teacher_stats,
+            "material_stats": material_stats
+        }
+    
     def get_overall_statistics(self) -> Dict:
         """전체 종합 통계"""
         try:
@@ -369,34 +543,20 @@ class StatisticsService:
             teacher_stats = self.get_teacher_statistics()
             material_stats = self.get_material_statistics()
             
-            # 전체 수익 (학생 수강료 + 강의 수강료)
-            total_revenue = (
-                student_stats["tuition_stats"]["total_revenue"] +
-                lecture_stats["revenue_stats"]["total_revenue"]
+            return self.combine_overall_statistics(
+                student_stats, lecture_stats, teacher_stats, material_stats
             )
-            
-            return {
-                "summary": {
-                    "total_students": student_stats["total_students"],
-                    "total_lectures": lecture_stats["total_lectures"],
-                    "total_teachers": teacher_stats["total_teachers"],
-                    "total_materials": material_stats["total_materials"],
-                    "total_revenue": total_revenue
-                },
-                "student_stats": student_stats,
-                "lecture_stats": lecture_stats,
-                "teacher_stats": teacher_stats,
-                "material_stats": material_stats
-            }
         except Exception as e:
             print(f"전체 통계 계산 오류: {e}")
+            self._mark_failed()
             return {
                 "summary": {
                     "total_students": 0,
                     "total_lectures": 0,
                     "total_teachers": 0,
                     "total_materials": 0,
-                    "total_revenue": 0
+                    "total_revenue": 0,
+                    "paid_revenue": 0
                 },
                 "student_stats": {},
                 "lecture_stats": {},
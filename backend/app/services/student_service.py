@@ -1,9 +1,15 @@
-from sqlmodel import Session, select, desc
-from typing import Optional
+from sqlmodel import Session, select, desc, func
+from typing import List, Optional
 from datetime import datetime
 
+from ..core.pagination import Page, fetch_page, fetch_keyset_page
+from ..core.projection import build_projection_query
 from ..models.student import Student
 from ..schemas.student import StudentCreate, StudentUpdate
+from .enrollment_service import EnrollmentService
+from .payment_service import PaymentService
+from .reminder_service import ReminderService
+from .upsert_service import UpsertService
 
 
 class StudentService:
@@ -17,28 +23,50 @@ class StudentService:
         is_active: Optional[bool] = None
     ) -> list[Student]:
         """학생 목록 조회"""
-        query = select(Student)
+        query = self._build_list_query(is_active).offset(skip).limit(limit)
+        return list(self.db.exec(query).all())
+
+    def get_students_page(
+        self, 
+        skip: int = 0, 
+        limit: int = 100, 
+        is_active: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        with_total: bool = False
+    ) -> Page:
+        """학생 목록과 전체 개수 조회
+
+        cursor가 있으면 (created_at, id) 키셋 페이지네이션, 없으면 OFFSET 방식으로 조회합니다.
+        키셋 방식의 전체 개수는 with_total일 때만 세고 아니면 None입니다.
+        fields가 있으면 해당 컬럼만 SELECT하고 항목을 모델 객체 대신 dict로 반환합니다.
+        """
+        query = self._build_list_query(is_active, fields)
+        if cursor:
+            return fetch_keyset_page(self.db, query, Student, cursor, limit, with_total=with_total)
+        return fetch_page(self.db, query, skip, limit)
+
+    def _build_list_query(self, is_active: Optional[bool] = None, fields: Optional[List[str]] = None):
+        """학생 목록 조회 쿼리 생성"""
+        query = build_projection_query(Student, fields) if fields else select(Student)
         
         if is_active is not None:
             query = query.where(Student.is_active == is_active)
         
-        # 최신 생성 순으로 정렬 (created_at 내림차순)
-        query = query.order_by(desc(Student.created_at))
-        query = query.offset(skip).limit(limit)
-        return list(self.db.exec(query).all())
+        # 최신 생성 순으로 정렬 (created_at 내림차순, 같은 시각은 id 내림차순)
+        return query.order_by(desc(Student.created_at), desc(Student.id))
 
     def get_student(self, student_id: int) -> Optional[Student]:
         """학생 상세 조회"""
         return self.db.get(Student, student_id)
 
-    def create_student(self, student_data: StudentCreate) -> Student:
-        """학생 등록"""
+    def create_student(self, student_data: StudentCreate) -> Optional[Student]:
+        """학생 등록 (이메일이 이미 있으면 None)
+
+        조회 후 삽입하지 않고 INSERT ... ON CONFLICT DO NOTHING 한 번으로 처리합니다.
+        """
         # Pydantic v1 호환성을 위해 dict() 사용
-        student = Student(**student_data.dict())
-        self.db.add(student)
-        self.db.commit()
-        self.db.refresh(student)
-        return student
+        return UpsertService(self.db).insert_if_absent("students", student_data.dict())
 
     def update_student(self, student_id: int, student_data: StudentUpdate) -> Optional[Student]:
         """학생 정보 수정"""
@@ -76,6 +104,9 @@ class StudentService:
         student = self.db.get(Student, student_id)
         if not student:
             return False
+        EnrollmentService(self.db).delete_for_student(student_id)
+        PaymentService(self.db).delete_for_student(student_id)
+        ReminderService(self.db).delete_for_student(student_id)
         self.db.delete(student)
         self.db.commit()
         return True
@@ -87,9 +118,9 @@ class StudentService:
 
     def count_students(self, is_active: Optional[bool] = None) -> int:
         """학생 수 조회"""
-        query = select(Student)
+        query = select(func.count()).select_from(Student)
         
         if is_active is not None:
             query = query.where(Student.is_active == is_active)
         
-        return len(self.db.exec(query).all()) 
\ No newline at end of file
+        return self.db.exec(query).one() 
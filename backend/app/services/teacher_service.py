@@ -1,7 +1,9 @@
-from sqlmodel import Session, select, desc
-from typing import Optional
+from sqlmodel import Session, select, desc, func
+from typing import List, Optional
 from datetime import datetime
 
+from ..core.pagination import Page, fetch_page, fetch_keyset_page
+from ..core.projection import build_projection_query
 from ..models.teacher import Teacher
 from ..schemas.teacher import TeacherCreate, TeacherUpdate
 
@@ -17,15 +19,38 @@ class TeacherService:
         is_active: Optional[bool] = None
     ) -> list[Teacher]:
         """강사 목록 조회"""
-        query = select(Teacher)
+        query = self._build_list_query(is_active).offset(skip).limit(limit)
+        return list(self.db.exec(query).all())
+
+    def get_teachers_page(
+        self, 
+        skip: int = 0, 
+        limit: int = 100, 
+        is_active: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        with_total: bool = False
+    ) -> Page:
+        """강사 목록과 전체 개수 조회
+
+        cursor가 있으면 (created_at, id) 키셋 페이지네이션, 없으면 OFFSET 방식으로 조회합니다.
+        키셋 방식의 전체 개수는 with_total일 때만 세고 아니면 None입니다.
+        fields가 있으면 해당 컬럼만 SELECT하고 항목을 모델 객체 대신 dict로 반환합니다.
+        """
+        query = self._build_list_query(is_active, fields)
+        if cursor:
+            return fetch_keyset_page(self.db, query, Teacher, cursor, limit, with_total=with_total)
+        return fetch_page(self.db, query, skip, limit)
+
+    def _build_list_query(self, is_active: Optional[bool] = None, fields: Optional[List[str]] = None):
+        """강사 목록 조회 쿼리 생성"""
+        query = build_projection_query(Teacher, fields) if fields else select(Teacher)
         
         if is_active is not None:
             query = query.where(Teacher.is_active == is_active)
         
-        # 최신 생성 순으로 정렬 (created_at 내림차순)
-        query = query.order_by(desc(Teacher.created_at))
-        query = query.offset(skip).limit(limit)
-        return list(self.db.exec(query).all())
+        # 최신 생성 순으로 정렬 (created_at 내림차순, 같은 시각은 id 내림차순)
+        return query.order_by(desc(Teacher.created_at), desc(Teacher.id))
 
     def get_teacher(self, teacher_id: int) -> Optional[Teacher]:
         """강사 상세 조회"""
@@ -87,9 +112,9 @@ class TeacherService:
 
     def count_teachers(self, is_active: Optional[bool] = None) -> int:
         """강사 수 조회"""
-        query = select(Teacher)
+        query = select(func.count()).select_from(Teacher)
         
         if is_active is not None:
             query = query.where(Teacher.is_active == is_active)
         
-        return len(self.db.exec(query).all()) 
\ No newline at end of file
+        return self.db.exec(query).one() 
@@ -0,0 +1,155 @@
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, select
+
+from ..core.audit import AUDITED_TABLES, record_created, record_updated
+from ..models.student import Student
+from ..models.teacher import Teacher
+from ..models.material import Material, MATERIAL_ISBN_PREDICATE
+from ..models.lecture import Lecture
+
+
+# 엔티티별 (모델, 충돌 키, 키 고유 인덱스의 부분 조건)
+UPSERT_TARGETS: Dict[str, Tuple[Any, str, Optional[str]]] = {
+    "students": (Student, "email", None),
+    "teachers": (Teacher, "email", None),
+    "materials": (Material, "isbn", MATERIAL_ISBN_PREDICATE),
+    "lectures": (Lecture, "title", None),
+}
+
+# 충돌 시에도 바꾸지 않는 컬럼
+IMMUTABLE_COLUMNS = ("id", "created_at")
+
+
+def dialect_insert(db: Session, model: Any):
+    """DB 방언에 맞는 INSERT (ON CONFLICT 지원)"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model)
+    if dialect == "sqlite":
+        return sqlite.insert(model)
+    raise ValueError(f"ON CONFLICT를 지원하지 않는 데이터베이스입니다: {dialect}")
+
+
+def _prepare(model: Any, data: Dict[str, Any]) -> Dict[str, Any]:
+    """INSERT할 값 (None은 빼서 모델 기본값 적용, 목록은 JSON 문자열로)"""
+    data = {
+        key: json.dumps(value, ensure_ascii=False) if isinstance(value, (list, dict)) else value
+        for key, value in data.items()
+        if value is not None
+    }
+    return model(**data).dict(exclude={"id"})
+
+
+class UpsertService:
+    """INSERT ... ON CONFLICT 기반 등록/수정 서비스
+
+    조회 후 삽입하는 대신 한 문장으로 처리하므로 동시 요청에서도 고유 제약 위반이 나지 않습니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def upsert(self, entity: str, data: Dict[str, Any], commit: bool = True) -> Any:
+        """키(email, isbn, title)가 있으면 보낸 값으로 수정, 없으면 등록 후 행을 반환"""
+        model, key, where = self._get_target(entity)
+        if not data.get(key):
+            raise ValueError(f"{key} 값이 필요합니다")
+
+        values = _prepare(model, data)
+        now = datetime.utcnow()
+        values["created_at"] = values["updated_at"] = now
+
+        # 보낸 필드만 수정 (created_at은 유지)
+        updates = {
+            column: values[column]
+            for column in data
+            if column in values and column not in IMMUTABLE_COLUMNS and column != key
+        }
+        updates["updated_at"] = now
+
+        # 변경 이력용으로 수정할 컬럼의 이전 값을 키로 먼저 읽음 (없으면 등록)
+        before = None
+        if model.__tablename__ in AUDITED_TABLES:
+            columns = [getattr(model, column) for column in updates]
+            query = select(*columns).where(getattr(model, key) == data[key])
+            if where:
+                query = query.where(text(where))
+            before = self.db.execute(query).first()
+
+        statement = dialect_insert(self.db, model).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[key],
+            index_where=text(where) if where else None,
+            set_=updates
+        ).returning(model).execution_options(populate_existing=True)
+
+        def audit(row: Any) -> None:
+            if before is None:
+                record_created(self.db, model.__tablename__, row.id, row.dict())
+            else:
+                record_updated(self.db, model.__tablename__, row.id, before._asdict(), updates)
+
+        return self._execute(statement, commit, audit)
+
+    def insert_if_absent(self, entity: str, data: Dict[str, Any], commit: bool = True) -> Optional[Any]:
+        """키가 없을 때만 등록하고 행을 반환 (이미 있으면 None)"""
+        model, key, where = self._get_target(entity)
+        values = _prepare(model, data)
+        values["created_at"] = values["updated_at"] = datetime.utcnow()
+
+        statement = dialect_insert(self.db, model).values(**values)
+        statement = statement.on_conflict_do_nothing(
+            index_elements=[key],
+            index_where=text(where) if where else None
+        ).returning(model)
+        return self._execute(statement, commit, lambda row: record_created(self.db, model.__tablename__, row.id, row.dict()))
+
+    def insert_many_if_absent(self, entity: str, rows: Iterable[Dict[str, Any]]) -> int:
+        """여러 행을 한 문장으로 등록 (키가 이미 있는 행은 건너뜀), 등록된 행 수를 반환"""
+        model, key, where = self._get_target(entity)
+        now = datetime.utcnow()
+        values: List[Dict[str, Any]] = []
+        for row in rows:
+            record = _prepare(model, row)
+            record["created_at"] = record["updated_at"] = now
+            values.append(record)
+        if not values:
+            return 0
+
+        statement = dialect_insert(self.db, model).values(values).on_conflict_do_nothing(
+            index_elements=[key],
+            index_where=text(where) if where else None
+        )
+        try:
+            inserted = self.db.execute(statement).rowcount
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return inserted
+
+    def _execute(self, statement: Any, commit: bool, audit: Optional[Callable[[Any], None]] = None) -> Optional[Any]:
+        try:
+            row = self.db.scalars(statement).first()
+            if row is not None and audit is not None:
+                audit(row)
+            if row is not None and commit:
+                # RETURNING으로 받은 값을 커밋 후 다시 조회하지 않도록 세션에서 분리
+                self.db.expunge(row)
+            if commit:
+                self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return row
+
+    @staticmethod
+    def _get_target(entity: str) -> Tuple[Any, str, Optional[str]]:
+        if entity not in UPSERT_TARGETS:
+            raise ValueError(f"지원하지 않는 엔티티 타입입니다: {entity}")
+        return UPSERT_TARGETS[entity]
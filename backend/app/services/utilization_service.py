@@ -0,0 +1,109 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import delete
+from sqlmodel import Session, select
+
+from ..core.schedule import (
+    WEEKDAYS,
+    MINUTES_PER_DAY,
+    UTILIZATION_SLOT_MINUTES,
+    ScheduleSlot,
+    is_undecided,
+    occupancy_matrix,
+)
+from ..models.schedule import LectureSlot
+from ..models.utilization import ResourceUtilization
+
+RESOURCE_CLASSROOM = "classroom"
+RESOURCE_TEACHER = "teacher"
+
+# (자원 종류, 자원 키)
+Resource = Tuple[str, str]
+
+
+def slot_resources(classroom: Optional[str], teacher_id: Optional[int]) -> Set[Resource]:
+    """구간이 차지하는 자원 (강의실이 비어 있거나 "미정"이거나 강사가 없으면 제외)"""
+    resources: Set[Resource] = set()
+    if not is_undecided(classroom):
+        resources.add((RESOURCE_CLASSROOM, classroom))
+    if teacher_id is not None:
+        resources.add((RESOURCE_TEACHER, str(teacher_id)))
+    return resources
+
+
+class UtilizationService:
+    """강의실/강사 주간 점유 히트맵 (resource_utilization) 관리
+
+    lecture_slot이 바뀐 자원만 다시 계산해 저장하므로 조회는 기본 키로 한 행을 읽는 것으로 끝납니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def rebuild(self, resources: Iterable[Resource]) -> None:
+        """주어진 자원의 히트맵을 lecture_slot에서 다시 계산 (커밋은 호출한 쪽에서)"""
+        for resource_type, resource_key in set(resources):
+            column = LectureSlot.classroom if resource_type == RESOURCE_CLASSROOM else LectureSlot.teacher_id
+            key: Any = resource_key if resource_type == RESOURCE_CLASSROOM else int(resource_key)
+            slots = self.db.exec(select(LectureSlot).where(column == key)).all()
+            self._save(resource_type, resource_key, slots)
+
+    def rebuild_all(self) -> None:
+        """모든 자원의 히트맵을 다시 계산 (커밋은 호출한 쪽에서)"""
+        grouped: Dict[Resource, List[LectureSlot]] = defaultdict(list)
+        for slot in self.db.exec(select(LectureSlot)):
+            for resource in slot_resources(slot.classroom, slot.teacher_id):
+                grouped[resource].append(slot)
+
+        self.db.execute(delete(ResourceUtilization))
+        for (resource_type, resource_key), slots in grouped.items():
+            self._save(resource_type, resource_key, slots)
+
+    def get_utilization(self, resource_type: str, resource_key: str) -> Optional[ResourceUtilization]:
+        """자원 하나의 히트맵"""
+        return self.db.get(ResourceUtilization, (resource_type, resource_key))
+
+    def list_utilization(self, resource_type: str) -> List[ResourceUtilization]:
+        """종류별 전체 히트맵 (키 순)"""
+        query = (
+            select(ResourceUtilization)
+            .where(ResourceUtilization.resource_type == resource_type)
+            .order_by(ResourceUtilization.resource_key)
+        )
+        return list(self.db.exec(query).all())
+
+    def _save(self, resource_type: str, resource_key: str, slots: List[LectureSlot]) -> None:
+        record = self.db.get(ResourceUtilization, (resource_type, resource_key))
+        if not slots:
+            if record is not None:
+                self.db.delete(record)
+            return
+
+        if record is None:
+            record = ResourceUtilization(resource_type=resource_type, resource_key=resource_key, occupancy=b"")
+        record.slot_minutes = UTILIZATION_SLOT_MINUTES
+        record.occupancy = occupancy_matrix(
+            ScheduleSlot(slot.weekday, slot.start_minute, slot.end_minute) for slot in slots
+        )
+        record.occupied_minutes = sum(slot.end_minute - slot.start_minute for slot in slots)
+        record.lecture_count = len({slot.lecture_id for slot in slots})
+        record.updated_at = datetime.utcnow()
+        self.db.add(record)
+
+
+def heatmap_to_dict(record: ResourceUtilization) -> Dict[str, Any]:
+    """히트맵 행을 응답 형태로 (요일별 칸 목록, 값은 칸 안에서 사용 중인 분)"""
+    per_day = MINUTES_PER_DAY // record.slot_minutes
+    cells = list(record.occupancy)
+    return {
+        "resource_type": record.resource_type,
+        "resource_key": record.resource_key,
+        "slot_minutes": record.slot_minutes,
+        "weekdays": list(WEEKDAYS),
+        "occupancy": [cells[day * per_day:(day + 1) * per_day] for day in range(len(WEEKDAYS))],
+        "occupied_minutes": record.occupied_minutes,
+        "lecture_count": record.lecture_count,
+        "updated_at": record.updated_at,
+    }
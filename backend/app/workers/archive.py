@@ -0,0 +1,13 @@
+from typing import Dict
+
+from app.services.archive_service import run_student_archive
+from app.workers.celery_app import celery_app
+
+
+@celery_app.task(bind=True, max_retries=3)
+def archive_inactive_students(self) -> Dict[str, int]:
+    """오래 비활성인 학생 보관 태스크 (beat로 매일 실행)"""
+    try:
+        return {"archived": run_student_archive()}
+    except Exception as e:
+        raise self.retry(exc=e, countdown=60)
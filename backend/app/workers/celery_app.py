@@ -6,7 +6,7 @@ celery_app = Celery(
     "academy_ai_assistant",
     broker=settings.redis_url,
     backend=settings.redis_url,
-    include=["app.workers.excel_rebuilder"]
+    include=["app.workers.excel_rebuilder", "app.workers.reminders", "app.workers.archive"]
 )
 
 # Celery 설정
@@ -26,4 +26,20 @@ celery_app.conf.update(
 # 태스크 라우팅
 celery_app.conf.task_routes = {
     "app.workers.excel_rebuilder.*": {"queue": "excel_rebuilder"},
-} 
\ No newline at end of file
+    "app.workers.reminders.*": {"queue": "reminders"},
+    "app.workers.archive.*": {"queue": "archive"},
+}
+
+# 주기 실행 (celery -A app.workers.celery_app beat)
+celery_app.conf.beat_schedule = {
+    "archive-inactive-students": {
+        "task": "app.workers.archive.archive_inactive_students",
+        "schedule": settings.archive_interval_seconds,
+    },
+}
+# 체납 알림은 REMINDER_SCHEDULER=celery일 때만
+if settings.reminder_scheduler == "celery":
+    celery_app.conf.beat_schedule["send-overdue-tuition-reminders"] = {
+        "task": "app.workers.reminders.send_overdue_reminders",
+        "schedule": settings.reminder_interval_seconds,
+    } 
\ No newline at end of file
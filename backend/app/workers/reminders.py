@@ -0,0 +1,13 @@
+from typing import Dict
+
+from app.services.reminder_service import run_overdue_reminders
+from app.workers.celery_app import celery_app
+
+
+@celery_app.task(bind=True, max_retries=3)
+def send_overdue_reminders(self) -> Dict[str, int]:
+    """수강료 체납 감지와 알림 발송 태스크 (beat로 주기 실행)"""
+    try:
+        return run_overdue_reminders()
+    except Exception as e:
+        raise self.retry(exc=e, countdown=60)
@@ -0,0 +1,106 @@
+"""pytest 공통 설정
+
+앱 모듈을 가져오기 전에 임시 SQLite DB를 DATABASE_URL로 지정하므로 backend/academy.db는 건드리지 않습니다.
+AI 라우터는 외부 SDK가 필요해 제외하고, 나머지 라우터를 main.py와 같은 prefix로 붙입니다.
+"""
+import os
+import tempfile
+
+_db_dir = tempfile.mkdtemp(prefix="academy-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("REMINDER_SCHEDULER", "off")
+os.environ.setdefault("REMINDER_FILE_PATH", os.path.join(_db_dir, "reminders.jsonl"))
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import delete
+from sqlmodel import Session, SQLModel
+
+from app.core.audit import drain_audit_queue
+from app.core.database import engine
+from app.core.response_cache import response_cache
+from app.core.search_index import install_search_indexes
+from app.models import *  # noqa: F401,F403 (모든 테이블을 metadata에 등록)
+from app.api.v1 import (
+    archive, attendance, audit, calendar, dashboard, enrollments, inventory, lectures, materials,
+    payments, recommendations, reminders, schedules, search, statistics, students, teachers, utilization
+)
+from app.services.dashboard_service import dashboard_cache
+
+ROUTERS = {
+    "/api/v1/lectures": lectures,
+    "/api/v1/materials": materials,
+    "/api/v1/students": students,
+    "/api/v1/teachers": teachers,
+    "/api/v1/enrollments": enrollments,
+    "/api/v1/schedules": schedules,
+    "/api/v1/utilization": utilization,
+    "/api/v1/calendar": calendar,
+    "/api/v1/attendance": attendance,
+    "/api/v1/payments": payments,
+    "/api/v1/reminders": reminders,
+    "/api/v1/inventory": inventory,
+    "/api/v1/recommendations": recommendations,
+    "/api/v1/audit": audit,
+    "/api/v1/archive": archive,
+}
+
+SQLModel.metadata.create_all(engine)
+# create_db_and_tables와 같이 검색용 FTS5 테이블과 트리거도 만듦
+install_search_indexes(engine)
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+    for prefix, module in ROUTERS.items():
+        app.include_router(module.router, prefix=prefix)
+    for module in (statistics, dashboard, search):
+        app.include_router(module.router, prefix="/api/v1")
+    return app
+
+
+@pytest.fixture(scope="session")
+def client() -> TestClient:
+    return TestClient(_build_app())
+
+
+@pytest.fixture
+def db():
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture(autouse=True)
+def clean_database():
+    """테스트마다 모든 테이블을 비우고 캐시를 초기화"""
+    yield
+    with Session(engine) as session:
+        for table in reversed(SQLModel.metadata.sorted_tables):
+            session.execute(delete(table))
+        session.commit()
+    drain_audit_queue(1_000_000)
+    response_cache.local.clear()
+    dashboard_cache.invalidate()
+
+
+@pytest.fixture
+def make_student(client):
+    """API로 학생 등록 (이름마다 이메일 생성)"""
+    def create(name: str = "김철수", **fields):
+        payload = {"name": name, "email": f"{abs(hash(name))}@academy.com", "grade": "고1", **fields}
+        response = client.post("/api/v1/students/", json=payload)
+        assert response.status_code in (200, 201), response.text
+        return response.json()
+    return create
+
+
+@pytest.fixture
+def make_lecture(client):
+    """API로 강의 등록"""
+    def create(title: str = "고1 수학 기초", **fields):
+        response = client.post("/api/v1/lectures/", json={"title": title, "subject": "수학", "grade": "고1", **fields})
+        assert response.status_code == 201, response.text
+        return response.json()
+    return create
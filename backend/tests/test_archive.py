@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+
+from app.core.audit import AUDIT_CREATE, AUDIT_DELETE, AUDIT_SOURCE_ARCHIVE, drain_audit_queue
+from app.models.student import Student
+from app.services import archive_service
+
+
+def _make_stale(db, student_id):
+    db.execute(
+        update(Student)
+        .where(Student.id == student_id)
+        .values(is_active=False, updated_at=datetime.utcnow() - timedelta(days=90))
+    )
+    db.commit()
+
+
+def _archive_events():
+    return [
+        (event.action, event.record_id)
+        for event in drain_audit_queue(1_000)
+        if event.table_name == "student" and event.source == AUDIT_SOURCE_ARCHIVE
+    ]
+
+
+def test_archive_and_restore_are_audited(client, db, make_student):
+    student = make_student("김철수")
+    _make_stale(db, student["id"])
+    drain_audit_queue(1_000)
+
+    assert client.post("/api/v1/archive/run?months=1").json()["archived"] == 1
+    assert _archive_events() == [(AUDIT_DELETE, student["id"])]
+
+    assert client.post(f"/api/v1/archive/students/{student['id']}/restore").status_code == 200
+    assert _archive_events() == [(AUDIT_CREATE, student["id"])]
+
+
+def test_archived_student_id_is_not_reused(client, db, make_student):
+    archived = make_student("김철수")
+    _make_stale(db, archived["id"])
+    assert client.post("/api/v1/archive/run?months=1").json()["archived"] == 1
+
+    newcomer = make_student("이영희")
+
+    assert newcomer["id"] > archived["id"]
+    assert client.get(f"/api/v1/archive/students/{archived['id']}").json()["archived"] is True
+
+
+def test_run_endpoint_skips_while_scheduled_run_holds_the_lock(client, db, make_student):
+    student = make_student("김철수")
+    _make_stale(db, student["id"])
+
+    with archive_service._archive_lock:
+        assert client.post("/api/v1/archive/run?months=1").json()["archived"] == 0
+    assert client.post("/api/v1/archive/run?months=1").json()["archived"] == 1
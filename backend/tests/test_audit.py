@@ -0,0 +1,52 @@
+import logging
+import queue
+from datetime import datetime
+
+from sqlalchemy import create_mock_engine
+from sqlalchemy.schema import CreateTable
+
+from app.core import audit
+from app.core.audit import AUDIT_CREATE, AuditEvent
+from app.models.audit import AuditLog
+
+
+def test_postgresql_table_is_partitioned_with_initial_partitions():
+    statements = []
+    mock = create_mock_engine("postgresql://", lambda sql, *args, **kwargs: statements.append(str(sql)))
+
+    AuditLog.__table__.create(mock)
+
+    create_table = str(CreateTable(AuditLog.__table__).compile(dialect=mock.dialect))
+    assert "PARTITION BY RANGE (created_at)" in create_table
+    assert "PRIMARY KEY (id, created_at)" in create_table
+    now = datetime.utcnow()
+    partitions = [sql for sql in statements if "PARTITION OF audit_log" in sql]
+    assert len(partitions) == 2
+    assert f"audit_log_{now.year:04d}_{now.month:02d}" in partitions[0]
+
+
+def test_sqlite_table_keeps_single_column_primary_key():
+    mock = create_mock_engine("sqlite://", lambda sql, *args, **kwargs: None)
+
+    create_table = str(CreateTable(AuditLog.__table__).compile(dialect=mock.dialect))
+
+    assert "PRIMARY KEY (id)" in create_table
+    assert "PARTITION" not in create_table
+
+
+class _Session:
+    def __init__(self, events):
+        self.info = {"audit_pending": events}
+
+
+def test_full_queue_drops_without_waiting_and_logs_once(monkeypatch, caplog):
+    monkeypatch.setattr(audit, "audit_queue", queue.Queue(maxsize=1))
+    monkeypatch.setattr(audit, "audit_dropped", 0)
+    events = [AuditEvent(datetime.utcnow(), "student", i, AUDIT_CREATE, "api", {}) for i in range(3)]
+
+    with caplog.at_level(logging.ERROR, logger=audit.__name__):
+        audit._enqueue_committed(_Session(events))
+
+    assert audit.audit_queue.qsize() == 1
+    assert audit.audit_dropped == 2
+    assert len([record for record in caplog.records if "2건" in record.getMessage()]) == 1
@@ -0,0 +1,66 @@
+def _upload(client, filename, content, **params):
+    return client.post("/api/v1/students/import", params=params, files={"file": (filename, content)})
+
+
+def _students(client):
+    return sorted(s["email"] for s in client.get("/api/v1/students/").json()["students"])
+
+
+def test_csv_import_inserts_rows_and_skips_duplicates(client, make_student):
+    make_student("김철수", email="kim@academy.com")
+    content = (
+        "name,email,grade\n"
+        "이영희,lee@academy.com,고2\n"
+        "김철수,kim@academy.com,고1\n"
+        "박민수,lee@academy.com,고3\n"
+    ).encode("utf-8-sig")
+
+    response = _upload(client, "students.csv", content)
+
+    report = response.json()
+    assert response.status_code == 201
+    assert (report["total_rows"], report["inserted"], report["skipped_duplicates"]) == (3, 1, 2)
+    assert sorted(error["row"] for error in report["errors"]) == [3, 4]
+    assert _students(client) == ["kim@academy.com", "lee@academy.com"]
+
+
+def test_ndjson_import_reports_bad_lines_and_keeps_going(client):
+    content = b"\n".join([
+        '{"name": "이영희", "email": "lee@academy.com", "grade": "고2"}'.encode(),
+        b'{"name": "broken", ',
+        '{"email": "noname@academy.com", "grade": "고1"}'.encode(),
+        b'{"name": "\xff\xfe", "email": "bad@academy.com", "grade": "\xb0\xed1"}',
+        '{"name": "박민수", "email": "park@academy.com", "grade": "고3"}'.encode(),
+    ])
+
+    response = _upload(client, "students.ndjson", content)
+
+    report = response.json()
+    assert response.status_code == 201
+    assert (report["total_rows"], report["inserted"], report["failed"]) == (5, 2, 3)
+    errors = {error["row"]: error["errors"][0] for error in report["errors"]}
+    assert sorted(errors) == [2, 3, 4]
+    assert "JSON" in errors[2]
+    assert "name" in errors[3]
+    assert "UTF-8" in errors[4]
+    assert _students(client) == ["lee@academy.com", "park@academy.com"]
+
+
+def test_csv_import_reports_non_utf8_row(client):
+    content = "name,email,grade\n이영희,lee@academy.com,고2\n".encode() + "박민수,park@academy.com,고3\n".encode("cp949")
+
+    report = _upload(client, "students.csv", content).json()
+
+    assert (report["inserted"], report["failed"]) == (1, 1)
+    assert report["errors"][0]["row"] == 3
+    assert _students(client) == ["lee@academy.com"]
+
+
+def test_dry_run_validates_without_inserting(client):
+    content = b'{"name": "kim", "email": "kim@academy.com", "grade": "g1"}\n{"name": "lee"}\n'
+
+    report = _upload(client, "students.jsonl", content, dry_run="true").json()
+
+    assert report["dry_run"] is True
+    assert (report["inserted"], report["failed"]) == (1, 1)
+    assert _students(client) == []
@@ -0,0 +1,41 @@
+def _create_students(client):
+    ids = []
+    for i, grade in enumerate(["고1", "고1", "고2"]):
+        response = client.post("/api/v1/students/", json={"name": f"학생{i}", "email": f"s{i}@academy.com", "grade": grade})
+        ids.append(response.json()["id"])
+    return ids
+
+
+def test_bulk_update_by_filter(client):
+    _create_students(client)
+
+    response = client.patch("/api/v1/students/bulk", json={"filters": {"grade": "고1"}, "patch": {"grade": "고2"}})
+
+    assert response.status_code == 200
+    assert response.json()["affected"] == 2
+
+
+def test_bulk_update_rejects_null_for_not_null_column(client):
+    ids = _create_students(client)
+
+    response = client.patch("/api/v1/students/bulk", json={"ids": ids, "patch": {"name": None}})
+
+    assert response.status_code == 400
+    assert "name" in response.json()["detail"]
+
+
+def test_bulk_update_allows_null_for_nullable_column(client):
+    ids = _create_students(client)
+
+    response = client.patch("/api/v1/students/bulk", json={"ids": ids[:1], "patch": {"phone": None}})
+
+    assert response.status_code == 200
+
+
+def test_bulk_update_rejects_lecture_title(client, make_lecture):
+    ids = [make_lecture("고1 수학 기초")["id"], make_lecture("고1 영어 기초")["id"]]
+
+    response = client.patch("/api/v1/lectures/bulk", json={"ids": ids, "patch": {"title": "같은 제목"}})
+
+    assert response.status_code == 400
+    assert "title" in response.json()["detail"]
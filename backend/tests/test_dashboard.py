@@ -0,0 +1,44 @@
+from app.services.dashboard_service import dashboard_cache
+from app.services.payment_service import PaymentService
+from app.services.statistics_service import StatisticsService
+
+
+def test_dashboard_returns_statistics(client):
+    client.post("/api/v1/students/", json={"name": "김철수", "email": "kim@academy.com", "grade": "고1"})
+
+    response = client.get("/api/v1/dashboard")
+
+    assert response.status_code == 200
+    assert response.json()["statistics"]["summary"]["total_students"] == 1
+
+
+def test_dashboard_does_not_cache_fallback_statistics(client, monkeypatch):
+    client.post("/api/v1/students/", json={"name": "김철수", "email": "kim@academy.com", "grade": "고1"})
+    original = PaymentService.revenue_totals
+
+    def failing_revenue_totals(self):
+        raise RuntimeError("monthly_revenue 조회 실패")
+
+    monkeypatch.setattr(PaymentService, "revenue_totals", failing_revenue_totals)
+    failed = client.get("/api/v1/dashboard").json()
+    assert failed["statistics"]["summary"]["total_students"] == 0
+
+    monkeypatch.setattr(PaymentService, "revenue_totals", original)
+    recovered = client.get("/api/v1/dashboard").json()
+    assert recovered["statistics"]["summary"]["total_students"] == 1
+
+
+def test_dashboard_does_not_cache_section_invalidated_during_load(client, monkeypatch):
+    client.post("/api/v1/students/", json={"name": "김철수", "email": "kim@academy.com", "grade": "고1"})
+    original = StatisticsService.get_student_statistics
+
+    def stale_student_statistics(self):
+        stats = original(self)
+        # 조회가 끝나기 전에 다른 요청의 쓰기가 커밋되어 캐시가 무효화된 상황
+        dashboard_cache.invalidate()
+        return stats
+
+    monkeypatch.setattr(StatisticsService, "get_student_statistics", stale_student_statistics)
+    client.get("/api/v1/dashboard")
+
+    assert dashboard_cache.get(("student_stats",)) is None
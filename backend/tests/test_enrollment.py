@@ -0,0 +1,62 @@
+def _enroll(client, student, lecture):
+    return client.post("/api/v1/enrollments/", json={"student_id": student["id"], "lecture_id": lecture["id"]})
+
+
+def test_enroll_assigns_increasing_ordinals(client, make_student, make_lecture):
+    lecture = make_lecture()
+
+    first = _enroll(client, make_student("김철수"), lecture)
+    second = _enroll(client, make_student("이영희"), lecture)
+
+    assert first.status_code == second.status_code == 201
+    assert [first.json()["ordinal"], second.json()["ordinal"]] == [0, 1]
+    assert client.get(f"/api/v1/lectures/{lecture['id']}").json()["current_students"] == 2
+
+
+def test_enroll_full_lecture_returns_409(client, make_student, make_lecture):
+    lecture = make_lecture(max_students=1)
+    _enroll(client, make_student("김철수"), lecture)
+
+    response = _enroll(client, make_student("이영희"), lecture)
+
+    assert response.status_code == 409
+
+
+def test_ordinal_is_not_reused_after_hard_delete(client, make_student, make_lecture):
+    lecture = make_lecture()
+    _enroll(client, make_student("김철수"), lecture)
+    deleted = make_student("이영희")
+    assert _enroll(client, deleted, lecture).json()["ordinal"] == 1
+    assert client.delete(f"/api/v1/students/{deleted['id']}/hard").status_code == 200
+
+    response = _enroll(client, make_student("박민수"), lecture)
+
+    assert response.json()["ordinal"] == 2
+
+
+def test_recount_matches_current_students_to_enrollments(client, db, make_student, make_lecture):
+    from app.models.lecture import Lecture
+    lecture = make_lecture(max_students=5)
+    _enroll(client, make_student("김철수"), lecture)
+    stored = db.get(Lecture, lecture["id"])
+    stored.current_students = 4
+    db.add(stored)
+    db.commit()
+
+    response = client.post("/api/v1/enrollments/recount")
+
+    assert response.json() == {"updated": 1}
+    db.refresh(stored)
+    assert stored.current_students == 1
+
+
+def test_enroll_and_withdraw_record_seat_changes_in_audit_log(client, make_student, make_lecture):
+    from app.core.audit import drain_audit_queue
+    lecture = make_lecture()
+    drain_audit_queue(100)
+
+    enrollment = _enroll(client, make_student("김철수"), lecture).json()
+    client.post(f"/api/v1/enrollments/{enrollment['id']}/withdraw")
+
+    changes = [event.changes for event in drain_audit_queue(100) if event.table_name == "lecture"]
+    assert changes == [{"current_students": [0, 1]}, {"current_students": [1, 0]}]
@@ -0,0 +1,24 @@
+from app.services.export_service import ExportService
+
+
+def _create_students(client, count):
+    for i in range(count):
+        client.post("/api/v1/students/", json={"name": f"학생{i}", "email": f"s{i}@academy.com", "grade": "고1"})
+
+
+def test_iter_rows_reads_all_rows(client, db):
+    _create_students(client, 3)
+
+    rows = list(ExportService(db).iter_rows("students", ["name"]))
+
+    assert sorted(row["name"] for row in rows) == ["학생0", "학생1", "학생2"]
+
+
+def test_iter_rows_limit_caps_rows_and_count_is_total(client, db):
+    _create_students(client, 5)
+    export = ExportService(db)
+
+    rows = list(export.iter_rows("students", ["name"], limit=2))
+
+    assert len(rows) == 2
+    assert export.count("students") == 5
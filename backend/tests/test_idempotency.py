@@ -0,0 +1,37 @@
+from app.models.idempotency import IdempotencyKey
+
+
+def _lecture(title, **fields):
+    return {"title": title, "subject": "수학", "grade": "고1", **fields}
+
+
+def test_same_key_replays_first_response(client):
+    headers = {"Idempotency-Key": "key-1"}
+    first = client.post("/api/v1/lectures/upsert", json=_lecture("고1 수학 기초"), headers=headers)
+
+    second = client.post("/api/v1/lectures/upsert", json=_lecture("고1 수학 기초"), headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert second.headers.get("idempotent-replayed") == "true"
+    assert second.json() == first.json()
+
+
+def test_same_key_with_different_payload_is_rejected(client):
+    headers = {"Idempotency-Key": "key-1"}
+    client.post("/api/v1/lectures/upsert", json=_lecture("고1 수학 기초"), headers=headers)
+
+    response = client.post("/api/v1/lectures/upsert", json=_lecture("고2 수학 심화"), headers=headers)
+
+    assert response.status_code == 422
+
+
+def test_failed_request_releases_key(client, db):
+    headers = {"Idempotency-Key": "key-1"}
+    failed = client.post("/api/v1/lectures/upsert", json=_lecture(""), headers=headers)
+    assert failed.status_code == 400
+    assert db.get(IdempotencyKey, "key-1") is None
+
+    retried = client.post("/api/v1/lectures/upsert", json=_lecture("고1 수학 기초"), headers=headers)
+
+    assert retried.status_code == 200
+    assert retried.headers.get("idempotent-replayed") is None
@@ -0,0 +1,35 @@
+import pytest
+
+from app.core.learning_analytics import analyze_cohort, merge_student_scores
+
+
+def test_merge_adds_scores_for_student_outside_cohort():
+    cohort = merge_student_scores([{"student_id": 1, "scores": {"수학": [70]}}], 2, {"수학": [80]})
+
+    assert [student["student_id"] for student in cohort] == [1, 2]
+    assert cohort[1]["scores"] == {"수학": [80]}
+
+
+def test_merge_adds_subjects_to_existing_student():
+    students = [{"student_id": 1, "scores": {"수학": [70, 75]}}, {"student_id": 2, "scores": {"영어": [90]}}]
+
+    cohort = merge_student_scores(students, 1, {"영어": [60, 65], "수학": [70, 75]})
+
+    assert len(cohort) == 2
+    assert cohort[0]["scores"] == {"수학": [70, 75], "영어": [60, 65]}
+    assert students[0]["scores"] == {"수학": [70, 75]}
+    target = next(result for result in analyze_cohort(cohort) if result["student_id"] == 1)
+    assert {item["subject"] for item in target["subjects"]} == {"수학", "영어"}
+
+
+def test_merge_rejects_conflicting_series():
+    with pytest.raises(ValueError, match="수학"):
+        merge_student_scores([{"student_id": 1, "scores": {"수학": [70]}}], 1, {"수학": [50]})
+
+
+def test_high_scores_are_not_weak_by_percentile_alone():
+    high = [{"student_id": i, "scores": {"수학": [score]}} for i, score in enumerate([90, 92, 94, 96, 98], 1)]
+    lagging = [{"student_id": 1, "scores": {"수학": [70]}}] + high[1:]
+
+    assert analyze_cohort(high)[0]["weaknesses"] == []
+    assert analyze_cohort(lagging)[0]["weaknesses"] == ["수학"]
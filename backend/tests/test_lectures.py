@@ -0,0 +1,41 @@
+def _lecture(title, **fields):
+    return {"title": title, "subject": "수학", "grade": "고1", **fields}
+
+
+def test_create_lecture(client):
+    response = client.post("/api/v1/lectures/", json=_lecture("고1 수학 기초"))
+
+    assert response.status_code == 201
+    assert response.json()["title"] == "고1 수학 기초"
+
+
+def test_create_lecture_with_duplicate_title_returns_409(client):
+    client.post("/api/v1/lectures/", json=_lecture("고1 수학 기초"))
+
+    response = client.post("/api/v1/lectures/", json=_lecture("고1 수학 기초"))
+
+    assert response.status_code == 409
+
+
+def test_update_lecture_to_duplicate_title_returns_409(client):
+    client.post("/api/v1/lectures/", json=_lecture("고1 수학 기초"))
+    other = client.post("/api/v1/lectures/", json=_lecture("고2 수학 심화")).json()
+
+    response = client.put(f"/api/v1/lectures/{other['id']}", json={"title": "고1 수학 기초"})
+
+    assert response.status_code == 409
+    assert client.get(f"/api/v1/lectures/{other['id']}").json()["title"] == "고2 수학 심화"
+
+
+def test_bulk_import_skips_duplicate_lecture_titles(client, db):
+    from app.services.bulk_import_service import BulkImportService
+    client.post("/api/v1/lectures/", json=_lecture("고1 수학 기초"))
+
+    report = BulkImportService(db).import_rows("lectures", iter([
+        _lecture("고1 수학 기초"),
+        _lecture("고2 수학 심화"),
+        _lecture("고2 수학 심화"),
+    ]))
+
+    assert report["inserted"] == 1
+    assert report["skipped_duplicates"] == 2
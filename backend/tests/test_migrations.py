@@ -0,0 +1,211 @@
+import importlib.util
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+VERSIONS = Path(__file__).resolve().parent.parent / "alembic" / "versions"
+
+
+def load_migration(revision: str):
+    path = next(VERSIONS.glob(f"{revision}_*.py"))
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_migration(engine, function, *args):
+    with engine.begin() as connection:
+        with Operations.context(MigrationContext.configure(connection)):
+            function(*args)
+
+
+def _lecture_table(titles):
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(sa.text("CREATE TABLE lecture (id INTEGER PRIMARY KEY, title VARCHAR)"))
+        connection.execute(sa.text("CREATE INDEX ix_lecture_title ON lecture (title)"))
+        for title in titles:
+            connection.execute(sa.text("INSERT INTO lecture (title) VALUES (:title)"), {"title": title})
+    return engine
+
+
+def _title_index_unique(engine):
+    return next(i for i in sa.inspect(engine).get_indexes("lecture") if i["name"] == "ix_lecture_title")["unique"]
+
+
+def test_upsert_keys_migration_makes_title_unique():
+    migration = load_migration("5d2f8a1c9e37")
+    engine = _lecture_table(["수학", "영어"])
+
+    run_migration(engine, migration._make_unique, "ix_lecture_title", "lecture", "title")
+
+    assert _title_index_unique(engine)
+
+
+def test_upsert_keys_migration_fails_on_duplicate_titles():
+    migration = load_migration("5d2f8a1c9e37")
+    engine = _lecture_table(["수학", "수학"])
+
+    with pytest.raises(RuntimeError, match="수학"):
+        run_migration(engine, migration._make_unique, "ix_lecture_title", "lecture", "title")
+    assert not _title_index_unique(engine)
+
+
+def test_upsert_keys_downgrade_restores_plain_index():
+    migration = load_migration("5d2f8a1c9e37")
+    engine = _lecture_table(["수학"])
+    run_migration(engine, migration._make_unique, "ix_lecture_title", "lecture", "title")
+
+    run_migration(engine, migration._replace_index, "ix_lecture_title", "lecture", "title")
+
+    assert not _title_index_unique(engine)
+
+
+def test_next_ordinal_migration_backfills_from_used_ordinals():
+    migration = load_migration("b3e9d7c2f5a1")
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(sa.text("CREATE TABLE lecture (id INTEGER PRIMARY KEY, title VARCHAR)"))
+        connection.execute(sa.text("CREATE TABLE enrollment (id INTEGER PRIMARY KEY, lecture_id INTEGER, ordinal INTEGER)"))
+        connection.execute(sa.text("CREATE TABLE enrollment_archive (id INTEGER, lecture_id INTEGER, ordinal INTEGER)"))
+        connection.execute(sa.text("INSERT INTO lecture (id, title) VALUES (1, '수학'), (2, '영어'), (3, '과학')"))
+        connection.execute(sa.text("INSERT INTO enrollment (lecture_id, ordinal) VALUES (1, 0), (1, 1), (2, 0)"))
+        connection.execute(sa.text("INSERT INTO enrollment_archive (id, lecture_id, ordinal) VALUES (9, 2, 4)"))
+
+    run_migration(engine, migration.upgrade)
+
+    with engine.connect() as connection:
+        rows = dict(connection.execute(sa.text("SELECT id, next_ordinal FROM lecture")).all())
+    assert rows == {1: 2, 2: 5, 3: 0}
+
+
+def _payment_schema():
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(sa.text(
+            "CREATE TABLE student (id INTEGER PRIMARY KEY, tuition_fee FLOAT, is_active BOOLEAN)"
+        ))
+        connection.execute(sa.text(
+            "CREATE TABLE lecture (id INTEGER PRIMARY KEY, tuition_fee INTEGER, is_active BOOLEAN)"
+        ))
+        connection.execute(sa.text(
+            "CREATE TABLE enrollment (id INTEGER PRIMARY KEY, student_id INTEGER, lecture_id INTEGER, status VARCHAR)"
+        ))
+    run_migration(engine, load_migration("f4c8a1d6b9e2").upgrade)
+    return engine
+
+
+def test_revenue_backfill_bills_current_month_and_drops_student_foreign_keys():
+    migration = load_migration("e2c6a8f4b1d9")
+    engine = _payment_schema()
+    with engine.begin() as connection:
+        connection.execute(sa.text(
+            "INSERT INTO student (id, tuition_fee, is_active) VALUES (1, 300000, 1), (2, 200000, 1), (3, 500000, 0)"
+        ))
+        connection.execute(sa.text("INSERT INTO lecture (id, tuition_fee, is_active) VALUES (10, 150000, 1)"))
+        connection.execute(sa.text("INSERT INTO enrollment (student_id, lecture_id, status) VALUES (2, 10, 'enrolled')"))
+
+    run_migration(engine, migration.rebuild_rollups, datetime(2026, 10, 22))
+    run_migration(engine, migration.drop_student_foreign_keys)
+
+    with engine.connect() as connection:
+        balances = dict(connection.execute(sa.text(
+            "SELECT student_id, billed FROM student_balance WHERE period = '2026-10'"
+        )).all())
+        month = connection.execute(sa.text(
+            "SELECT billed, paid, outstanding FROM monthly_revenue WHERE period = '2026-10'"
+        )).one()
+    assert balances == {1: 300000, 2: 150000}
+    assert tuple(month) == (450000, 0, 450000)
+    inspector = sa.inspect(engine)
+    assert inspector.get_foreign_keys("payment") == []
+    assert inspector.get_foreign_keys("student_balance") == []
+
+
+def test_revenue_backfill_recomputes_rollups_from_ledger():
+    migration = load_migration("e2c6a8f4b1d9")
+    engine = _payment_schema()
+    with engine.begin() as connection:
+        connection.execute(sa.text("INSERT INTO student (id, tuition_fee, is_active) VALUES (1, 100000, 1)"))
+        connection.execute(sa.text(
+            "INSERT INTO student_balance (period, student_id, billed, paid, updated_at) "
+            "VALUES ('2026-09', 1, 100000, 0, '2026-09-01')"
+        ))
+        connection.execute(sa.text(
+            "INSERT INTO payment (student_id, lecture_id, amount, period, paid_at, created_at) VALUES "
+            "(1, 10, 60000, '2026-09', '2026-09-05', '2026-09-05'), "
+            "(1, NULL, 10000, '2026-09', '2026-09-06', '2026-09-06'), "
+            "(1, 10, 100000, '2026-10', '2026-10-02', '2026-10-02')"
+        ))
+
+    run_migration(engine, migration.rebuild_rollups, datetime(2026, 10, 22))
+
+    with engine.connect() as connection:
+        months = {
+            row.period: (row.billed, row.paid, row.outstanding, row.payment_count)
+            for row in connection.execute(sa.text("SELECT * FROM monthly_revenue"))
+        }
+        lectures = connection.execute(sa.text(
+            "SELECT period, paid, payment_count FROM lecture_revenue ORDER BY period"
+        )).all()
+    # 이번 달(10월)은 이미 납부가 있어도 청구가 없었으므로 새로 청구
+    assert months == {"2026-09": (100000, 70000, 30000, 2), "2026-10": (100000, 100000, 0, 1)}
+    assert [tuple(row) for row in lectures] == [("2026-09", 60000, 1), ("2026-10", 100000, 1)]
+
+
+def test_student_autoincrement_migration_keeps_indexes_and_triggers():
+    migration = load_migration("f9b2d5e8a3c6")
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(sa.text(
+            "CREATE TABLE student (id INTEGER NOT NULL, email VARCHAR NOT NULL, is_active BOOLEAN NOT NULL, "
+            "PRIMARY KEY (id), UNIQUE (email))"
+        ))
+        connection.execute(sa.text("CREATE INDEX ix_student_active ON student (email) WHERE is_active = 1"))
+        connection.execute(sa.text("CREATE TABLE student_log (id INTEGER)"))
+        connection.execute(sa.text(
+            "CREATE TRIGGER student_ai AFTER INSERT ON student BEGIN INSERT INTO student_log VALUES (new.id); END"
+        ))
+        connection.execute(sa.text("CREATE TABLE student_archive (id INTEGER PRIMARY KEY, email VARCHAR)"))
+        connection.execute(sa.text("INSERT INTO student (id, email, is_active) VALUES (1, 'a@academy.com', 1)"))
+        connection.execute(sa.text("INSERT INTO student_archive (id, email) VALUES (7, 'b@academy.com')"))
+
+    run_migration(engine, migration.upgrade)
+
+    with engine.begin() as connection:
+        schema = dict(connection.execute(sa.text("SELECT name, sql FROM sqlite_master WHERE tbl_name = 'student'")).all())
+        connection.execute(sa.text("INSERT INTO student (email, is_active) VALUES ('c@academy.com', 1)"))
+        new_id = connection.execute(sa.text("SELECT id FROM student WHERE email = 'c@academy.com'")).scalar()
+        logged = connection.execute(sa.text("SELECT id FROM student_log")).scalars().all()
+    assert "AUTOINCREMENT" in schema["student"]
+    assert "WHERE is_active = 1" in schema["ix_student_active"]
+    assert new_id == 8
+    assert logged == [1, 8]
+
+    run_migration(engine, migration.downgrade)
+    with engine.connect() as connection:
+        sql = connection.execute(sa.text("SELECT sql FROM sqlite_master WHERE name = 'student'")).scalar()
+    assert "AUTOINCREMENT" not in sql
+
+
+def test_current_students_migration_recounts_from_enrollments():
+    migration = load_migration("c8e5a3f1d7b4")
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(sa.text("CREATE TABLE lecture (id INTEGER PRIMARY KEY, current_students INTEGER)"))
+        connection.execute(sa.text("CREATE TABLE enrollment (id INTEGER PRIMARY KEY, lecture_id INTEGER, status VARCHAR)"))
+        connection.execute(sa.text("INSERT INTO lecture (id, current_students) VALUES (1, 8), (2, 0)"))
+        connection.execute(sa.text(
+            "INSERT INTO enrollment (lecture_id, status) VALUES (1, 'enrolled'), (1, 'withdrawn'), (2, 'enrolled')"
+        ))
+
+    run_migration(engine, migration.upgrade)
+
+    with engine.connect() as connection:
+        counts = connection.execute(sa.text("SELECT id, current_students FROM lecture ORDER BY id")).all()
+    assert [tuple(row) for row in counts] == [(1, 1), (2, 1)]
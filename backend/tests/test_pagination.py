@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, create_engine, desc, select
+from sqlmodel import Session
+
+from app.core.pagination import cursor_for, decode_cursor, fetch_keyset_page, fetch_page
+
+
+def _create_students(client, count):
+    for i in range(count):
+        response = client.post("/api/v1/students/", json={"name": f"학생{i}", "email": f"s{i}@academy.com", "grade": "고1"})
+        assert response.status_code in (200, 201)
+
+
+def _walk(client, limit, **params):
+    first = client.get("/api/v1/students/", params={"limit": limit, **params}).json()
+    pages = [first]
+    while pages[-1]["next_cursor"]:
+        pages.append(client.get("/api/v1/students/", params={"limit": limit, "cursor": pages[-1]["next_cursor"], **params}).json())
+    return pages
+
+
+def test_cursor_pages_skip_count_and_page_number(client):
+    _create_students(client, 5)
+
+    pages = _walk(client, 2)
+
+    assert pages[0]["total"] == 5
+    assert pages[0]["page"] == 1
+    assert all(page["total"] is None and page["page"] is None for page in pages[1:])
+    names = [s["name"] for page in pages for s in page["students"]]
+    assert sorted(names) == [f"학생{i}" for i in range(5)]
+
+
+def test_cursor_page_counts_when_requested(client):
+    _create_students(client, 3)
+    first = client.get("/api/v1/students/", params={"limit": 1}).json()
+
+    second = client.get("/api/v1/students/", params={"limit": 1, "cursor": first["next_cursor"], "with_total": True}).json()
+
+    assert second["total"] == 3
+
+
+def test_cursor_for_row_without_created_at():
+    cursor = cursor_for({"created_at": None, "id": 7})
+
+    assert decode_cursor(cursor) == (None, 7)
+
+
+def test_keyset_walks_rows_without_created_at():
+    # 예전 스키마에는 created_at이 NULL인 행이 있을 수 있음
+    table = Table("legacy", MetaData(), Column("id", Integer, primary_key=True), Column("created_at", DateTime, nullable=True))
+    engine = create_engine("sqlite://")
+    table.metadata.create_all(engine)
+    now = datetime(2024, 1, 1)
+    with Session(engine) as db:
+        db.execute(table.insert(), [
+            {"id": i, "created_at": None if i % 3 == 0 else now - timedelta(days=i % 2)}
+            for i in range(1, 10)
+        ])
+        query = select(table).order_by(desc(table.c.created_at), desc(table.c.id))
+
+        page = fetch_page(db, query, 0, 2)
+        seen = [row["id"] for row in page.items]
+        while page.next_cursor:
+            page = fetch_keyset_page(db, query, table.c, page.next_cursor, 2)
+            seen.extend(row["id"] for row in page.items)
+
+        expected = [row.id for row in db.execute(query)]
+    assert seen == expected
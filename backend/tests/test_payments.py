@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+from sqlmodel import select
+
+from app.models.payment import Payment, StudentBalance
+from app.models.student import Student
+from app.services.payment_service import PaymentService
+
+
+def _pay(client, student_id, amount, period="2026-10", **fields):
+    response = client.post(
+        "/api/v1/payments/", json={"student_id": student_id, "amount": amount, "period": period, **fields}
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def test_hard_delete_keeps_ledger_and_clears_outstanding(client, db, make_student):
+    student = make_student("김철수", tuition_fee=300000)
+    assert client.post("/api/v1/payments/periods/2026-10/bill").json()["outstanding"] == 300000
+    _pay(client, student["id"], 100000)
+
+    response = client.delete(f"/api/v1/students/{student['id']}/hard")
+    assert response.status_code == 200, response.text
+
+    payments = db.exec(select(Payment).where(Payment.student_id == student["id"])).all()
+    assert [payment.amount for payment in payments] == [100000]
+    balance = db.get(StudentBalance, ("2026-10", student["id"]))
+    assert (balance.billed, balance.paid) == (100000, 100000)
+    month = client.get("/api/v1/payments/monthly").json()[0]
+    assert (month["paid"], month["outstanding"], month["payment_count"]) == (100000, 0, 1)
+
+
+def test_bill_period_without_students_returns_none(client, db):
+    assert PaymentService(db).bill_period("2026-11") is None
+    assert client.post("/api/v1/payments/periods/2026-11/bill").status_code == 404
+
+
+def test_archiving_keeps_past_revenue_after_rebilling(client, db, make_student):
+    stays = make_student("김철수", tuition_fee=100)
+    archived = make_student("이영희", tuition_fee=300)
+    assert client.post("/api/v1/payments/periods/2026-01/bill").status_code == 200
+    _pay(client, stays["id"], 100, period="2026-01")
+    _pay(client, archived["id"], 100, period="2026-01")
+    db.execute(
+        update(Student)
+        .where(Student.id == archived["id"])
+        .values(is_active=False, updated_at=datetime.utcnow() - timedelta(days=90))
+    )
+    db.commit()
+
+    assert client.post("/api/v1/archive/run?months=1").json()["archived"] == 1
+    month = client.post("/api/v1/payments/periods/2026-01/bill").json()
+
+    # 납부와 건수는 그대로, 보관한 학생의 받지 못한 200은 미납에서 빠짐
+    assert (month["paid"], month["payment_count"], month["outstanding"]) == (200, 2, 0)
+    assert month["billed"] == 200
+
+
+def test_statistics_keep_tuition_revenue_and_add_paid_revenue(client, make_student, make_lecture):
+    student = make_student("김철수", tuition_fee=300000)
+    lecture = make_lecture(tuition_fee=200000)
+    client.post("/api/v1/enrollments/", json={"student_id": student["id"], "lecture_id": lecture["id"]})
+    _pay(client, student["id"], 100000, lecture_id=lecture["id"])
+
+    tuition = client.get("/api/v1/statistics/students").json()["tuition_stats"]
+    revenue = client.get("/api/v1/statistics/lectures").json()["revenue_stats"]
+    summary = client.get("/api/v1/statistics/overall").json()["summary"]
+
+    assert (tuition["total_revenue"], tuition["paid_revenue"]) == (300000, 100000)
+    assert (revenue["total_revenue"], revenue["paid_revenue"]) == (200000, 100000)
+    assert (summary["total_revenue"], summary["paid_revenue"]) == (500000, 100000)
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from app.core.database import engine
+from app.models.student import Student
+from app.services import recommendation_service
+from app.services.recommendation_service import RecommendationNotFoundError, recommend_lectures
+
+
+@pytest.fixture(autouse=True)
+def reset_index():
+    recommendation_service._index = None
+    yield
+    recommendation_service._index = None
+
+
+def _recommended(student_id):
+    return [lecture["lecture_id"] for lecture in recommend_lectures([student_id], 10)[student_id]]
+
+
+def test_committed_enrollment_is_reflected_on_next_read(client, make_student, make_lecture):
+    student = make_student("김철수")
+    math = make_lecture("고1 수학 기초")
+    english = make_lecture("고1 영어 기초", subject="영어")
+    assert set(_recommended(student["id"])) == {math["id"], english["id"]}
+
+    response = client.post("/api/v1/enrollments/", json={"student_id": student["id"], "lecture_id": math["id"]})
+    assert response.status_code == 201
+
+    assert _recommended(student["id"]) == [english["id"]]
+
+
+def test_writes_outside_the_process_are_picked_up_after_resync_interval(monkeypatch, make_student, make_lecture):
+    student = make_student("김철수")
+    make_lecture()
+    _recommended(student["id"])
+
+    # 다른 프로세스의 쓰기처럼 세션 훅(테이블 버전)을 거치지 않고 비활성으로 바꿈
+    with engine.begin() as connection:
+        connection.execute(
+            update(Student).where(Student.id == student["id"]).values(is_active=False, updated_at=datetime.utcnow())
+        )
+    assert _recommended(student["id"]) != []
+
+    monkeypatch.setattr(recommendation_service, "RECOMMENDATION_RESYNC_INTERVAL", timedelta(0))
+    with pytest.raises(RecommendationNotFoundError):
+        recommend_lectures([student["id"]], 10)
+
+
+def test_new_student_gets_a_row_without_full_rebuild(monkeypatch, make_student, make_lecture):
+    make_student("김철수")
+    lecture = make_lecture()
+    recommend_lectures([], 1)
+
+    monkeypatch.setattr(recommendation_service, "RECOMMENDATION_PARTIAL_REFRESH_RATIO", 2.0)
+    original = recommendation_service.RecommendationService.refresh_students
+
+    def partial_only(self, index, student_ids=None):
+        assert student_ids is not None, "학생 행렬 전체를 다시 만들면 안 됨"
+        return original(self, index, student_ids)
+
+    monkeypatch.setattr(recommendation_service.RecommendationService, "refresh_students", partial_only)
+    newcomer = make_student("이영희")
+
+    assert _recommended(newcomer["id"]) == [lecture["id"]]
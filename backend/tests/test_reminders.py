@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.core.notifier import Notifier, get_notifier
+from app.models.reminder import REMINDER_PENDING, REMINDER_SENT
+from app.services.reminder_service import ReminderService
+
+
+class RecordingNotifier(Notifier):
+    def __init__(self):
+        self.sent = []
+
+    def send_batch(self, messages):
+        self.sent.extend(messages)
+        return {}
+
+
+def _overdue_student(make_student, name):
+    due = (datetime.utcnow() - timedelta(days=3)).replace(microsecond=0)
+    return make_student(name, tuition_due_date=due.isoformat())
+
+
+def test_reminders_are_off_by_default():
+    assert settings.reminder_scheduler == "off"
+    assert settings.reminder_notifier == "off"
+    assert get_notifier() is None
+
+
+def test_dispatch_without_notifier_leaves_reminders_pending(client, db, make_student):
+    _overdue_student(make_student, "김철수")
+
+    result = ReminderService(db).run()
+
+    assert result["detected"] == 1
+    assert result["sent"] == 0
+    assert [r["status"] for r in client.get("/api/v1/reminders/").json()["reminders"]] == [REMINDER_PENDING]
+
+
+def test_dispatch_sends_through_configured_notifier(client, db, make_student):
+    student = _overdue_student(make_student, "김철수")
+    notifier = RecordingNotifier()
+
+    result = ReminderService(db, notifier=notifier).run()
+
+    assert result["sent"] == 1
+    assert [message.student_id for message in notifier.sent] == [student["id"]]
+    assert [r["status"] for r in client.get("/api/v1/reminders/").json()["reminders"]] == [REMINDER_SENT]
+
+
+def test_notifier_requires_send_batch():
+    class Incomplete(Notifier):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
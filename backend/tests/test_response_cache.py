@@ -0,0 +1,41 @@
+from app.core import response_cache as response_cache_module
+from app.core.config import settings
+from app.core.response_cache import LRUBytesCache
+
+
+def test_lru_entry_expires_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(response_cache_module.time, "monotonic", lambda: now[0])
+    cache = LRUBytesCache(max_bytes=1024, ttl_seconds=60)
+    cache.set("key", (b"body", "application/json"))
+
+    now[0] += 59
+    assert cache.get("key") == (b"body", "application/json")
+    now[0] += 2
+    assert cache.get("key") is None
+    assert cache.current_bytes == 0
+
+
+def test_list_response_is_cached_until_write(client):
+    client.post("/api/v1/students/", json={"name": "김철수", "email": "kim@academy.com", "grade": "고1"})
+
+    first = client.get("/api/v1/students/")
+    second = client.get("/api/v1/students/")
+    assert second.headers.get("x-cache") == "HIT"
+    assert second.content == first.content
+
+    client.post("/api/v1/students/", json={"name": "이영희", "email": "lee@academy.com", "grade": "고2"})
+    third = client.get("/api/v1/students/")
+    assert third.headers.get("x-cache") is None
+    assert third.json()["total"] == 2
+
+
+def test_multiple_workers_without_shared_versions_disable_cache(client, monkeypatch):
+    monkeypatch.setattr(settings, "web_concurrency", 4)
+    client.post("/api/v1/students/", json={"name": "김철수", "email": "kim@academy.com", "grade": "고1"})
+
+    first = client.get("/api/v1/students/")
+    second = client.get("/api/v1/students/", headers={"If-None-Match": first.headers["etag"]})
+
+    assert second.status_code == 200
+    assert second.headers.get("x-cache") is None
@@ -0,0 +1,110 @@
+import pytest
+from sqlmodel import select
+
+from app.core.schedule import ScheduleSlot, parse_schedule
+
+
+def _lecture(title, **fields):
+    return {"title": title, "subject": "수학", "grade": "고1", **fields}
+
+
+def test_parse_schedule():
+    assert parse_schedule("월수 14:00-16:00") == [ScheduleSlot(0, 840, 960), ScheduleSlot(2, 840, 960)]
+
+
+@pytest.mark.parametrize("schedule", ["", "  ", "미정", " 미정 "])
+def test_parse_undecided_schedule_has_no_slots(schedule):
+    assert parse_schedule(schedule) == []
+
+
+def test_parse_malformed_schedule_raises():
+    with pytest.raises(ValueError):
+        parse_schedule("월 16:00-14:00")
+
+
+def test_overlapping_lecture_in_same_classroom_conflicts(client):
+    client.post("/api/v1/lectures/", json=_lecture("수학 A", schedule="월수 14:00-16:00", classroom="101호"))
+
+    response = client.post("/api/v1/lectures/", json=_lecture("수학 B", schedule="수 15:00-17:00", classroom="101호"))
+
+    assert response.status_code == 409
+
+
+def test_undecided_schedule_is_accepted(client):
+    response = client.post("/api/v1/lectures/", json=_lecture("수학 A", schedule="미정", classroom="101호"))
+
+    assert response.status_code == 201
+
+
+def test_free_text_schedule_skips_conflict_check(client):
+    response = client.post("/api/v1/lectures/", json=_lecture("수학 A", schedule="협의 후 결정", classroom="101호"))
+
+    assert response.status_code == 201
+
+
+def test_undecided_classroom_does_not_conflict(client):
+    client.post("/api/v1/lectures/", json=_lecture("수학 A", schedule="월 14:00-16:00", classroom="미정"))
+
+    response = client.post("/api/v1/lectures/", json=_lecture("수학 B", schedule="월 14:00-16:00", classroom="미정"))
+
+    assert response.status_code == 201
+
+
+def test_legacy_schedule_does_not_block_classroom_change(client, db):
+    from app.models.lecture import Lecture
+    created = client.post("/api/v1/lectures/", json=_lecture("수학 A")).json()
+    lecture = db.get(Lecture, created["id"])
+    lecture.schedule = "월 25:00-26:00"
+    db.add(lecture)
+    db.commit()
+
+    response = client.put(f"/api/v1/lectures/{created['id']}", json={"classroom": "102호"})
+
+    assert response.status_code == 200
+    assert response.json()["classroom"] == "102호"
+
+
+def test_bulk_update_rejects_schedule_fields(client):
+    first = client.post("/api/v1/lectures/", json=_lecture("수학 A", schedule="월 14:00-16:00", classroom="101호")).json()
+    second = client.post("/api/v1/lectures/", json=_lecture("수학 B", schedule="월 14:00-16:00", classroom="102호")).json()
+    ids = [first["id"], second["id"]]
+
+    moved = client.patch("/api/v1/lectures/bulk", json={"ids": ids, "patch": {"classroom": "101호"}})
+    reactivated = client.patch("/api/v1/lectures/bulk", json={"ids": ids, "patch": {"is_active": True}})
+    deactivated = client.patch("/api/v1/lectures/bulk", json={"ids": ids, "patch": {"is_active": False}})
+
+    assert moved.status_code == 400
+    assert reactivated.status_code == 400
+    assert deactivated.status_code == 200
+    # 비활성화된 강의의 구간은 비워져 같은 시간에 새 강의를 만들 수 있음
+    response = client.post("/api/v1/lectures/", json=_lecture("수학 C", schedule="월 14:00-16:00", classroom="101호"))
+    assert response.status_code == 201
+
+
+def test_enrollment_does_not_resync_schedule(client, make_student, monkeypatch):
+    from app.services import schedule_service
+    lecture = client.post("/api/v1/lectures/", json=_lecture("수학 A", schedule="월 14:00-16:00", classroom="101호")).json()
+    student = make_student("김철수")
+    calls = []
+    monkeypatch.setattr(schedule_service, "sync_changed_lectures", lambda: calls.append("rescan"))
+    monkeypatch.setattr(schedule_service, "sync_lecture_ids", lambda ids: calls.append(set(ids)))
+
+    response = client.post("/api/v1/enrollments/", json={"student_id": student["id"], "lecture_id": lecture["id"]})
+
+    assert response.status_code == 201
+    assert calls == []
+
+
+def test_created_lecture_slots_are_written_with_the_lecture(client, db, monkeypatch):
+    from app.models.schedule import LectureSlot
+    from app.services import schedule_service
+    client.get("/api/v1/utilization/classrooms")
+    # 커밋 후 동기화가 없어도 다음 겹침 확인이 새 강의를 봐야 함
+    monkeypatch.setattr(schedule_service, "sync_lecture_ids", lambda ids: set())
+
+    created = client.post("/api/v1/lectures/", json=_lecture("수학 A", schedule="월 14:00-16:00", classroom="101호")).json()
+    response = client.post("/api/v1/lectures/", json=_lecture("수학 B", schedule="월 15:00-17:00", classroom="101호"))
+
+    slots = db.exec(select(LectureSlot).where(LectureSlot.lecture_id == created["id"])).all()
+    assert len(slots) == 1
+    assert response.status_code == 409
@@ -0,0 +1,74 @@
+def test_search_matches_name(client):
+    client.post("/api/v1/students/", json={"name": "김철수", "email": "kim@academy.com", "grade": "고1"})
+    client.post("/api/v1/students/", json={"name": "이영희", "email": "lee@academy.com", "grade": "고2"})
+
+    response = client.get("/api/v1/search", params={"q": "철수"})
+
+    assert response.status_code == 200
+    assert [s["name"] for s in response.json()["students"]] == ["김철수"]
+
+
+def test_search_whitespace_query_returns_nothing(client):
+    client.post("/api/v1/students/", json={"name": "김철수", "email": "kim@academy.com", "grade": "고1"})
+
+    response = client.get("/api/v1/search", params={"q": "   "})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["students"] == [] and body["teachers"] == [] and body["materials"] == []
+
+
+def test_search_uses_fts5_index(client):
+    client.post("/api/v1/students/", json={"name": "김철수", "email": "kim@academy.com", "grade": "고1"})
+    client.post("/api/v1/students/", json={"name": "이영희", "email": "lee@academy.com", "grade": "고2"})
+
+    response = client.get("/api/v1/search", params={"q": "김철수"})
+
+    body = response.json()
+    assert body["backend"] == "fts5"
+    assert [s["name"] for s in body["students"]] == ["김철수"]
+
+
+def test_fts5_search_ranks_better_matches_first(client):
+    client.post("/api/v1/students/", json={"name": "박민수", "email": "park.minsu@academy.com", "grade": "고1"})
+    client.post("/api/v1/students/", json={"name": "minsu", "email": "minsu@academy.com", "grade": "고1"})
+
+    response = client.get("/api/v1/search", params={"q": "minsu", "entities": "students"})
+
+    students = response.json()["students"]
+    assert [s["name"] for s in students] == ["minsu", "박민수"]
+    assert students[0]["score"] > students[1]["score"]
+
+
+def test_fts5_index_follows_updates_and_digits_only_phone(client):
+    created = client.post(
+        "/api/v1/students/", json={"name": "김철수", "email": "kim@academy.com", "grade": "고1", "phone": "010-1234-5678"}
+    ).json()
+    client.put(f"/api/v1/students/{created['id']}", json={"name": "김영수"})
+
+    renamed = client.get("/api/v1/search", params={"q": "김영수"}).json()["students"]
+    by_phone = client.get("/api/v1/search", params={"q": "12345678"}).json()["students"]
+
+    assert [s["id"] for s in renamed] == [created["id"]]
+    assert [s["id"] for s in by_phone] == [created["id"]]
+    assert client.get("/api/v1/search", params={"q": "김철수"}).json()["students"] == []
+
+
+def test_install_search_indexes_backfills_existing_rows():
+    import sqlalchemy as sa
+    from sqlmodel import SQLModel
+    from app.core.search_index import install_search_indexes
+    engine = sa.create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(sa.text(
+            "INSERT INTO student (name, email, grade, tuition_fee, is_active, created_at, updated_at) "
+            "VALUES ('김철수', 'kim@academy.com', '고1', 0, 1, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+        ))
+
+    assert install_search_indexes(engine)
+    assert install_search_indexes(engine)
+
+    with engine.connect() as connection:
+        found = connection.execute(sa.text("SELECT rowid FROM student_fts WHERE student_fts MATCH '\"김철수\"'")).all()
+    assert len(found) == 1
@@ -8,8 +8,10 @@ export interface StudentStatistics {
   inactive_students: number;
   grade_distribution: Record<string, number>;
   tuition_stats: {
-    total_revenue: number;
+    total_revenue: number;  // 활성 학생 수강료 합계
+    paid_revenue: number;  // 납부 원장 기준 실제 납부액
     average_tuition: number;
+    outstanding_balance: number;
     overdue_count: number;
     recent_registrations: number;
   };
@@ -29,7 +31,8 @@ export interface LectureStatistics {
     enrollment_rate: number;
   };
   revenue_stats: {
-    total_revenue: number;
+    total_revenue: number;  // 수강료 × 현재 수강생 수
+    paid_revenue: number;  // 강의별 실제 납부액
     average_tuition: number;
   };
   popular_lectures: Array<{
@@ -77,6 +80,7 @@ export interface OverallStatistics {
     total_teachers: number;
     total_materials: number;
     total_revenue: number;
+    paid_revenue: number;
   };
   student_stats: StudentStatistics;
   lecture_stats: LectureStatistics;
@@ -1,3 +1,5 @@
+import { LearningAnalysisRequest, LearningAnalysisResponse } from '@/types/ai';
+
 // API 클라이언트 설정
 const API_BASE = process.env.NODE_ENV === 'development' 
   ? 'http://localhost:8000/api'  // 개발 환경: 백엔드 포트 8000 사용
@@ -147,7 +149,7 @@ export const materialsApi = {
 // AI 관련 API
 export const aiApi = {
   chat: (message: string) => apiClient.post('/v1/ai/chat/test', { message }),
-  analyze: (data: any) => apiClient.post('/v1/ai/analyze', data),
+  analyze: (data: LearningAnalysisRequest) => apiClient.post<LearningAnalysisResponse>('/v1/ai/analyze', data),
   command: (command: string) => apiClient.post('/v1/ai/command', { command }),
 };
 
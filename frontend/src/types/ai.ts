@@ -14,6 +14,43 @@ export interface AnalysisData {
   progressScore: number;
 }
 
+// 학습 분석 요청 (/v1/ai/analyze)
+export interface StudentScores {
+  student_id?: number;
+  name?: string;
+  scores: Record<string, number[]>;  // 과목 → 평가 순 점수 (0~100)
+}
+
+export interface LearningAnalysisRequest {
+  students?: StudentScores[];  // 백분위 비교 대상 (반 전체)
+  student_id?: number;  // 요약할 학생
+  scores?: Record<string, number[]>;  // 학생 한 명만 보낼 때
+  summarize?: boolean;
+}
+
+export interface SubjectAnalysis {
+  subject: string;
+  latest: number;
+  mean: number;
+  trend: number;  // 평가당 점수 변화
+  percentile: number;  // 반 내 백분위
+  assessments: number;
+}
+
+export interface StudentAnalysis {
+  student_id: number | null;
+  strengths: string[];
+  weaknesses: string[];
+  recommendations: string[];
+  progress_score: number;
+  subjects: SubjectAnalysis[];
+}
+
+// 요약할 학생이 정해지면 그 학생 결과, 아니면 반 전체 결과
+export type LearningAnalysisResponse =
+  | (StudentAnalysis & { cohort_size: number; ai_analysis: string | null })
+  | { cohort_size: number; students: StudentAnalysis[] };
+
 export interface CommandData {
   commandType: 'student' | 'teacher' | 'material' | 'tuition';
   action: 'get' | 'create' | 'update' | 'delete' | 'list';